@@ -0,0 +1,397 @@
+import asyncio
+import json
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs
+
+import httpx
+
+
+@dataclass
+class MockGrafanaScale:
+    """The class includes all necessary variables to specify the size and the latency of the synthetic Grafana instance
+
+    Args:
+        folders (int): Specify the number of the top level folders (default 20)
+        subfolders (int): Specify the number of the child folders of every folder (default 3)
+        folder_depth (int): Specify the number of the folder tree levels. Please use 1 to disable the nested folders (default 3)
+        dashboards (int): Specify the number of the dashboards (default 500)
+        users (int): Specify the number of the users (default 1000)
+        teams (int): Specify the number of the teams (default 200)
+        latency (float): Specify the simulated server latency of every request in seconds (default 0.0)
+    """
+
+    folders: int = 20
+    subfolders: int = 3
+    folder_depth: int = 3
+    dashboards: int = 500
+    users: int = 1000
+    teams: int = 200
+    latency: float = 0.0
+
+
+@dataclass
+class MockGrafana:
+    """The class includes an ASGI application that serves a synthetic stand-in of the Grafana API for the benchmarks. The application serves the folders, the folder tree, the search, the dashboards, the user and team pagination and the alert rule provisioning endpoints
+
+    Args:
+        scale (MockGrafanaScale): Specify the size and the latency of the synthetic Grafana instance (default MockGrafanaScale())
+    """
+
+    scale: MockGrafanaScale = field(default_factory=MockGrafanaScale)
+    folders: list = field(default_factory=list, init=False)
+    folders_by_parent: dict = field(default_factory=dict, init=False)
+    dashboards: dict = field(default_factory=dict, init=False)
+    users: list = field(default_factory=list, init=False)
+    teams: list = field(default_factory=list, init=False)
+    alert_rules: dict = field(default_factory=dict, init=False)
+    requests: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self._create_the_folders()
+
+        for index in range(self.scale.dashboards):
+            folder: dict = self.folders[index % len(self.folders)]
+            uid: str = f"dashboard{index}"
+            self.dashboards[uid] = dict(
+                {
+                    "id": index + 1,
+                    "uid": uid,
+                    "title": f"Dashboard {index}",
+                    "folderUid": folder.get("uid"),
+                    "folderTitle": folder.get("title"),
+                    "version": 1,
+                }
+            )
+
+        self.users = [
+            dict(
+                {
+                    "id": index + 1,
+                    "name": f"User {index}",
+                    "login": f"user{index}",
+                    "email": f"user{index}@example.com",
+                    "isAdmin": False,
+                }
+            )
+            for index in range(self.scale.users)
+        ]
+        self.teams = [
+            dict(
+                {
+                    "id": index + 1,
+                    "uid": f"team{index}",
+                    "name": f"Team {index}",
+                    "email": f"team{index}@example.com",
+                    "memberCount": 0,
+                }
+            )
+            for index in range(self.scale.teams)
+        ]
+
+    async def __call__(self, scope: dict, receive, send):
+        if scope.get("type") == "lifespan":
+            while True:
+                message: dict = await receive()
+                if message.get("type") == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message.get("type") == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        body: bytes = b""
+        more_body: bool = True
+        while more_body:
+            message: dict = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        self.requests += 1
+        status_code, payload = self.handle_the_request(
+            scope.get("method"),
+            scope.get("path"),
+            parse_qs(scope.get("query_string", b"").decode("utf-8")),
+            json.loads(body) if len(body) != 0 else None,
+        )
+
+        if self.scale.latency > 0:
+            await asyncio.sleep(self.scale.latency)
+
+        content: bytes = json.dumps(payload).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(content)).encode("utf-8")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    def handle_the_request(
+        self, method: str, path: str, query: dict, payload: any
+    ) -> tuple:
+        """The method includes a functionality to route a request to the synthetic Grafana endpoints
+
+        Args:
+            method (str): Specify the method of the request
+            path (str): Specify the path of the request
+            query (dict): Specify the parsed query parameters of the request
+            payload (any): Specify the decoded JSON payload of the request
+
+        Returns:
+            response (tuple): Returns the status code and the JSON payload of the response
+        """
+
+        segments: list = path.rstrip("/").split("/")[1:]
+
+        if method == "GET" and path == "/api/search":
+            return 200, self._search(query)
+        elif method == "GET" and path == "/api/folders":
+            parent_uid: str = MockGrafana._get_the_parameter(query, "parentUid")
+            if parent_uid is not None:
+                return 200, self.folders_by_parent.get(parent_uid, list())
+            return 200, self.folders_by_parent.get(None)[
+                : int(MockGrafana._get_the_parameter(query, "limit", 1000))
+            ]
+        elif (
+            method == "GET"
+            and segments[:2] == ["api", "folders"]
+            and len(segments) == 3
+        ):
+            folders: list = [
+                folder for folder in self.folders if folder.get("uid") == segments[2]
+            ]
+            if len(folders) == 0:
+                return 404, dict({"message": "folder not found"})
+            return 200, folders[0]
+        elif method == "POST" and path == "/api/dashboards/db":
+            return 200, self._create_or_update_the_dashboard(payload)
+        elif method == "GET" and segments[:3] == ["api", "dashboards", "uid"]:
+            dashboard: dict = self.dashboards.get(segments[3])
+            if dashboard is None:
+                return 404, dict({"message": "Dashboard not found"})
+            return 200, dict(
+                {
+                    "dashboard": dict(
+                        {
+                            "id": dashboard.get("id"),
+                            "uid": dashboard.get("uid"),
+                            "title": dashboard.get("title"),
+                            "version": dashboard.get("version"),
+                        }
+                    ),
+                    "meta": dict(
+                        {
+                            "folderUid": dashboard.get("folderUid"),
+                            "version": dashboard.get("version"),
+                        }
+                    ),
+                }
+            )
+        elif method == "GET" and path == "/api/users/search":
+            users, page, results_per_page = MockGrafana._get_the_page(self.users, query)
+            return 200, dict(
+                {
+                    "totalCount": len(self.users),
+                    "users": users,
+                    "page": page,
+                    "perPage": results_per_page,
+                }
+            )
+        elif method == "GET" and path == "/api/teams/search":
+            teams, page, results_per_page = MockGrafana._get_the_page(self.teams, query)
+            return 200, dict(
+                {
+                    "totalCount": len(self.teams),
+                    "teams": teams,
+                    "page": page,
+                    "perPage": results_per_page,
+                }
+            )
+        elif method == "POST" and path == "/api/v1/provisioning/alert-rules":
+            alert_rule: dict = dict(payload)
+            alert_rule["uid"] = alert_rule.get("uid") or f"rule{len(self.alert_rules)}"
+            self.alert_rules[alert_rule.get("uid")] = alert_rule
+            return 201, alert_rule
+        elif method == "GET" and path == "/api/health":
+            return 200, dict({"database": "ok"})
+
+        return 404, dict({"message": "Not found"})
+
+    def _create_the_folders(self):
+        """The method includes a functionality to create the synthetic folder tree
+
+        Returns:
+            None
+        """
+
+        level: list = [None]
+
+        for depth in range(max(self.scale.folder_depth, 1)):
+            next_level: list = list()
+
+            for parent_uid in level:
+                for _ in range(
+                    self.scale.folders if depth == 0 else self.scale.subfolders
+                ):
+                    folder_id: int = len(self.folders) + 1
+                    folder: dict = dict(
+                        {
+                            "id": folder_id,
+                            "uid": f"folder{folder_id}",
+                            "title": f"Folder {folder_id}",
+                            "type": "dash-folder",
+                        }
+                    )
+                    if parent_uid is not None:
+                        folder["parentUid"] = parent_uid
+
+                    self.folders.append(folder)
+                    self.folders_by_parent.setdefault(parent_uid, list()).append(
+                        folder
+                    )
+                    next_level.append(folder.get("uid"))
+
+            level = next_level
+
+    def _search(self, query: dict) -> list:
+        """The method includes a functionality to search the synthetic folders and dashboards
+
+        Args:
+            query (dict): Specify the parsed query parameters of the request
+
+        Returns:
+            results (list): Returns the search results
+        """
+
+        if MockGrafana._get_the_parameter(query, "folderIds") == "0":
+            return self.folders_by_parent.get(None)
+
+        search_type: str = MockGrafana._get_the_parameter(query, "type")
+        search_query: str = MockGrafana._get_the_parameter(query, "query", "")
+
+        results: list = list()
+        if search_type in (None, "dash-folder"):
+            results.extend(self.folders)
+        if search_type in (None, "dash-db"):
+            results.extend(
+                dict(dashboard, type="dash-db") for dashboard in self.dashboards.values()
+            )
+
+        results = [
+            result
+            for result in results
+            if search_query.lower() in result.get("title").lower()
+        ]
+
+        limit: int = int(MockGrafana._get_the_parameter(query, "limit", 1000))
+        page: int = int(MockGrafana._get_the_parameter(query, "page", 1))
+        return results[(page - 1) * limit : page * limit]
+
+    def _create_or_update_the_dashboard(self, payload: dict) -> dict:
+        """The method includes a functionality to create or update a synthetic dashboard
+
+        Args:
+            payload (dict): Specify the payload of the dashboard request
+
+        Returns:
+            result (dict): Returns the result of the deployment
+        """
+
+        dashboard: dict = payload.get("dashboard")
+        uid: str = dashboard.get("uid") or f"dashboard{len(self.dashboards)}"
+        existing_dashboard: dict = self.dashboards.get(uid, dict())
+
+        self.dashboards[uid] = dict(
+            {
+                "id": existing_dashboard.get("id", len(self.dashboards) + 1),
+                "uid": uid,
+                "title": dashboard.get("title"),
+                "folderUid": payload.get("folderUid"),
+                "version": existing_dashboard.get("version", 0) + 1,
+            }
+        )
+
+        return dict(
+            {
+                "id": self.dashboards[uid].get("id"),
+                "uid": uid,
+                "url": f"/d/{uid}",
+                "status": "success",
+                "version": self.dashboards[uid].get("version"),
+            }
+        )
+
+    @staticmethod
+    def _get_the_parameter(query: dict, name: str, default: any = None) -> any:
+        """The method includes a functionality to get the first value of a query parameter
+
+        Args:
+            query (dict): Specify the parsed query parameters of the request
+            name (str): Specify the name of the parameter
+            default (any): Specify the default value of the parameter (default None)
+
+        Returns:
+            value (any): Returns the value of the parameter
+        """
+
+        return query.get(name, [default])[0]
+
+    @staticmethod
+    def _get_the_page(items: list, query: dict) -> tuple:
+        """The method includes a functionality to get a page of the items specified by the perpage and page query parameters
+
+        Args:
+            items (list): Specify the items
+            query (dict): Specify the parsed query parameters of the request
+
+        Returns:
+            page (tuple): Returns the items of the page, the page and the results per page
+        """
+
+        results_per_page: int = int(
+            MockGrafana._get_the_parameter(query, "perpage", 1000)
+        )
+        page: int = int(MockGrafana._get_the_parameter(query, "page", 1))
+        return (
+            items[(page - 1) * results_per_page : page * results_per_page],
+            page,
+            results_per_page,
+        )
+
+
+class ThreadedASGITransport(httpx.BaseTransport):
+    """The class includes a synchronous HTTPX transport that forwards the requests to an ASGI application. The application runs on an event loop inside a background thread, so that concurrent requests of multiple threads are served concurrently
+
+    Args:
+        app (any): Specify the ASGI application
+    """
+
+    def __init__(self, app: any):
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self.thread: threading.Thread = threading.Thread(
+            target=self.loop.run_forever, daemon=True
+        )
+        self.thread.start()
+        self.async_transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        status_code, headers, content = asyncio.run_coroutine_threadsafe(
+            self._handle_the_async_request(request), self.loop
+        ).result()
+        return httpx.Response(status_code, headers=headers, content=content)
+
+    def close(self):
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+
+    async def _handle_the_async_request(self, request: httpx.Request) -> tuple:
+        response: httpx.Response = await self.async_transport.handle_async_request(
+            request
+        )
+        return response.status_code, response.headers, await response.aread()
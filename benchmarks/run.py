@@ -0,0 +1,506 @@
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable, List
+
+import httpx
+
+from grafana_api.alerting_provisioning import AlertingProvisioning
+from grafana_api.dashboard import Dashboard
+from grafana_api.folder import AsyncFolder, Folder
+from grafana_api.model import (
+    APIModel,
+    AlertQuery,
+    AlertRule,
+    AlertRuleQueryModel,
+    AlertRuleQueryModelCondition,
+    MetricsCollector,
+)
+from grafana_api.search import Search
+from grafana_api.team import Team
+from grafana_api.user import User
+
+from benchmarks.mock_grafana import (
+    MockGrafana,
+    MockGrafanaScale,
+    ThreadedASGITransport,
+)
+
+try:
+    import uvicorn
+except ImportError:  # pragma: no cover
+    uvicorn = None
+
+# The constant includes the host of the in-process mock Grafana instance.
+MOCK_GRAFANA_HOST: str = "http://mock-grafana"
+
+
+@dataclass
+class BenchmarkResult:
+    """The class includes the result of a benchmark
+
+    Args:
+        name (str): Specify the name of the benchmark
+        iterations (int): Specify the number of the measured iterations
+        total_seconds (float): Specify the total duration of all measured iterations in seconds
+        iterations_per_second (float): Specify the throughput of the benchmark
+        requests (int): Specify the number of the HTTP requests of all measured iterations
+        requests_per_second (float): Specify the HTTP request throughput of the benchmark
+        latency (dict): Specify the min, mean, p50, p95, p99 and max duration of an iteration in seconds
+    """
+
+    name: str
+    iterations: int
+    total_seconds: float
+    iterations_per_second: float
+    requests: int
+    requests_per_second: float
+    latency: dict = field(default_factory=dict)
+
+
+def create_the_alert_rule(index: int) -> AlertRule:
+    """The method includes a functionality to create a synthetic alert rule
+
+    Args:
+        index (int): Specify the index of the alert rule
+
+    Returns:
+        alert_rule (AlertRule): Returns the alert rule
+    """
+
+    alert_rule_query_model: AlertRuleQueryModel = AlertRuleQueryModel(
+        [AlertRuleQueryModelCondition([0], "gt", "and", ["A"], [], "last", "query")],
+        {"type": "__expr__", "uid": "__expr__"},
+        "A",
+        False,
+        1000,
+        43200,
+        "B",
+        "classic_conditions",
+    )
+    return AlertRule(
+        "B",
+        [AlertQuery("datasource", alert_rule_query_model, "", "A", 600, 0)],
+        "Alerting",
+        "folder1",
+        "NoData",
+        1,
+        "benchmark",
+        f"Alert rule {index}",
+        f"rule{index}",
+        "5m",
+    )
+
+
+def calculate_the_latency(durations: list) -> dict:
+    """The method includes a functionality to calculate the latency statistics of the iterations
+
+    Args:
+        durations (list): Specify the durations of the iterations in seconds
+
+    Returns:
+        latency (dict): Returns the min, mean, p50, p95, p99 and max duration in seconds
+    """
+
+    if len(durations) == 1:
+        percentiles: list = durations * 99
+    else:
+        percentiles: list = statistics.quantiles(durations, n=100, method="inclusive")
+
+    return dict(
+        {
+            "min": min(durations),
+            "mean": statistics.fmean(durations),
+            "p50": percentiles[49],
+            "p95": percentiles[94],
+            "p99": percentiles[98],
+            "max": max(durations),
+        }
+    )
+
+
+def create_the_result(
+    name: str, durations: list, total_seconds: float, metrics_collector: MetricsCollector
+) -> BenchmarkResult:
+    """The method includes a functionality to create the result of a benchmark
+
+    Args:
+        name (str): Specify the name of the benchmark
+        durations (list): Specify the durations of the iterations in seconds
+        total_seconds (float): Specify the total duration of all iterations in seconds
+        metrics_collector (MetricsCollector): Specify the metrics collector of the measured iterations
+
+    Returns:
+        result (BenchmarkResult): Returns the result of the benchmark
+    """
+
+    requests: int = sum(
+        endpoint_metrics.get("requests")
+        for endpoint_metrics in metrics_collector.get_the_metrics().values()
+    )
+    return BenchmarkResult(
+        name,
+        len(durations),
+        total_seconds,
+        len(durations) / total_seconds,
+        requests,
+        requests / total_seconds,
+        calculate_the_latency(durations),
+    )
+
+
+def run_the_benchmark(
+    name: str,
+    model: APIModel,
+    benchmark: Callable[[int], any],
+    iterations: int,
+    warmup: int,
+) -> BenchmarkResult:
+    """The method includes a functionality to measure a synchronous benchmark
+
+    Args:
+        name (str): Specify the name of the benchmark
+        model (APIModel): Specify the model of the benchmark
+        benchmark (Callable[[int], any]): Specify the benchmark function that is called with the index of the iteration
+        iterations (int): Specify the number of the measured iterations
+        warmup (int): Specify the number of the not measured warmup iterations
+
+    Returns:
+        result (BenchmarkResult): Returns the result of the benchmark
+    """
+
+    for index in range(warmup):
+        benchmark(-index - 1)
+
+    metrics_collector: MetricsCollector = MetricsCollector()
+    model.request_hooks.append(metrics_collector)
+    durations: list = list()
+
+    try:
+        started_at: float = time.perf_counter()
+        for index in range(iterations):
+            iteration_started_at: float = time.perf_counter()
+            benchmark(index)
+            durations.append(time.perf_counter() - iteration_started_at)
+        total_seconds: float = time.perf_counter() - started_at
+    finally:
+        model.request_hooks.remove(metrics_collector)
+
+    return create_the_result(name, durations, total_seconds, metrics_collector)
+
+
+async def run_the_async_benchmark(
+    name: str,
+    model: APIModel,
+    benchmark: Callable[[int], Awaitable[any]],
+    iterations: int,
+    warmup: int,
+) -> BenchmarkResult:
+    """The method includes a functionality to measure an asynchronous benchmark
+
+    Args:
+        name (str): Specify the name of the benchmark
+        model (APIModel): Specify the model of the benchmark
+        benchmark (Callable[[int], Awaitable[any]]): Specify the benchmark coroutine function that is called with the index of the iteration
+        iterations (int): Specify the number of the measured iterations
+        warmup (int): Specify the number of the not measured warmup iterations
+
+    Returns:
+        result (BenchmarkResult): Returns the result of the benchmark
+    """
+
+    for index in range(warmup):
+        await benchmark(-index - 1)
+
+    metrics_collector: MetricsCollector = MetricsCollector()
+    model.request_hooks.append(metrics_collector)
+    durations: list = list()
+
+    try:
+        started_at: float = time.perf_counter()
+        for index in range(iterations):
+            iteration_started_at: float = time.perf_counter()
+            await benchmark(index)
+            durations.append(time.perf_counter() - iteration_started_at)
+        total_seconds: float = time.perf_counter() - started_at
+    finally:
+        model.request_hooks.remove(metrics_collector)
+
+    return create_the_result(name, durations, total_seconds, metrics_collector)
+
+
+def run_the_benchmarks(
+    host: str,
+    app: MockGrafana,
+    iterations: int,
+    warmup: int,
+    page_size: int,
+    in_process: bool,
+) -> List[BenchmarkResult]:
+    """The method includes a functionality to run all benchmarks against the mock Grafana instance
+
+    Args:
+        host (str): Specify the host of the mock Grafana instance
+        app (MockGrafana): Specify the mock Grafana application
+        iterations (int): Specify the number of the measured iterations of every benchmark
+        warmup (int): Specify the number of the not measured warmup iterations of every benchmark
+        page_size (int): Specify the results per page of the paginated benchmarks
+        in_process (bool): Specify if the requests are forwarded to the application in-process instead of a local server
+
+    Returns:
+        results (List[BenchmarkResult]): Returns the results of all benchmarks
+    """
+
+    model: APIModel = APIModel(host=host, token="benchmark", folder_index_ttl=0)
+    if in_process:
+        model.http_client = httpx.Client(transport=ThreadedASGITransport(app))
+
+    results: List[BenchmarkResult] = list()
+
+    with model:
+        folder: Folder = Folder(model)
+        results.append(
+            run_the_benchmark(
+                "folder.get_folders.nested",
+                model,
+                lambda index: folder.get_folders(nested_folders=True),
+                iterations,
+                warmup,
+            )
+        )
+
+        dashboard: Dashboard = Dashboard(model)
+        model.folder_index_ttl = 60.0
+        results.append(
+            run_the_benchmark(
+                "dashboard.create_or_update_dashboard",
+                model,
+                lambda index: dashboard.create_or_update_dashboard(
+                    "Folder 1",
+                    {"uid": f"benchmark{index}", "title": f"Benchmark {index}"},
+                    "Benchmark",
+                    overwrite=True,
+                ),
+                iterations,
+                warmup,
+            )
+        )
+        model.folder_index_ttl = 0
+
+        search: Search = Search(model)
+        results.append(
+            run_the_benchmark(
+                "search.search",
+                model,
+                lambda index: search.search(f"type=dash-db&limit={page_size}"),
+                iterations,
+                warmup,
+            )
+        )
+
+        user: User = User(model)
+        results.append(
+            run_the_benchmark(
+                "user.iter_users",
+                model,
+                lambda index: list(user.iter_users(results_per_page=page_size)),
+                iterations,
+                warmup,
+            )
+        )
+        results.append(
+            run_the_benchmark(
+                "user.iter_users.prefetch",
+                model,
+                lambda index: list(
+                    user.iter_users(results_per_page=page_size, prefetch=True)
+                ),
+                iterations,
+                warmup,
+            )
+        )
+
+        team: Team = Team(model)
+        results.append(
+            run_the_benchmark(
+                "team.iter_teams",
+                model,
+                lambda index: list(team.iter_teams(results_per_page=page_size)),
+                iterations,
+                warmup,
+            )
+        )
+
+        alerting_provisioning: AlertingProvisioning = AlertingProvisioning(model)
+        results.append(
+            run_the_benchmark(
+                "alerting_provisioning.add_alert_rule",
+                model,
+                lambda index: alerting_provisioning.add_alert_rule(
+                    create_the_alert_rule(index)
+                ),
+                iterations,
+                warmup,
+            )
+        )
+
+    async def _run_the_async_benchmarks():
+        async with model:
+            if in_process:
+                model.async_http_client = httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app)
+                )
+
+            async_folder: AsyncFolder = AsyncFolder(model)
+            results.append(
+                await run_the_async_benchmark(
+                    "async_folder.get_folders.nested",
+                    model,
+                    lambda index: async_folder.get_folders(nested_folders=True),
+                    iterations,
+                    warmup,
+                )
+            )
+
+    asyncio.run(_run_the_async_benchmarks())
+
+    return results
+
+
+def start_the_server(app: MockGrafana, port: int) -> str:
+    """The method includes a functionality to start the mock Grafana application as local uvicorn server inside a background thread
+
+    Args:
+        app (MockGrafana): Specify the mock Grafana application
+        port (int): Specify the port of the server
+
+    Raises:
+        Exception: The optional uvicorn dependency is not installed or the server did not start
+
+    Returns:
+        host (str): Returns the host of the server
+    """
+
+    if uvicorn is None:
+        raise Exception("Please install uvicorn to run the benchmarks against a server.")
+
+    server: uvicorn.Server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+
+    started_at: float = time.monotonic()
+    while not server.started:
+        if time.monotonic() - started_at > 10:
+            raise Exception("The mock Grafana server did not start.")
+        time.sleep(0.01)
+
+    return f"http://127.0.0.1:{port}"
+
+
+def main(arguments: list = None) -> dict:
+    """The method includes a functionality to run the benchmarks and to emit the results as JSON
+
+    Args:
+        arguments (list): Specify the command line arguments (default sys.argv[1:])
+
+    Returns:
+        report (dict): Returns the benchmark report
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmark the Grafana API SDK against a local mock Grafana"
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--folders", type=int, default=20)
+    parser.add_argument("--subfolders", type=int, default=3)
+    parser.add_argument("--folder-depth", type=int, default=3)
+    parser.add_argument("--dashboards", type=int, default=500)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--teams", type=int, default=200)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="The simulated server latency of every request in seconds",
+    )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Serve the mock Grafana by uvicorn on a local port instead of in-process",
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--output", help="The path of the JSON report. By default, stdout is used"
+    )
+    parsed_arguments: argparse.Namespace = parser.parse_args(arguments)
+
+    scale: MockGrafanaScale = MockGrafanaScale(
+        folders=parsed_arguments.folders,
+        subfolders=parsed_arguments.subfolders,
+        folder_depth=parsed_arguments.folder_depth,
+        dashboards=parsed_arguments.dashboards,
+        users=parsed_arguments.users,
+        teams=parsed_arguments.teams,
+        latency=parsed_arguments.latency,
+    )
+    app: MockGrafana = MockGrafana(scale)
+    host: str = (
+        start_the_server(app, parsed_arguments.port)
+        if parsed_arguments.server
+        else MOCK_GRAFANA_HOST
+    )
+
+    results: List[BenchmarkResult] = run_the_benchmarks(
+        host,
+        app,
+        parsed_arguments.iterations,
+        parsed_arguments.warmup,
+        parsed_arguments.page_size,
+        not parsed_arguments.server,
+    )
+
+    report: dict = dict(
+        {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "environment": dict(
+                {
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                    "httpx": httpx.__version__,
+                }
+            ),
+            "configuration": dict(
+                {
+                    "iterations": parsed_arguments.iterations,
+                    "warmup": parsed_arguments.warmup,
+                    "page_size": parsed_arguments.page_size,
+                    "server": parsed_arguments.server,
+                    "scale": asdict(scale),
+                }
+            ),
+            "benchmarks": [asdict(result) for result in results],
+        }
+    )
+
+    if parsed_arguments.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(parsed_arguments.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""The package includes the Grafana API SDK. The public classes of the submodules are available as attributes of the package e.g. grafana_api.APIModel or grafana_api.Dashboard. The submodules are imported lazily with the first access of a corresponding attribute, so that importing the package is fast and only the required submodules are loaded"""
+
+import importlib
+
+# The constant includes the submodules of the package that can be accessed as attributes of the package.
+_SUBMODULES: tuple = (
+    "admin",
+    "alerting",
+    "alerting_notifications",
+    "alerting_provisioning",
+    "annotations",
+    "api",
+    "authentication",
+    "correlations",
+    "dashboard",
+    "dashboard_backup",
+    "datasource",
+    "external_group",
+    "folder",
+    "legacy_alerting",
+    "legacy_playlist",
+    "library",
+    "licensing",
+    "model",
+    "organisation",
+    "other_http",
+    "playlist",
+    "preferences",
+    "query_history",
+    "rbac",
+    "reporting",
+    "search",
+    "service_account",
+    "short_url",
+    "snapshot",
+    "sso_settings",
+    "team",
+    "user",
+)
+
+# The constant includes the public classes of the package and the submodules that define them.
+_ATTRIBUTES: dict = {
+    "Api": "api",
+    "AsyncApi": "api",
+    "BatchExecutor": "api",
+    "JSONStreamParser": "api",
+    "Admin": "admin",
+    "Alerting": "alerting",
+    "AlertingNotifications": "alerting_notifications",
+    "AlertingProvisioning": "alerting_provisioning",
+    "Annotations": "annotations",
+    "Authentication": "authentication",
+    "Correlations": "correlations",
+    "Dashboard": "dashboard",
+    "AsyncDashboard": "dashboard",
+    "DashboardBackup": "dashboard_backup",
+    "Datasource": "datasource",
+    "DatasourcePermissions": "datasource",
+    "DatasourceLegacyPermissions": "datasource",
+    "DatasourceQueryResourceCaching": "datasource",
+    "DatasourceLabelBasedAccessControl": "datasource",
+    "AsyncDatasource": "datasource",
+    "ExternalGroup": "external_group",
+    "Folder": "folder",
+    "AsyncFolder": "folder",
+    "LegacyPlaylist": "legacy_playlist",
+    "Library": "library",
+    "Licensing": "licensing",
+    "Organisation": "organisation",
+    "OrganisationAdmin": "organisation",
+    "OtherHTTP": "other_http",
+    "Playlist": "playlist",
+    "Preferences": "preferences",
+    "QueryHistory": "query_history",
+    "RBAC": "rbac",
+    "Reporting": "reporting",
+    "Search": "search",
+    "AsyncSearch": "search",
+    "ServiceAccount": "service_account",
+    "ShortUrl": "short_url",
+    "Snapshot": "snapshot",
+    "SSOSettings": "sso_settings",
+    "Team": "team",
+    "AsyncTeam": "team",
+    "User": "user",
+    "CurrentUser": "user",
+    "AsyncUser": "user",
+    "AsyncCurrentUser": "user",
+    "APIEndpoints": "model",
+    "RequestsMethods": "model",
+    "SortDirection": "model",
+    "JSONCodec": "model",
+    "FolderIndex": "model",
+    "DatasourceRegistry": "model",
+    "CachedResponse": "model",
+    "ResponseCache": "model",
+    "QueryResultCache": "model",
+    "RetryPolicy": "model",
+    "TokenBucket": "model",
+    "RateLimiter": "model",
+    "CircuitState": "model",
+    "CircuitBreakerOpenError": "model",
+    "CircuitBreaker": "model",
+    "RequestEvent": "model",
+    "RequestHook": "model",
+    "EndpointMetrics": "model",
+    "MetricsCollector": "model",
+    "APIModel": "model",
+    "DatasourceQuery": "model",
+    "DatasourceQueryRequest": "model",
+    "DatasourceRuleQuery": "model",
+    "DatasourcePermission": "model",
+    "Alert": "model",
+    "AlertRuleQueryModelCondition": "model",
+    "AlertRuleQueryModel": "model",
+    "AlertQuery": "model",
+    "AlertRule": "model",
+    "EmbeddedContactPoint": "model",
+    "MatchType": "model",
+    "Matcher": "model",
+    "Route": "model",
+    "TimeRange": "model",
+    "TimeInterval": "model",
+    "MuteTimeInterval": "model",
+    "Silence": "model",
+    "AlertmanagerConfig": "model",
+    "AlertmanagerReceivers": "model",
+    "RulerRule": "model",
+    "UserObject": "model",
+    "PlaylistObject": "model",
+    "PlaylistItemObject": "model",
+    "TeamObject": "model",
+    "QueryDatasourceObject": "model",
+    "QueryObject": "model",
+    "CorrelationObject": "model",
+    "FindAnnotationObject": "model",
+    "AnnotationObject": "model",
+    "AnnotationGraphiteObject": "model",
+    "GlobalUser": "model",
+    "RolePermission": "model",
+    "CustomRole": "model",
+    "DatasourceCache": "model",
+    "PublicDashboard": "model",
+    "SSOSetting": "model",
+    "DashboardSchema": "model",
+    "Report": "model",
+    "ReportBrandingSettings": "model",
+    "BatchResult": "model",
+    "DeployStatus": "model",
+    "DashboardDeployResult": "model",
+    "ExportFormat": "model",
+    "DataFrameBackend": "model",
+    "DataFrameField": "model",
+    "DataFrame": "model",
+    "DataFrameDecoder": "model",
+}
+
+__all__: list = [*_ATTRIBUTES.keys(), *_SUBMODULES]
+
+
+def __getattr__(name: str) -> any:
+    """The function includes a functionality to lazily import the submodule of a requested attribute of the package
+
+    Args:
+        name (str): Specify the name of the requested attribute
+
+    Raises:
+        AttributeError: The package has no attribute with the specified name
+
+    Returns:
+        attribute (any): Returns the requested class or submodule
+    """
+
+    if name in _ATTRIBUTES:
+        value: any = getattr(
+            importlib.import_module(f".{_ATTRIBUTES[name]}", __name__), name
+        )
+    elif name in _SUBMODULES:
+        value: any = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """The function includes a functionality to list the attributes of the package including the lazily imported ones
+
+    Returns:
+        attributes (list): Returns the attributes of the package
+    """
+
+    return sorted(set(globals().keys()) | set(__all__))
@@ -1,6 +1,6 @@
 import datetime
-import json
 import logging
+from typing import Generator
 
 from .model import (
     APIModel,
@@ -88,7 +88,7 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_ALERTMANAGER.value}/{datasource_uid}/api/v2/alerts",
                 RequestsMethods.POST,
-                json.dumps(alerts_json_list),
+                alerts_json_list,
             )
 
             if api_call != dict():
@@ -251,7 +251,7 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_ALERTMANAGER.value}/{datasource_uid}/api/v2/silences",
                 RequestsMethods.POST,
-                json.dumps(silence_json_dict),
+                silence_json_dict,
             )
 
             if api_call == dict() or (
@@ -402,7 +402,7 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_ALERTMANAGER.value}/{datasource_uid}/config/api/v1/alerts",
                 RequestsMethods.POST,
-                json.dumps(alertmanager_configuration_json_dict),
+                alertmanager_configuration_json_dict,
                 response_status_code=True,
             )
 
@@ -472,7 +472,7 @@ class Alerting:
             api_call: any = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_ALERTMANAGER.value}/{datasource_uid}/config/api/v1/receivers/test",
                 RequestsMethods.POST,
-                json.dumps(alertmanager_receivers_json_dict),
+                alertmanager_receivers_json_dict,
                 response_status_code=True,
             )
 
@@ -562,6 +562,31 @@ class Alerting:
             logging.error("There is no datasource_uid defined.")
             raise ValueError
 
+    def iter_prometheus_rule_groups(
+        self, datasource_uid: str = "grafana"
+    ) -> Generator[dict, None, None]:
+        """The method includes a functionality to stream all prometheus rule groups specified by the datasource_uid
+
+        Args:
+            datasource_uid (str): Specify the datasource uid or recipient of the alerts (default grafana)
+
+        Raises:
+            ValueError: Missed specifying a necessary value or the response does not include rule groups
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            groups (Generator[dict, None, None]): Returns the prometheus rule groups
+        """
+
+        if len(datasource_uid) != 0:
+            yield from Api(self.grafana_api_model).iterate_the_json_items(
+                f"{APIEndpoints.ALERTS_PROMETHEUS.value}/{datasource_uid}/api/v1/rules",
+                ("data", "groups"),
+            )
+        else:
+            logging.error("There is no datasource_uid defined.")
+            raise ValueError
+
     def get_ruler_rules(self, datasource_uid: str = "grafana") -> dict:
         """The method includes a functionality to get all ruler rules specified by the datasource_uid
 
@@ -590,6 +615,30 @@ class Alerting:
             logging.error("There is no datasource_uid defined.")
             raise ValueError
 
+    def iter_ruler_rules(
+        self, datasource_uid: str = "grafana"
+    ) -> Generator[tuple, None, None]:
+        """The method includes a functionality to stream all ruler rules specified by the datasource_uid
+
+        Args:
+            datasource_uid (str): Specify the datasource uid or recipient of the alerts (default grafana)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            namespaces (Generator[tuple, None, None]): Returns the namespace and the list of the rule groups of every namespace
+        """
+
+        if len(datasource_uid) != 0:
+            yield from Api(self.grafana_api_model).iterate_the_json_items(
+                f"{APIEndpoints.ALERTS_RULER.value}/{datasource_uid}/api/v1/rules",
+            )
+        else:
+            logging.error("There is no datasource_uid defined.")
+            raise ValueError
+
     def delete_ruler_namespace(self, namespace: str, datasource_uid: str = "grafana"):
         """The method includes a functionality to delete a ruler namespace specified by the namespace name and the datasource_uid
 
@@ -701,13 +750,11 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_RULER.value}/{datasource_uid}/api/v1/rules/{namespace}",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "interval": interval,
-                        "name": group_name,
-                        "rules": rules_json_list,
-                    }
-                ),
+                {
+                    "interval": interval,
+                    "name": group_name,
+                    "rules": rules_json_list,
+                },
             )
 
             if api_call != dict():
@@ -831,12 +878,10 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 "/api/v1/eval",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "data": datasource_rule_query_objects_json,
-                        "now": str(datetime.datetime.now()),
-                    }
-                ),
+                {
+                    "data": datasource_rule_query_objects_json,
+                    "now": str(datetime.datetime.now()),
+                },
             )
 
             if api_call == dict() or api_call.get("message") is not None:
@@ -903,16 +948,14 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"/api/v1/rule/test/{datasource_uid}",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "expr": expr,
-                        "grafana_condition": {
-                            "condition": condition,
-                            "data": datasource_rule_query_objects_json,
-                            "now": str(datetime.datetime.now()),
-                        },
-                    }
-                ),
+                {
+                    "expr": expr,
+                    "grafana_condition": {
+                        "condition": condition,
+                        "data": datasource_rule_query_objects_json,
+                        "now": str(datetime.datetime.now()),
+                    },
+                },
             )
 
             if api_call == dict() or api_call.get("message") is not None:
@@ -968,12 +1011,10 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 "/api/v1/rule/backtest",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "condition": condition,
-                        "data": datasource_rule_query_objects_json,
-                    }
-                ),
+                {
+                    "condition": condition,
+                    "data": datasource_rule_query_objects_json,
+                },
             )
 
             if api_call == dict() or api_call.get("message") is not None:
@@ -1062,12 +1103,10 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_NGALERT.value}/admin_config",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "Alertmanagers": alert_managers,
-                        "alertmanagersChoice": alertmanagers_choice,
-                    }
-                ),
+                {
+                    "Alertmanagers": alert_managers,
+                    "alertmanagersChoice": alertmanagers_choice,
+                },
             )
 
             if api_call != dict():
@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import List
 
@@ -80,7 +79,7 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/alert-rules",
                 RequestsMethods.POST,
-                json.dumps(self._create_alert_rule_dictionary(alert_rule)),
+                self._create_alert_rule_dictionary(alert_rule),
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -116,7 +115,7 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/alert-rules/{uid}",
                 RequestsMethods.PUT,
-                json.dumps(self._create_alert_rule_dictionary(alert_rule)),
+                self._create_alert_rule_dictionary(alert_rule),
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -157,7 +156,7 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/folder/{folder_uid}/rule-groups/{group}",
                 RequestsMethods.PUT,
-                json.dumps({"interval": alert_rule_group_interval}),
+                {"interval": alert_rule_group_interval},
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -249,16 +248,14 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/contact-points",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "name": embedded_contact_point.name,
-                        "type": embedded_contact_point.type,
-                        "settings": embedded_contact_point.settings,
-                        "disableResolveMessage": embedded_contact_point.disable_resolve_message,
-                        "provenance": embedded_contact_point.provenance,
-                        "UID": embedded_contact_point.uid,
-                    }
-                ),
+                {
+                    "name": embedded_contact_point.name,
+                    "type": embedded_contact_point.type,
+                    "settings": embedded_contact_point.settings,
+                    "disableResolveMessage": embedded_contact_point.disable_resolve_message,
+                    "provenance": embedded_contact_point.provenance,
+                    "UID": embedded_contact_point.uid,
+                },
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -297,16 +294,14 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/contact-points/{uid}",
                 RequestsMethods.PUT,
-                json.dumps(
-                    {
-                        "name": embedded_contact_point.name,
-                        "type": embedded_contact_point.type,
-                        "settings": embedded_contact_point.settings,
-                        "disableResolveMessage": embedded_contact_point.disable_resolve_message,
-                        "provenance": embedded_contact_point.provenance,
-                        "UID": embedded_contact_point.uid,
-                    }
-                ),
+                {
+                    "name": embedded_contact_point.name,
+                    "type": embedded_contact_point.type,
+                    "settings": embedded_contact_point.settings,
+                    "disableResolveMessage": embedded_contact_point.disable_resolve_message,
+                    "provenance": embedded_contact_point.provenance,
+                    "UID": embedded_contact_point.uid,
+                },
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -390,7 +385,7 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/policies",
                 RequestsMethods.PUT,
-                json.dumps(self._create_alert_route_dictionary(route)),
+                self._create_alert_route_dictionary(route),
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -473,7 +468,7 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/mute-timings",
                 RequestsMethods.POST,
-                json.dumps(self._create_mute_timing_dictionary(mute_time_interval)),
+                self._create_mute_timing_dictionary(mute_time_interval),
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -512,7 +507,7 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/mute-timings/{name}",
                 RequestsMethods.PUT,
-                json.dumps(self._create_mute_timing_dictionary(mute_time_interval)),
+                self._create_mute_timing_dictionary(mute_time_interval),
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -627,7 +622,7 @@ class AlertingProvisioning:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTING_PROVISIONING.value}/templates/{name}",
                 RequestsMethods.PUT,
-                json.dumps({"template": message_template}),
+                {"template": message_template},
                 response_status_code=True,
                 disable_provenance_header=disable_provenance,
             )
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -147,7 +146,7 @@ class Annotations:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.ANNOTATIONS.value,
                 RequestsMethods.POST,
-                json.dumps(annotation_object),
+                annotation_object,
             )
 
             if (
@@ -198,7 +197,7 @@ class Annotations:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ANNOTATIONS.value}/graphite",
                 RequestsMethods.POST,
-                json.dumps(annotation_object),
+                annotation_object,
             )
 
             if (
@@ -250,7 +249,7 @@ class Annotations:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ANNOTATIONS.value}/{id}",
                 RequestsMethods.PATCH,
-                json.dumps(annotation_object),
+                annotation_object,
             )
 
             if api_call.get("message") != "Annotation patched":
@@ -1,13 +1,39 @@
 import logging
 import json
 import base64
-from typing import Union
+import contextlib
+import time
+import asyncio
+import inspect
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    Union,
+)
 
 import httpx
 from httpx import ConnectError
-import asyncio
 
-from .model import RequestsMethods, ERROR_MESSAGES, APIModel
+from .model import (
+    RequestsMethods,
+    ERROR_MESSAGES,
+    APIModel,
+    BatchResult,
+    CachedResponse,
+    ResponseCache,
+    RetryPolicy,
+    CircuitBreaker,
+    RequestEvent,
+)
 
 
 class Api:
@@ -27,7 +53,7 @@ class Api:
         self,
         api_call: str,
         method: RequestsMethods = RequestsMethods.GET,
-        json_complete: str = None,
+        json_complete: Union[str, bytes, dict, list] = None,
         org_id_header: int = None,
         disable_provenance_header: bool = False,
         response_status_code: bool = False,
@@ -37,7 +63,7 @@ class Api:
         Args:
             api_call (str): Specify the API call endpoint
             method (RequestsMethods): Specify the used method (default GET)
-            json_complete (str): Specify the inserted JSON as string
+            json_complete (Union[str, bytes, dict, list]): Specify the inserted JSON as string, bytes or as object that is serialized by the JSON codec of the model
             org_id_header (int): Specify the optional organization id as header for the corresponding API call
             disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
             response_status_code (bool): Specify if the response should include the original status code (default False)
@@ -50,10 +76,218 @@ class Api:
         """
 
         api_url: str = f"{self.grafana_api_model.host}{api_call}"
+        headers: dict = self._create_the_http_api_headers(
+            org_id_header, disable_provenance_header
+        )
+
+        if json_complete is not None and not isinstance(json_complete, (str, bytes)):
+            json_complete = self.grafana_api_model.json_codec.dumps(json_complete)
+
+        http: httpx.Client = self.get_the_http_api_client()
+
+        return self._execute_the_api_call(
+            http, method, api_url, response_status_code, json_complete, headers
+        )
+
+    @contextlib.contextmanager
+    def stream_the_api(
+        self,
+        api_call: str,
+        method: RequestsMethods = RequestsMethods.GET,
+        json_complete: Union[str, bytes, dict, list] = None,
+        org_id_header: int = None,
+        disable_provenance_header: bool = False,
+    ) -> Generator[httpx.Response, None, None]:
+        """The method includes a functionality to execute a defined API call against the Grafana endpoints and to stream the response content instead of reading it into memory. The request respects the circuit breaker, the rate limiter, the request hooks and the retry policy of the model, but bypasses the response cache
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            method (RequestsMethods): Specify the used method (default GET)
+            json_complete (Union[str, bytes, dict, list]): Specify the inserted JSON as string, bytes or as object that is serialized by the JSON codec of the model (default None)
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+            disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            response (Generator[httpx.Response, None, None]): Returns the context manager of the streamed response. The response is closed by leaving the context
+        """
+
+        api_url: str = f"{self.grafana_api_model.host}{api_call}"
+        headers: dict = self._create_the_http_api_headers(
+            org_id_header, disable_provenance_header
+        )
+
+        if json_complete is not None and not isinstance(json_complete, (str, bytes)):
+            json_complete = self.grafana_api_model.json_codec.dumps(json_complete)
+
+        response: httpx.Response = self._send_the_uncached_http_request(
+            self.get_the_http_api_client(),
+            method.value,
+            api_url,
+            headers,
+            json_complete,
+            stream=True,
+        )
+
+        try:
+            if (
+                self.grafana_api_model.response_cache is not None
+                and method.value != RequestsMethods.GET.value
+            ):
+                self.grafana_api_model.response_cache.clear()
+
+            if response.is_error:
+                response.read()
+                self._check_the_streamed_response(response)
+
+            yield response
+        finally:
+            response.close()
+
+    def iterate_the_json_items(
+        self,
+        api_call: str,
+        path: tuple = (),
+        method: RequestsMethods = RequestsMethods.GET,
+        json_complete: Union[str, bytes, dict, list] = None,
+        org_id_header: int = None,
+        disable_provenance_header: bool = False,
+    ) -> Generator[any, None, None]:
+        """The method includes a functionality to stream the response of a defined API call and to incrementally decode the items of a JSON array or the key value pairs of a JSON object
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            path (tuple): Specify the object keys of the path to the JSON array or object e.g. ("data", "groups"). Please use an empty path for the root of the response (default ())
+            method (RequestsMethods): Specify the used method (default GET)
+            json_complete (Union[str, bytes, dict, list]): Specify the inserted JSON as string, bytes or as object that is serialized by the JSON codec of the model (default None)
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+            disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+
+        Raises:
+            ValueError: The response is not valid JSON or does not include the path
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            items (Generator[any, None, None]): Returns the items of a JSON array or the key value pairs as tuples of a JSON object
+        """
+
+        with self.stream_the_api(
+            api_call, method, json_complete, org_id_header, disable_provenance_header
+        ) as response:
+            json_stream_parser: JSONStreamParser = JSONStreamParser(
+                path, self.grafana_api_model.json_codec.loads
+            )
+
+            for chunk in response.iter_text():
+                yield from json_stream_parser.feed(chunk)
+
+            yield from json_stream_parser.close()
+
+    def iterate_the_lines(
+        self,
+        api_call: str,
+        org_id_header: int = None,
+    ) -> Generator[str, None, None]:
+        """The method includes a functionality to stream the response of a defined GET API call line by line
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            lines (Generator[str, None, None]): Returns the lines of the response
+        """
+
+        with self.stream_the_api(api_call, org_id_header=org_id_header) as response:
+            yield from response.iter_lines()
+
+    def write_the_api_response(
+        self,
+        api_call: str,
+        target: Union[str, BinaryIO],
+        org_id_header: int = None,
+    ) -> int:
+        """The method includes a functionality to stream the raw response of a defined GET API call directly to a file without decoding it
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            target (Union[str, BinaryIO]): Specify the path of the file or a binary file object
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            size (int): Returns the number of the written bytes
+        """
+
+        with self.stream_the_api(api_call, org_id_header=org_id_header) as response:
+            if isinstance(target, str):
+                with open(target, "wb") as file:
+                    return Api._write_the_chunks(response.iter_bytes(), file)
+
+            return Api._write_the_chunks(response.iter_bytes(), target)
+
+    @staticmethod
+    def _write_the_chunks(chunks: Iterable[bytes], file: BinaryIO) -> int:
+        """The method includes a functionality to write the chunks of a response to a binary file
+
+        Args:
+            chunks (Iterable[bytes]): Specify the chunks of the response
+            file (BinaryIO): Specify the binary file object
+
+        Returns:
+            size (int): Returns the number of the written bytes
+        """
+
+        size: int = 0
+        for chunk in chunks:
+            file.write(chunk)
+            size += len(chunk)
+
+        return size
+
+    def _check_the_streamed_response(self, response: httpx.Response):
+        """The method includes a functionality to check a streamed error response. Invalid API key errors are raised as connection errors
+
+        Args:
+            response (httpx.Response): Specify the read error response
+
+        Raises:
+            ConnectError: The API key is invalid
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        self._check_the_api_call_response(response)
+        logging.error(
+            f"The streamed API call failed with {response.status_code}: {response.text}."
+        )
+        raise Exception
+
+    def _create_the_http_api_headers(
+        self, org_id_header: int = None, disable_provenance_header: bool = False
+    ) -> dict:
+        """The method includes a functionality to create the headers of an API call
+
+        Args:
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+            disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+
+        Returns:
+            headers (dict): Returns the headers of the API call
+        """
 
         headers: dict = dict()
         if self.grafana_api_model.headers is not None:
-            headers: dict = self.grafana_api_model.headers
+            headers.update(self.grafana_api_model.headers)
 
         headers.update(
             {"Authorization": f"Bearer {self.grafana_api_model.token}"},
@@ -74,28 +308,12 @@ class Api:
         headers["Accept"] = "application/json"
 
         if org_id_header is not None and isinstance(org_id_header, int):
-            headers["X-Grafana-Org-Id"] = org_id_header
+            headers["X-Grafana-Org-Id"] = f"{org_id_header}"
 
         if isinstance(disable_provenance_header, bool) and disable_provenance_header:
             headers["X-Disable-Provenance"] = f"{disable_provenance_header}"
 
-        http: Union[httpx.Client, httpx.AsyncClient] = self.create_the_http_api_client(
-            headers
-        )
-
-        if self.grafana_api_model.http2_support:
-
-            async def _execute_async_api_call():
-                async with http:
-                    return await self._execute_the_async_api_call(
-                        http, method, api_url, response_status_code, json_complete
-                    )
-
-            return asyncio.run(_execute_async_api_call())
-
-        return self._execute_the_api_call(
-            http, method, api_url, response_status_code, json_complete
-        )
+        return headers
 
     def _execute_the_api_call(
         self,
@@ -103,7 +321,8 @@ class Api:
         method: RequestsMethods,
         api_url: str,
         response_status_code: bool,
-        json_complete: str,
+        json_complete: Union[str, bytes],
+        headers: dict = None,
     ) -> any:
         """The method includes a functionality to execute a synchronous api call
 
@@ -112,7 +331,8 @@ class Api:
             method (RequestsMethods): Specify the used method
             api_url (str): Specify the used api url
             response_status_code (bool): Specify if the response code should be returned
-            json_complete (str): Specify the forwarded json in case of patch, post or put calls
+            json_complete (Union[str, bytes]): Specify the forwarded json in case of patch, post or put calls
+            headers (dict): Specify the optional request headers (default None)
 
         Raises:
             Exception: Unspecified error by executing the API call
@@ -124,13 +344,15 @@ class Api:
         try:
             if method.value == RequestsMethods.GET.value:
                 return self._check_the_api_call_response(
-                    http.request("GET", api_url),
+                    self._send_the_http_request(http, "GET", api_url, headers),
                     response_status_code,
                 )
             elif method.value == RequestsMethods.PUT.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        http.request("PUT", api_url, content=json_complete),
+                        self._send_the_http_request(
+                            http, "PUT", api_url, headers, json_complete
+                        ),
                         response_status_code,
                     )
                 else:
@@ -139,7 +361,9 @@ class Api:
             elif method.value == RequestsMethods.POST.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        http.request("POST", api_url, content=json_complete),
+                        self._send_the_http_request(
+                            http, "POST", api_url, headers, json_complete
+                        ),
                         response_status_code,
                     )
                 else:
@@ -148,7 +372,9 @@ class Api:
             elif method.value == RequestsMethods.PATCH.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        http.request("PATCH", api_url, content=json_complete),
+                        self._send_the_http_request(
+                            http, "PATCH", api_url, headers, json_complete
+                        ),
                         response_status_code,
                     )
                 else:
@@ -156,7 +382,8 @@ class Api:
                     raise Exception
             elif method.value == RequestsMethods.DELETE.value:
                 return self._check_the_api_call_response(
-                    http.request("DELETE", api_url), response_status_code
+                    self._send_the_http_request(http, "DELETE", api_url, headers),
+                    response_status_code,
                 )
             else:
                 logging.error("Please define a valid method.")
@@ -170,7 +397,8 @@ class Api:
         method: RequestsMethods,
         api_url: str,
         response_status_code: bool,
-        json_complete: str,
+        json_complete: Union[str, bytes],
+        headers: dict = None,
     ):
         """The method includes a functionality to execute an asynchronous api call
 
@@ -179,7 +407,8 @@ class Api:
             method (RequestsMethods): Specify the used method
             api_url (str): Specify the used api url
             response_status_code (bool): Specify if the response code should be returned
-            json_complete (str): Specify the forwarded json in case of patch, post or put calls
+            json_complete (Union[str, bytes]): Specify the forwarded json in case of patch, post or put calls
+            headers (dict): Specify the optional request headers (default None)
 
         Raises:
             Exception: Unspecified error by executing the API call
@@ -191,13 +420,17 @@ class Api:
         try:
             if method.value == RequestsMethods.GET.value:
                 return self._check_the_api_call_response(
-                    await http.request("GET", api_url),
+                    await self._send_the_async_http_request(
+                        http, "GET", api_url, headers
+                    ),
                     response_status_code,
                 )
             elif method.value == RequestsMethods.PUT.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        await http.request("PUT", api_url, content=json_complete),
+                        await self._send_the_async_http_request(
+                            http, "PUT", api_url, headers, json_complete
+                        ),
                         response_status_code,
                     )
                 else:
@@ -206,7 +439,9 @@ class Api:
             elif method.value == RequestsMethods.POST.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        await http.request("POST", api_url, content=json_complete),
+                        await self._send_the_async_http_request(
+                            http, "POST", api_url, headers, json_complete
+                        ),
                         response_status_code,
                     )
                 else:
@@ -215,7 +450,9 @@ class Api:
             elif method.value == RequestsMethods.PATCH.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        await http.request("PATCH", api_url, content=json_complete),
+                        await self._send_the_async_http_request(
+                            http, "PATCH", api_url, headers, json_complete
+                        ),
                         response_status_code,
                     )
                 else:
@@ -223,7 +460,10 @@ class Api:
                     raise Exception
             elif method.value == RequestsMethods.DELETE.value:
                 return self._check_the_api_call_response(
-                    await http.request("DELETE", api_url), response_status_code
+                    await self._send_the_async_http_request(
+                        http, "DELETE", api_url, headers
+                    ),
+                    response_status_code,
                 )
             else:
                 logging.error("Please define a valid method.")
@@ -231,126 +471,1842 @@ class Api:
         except Exception as e:
             raise e
 
-    @staticmethod
-    def _check_the_api_call_response(
-        response: any = None, response_status_code: bool = False
-    ) -> any:
-        """The method includes a functionality to check the output of API call method for errors
+    def _send_the_http_request(
+        self,
+        http: httpx.Client,
+        method: str,
+        api_url: str,
+        headers: dict,
+        content: Union[str, bytes] = None,
+    ) -> httpx.Response:
+        """The method includes a functionality to send a synchronous HTTP request. GET requests are served by the optional response cache of the model and all other requests clear the cache
 
         Args:
-            response (any): Specify the inserted response
-            response_status_code (bool): Specify if the original status code should be attached to the result (default False)
+            http (httpx.Client): Specify the used synchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the request headers
+            content (Union[str, bytes]): Specify the optional request content (default None)
 
         Raises:
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (any): Returns the value of the api call
+            response (httpx.Response): Returns the response
         """
 
-        if Api._check_if_valid_json(response.text):
-            if (
-                len(json.loads(response.text)) != 0
-                and type(json.loads(response.text)) == dict
-            ):
-                if (
-                    "message" in json.loads(response.text).keys()
-                    and json.loads(response.text)["message"] in ERROR_MESSAGES
-                ):
-                    logging.error(json.loads(response.text)["message"])
-                    raise ConnectError(str(json.loads(response.text)["message"]))
+        response_cache: ResponseCache = self.grafana_api_model.response_cache
 
-            json_response: Union[dict, list] = json.loads(response.text)
+        if response_cache is None:
+            return self._send_the_uncached_http_request(
+                http, method, api_url, headers, content
+            )
 
-            if isinstance(json_response, dict) and response_status_code:
-                json_response.update({"status": response.status_code})
-            elif isinstance(json_response, list) and response_status_code:
-                json_response[0].update({"status": response.status_code})
-            return json_response
-        else:
-            if response_status_code:
-                return dict({"status": response.status_code, "data": response.text})
-            else:
-                return response
+        if method != RequestsMethods.GET.value:
+            response: httpx.Response = self._send_the_uncached_http_request(
+                http, method, api_url, headers, content
+            )
+            response_cache.clear()
+            return response
 
-    @staticmethod
-    def _check_if_valid_json(response: str) -> bool:
-        """The method includes a functionality to check if the response json is valid
+        cache_key: tuple = ResponseCache.create_the_key(api_url, headers)
+        cached_response: Union[CachedResponse, None] = response_cache.get(cache_key)
+
+        if cached_response is not None and cached_response.is_fresh():
+            return cached_response.response
+
+        return Api._process_the_cached_response(
+            response_cache,
+            cache_key,
+            cached_response,
+            self._send_the_uncached_http_request(
+                http,
+                method,
+                api_url,
+                Api._create_the_conditional_headers(headers, cached_response),
+            ),
+        )
+
+    def _send_the_uncached_http_request(
+        self,
+        http: httpx.Client,
+        method: str,
+        api_url: str,
+        headers: dict,
+        content: Union[str, bytes] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """The method includes a functionality to send a synchronous HTTP request. The request is guarded by the optional circuit breaker of the model
 
         Args:
-            response (str): Specify the inserted response json as string
+            http (httpx.Client): Specify the used synchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the request headers
+            content (Union[str, bytes]): Specify the optional request content (default None)
+            stream (bool): Specify if the response content should be streamed instead of being read (default False)
+
+        Raises:
+            CircuitBreakerOpenError: The request is rejected by the open circuit breaker
+            Exception: Unspecified error by executing the API call
 
         Returns:
-            result (bool): Returns if the json is valid or not
+            response (httpx.Response): Returns the response
         """
 
-        valid_json: bool = False
+        circuit_breaker: CircuitBreaker = self.grafana_api_model.circuit_breaker
 
-        if response.encode() not in [b'""\n', b"null"]:
-            try:
-                json.loads(response)
-                valid_json = True
-            except (TypeError, ValueError):
-                valid_json = False
+        if circuit_breaker is None:
+            return self._send_the_retried_http_request(
+                http, method, api_url, headers, content, stream
+            )
 
-        return valid_json
+        circuit_breaker.before_request()
 
-    @staticmethod
-    def prepare_api_string(query_string: str) -> str:
-        """The method includes a functionality to prepare the api string for the queries
+        try:
+            response: httpx.Response = self._send_the_retried_http_request(
+                http, method, api_url, headers, content, stream
+            )
+        except Exception as e:
+            circuit_breaker.record_failure()
+            raise e
+
+        circuit_breaker.record_response(response.status_code)
+        return response
+
+    def _send_the_retried_http_request(
+        self,
+        http: httpx.Client,
+        method: str,
+        api_url: str,
+        headers: dict,
+        content: Union[str, bytes] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """The method includes a functionality to send a synchronous HTTP request. Every attempt respects the optional rate limiter, is reported to the optional request hooks and the request is retried according to the optional retry policy of the model
 
         Args:
-            query_string (str): Specify the corresponding query string
+            http (httpx.Client): Specify the used synchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the request headers
+            content (Union[str, bytes]): Specify the optional request content (default None)
+            stream (bool): Specify if the response content should be streamed instead of being read (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
 
         Returns:
-            query_string (str): Returns the adjusted query string
+            response (httpx.Response): Returns the response
         """
 
-        if len(query_string) >= 1:
-            return f"{query_string}&"
-        else:
-            return query_string
+        attempt: int = 0
 
-    def create_the_http_api_client(
-        self, headers: dict = None
-    ) -> Union[httpx.Client, httpx.AsyncClient]:
-        """The method includes a functionality to create the corresponding HTTP client
+        while True:
+            if self.grafana_api_model.rate_limiter is not None:
+                self.grafana_api_model.rate_limiter.acquire(api_url)
+
+            request_event: Union[RequestEvent, None] = self._start_the_request_event(
+                method, api_url, attempt, content
+            )
+
+            try:
+                response: httpx.Response = self._execute_the_http_request(
+                    http, method, api_url, headers, content, stream
+                )
+            except Exception as e:
+                self._finish_the_request_event(request_event, error=e)
+                backoff: Union[float, None] = self._get_the_retry_backoff(
+                    method, api_url, attempt, error=e
+                )
+                if backoff is None:
+                    raise e
+            else:
+                self._finish_the_request_event(request_event, response=response)
+                backoff: Union[float, None] = self._get_the_retry_backoff(
+                    method, api_url, attempt, response=response
+                )
+                if backoff is None:
+                    return response
+                response.close()
+
+            time.sleep(backoff)
+            attempt += 1
+
+    def _execute_the_http_request(
+        self,
+        http: httpx.Client,
+        method: str,
+        api_url: str,
+        headers: dict,
+        content: Union[str, bytes] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """The method includes a functionality to execute a single synchronous HTTP request. In the HTTP/2 mode, the request waits for a free stream of the multiplexed connections. The stream of a streamed response is released by closing the response
 
         Args:
-            headers (dict): Specify the optional inserted headers (default None)
+            http (httpx.Client): Specify the used synchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the request headers
+            content (Union[str, bytes]): Specify the optional request content (default None)
+            stream (bool): Specify if the response content should be streamed instead of being read (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
 
         Returns:
-            client (Union[httpx.Client, httpx.AsyncClient]): Returns the corresponding client
+            response (httpx.Response): Returns the response
         """
 
-        transport: httpx.HTTPTransport = httpx.HTTPTransport(
-            verify=self.grafana_api_model.ssl_context,
-            retries=self.grafana_api_model.retries,
+        stream_semaphore: Union[threading.BoundedSemaphore, None] = (
+            self.grafana_api_model.stream_semaphore
         )
-        limits: httpx.Limits = httpx.Limits(
-            max_connections=self.grafana_api_model.num_pools
+
+        if stream_semaphore is not None:
+            stream_semaphore.acquire()
+
+        try:
+            if stream:
+                response: httpx.Response = http.send(
+                    http.build_request(
+                        method, api_url, content=content, headers=headers
+                    ),
+                    stream=True,
+                )
+
+                if stream_semaphore is not None:
+                    response.stream = _ReleasingByteStream(
+                        response.stream, stream_semaphore.release
+                    )
+                    stream_semaphore = None
+
+                return response
+            elif content is None:
+                return http.request(method, api_url, headers=headers)
+            else:
+                return http.request(method, api_url, content=content, headers=headers)
+        finally:
+            if stream_semaphore is not None:
+                stream_semaphore.release()
+
+    async def _execute_the_async_http_request(
+        self,
+        http: httpx.AsyncClient,
+        method: str,
+        api_url: str,
+        headers: dict,
+        content: Union[str, bytes] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """The method includes a functionality to execute a single asynchronous HTTP request. In the HTTP/2 mode, the request waits for a free stream of the multiplexed connections. The stream of a streamed response is released by closing the response
+
+        Args:
+            http (httpx.AsyncClient): Specify the used asynchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the request headers
+            content (Union[str, bytes]): Specify the optional request content (default None)
+            stream (bool): Specify if the response content should be streamed instead of being read (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            response (httpx.Response): Returns the response
+        """
+
+        async_stream_semaphore: Union[asyncio.Semaphore, None] = (
+            self.grafana_api_model.async_stream_semaphore
         )
-        http2: bool = self.grafana_api_model.http2_support
 
-        if http2:
-            async_transport: httpx.AsyncHTTPTransport = httpx.AsyncHTTPTransport(
-                retries=self.grafana_api_model.retries, http2=http2
-            )
-            return httpx.AsyncClient(
-                http2=True,
-                limits=limits,
-                timeout=self.grafana_api_model.timeout,
-                headers=headers,
-                transport=async_transport,
-                verify=self.grafana_api_model.ssl_context,
-                follow_redirects=self.grafana_api_model.follow_redirects,
+        if async_stream_semaphore is not None:
+            await async_stream_semaphore.acquire()
+
+        try:
+            if stream:
+                response: httpx.Response = await http.send(
+                    http.build_request(
+                        method, api_url, content=content, headers=headers
+                    ),
+                    stream=True,
+                )
+
+                if async_stream_semaphore is not None:
+                    response.stream = _ReleasingByteStream(
+                        response.stream, async_stream_semaphore.release
+                    )
+                    async_stream_semaphore = None
+
+                return response
+            elif content is None:
+                return await http.request(method, api_url, headers=headers)
+            else:
+                return await http.request(
+                    method, api_url, content=content, headers=headers
+                )
+        finally:
+            if async_stream_semaphore is not None:
+                async_stream_semaphore.release()
+
+    def _start_the_request_event(
+        self,
+        method: str,
+        api_url: str,
+        attempt: int,
+        content: Union[str, bytes] = None,
+    ) -> Union[RequestEvent, None]:
+        """The method includes a functionality to create the event of a request attempt and to call the before request hooks of the model
+
+        Args:
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            attempt (int): Specify the number of the already executed retries
+            content (Union[str, bytes]): Specify the optional request content (default None)
+
+        Returns:
+            request_event (Union[RequestEvent, None]): Returns the event of the request attempt or None, if no request hooks are defined
+        """
+
+        if len(self.grafana_api_model.request_hooks) == 0:
+            return None
+
+        if content is None:
+            request_bytes: int = 0
+        elif isinstance(content, str):
+            request_bytes: int = len(content.encode("utf-8"))
+        else:
+            request_bytes: int = len(content)
+
+        request_event: RequestEvent = RequestEvent(
+            method, api_url, attempt, request_bytes
+        )
+
+        for request_hook in self.grafana_api_model.request_hooks:
+            Api._call_the_request_hook(request_hook.before_request, request_event)
+
+        return request_event
+
+    def _finish_the_request_event(
+        self,
+        request_event: Union[RequestEvent, None],
+        response: httpx.Response = None,
+        error: Exception = None,
+    ):
+        """The method includes a functionality to complete the event of a request attempt and to call the after response or the error hooks of the model
+
+        Args:
+            request_event (Union[RequestEvent, None]): Specify the event of the request attempt
+            response (httpx.Response): Specify the response of the request (default None)
+            error (Exception): Specify the error of the request (default None)
+
+        Returns:
+            None
+        """
+
+        if request_event is None:
+            return
+
+        request_event.duration = time.monotonic() - request_event.started_at
+
+        if response is not None:
+            request_event.status_code = response.status_code
+            try:
+                request_event.response_bytes = len(response.content)
+            except httpx.ResponseNotRead:
+                request_event.response_bytes = int(
+                    response.headers.get("Content-Length", 0)
+                )
+
+            for request_hook in self.grafana_api_model.request_hooks:
+                Api._call_the_request_hook(
+                    request_hook.after_response, request_event, response
+                )
+        else:
+            request_event.error = error
+
+            for request_hook in self.grafana_api_model.request_hooks:
+                Api._call_the_request_hook(request_hook.on_error, request_event, error)
+
+    @staticmethod
+    def _call_the_request_hook(hook: Callable, *args):
+        """The method includes a functionality to call a request hook. Errors of the hook are logged and do not affect the request
+
+        Args:
+            hook (Callable): Specify the hook method
+            *args: Specify the arguments of the hook
+
+        Returns:
+            None
+        """
+
+        try:
+            hook(*args)
+        except Exception as e:
+            logging.error(f"The request hook {hook!r} failed: {e!r}")
+
+    def _get_the_retry_backoff(
+        self,
+        method: str,
+        api_url: str,
+        attempt: int,
+        response: httpx.Response = None,
+        error: Exception = None,
+    ) -> Union[float, None]:
+        """The method includes a functionality to check if a request should be retried according to the retry policy of the model and to calculate the corresponding delay
+
+        Args:
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            attempt (int): Specify the number of the already executed retries
+            response (httpx.Response): Specify the response of the request (default None)
+            error (Exception): Specify the error of the request (default None)
+
+        Returns:
+            backoff (Union[float, None]): Returns the delay in seconds before the next retry or None, if the request should not be retried
+        """
+
+        retry_policy: RetryPolicy = self.grafana_api_model.retry_policy
+
+        if (
+            retry_policy is None
+            or attempt >= retry_policy.max_retries
+            or not retry_policy.is_retryable(
+                method,
+                response.status_code if response is not None else None,
+                error,
+            )
+        ):
+            return None
+
+        backoff: float = retry_policy.get_the_backoff(attempt, response)
+        logging.info(
+            f"The {method} request to {api_url} failed with "
+            f"{response.status_code if response is not None else repr(error)}. "
+            f"Retry {attempt + 1} of {retry_policy.max_retries} in {backoff:.2f} seconds."
+        )
+        return backoff
+
+    @staticmethod
+    def _create_the_conditional_headers(
+        headers: dict, cached_response: Union[CachedResponse, None]
+    ) -> dict:
+        """The method includes a functionality to attach the conditional headers of an expired cached response to the request headers
+
+        Args:
+            headers (dict): Specify the request headers
+            cached_response (Union[CachedResponse, None]): Specify the expired cached response or None
+
+        Returns:
+            headers (dict): Returns the request headers including the conditional headers
+        """
+
+        if cached_response is None:
+            return headers
+
+        return dict(headers, **cached_response.get_the_conditional_headers())
+
+    @staticmethod
+    def _process_the_cached_response(
+        response_cache: ResponseCache,
+        cache_key: tuple,
+        cached_response: Union[CachedResponse, None],
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """The method includes a functionality to update the response cache based on the response of a GET request. A not modified response renews the expired cached response and a successful response is cached
+
+        Args:
+            response_cache (ResponseCache): Specify the response cache
+            cache_key (tuple): Specify the cache key of the request
+            cached_response (Union[CachedResponse, None]): Specify the expired cached response or None
+            response (httpx.Response): Specify the response
+
+        Returns:
+            response (httpx.Response): Returns the cached response in case of a not modified response, otherwise the response
+        """
+
+        if response.status_code == 304 and cached_response is not None:
+            response_cache.put(cache_key, cached_response.response)
+            return cached_response.response
+
+        if 200 <= response.status_code < 300:
+            response_cache.put(cache_key, response)
+
+        return response
+
+    async def _send_the_async_http_request(
+        self,
+        http: httpx.AsyncClient,
+        method: str,
+        api_url: str,
+        headers: dict,
+        content: Union[str, bytes] = None,
+    ) -> httpx.Response:
+        """The method includes a functionality to send an asynchronous HTTP request. GET requests are served by the optional response cache of the model and all other requests clear the cache
+
+        Args:
+            http (httpx.AsyncClient): Specify the used asynchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the request headers
+            content (Union[str, bytes]): Specify the optional request content (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            response (httpx.Response): Returns the response
+        """
+
+        response_cache: ResponseCache = self.grafana_api_model.response_cache
+
+        if response_cache is None:
+            return await self._send_the_uncached_async_http_request(
+                http, method, api_url, headers, content
+            )
+
+        if method != RequestsMethods.GET.value:
+            response: httpx.Response = await self._send_the_uncached_async_http_request(
+                http, method, api_url, headers, content
+            )
+            response_cache.clear()
+            return response
+
+        cache_key: tuple = ResponseCache.create_the_key(api_url, headers)
+        cached_response: Union[CachedResponse, None] = response_cache.get(cache_key)
+
+        if cached_response is not None and cached_response.is_fresh():
+            return cached_response.response
+
+        return Api._process_the_cached_response(
+            response_cache,
+            cache_key,
+            cached_response,
+            await self._send_the_uncached_async_http_request(
+                http,
+                method,
+                api_url,
+                Api._create_the_conditional_headers(headers, cached_response),
+            ),
+        )
+
+    async def _send_the_uncached_async_http_request(
+        self,
+        http: httpx.AsyncClient,
+        method: str,
+        api_url: str,
+        headers: dict,
+        content: Union[str, bytes] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """The method includes a functionality to send an asynchronous HTTP request. The request is guarded by the optional circuit breaker of the model
+
+        Args:
+            http (httpx.AsyncClient): Specify the used asynchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the request headers
+            content (Union[str, bytes]): Specify the optional request content (default None)
+            stream (bool): Specify if the response content should be streamed instead of being read (default False)
+
+        Raises:
+            CircuitBreakerOpenError: The request is rejected by the open circuit breaker
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            response (httpx.Response): Returns the response
+        """
+
+        circuit_breaker: CircuitBreaker = self.grafana_api_model.circuit_breaker
+
+        if circuit_breaker is None:
+            return await self._send_the_retried_async_http_request(
+                http, method, api_url, headers, content, stream
+            )
+
+        circuit_breaker.before_request()
+
+        try:
+            response: httpx.Response = await self._send_the_retried_async_http_request(
+                http, method, api_url, headers, content, stream
+            )
+        except Exception as e:
+            circuit_breaker.record_failure()
+            raise e
+
+        circuit_breaker.record_response(response.status_code)
+        return response
+
+    async def _send_the_retried_async_http_request(
+        self,
+        http: httpx.AsyncClient,
+        method: str,
+        api_url: str,
+        headers: dict,
+        content: Union[str, bytes] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """The method includes a functionality to send an asynchronous HTTP request. Every attempt respects the optional rate limiter, is reported to the optional request hooks and the request is retried according to the optional retry policy of the model
+
+        Args:
+            http (httpx.AsyncClient): Specify the used asynchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the request headers
+            content (Union[str, bytes]): Specify the optional request content (default None)
+            stream (bool): Specify if the response content should be streamed instead of being read (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            response (httpx.Response): Returns the response
+        """
+
+        attempt: int = 0
+
+        while True:
+            if self.grafana_api_model.rate_limiter is not None:
+                await self.grafana_api_model.rate_limiter.acquire_async(api_url)
+
+            request_event: Union[RequestEvent, None] = self._start_the_request_event(
+                method, api_url, attempt, content
+            )
+
+            try:
+                response: httpx.Response = await self._execute_the_async_http_request(
+                    http, method, api_url, headers, content, stream
+                )
+            except Exception as e:
+                self._finish_the_request_event(request_event, error=e)
+                backoff: Union[float, None] = self._get_the_retry_backoff(
+                    method, api_url, attempt, error=e
+                )
+                if backoff is None:
+                    raise e
+            else:
+                self._finish_the_request_event(request_event, response=response)
+                backoff: Union[float, None] = self._get_the_retry_backoff(
+                    method, api_url, attempt, response=response
+                )
+                if backoff is None:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(backoff)
+            attempt += 1
+
+    def _check_the_api_call_response(
+        self, response: any = None, response_status_code: bool = False
+    ) -> any:
+        """The method includes a functionality to check the output of API call method for errors
+
+        Args:
+            response (any): Specify the inserted response
+            response_status_code (bool): Specify if the original status code should be attached to the result (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the value of the api call
+        """
+
+        valid_json, json_response = Api._decode_the_json(
+            response.content, self.grafana_api_model.json_codec.loads
+        )
+
+        if valid_json:
+            if (
+                isinstance(json_response, dict)
+                and json_response.get("message") in ERROR_MESSAGES
+            ):
+                logging.error(json_response["message"])
+                raise ConnectError(str(json_response["message"]))
+
+            if isinstance(json_response, dict) and response_status_code:
+                json_response.update({"status": response.status_code})
+            elif (
+                isinstance(json_response, list)
+                and len(json_response) != 0
+                and response_status_code
+            ):
+                json_response[0].update({"status": response.status_code})
+            return json_response
+        else:
+            if response_status_code:
+                return dict({"status": response.status_code, "data": response.text})
+            else:
+                return response
+
+    @staticmethod
+    def _check_if_valid_json(response: str) -> bool:
+        """The method includes a functionality to check if the response json is valid
+
+        Args:
+            response (str): Specify the inserted response json as string
+
+        Returns:
+            result (bool): Returns if the json is valid or not
+        """
+
+        return Api._decode_the_json(response)[0]
+
+    @staticmethod
+    def _decode_the_json(
+        response: Union[str, bytes], json_loads: Callable = json.loads
+    ) -> tuple:
+        """The method includes a functionality to decode the response json in a single pass. Empty strings and null values are not handled as valid json
+
+        Args:
+            response (Union[str, bytes]): Specify the inserted response json as string or bytes
+            json_loads (Callable): Specify the function to deserialize the json (default json.loads)
+
+        Returns:
+            result (tuple): Returns if the json is valid and the decoded json
+        """
+
+        try:
+            if len(response) == 0 or response in (b'""\n', b"null", '""\n', "null"):
+                return False, None
+
+            return True, json_loads(response)
+        except (TypeError, ValueError):
+            return False, None
+
+    @staticmethod
+    def iterate_the_pages(
+        get_page: Callable[[int], tuple],
+        results_per_page: int,
+        prefetch: bool = False,
+        start_page: int = 1,
+    ) -> Generator[any, None, None]:
+        """The method includes a functionality to lazily iterate over the items of a paged API endpoint. The pages are requested on demand and optionally, the next page is prefetched concurrently while the items of the current page are consumed
+
+        Args:
+            get_page (Callable[[int], tuple]): Specify the function that returns the items and the total count (or None) of a page specified by the page number
+            results_per_page (int): Specify the results_per_page as integer
+            prefetch (bool): Specify if the next page should be prefetched concurrently (default False)
+            start_page (int): Specify the first page as integer (default 1)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            items (Generator[any, None, None]): Returns the items of all pages
+        """
+
+        if results_per_page is None or results_per_page < 1:
+            logging.error("The results_per_page value must be greater than 0.")
+            raise ValueError
+
+        executor: Union[ThreadPoolExecutor, None] = (
+            ThreadPoolExecutor(max_workers=1) if prefetch else None
+        )
+
+        try:
+            page: int = start_page
+            items, total_count = get_page(page)
+
+            while True:
+                last_page: bool = len(items) < results_per_page or (
+                    total_count is not None and page * results_per_page >= total_count
+                )
+
+                next_page = None
+                if not last_page and executor is not None:
+                    next_page = executor.submit(get_page, page + 1)
+
+                yield from items
+
+                if last_page:
+                    return
+
+                page += 1
+                items, total_count = (
+                    next_page.result() if next_page is not None else get_page(page)
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def prepare_api_string(query_string: str) -> str:
+        """The method includes a functionality to prepare the api string for the queries
+
+        Args:
+            query_string (str): Specify the corresponding query string
+
+        Returns:
+            query_string (str): Returns the adjusted query string
+        """
+
+        if len(query_string) >= 1:
+            return f"{query_string}&"
+        else:
+            return query_string
+
+    @staticmethod
+    def check_the_api_call(api_call: any, key: str) -> any:
+        """The method includes a functionality to check that the result of an API call is a dict that includes the specified key
+
+        Args:
+            api_call (any): Specify the result of the API call
+            key (str): Specify the key that must be included inside the result
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the checked result of the API call
+        """
+
+        if api_call == dict() or api_call.get(key) is None:
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+        else:
+            return api_call
+
+    @staticmethod
+    def check_the_api_call_type(api_call: any, expected_type: type) -> any:
+        """The method includes a functionality to check that the result of an API call is a non-empty value of the specified type
+
+        Args:
+            api_call (any): Specify the result of the API call
+            expected_type (type): Specify the expected type of the result e.g. dict or list
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the checked result of the API call
+        """
+
+        if isinstance(api_call, expected_type) is False or len(api_call) == 0:
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+        else:
+            return api_call
+
+    @staticmethod
+    def check_the_api_call_items(
+        api_call: any, key: str, allow_empty: bool = False
+    ) -> any:
+        """The method includes a functionality to check that the result of an API call is a list whose first item includes the specified key
+
+        Args:
+            api_call (any): Specify the result of the API call
+            key (str): Specify the key that must be included inside the first item of the result
+            allow_empty (bool): Specify if an empty list is a valid result (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the checked result of the API call
+        """
+
+        if (api_call == list() and not allow_empty) or (
+            api_call != list() and api_call[0].get(key) is None
+        ):
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+        else:
+            return api_call
+
+    @staticmethod
+    def check_the_api_call_message(
+        api_call: any, messages: Union[str, list], info: str = None
+    ) -> any:
+        """The method includes a functionality to check that the result of an API call includes one of the specified messages
+
+        Args:
+            api_call (any): Specify the result of the API call
+            messages (Union[str, list]): Specify the expected message or the list of the expected messages
+            info (str): Specify the optional message that is logged for a successful API call (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the checked result of the API call
+        """
+
+        if api_call.get("message") not in (
+            [messages] if isinstance(messages, str) else messages
+        ):
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+        else:
+            if info is not None:
+                logging.info(info)
+            return api_call
+
+    def create_the_http_api_client(
+        self, headers: dict = None
+    ) -> Union[httpx.Client, httpx.AsyncClient]:
+        """The method includes a functionality to create the corresponding HTTP client
+
+        Args:
+            headers (dict): Specify the optional inserted headers (default None)
+
+        Returns:
+            client (Union[httpx.Client, httpx.AsyncClient]): Returns the corresponding client
+        """
+
+        transport: httpx.HTTPTransport = httpx.HTTPTransport(
+            verify=self.grafana_api_model.get_the_ssl_context(),
+            retries=self.grafana_api_model.retries,
+        )
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=self.grafana_api_model.num_pools
+        )
+        http2: bool = self.grafana_api_model.http2_support
+
+        if http2:
+            async_transport: httpx.AsyncHTTPTransport = httpx.AsyncHTTPTransport(
+                retries=self.grafana_api_model.retries, http2=http2
+            )
+            return httpx.AsyncClient(
+                http2=True,
+                limits=limits,
+                timeout=self.grafana_api_model.timeout,
+                headers=headers,
+                transport=async_transport,
+                verify=self.grafana_api_model.get_the_ssl_context(),
+                follow_redirects=self.grafana_api_model.follow_redirects,
+            )
+        else:
+            return httpx.Client(
+                limits=limits,
+                timeout=self.grafana_api_model.timeout,
+                headers=headers,
+                transport=transport,
+                verify=self.grafana_api_model.get_the_ssl_context(),
+                follow_redirects=self.grafana_api_model.follow_redirects,
+            )
+
+    def _create_the_http_limits(self) -> httpx.Limits:
+        """The method includes a functionality to create the connection limits of the shared HTTP clients. In the HTTP/2 mode, the number of connections is limited to the multiplexed connections of the model, so that concurrent requests share the established connections instead of opening new ones
+
+        Returns:
+            limits (httpx.Limits): Returns the connection limits
+        """
+
+        if self.grafana_api_model.http2_support:
+            return httpx.Limits(
+                max_connections=self.grafana_api_model.http2_max_connections,
+                max_keepalive_connections=self.grafana_api_model.http2_max_connections,
+                keepalive_expiry=self.grafana_api_model.keepalive_expiry,
+            )
+
+        return httpx.Limits(
+            max_connections=self.grafana_api_model.num_pools,
+            keepalive_expiry=self.grafana_api_model.keepalive_expiry,
+        )
+
+    def get_the_http_api_client(self) -> httpx.Client:
+        """The method includes a functionality to get the shared HTTP client of the Grafana API model. The client is created with the first call and reused by all following API calls, so that the established connections are kept alive inside the connection pool
+
+        Returns:
+            client (httpx.Client): Returns the shared client
+        """
+
+        with self.grafana_api_model.http_client_lock:
+            http: httpx.Client = self.grafana_api_model.http_client
+
+            if http is None or http.is_closed is True:
+                limits: httpx.Limits = self._create_the_http_limits()
+                transport: httpx.HTTPTransport = httpx.HTTPTransport(
+                    verify=self.grafana_api_model.get_the_ssl_context(),
+                    retries=self.grafana_api_model.retries,
+                    http2=self.grafana_api_model.http2_support,
+                    limits=limits,
+                )
+                http = httpx.Client(
+                    http2=self.grafana_api_model.http2_support,
+                    limits=limits,
+                    timeout=self.grafana_api_model.timeout,
+                    transport=transport,
+                    verify=self.grafana_api_model.get_the_ssl_context(),
+                    follow_redirects=self.grafana_api_model.follow_redirects,
+                )
+                self.grafana_api_model.http_client = http
+                self.grafana_api_model.stream_semaphore = (
+                    threading.BoundedSemaphore(
+                        self.grafana_api_model.http2_max_concurrent_streams
+                        * self.grafana_api_model.http2_max_connections
+                    )
+                    if self.grafana_api_model.http2_support
+                    else None
+                )
+
+            return http
+
+
+class AsyncApi(Api):
+    """The class includes all necessary methods to make asynchronous API calls to the Grafana API endpoints. All asynchronous API calls of a Grafana API model share one asynchronous HTTP client, so that the calls can be awaited concurrently e.g. with asyncio.gather
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    async def call_the_api(
+        self,
+        api_call: str,
+        method: RequestsMethods = RequestsMethods.GET,
+        json_complete: Union[str, bytes, dict, list] = None,
+        org_id_header: int = None,
+        disable_provenance_header: bool = False,
+        response_status_code: bool = False,
+    ) -> any:
+        """The method execute a defined asynchronous API call against the Grafana endpoints
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            method (RequestsMethods): Specify the used method (default GET)
+            json_complete (Union[str, bytes, dict, list]): Specify the inserted JSON as string, bytes or as object that is serialized by the JSON codec of the model
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call
+            disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+            response_status_code (bool): Specify if the response should include the original status code (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the value of the api call
+        """
+
+        api_url: str = f"{self.grafana_api_model.host}{api_call}"
+        headers: dict = self._create_the_http_api_headers(
+            org_id_header, disable_provenance_header
+        )
+
+        if json_complete is not None and not isinstance(json_complete, (str, bytes)):
+            json_complete = self.grafana_api_model.json_codec.dumps(json_complete)
+
+        http: httpx.AsyncClient = await self._get_the_async_http_api_client()
+
+        return await self._execute_the_async_api_call(
+            http, method, api_url, response_status_code, json_complete, headers
+        )
+
+    @contextlib.asynccontextmanager
+    async def stream_the_api(
+        self,
+        api_call: str,
+        method: RequestsMethods = RequestsMethods.GET,
+        json_complete: Union[str, bytes, dict, list] = None,
+        org_id_header: int = None,
+        disable_provenance_header: bool = False,
+    ) -> AsyncGenerator[httpx.Response, None]:
+        """The method includes a functionality to execute a defined asynchronous API call against the Grafana endpoints and to stream the response content instead of reading it into memory. The request respects the circuit breaker, the rate limiter, the request hooks and the retry policy of the model, but bypasses the response cache
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            method (RequestsMethods): Specify the used method (default GET)
+            json_complete (Union[str, bytes, dict, list]): Specify the inserted JSON as string, bytes or as object that is serialized by the JSON codec of the model (default None)
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+            disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            response (AsyncGenerator[httpx.Response, None]): Returns the asynchronous context manager of the streamed response. The response is closed by leaving the context
+        """
+
+        api_url: str = f"{self.grafana_api_model.host}{api_call}"
+        headers: dict = self._create_the_http_api_headers(
+            org_id_header, disable_provenance_header
+        )
+
+        if json_complete is not None and not isinstance(json_complete, (str, bytes)):
+            json_complete = self.grafana_api_model.json_codec.dumps(json_complete)
+
+        response: httpx.Response = await self._send_the_uncached_async_http_request(
+            await self._get_the_async_http_api_client(),
+            method.value,
+            api_url,
+            headers,
+            json_complete,
+            stream=True,
+        )
+
+        try:
+            if (
+                self.grafana_api_model.response_cache is not None
+                and method.value != RequestsMethods.GET.value
+            ):
+                self.grafana_api_model.response_cache.clear()
+
+            if response.is_error:
+                await response.aread()
+                self._check_the_streamed_response(response)
+
+            yield response
+        finally:
+            await response.aclose()
+
+    async def iterate_the_json_items(
+        self,
+        api_call: str,
+        path: tuple = (),
+        method: RequestsMethods = RequestsMethods.GET,
+        json_complete: Union[str, bytes, dict, list] = None,
+        org_id_header: int = None,
+        disable_provenance_header: bool = False,
+    ) -> AsyncGenerator[any, None]:
+        """The method includes a functionality to stream the response of a defined asynchronous API call and to incrementally decode the items of a JSON array or the key value pairs of a JSON object
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            path (tuple): Specify the object keys of the path to the JSON array or object e.g. ("data", "groups"). Please use an empty path for the root of the response (default ())
+            method (RequestsMethods): Specify the used method (default GET)
+            json_complete (Union[str, bytes, dict, list]): Specify the inserted JSON as string, bytes or as object that is serialized by the JSON codec of the model (default None)
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+            disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+
+        Raises:
+            ValueError: The response is not valid JSON or does not include the path
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            items (AsyncGenerator[any, None]): Returns the items of a JSON array or the key value pairs as tuples of a JSON object
+        """
+
+        async with self.stream_the_api(
+            api_call, method, json_complete, org_id_header, disable_provenance_header
+        ) as response:
+            json_stream_parser: JSONStreamParser = JSONStreamParser(
+                path, self.grafana_api_model.json_codec.loads
+            )
+
+            async for chunk in response.aiter_text():
+                for item in json_stream_parser.feed(chunk):
+                    yield item
+
+            for item in json_stream_parser.close():
+                yield item
+
+    async def iterate_the_lines(
+        self,
+        api_call: str,
+        org_id_header: int = None,
+    ) -> AsyncGenerator[str, None]:
+        """The method includes a functionality to stream the response of a defined asynchronous GET API call line by line
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            lines (AsyncGenerator[str, None]): Returns the lines of the response
+        """
+
+        async with self.stream_the_api(
+            api_call, org_id_header=org_id_header
+        ) as response:
+            async for line in response.aiter_lines():
+                yield line
+
+    async def write_the_api_response(
+        self,
+        api_call: str,
+        target: Union[str, BinaryIO],
+        org_id_header: int = None,
+    ) -> int:
+        """The method includes a functionality to stream the raw response of a defined asynchronous GET API call directly to a file without decoding it
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            target (Union[str, BinaryIO]): Specify the path of the file or a binary file object
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            size (int): Returns the number of the written bytes
+        """
+
+        async with self.stream_the_api(
+            api_call, org_id_header=org_id_header
+        ) as response:
+            if isinstance(target, str):
+                with open(target, "wb") as file:
+                    return await AsyncApi._write_the_async_chunks(
+                        response.aiter_bytes(), file
+                    )
+
+            return await AsyncApi._write_the_async_chunks(
+                response.aiter_bytes(), target
+            )
+
+    @staticmethod
+    async def _write_the_async_chunks(
+        chunks: AsyncIterable[bytes], file: BinaryIO
+    ) -> int:
+        """The method includes a functionality to write the chunks of an asynchronous response to a binary file
+
+        Args:
+            chunks (AsyncIterable[bytes]): Specify the chunks of the response
+            file (BinaryIO): Specify the binary file object
+
+        Returns:
+            size (int): Returns the number of the written bytes
+        """
+
+        size: int = 0
+        async for chunk in chunks:
+            file.write(chunk)
+            size += len(chunk)
+
+        return size
+
+    @staticmethod
+    async def iterate_the_pages(
+        get_page: Callable[[int], Awaitable[tuple]],
+        results_per_page: int,
+        prefetch: bool = False,
+        start_page: int = 1,
+    ) -> AsyncGenerator[any, None]:
+        """The method includes a functionality to lazily iterate over the items of a paged API endpoint asynchronously. The pages are requested on demand and optionally, the next page is prefetched concurrently while the items of the current page are consumed
+
+        Args:
+            get_page (Callable[[int], Awaitable[tuple]]): Specify the coroutine function that returns the items and the total count (or None) of a page specified by the page number
+            results_per_page (int): Specify the results_per_page as integer
+            prefetch (bool): Specify if the next page should be prefetched concurrently (default False)
+            start_page (int): Specify the first page as integer (default 1)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            items (AsyncGenerator[any, None]): Returns the items of all pages
+        """
+
+        if results_per_page is None or results_per_page < 1:
+            logging.error("The results_per_page value must be greater than 0.")
+            raise ValueError
+
+        next_page: Union[asyncio.Task, None] = None
+
+        try:
+            page: int = start_page
+            items, total_count = await get_page(page)
+
+            while True:
+                last_page: bool = len(items) < results_per_page or (
+                    total_count is not None and page * results_per_page >= total_count
+                )
+
+                if not last_page and prefetch:
+                    next_page = asyncio.ensure_future(get_page(page + 1))
+
+                for item in items:
+                    yield item
+
+                if last_page:
+                    return
+
+                page += 1
+                if next_page is not None:
+                    items, total_count = await next_page
+                    next_page = None
+                else:
+                    items, total_count = await get_page(page)
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    def get_the_http_api_client(self) -> httpx.AsyncClient:
+        """The method includes a functionality to get the shared asynchronous HTTP client of the Grafana API model. The client is created with the first call and reused by all following asynchronous API calls of the same event loop. A client that is assigned to the model is bound to the event loop of the first call. If the event loop changes e.g. by multiple asyncio.run calls, the stale client is closed and a new client is created, because the connections of a client are bound to the event loop
+
+        Returns:
+            client (httpx.AsyncClient): Returns the shared asynchronous client
+        """
+
+        http: httpx.AsyncClient = self.grafana_api_model.async_http_client
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        if (
+            http is not None
+            and http.is_closed is False
+            and self.grafana_api_model.async_http_client_loop is None
+        ):
+            self.grafana_api_model.async_http_client_loop = loop
+
+        if (
+            http is None
+            or http.is_closed is True
+            or self.grafana_api_model.async_http_client_loop is not loop
+        ):
+            if http is not None and http.is_closed is False:
+                close_task: asyncio.Task = loop.create_task(
+                    AsyncApi._close_the_stale_http_client(http)
+                )
+                self.grafana_api_model.async_http_client_close_tasks.add(close_task)
+                close_task.add_done_callback(
+                    self.grafana_api_model.async_http_client_close_tasks.discard
+                )
+
+            limits: httpx.Limits = self._create_the_http_limits()
+            transport: httpx.AsyncHTTPTransport = httpx.AsyncHTTPTransport(
+                verify=self.grafana_api_model.get_the_ssl_context(),
+                retries=self.grafana_api_model.retries,
+                http2=self.grafana_api_model.http2_support,
+                limits=limits,
             )
-        else:
-            return httpx.Client(
+            http = httpx.AsyncClient(
+                http2=self.grafana_api_model.http2_support,
                 limits=limits,
                 timeout=self.grafana_api_model.timeout,
-                headers=headers,
                 transport=transport,
-                verify=self.grafana_api_model.ssl_context,
+                verify=self.grafana_api_model.get_the_ssl_context(),
                 follow_redirects=self.grafana_api_model.follow_redirects,
             )
+            self.grafana_api_model.async_http_client = http
+            self.grafana_api_model.async_http_client_loop = loop
+            self.grafana_api_model.async_stream_semaphore = (
+                asyncio.Semaphore(
+                    self.grafana_api_model.http2_max_concurrent_streams
+                    * self.grafana_api_model.http2_max_connections
+                )
+                if self.grafana_api_model.http2_support
+                else None
+            )
+
+        return http
+
+    async def _get_the_async_http_api_client(self) -> httpx.AsyncClient:
+        """The method includes a functionality to get the shared asynchronous HTTP client of the Grafana API model and to wait until the stale clients of the previous event loops are closed
+
+        Returns:
+            client (httpx.AsyncClient): Returns the shared asynchronous client
+        """
+
+        http: httpx.AsyncClient = self.get_the_http_api_client()
+
+        if len(self.grafana_api_model.async_http_client_close_tasks) != 0:
+            await asyncio.gather(
+                *list(self.grafana_api_model.async_http_client_close_tasks)
+            )
+
+        return http
+
+    @staticmethod
+    async def _close_the_stale_http_client(http: httpx.AsyncClient):
+        """The method includes a functionality to close an asynchronous HTTP client of a previous event loop. The connections of a closed event loop can't be closed gracefully, so the corresponding errors are ignored
+
+        Args:
+            http (httpx.AsyncClient): Specify the stale asynchronous client
+
+        Returns:
+            None
+        """
+
+        try:
+            await http.aclose()
+        except Exception as e:
+            logging.debug(f"The stale asynchronous client was closed with: {e}.")
+
+
+class BatchExecutor:
+    """The class includes all necessary methods to execute multiple independent API calls concurrently. A request is either a tuple of the API call endpoint and the optional method and JSON payload e.g. ("/api/dashboards/uid/test",) or a callable e.g. functools.partial(dashboard.get_dashboard_by_uid, "test") or a tuple of a callable and the corresponding arguments e.g. (dashboard.get_dashboard_by_uid, "test")
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+        max_workers (int): Specify the maximum number of concurrently executed requests. By default, the maximum concurrency of the model is used, i.e. the number of the connection pool or in the HTTP/2 mode, the number of the multiplexed streams (default None)
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+        max_workers (int): This is where we store the maximum number of concurrently executed requests
+    """
+
+    def __init__(self, grafana_api_model: APIModel, max_workers: int = None):
+        self.grafana_api_model = grafana_api_model
+        self.max_workers = (
+            max_workers
+            if max_workers is not None
+            else grafana_api_model.get_the_max_concurrency()
+        )
+
+    def execute(self, requests: list) -> List[BatchResult]:
+        """The method includes a functionality to execute the requests concurrently inside a thread pool that shares the HTTP client of the model
+
+        Args:
+            requests (list): Specify the requests
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            results (List[BatchResult]): Returns the results and errors of the requests in the order of the requests
+        """
+
+        if self.max_workers is None or self.max_workers < 1:
+            logging.error("The max_workers value must be greater than 0.")
+            raise ValueError
+
+        if len(requests) == 0:
+            return list()
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(requests))
+        ) as executor:
+            return list(executor.map(self._execute_the_request, requests))
+
+    async def execute_async(self, requests: list) -> List[BatchResult]:
+        """The method includes a functionality to execute the requests concurrently inside the running event loop. The tuple requests are executed by the shared asynchronous HTTP client of the model and the results of asynchronous callables are awaited
+
+        Args:
+            requests (list): Specify the requests
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            results (List[BatchResult]): Returns the results and errors of the requests in the order of the requests
+        """
+
+        if self.max_workers is None or self.max_workers < 1:
+            logging.error("The max_workers value must be greater than 0.")
+            raise ValueError
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def _execute_the_bounded_request(request: any) -> BatchResult:
+            async with semaphore:
+                return await self._execute_the_async_request(request)
+
+        return list(
+            await asyncio.gather(
+                *[_execute_the_bounded_request(request) for request in requests]
+            )
+        )
+
+    def _execute_the_request(self, request: any) -> BatchResult:
+        """The method includes a functionality to execute a single request and to catch the corresponding error
+
+        Args:
+            request (any): Specify the request
+
+        Returns:
+            result (BatchResult): Returns the result or the error of the request
+        """
+
+        try:
+            if callable(request):
+                return BatchResult(request, request())
+            elif callable(request[0]):
+                return BatchResult(request, request[0](*request[1:]))
+            else:
+                return BatchResult(
+                    request, Api(self.grafana_api_model).call_the_api(*request)
+                )
+        except Exception as e:
+            logging.error(f"The request {request} failed: {e!r}.")
+            return BatchResult(request, error=e)
+
+    async def _execute_the_async_request(self, request: any) -> BatchResult:
+        """The method includes a functionality to execute a single asynchronous request and to catch the corresponding error
+
+        Args:
+            request (any): Specify the request
+
+        Returns:
+            result (BatchResult): Returns the result or the error of the request
+        """
+
+        try:
+            if callable(request):
+                result: any = request()
+            elif callable(request[0]):
+                result: any = request[0](*request[1:])
+            else:
+                result: any = AsyncApi(self.grafana_api_model).call_the_api(*request)
+
+            if inspect.isawaitable(result):
+                result = await result
+
+            return BatchResult(request, result)
+        except Exception as e:
+            logging.error(f"The request {request} failed: {e!r}.")
+            return BatchResult(request, error=e)
+
+
+class JSONStreamParser:
+    """The class includes an incremental JSON parser that decodes the items of a JSON array or the key value pairs of a JSON object while the response is streamed. The items are located by the path of the object keys from the root of the document e.g. ("data", "groups") and every item is decoded individually, so that only the current item is kept in memory
+
+    Args:
+        path (tuple): Specify the object keys of the path to the JSON array or object whose items should be decoded. Please use an empty path for the root of the document (default ())
+        json_loads (Callable): Specify the function to decode an item (default json.loads)
+
+    Attributes:
+        path (tuple): This is where we store the path
+        json_loads (Callable): This is where we store the function to decode an item
+    """
+
+    # The constants include the delimiters that are searched inside strings, containers and primitive values.
+    _STRING_DELIMITERS: re.Pattern = re.compile(r'["\\]')
+    _CONTAINER_DELIMITERS: re.Pattern = re.compile(r'[\[\]{}"]')
+    _PRIMITIVE_DELIMITERS: re.Pattern = re.compile(r"[,\]}\s]")
+    _WHITESPACES: str = " \t\r\n"
+    _DECODER: json.JSONDecoder = json.JSONDecoder()
+    _MORE_DATA: object = object()
+
+    def __init__(self, path: tuple = (), json_loads: Callable = json.loads):
+        self.path = path
+        self.json_loads = json_loads
+        self._buffer: str = ""
+        self._position: int = 0
+        self._value_start: Union[int, None] = None
+        self._finished: bool = False
+        self._done: bool = False
+        self._parser: Generator = self._parse()
+
+    def feed(self, chunk: str) -> list:
+        """The method includes a functionality to add the next chunk of the document and to decode all completed items
+
+        Args:
+            chunk (str): Specify the next chunk of the document
+
+        Raises:
+            ValueError: The document is not valid JSON or the path is not included
+
+        Returns:
+            items (list): Returns the completed items of the chunk
+        """
+
+        offset: int = (
+            self._value_start if self._value_start is not None else self._position
+        )
+        self._buffer = f"{self._buffer[offset:]}{chunk}"
+        self._position -= offset
+        if self._value_start is not None:
+            self._value_start = 0
+
+        return self._resume()
+
+    def close(self) -> list:
+        """The method includes a functionality to finish the document and to decode the remaining items
+
+        Raises:
+            ValueError: The document is incomplete, not valid JSON or the path is not included
+
+        Returns:
+            items (list): Returns the remaining items
+        """
+
+        self._finished = True
+        items: list = self._resume()
+
+        if not self._done:
+            logging.error("The JSON document is incomplete.")
+            raise ValueError
+
+        return items
+
+    def _resume(self) -> list:
+        """The method includes a functionality to continue the parsing until more data is necessary
+
+        Raises:
+            ValueError: The document is not valid JSON or the path is not included
+
+        Returns:
+            items (list): Returns the decoded items
+        """
+
+        items: list = list()
+
+        if self._done:
+            return items
+
+        for item in self._parser:
+            if item is JSONStreamParser._MORE_DATA:
+                return items
+            items.append(item)
+
+        self._done = True
+        return items
+
+    def _parse(self) -> Generator:
+        """The method includes a functionality to parse the document. The generator yields the decoded items and requests more data by yielding _MORE_DATA
+
+        Raises:
+            ValueError: The document is not valid JSON or the path is not included
+
+        Returns:
+            items (Generator): Returns the decoded items
+        """
+
+        for key in self.path:
+            yield from self._expect("{")
+            while True:
+                if (yield from self._peek()) == "}":
+                    logging.error(
+                        f"The JSON document does not include the path {self.path}."
+                    )
+                    raise ValueError
+
+                name: str = (yield from self._read_the_value())
+                yield from self._expect(":")
+                if name == key:
+                    break
+
+                yield from self._scan_the_value(keep=False)
+                if (yield from self._expect(",}")) == "}":
+                    logging.error(
+                        f"The JSON document does not include the path {self.path}."
+                    )
+                    raise ValueError
+
+        opening: str = yield from self._expect("[{")
+        closing: str = "]" if opening == "[" else "}"
+
+        if (yield from self._peek()) == closing:
+            self._position += 1
+            return
+
+        while True:
+            if opening == "{":
+                name: str = (yield from self._read_the_value())
+                yield from self._expect(":")
+                yield name, (yield from self._read_the_value())
+            else:
+                yield (yield from self._read_the_value())
+
+            if (yield from self._expect(f",{closing}")) == closing:
+                return
+
+    def _peek(self) -> Generator:
+        """The method includes a functionality to skip the whitespaces and to get the next character without consuming it
+
+        Returns:
+            character (str): Returns the next character or an empty string at the end of the document
+        """
+
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in JSONStreamParser._WHITESPACES
+            ):
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            elif self._finished:
+                return ""
+
+            yield JSONStreamParser._MORE_DATA
+
+    def _expect(self, characters: str) -> Generator:
+        """The method includes a functionality to consume the next character, if it's one of the expected characters
+
+        Args:
+            characters (str): Specify the expected characters
+
+        Raises:
+            ValueError: The next character is not expected
+
+        Returns:
+            character (str): Returns the consumed character
+        """
+
+        character: str = yield from self._peek()
+
+        if character == "" or character not in characters:
+            logging.error(
+                f"The JSON document is not valid. Expected one of {characters!r}, but found {character!r}."
+            )
+            raise ValueError
+
+        self._position += 1
+        return character
+
+    def _read_the_value(self) -> Generator:
+        """The method includes a functionality to read and decode the next JSON value. Completely buffered strings, arrays and objects are located by the C accelerated decoder of the standard library, so that only incomplete values are scanned
+
+        Raises:
+            ValueError: The document is incomplete or not valid JSON
+
+        Returns:
+            value (any): Returns the decoded value
+        """
+
+        first_character: str = yield from self._peek()
+
+        if first_character != "" and first_character in '[{"':
+            try:
+                value, end = JSONStreamParser._DECODER.raw_decode(
+                    self._buffer, self._position
+                )
+            except ValueError:
+                pass
+            else:
+                if self.json_loads is json.loads:
+                    self._position = end
+                    return value
+
+                self._value_start = self._position
+                return self.json_loads(self._take_the_value(end, True))
+
+        return self.json_loads((yield from self._scan_the_value()))
+
+    def _scan_the_value(self, keep: bool = True) -> Generator:
+        """The method includes a functionality to find the end of the next JSON value without decoding it
+
+        Args:
+            keep (bool): Specify if the text of the value should be returned. Otherwise, the value is skipped without buffering it (default True)
+
+        Raises:
+            ValueError: The document is incomplete
+
+        Returns:
+            value (str): Returns the text of the value or an empty string, if the value is skipped
+        """
+
+        first_character: str = yield from self._peek()
+
+        if first_character != "" and first_character in ",:]}":
+            logging.error(
+                f"The JSON document is not valid. Expected a value, but found {first_character!r}."
+            )
+            raise ValueError
+
+        self._value_start = self._position
+
+        index: int = self._position + 1
+        depth: int = 1 if first_character != "" and first_character in "[{" else 0
+        in_string: bool = first_character == '"'
+
+        while True:
+            if depth == 0 and not in_string:
+                match: Union[re.Match, None] = (
+                    JSONStreamParser._PRIMITIVE_DELIMITERS.search(self._buffer, index)
+                )
+                if match is not None:
+                    return self._take_the_value(match.start(), keep)
+                index = len(self._buffer)
+            else:
+                while True:
+                    if in_string:
+                        match: Union[re.Match, None] = (
+                            JSONStreamParser._STRING_DELIMITERS.search(
+                                self._buffer, index
+                            )
+                        )
+                        if match is None:
+                            index = len(self._buffer)
+                            break
+                        elif match.group() == "\\":
+                            if match.end() >= len(self._buffer):
+                                index = match.start()
+                                break
+                            index = match.end() + 1
+                            continue
+
+                        in_string = False
+                        index = match.end()
+                        if depth == 0:
+                            return self._take_the_value(index, keep)
+                    else:
+                        match: Union[re.Match, None] = (
+                            JSONStreamParser._CONTAINER_DELIMITERS.search(
+                                self._buffer, index
+                            )
+                        )
+                        if match is None:
+                            index = len(self._buffer)
+                            break
+
+                        index = match.end()
+                        if match.group() == '"':
+                            in_string = True
+                        elif match.group() in "[{":
+                            depth += 1
+                        else:
+                            depth -= 1
+                            if depth == 0:
+                                return self._take_the_value(index, keep)
+
+            if self._finished:
+                if depth == 0 and not in_string and first_character != "":
+                    return self._take_the_value(index, keep)
+
+                logging.error("The JSON document is incomplete.")
+                raise ValueError
+
+            if not keep:
+                self._value_start = index
+
+            offset: int = index - self._value_start
+            yield JSONStreamParser._MORE_DATA
+            index = self._value_start + offset
+
+    def _take_the_value(self, end: int, keep: bool) -> str:
+        """The method includes a functionality to consume the scanned value
+
+        Args:
+            end (int): Specify the end index of the value inside the buffer
+            keep (bool): Specify if the text of the value should be returned
+
+        Returns:
+            value (str): Returns the text of the value or an empty string, if the value is skipped
+        """
+
+        value: str = self._buffer[self._value_start : end] if keep else ""
+        self._position = end
+        self._value_start = None
+        return value
+
+
+class _ReleasingByteStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """The class includes a wrapper of the byte stream of a streamed response, that calls the release function once the response is closed
+
+    Args:
+        stream (Union[httpx.SyncByteStream, httpx.AsyncByteStream]): Specify the wrapped byte stream of the response
+        release (Callable): Specify the function that is called once by closing the stream
+    """
+
+    def __init__(
+        self,
+        stream: Union[httpx.SyncByteStream, httpx.AsyncByteStream],
+        release: Callable,
+    ):
+        self.stream = stream
+        self.release = release
+        self.released: bool = False
+
+    def __iter__(self) -> Generator[bytes, None, None]:
+        yield from self.stream
+
+    async def __aiter__(self) -> AsyncGenerator[bytes, None]:
+        async for chunk in self.stream:
+            yield chunk
+
+    def close(self):
+        try:
+            self.stream.close()
+        finally:
+            self._release()
+
+    async def aclose(self):
+        try:
+            await self.stream.aclose()
+        finally:
+            self._release()
+
+    def _release(self):
+        if not self.released:
+            self.released = True
+            self.release()
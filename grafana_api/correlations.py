@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import Union
 
@@ -131,20 +130,18 @@ class Correlations:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DATASOURCES.value}/uid/{correlation_object.source_datasource_uid}/correlations",
                 RequestsMethods.POST,
-                json.dumps(
-                    dict(
-                        {
-                            "targetUID": correlation_object.target_datasource_uid,
-                            "label": correlation_object.label,
-                            "description": correlation_object.description,
+                dict(
+                    {
+                        "targetUID": correlation_object.target_datasource_uid,
+                        "label": correlation_object.label,
+                        "description": correlation_object.description,
+                        "type": correlation_object.config_type,
+                        "config": {
                             "type": correlation_object.config_type,
-                            "config": {
-                                "type": correlation_object.config_type,
-                                "field": correlation_object.config_field,
-                                "target": correlation_object.config_target,
-                            },
-                        }
-                    )
+                            "field": correlation_object.config_field,
+                            "target": correlation_object.config_target,
+                        },
+                    }
                 ),
             )
 
@@ -223,7 +220,7 @@ class Correlations:
             api_call: any = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DATASOURCES.value}/uid/{source_datasource_uid}/correlations/{correlation_uid}",
                 RequestsMethods.PATCH,
-                json.dumps(dict({"label": label, "description": description})),
+                dict({"label": label, "description": description}),
             )
 
             if api_call == dict() or api_call.get("message") is None:
@@ -1,9 +1,20 @@
 import json
+import hashlib
 import logging
-
-from .model import APIModel, APIEndpoints, RequestsMethods, PublicDashboard
-from .folder import Folder
-from .api import Api
+from typing import Iterable, List
+
+from .model import (
+    APIModel,
+    APIEndpoints,
+    RequestsMethods,
+    PublicDashboard,
+    FolderIndex,
+    BatchResult,
+    DeployStatus,
+    DashboardDeployResult,
+)
+from .folder import Folder, AsyncFolder
+from .api import Api, AsyncApi, BatchExecutor
 
 
 class Dashboard:
@@ -47,31 +58,255 @@ class Dashboard:
                 self.grafana_api_model
             ).get_folder_uid_by_dashboard_path(dashboard_path)
 
-            dashboard_json_complete: dict = {
-                "dashboard": dashboard_json,
-                "message": message,
-                "overwrite": overwrite,
-            }
-            if folder_uid is not None:
-                dashboard_json_complete["folderUid"] = folder_uid
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/db",
-                RequestsMethods.POST,
-                json.dumps(dashboard_json_complete),
+            Dashboard._check_the_dashboard_deployment(
+                Api(self.grafana_api_model).call_the_api(
+                    *Dashboard._create_the_dashboard_request(
+                        folder_uid, dashboard_json, message, overwrite
+                    )
+                )
             )
-
-            if api_call.get("status") != "success":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully deployed the dashboard.")
         else:
             logging.error(
                 "There is no dashboard_path or dashboard_json or message defined."
             )
             raise ValueError
 
+    def deploy_many(
+        self,
+        dashboards: Iterable,
+        overwrite: bool = False,
+        max_workers: int = None,
+        skip_unchanged: bool = True,
+    ) -> List[DashboardDeployResult]:
+        """The method includes a functionality to deploy multiple dashboards. The dashboard paths are resolved once by the folder index, the dashboards whose content hash matches the already deployed dashboard are skipped and the remaining dashboards are deployed concurrently
+
+        Args:
+            dashboards (Iterable): Specify the dashboards as tuples of the dashboard path, the dashboard as dict and the commit message
+            overwrite (bool): Should the already existing dashboards be overwritten (default False)
+            max_workers (int): Specify the maximum number of concurrent requests. By default, the maximum concurrency of the model is used (default None)
+            skip_unchanged (bool): Specify if the dashboards with an unchanged content should be skipped. The check requires a uid inside the dashboard (default True)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            results (List[DashboardDeployResult]): Returns the result of every dashboard deployment in the order of the dashboards
+        """
+
+        batch_executor: BatchExecutor = BatchExecutor(
+            self.grafana_api_model, max_workers
+        )
+        results, deployments = Dashboard._prepare_the_deployments(
+            list(dashboards), Folder(self.grafana_api_model).get_folder_index()
+        )
+
+        if skip_unchanged:
+            deployments = Dashboard._skip_the_unchanged_deployments(
+                deployments,
+                batch_executor.execute(
+                    Dashboard._create_the_deployed_dashboard_requests(deployments)
+                ),
+                results,
+            )
+
+        Dashboard._collect_the_deployment_results(
+            deployments,
+            batch_executor.execute(
+                Dashboard._create_the_deployment_requests(deployments, overwrite)
+            ),
+            results,
+        )
+
+        return results
+
+    @staticmethod
+    def calculate_dashboard_hash(dashboard_json: dict) -> str:
+        """The method includes a functionality to calculate the content hash of a dashboard. The id and the version of the dashboard are managed by Grafana and are not part of the hash
+
+        Args:
+            dashboard_json (dict): Specify the dashboard as dict
+
+        Returns:
+            dashboard_hash (str): Returns the SHA-256 hash of the dashboard content
+        """
+
+        dashboard_content: dict = {
+            key: value
+            for key, value in dashboard_json.items()
+            if key not in ("id", "version")
+        }
+
+        return hashlib.sha256(
+            json.dumps(
+                dashboard_content, sort_keys=True, separators=(",", ":"), default=str
+            ).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def _prepare_the_deployments(
+        dashboards: list, folder_index: FolderIndex
+    ) -> tuple:
+        """The method includes a functionality to validate the dashboards and to resolve the folder uids of the dashboard paths
+
+        Args:
+            dashboards (list): Specify the dashboards as tuples of the dashboard path, the dashboard as dict and the commit message
+            folder_index (FolderIndex): Specify the folder index
+
+        Returns:
+            deployments (tuple): Returns the results of all dashboards and the pending deployments as list of tuples of the position, the folder uid, the dashboard and the commit message
+        """
+
+        results: list = list()
+        deployments: list = list()
+
+        for position, (dashboard_path, dashboard_json, message) in enumerate(
+            dashboards
+        ):
+            dashboard_uid: str = (
+                dashboard_json.get("uid") if isinstance(dashboard_json, dict) else None
+            )
+            results.append(DashboardDeployResult(dashboard_path, dashboard_uid))
+
+            if len(dashboard_path) == 0 or not dashboard_json or len(message) == 0:
+                logging.error(
+                    "There is no dashboard_path or dashboard_json or message defined."
+                )
+                results[position].status = DeployStatus.FAILED
+                results[position].error = ValueError(
+                    "There is no dashboard_path or dashboard_json or message defined."
+                )
+                continue
+
+            folder: dict | None = folder_index.get_folder(dashboard_path)
+
+            if folder is None:
+                logging.error(
+                    f"There's no folder_uid for the dashboard named {dashboard_path} available."
+                )
+                results[position].status = DeployStatus.FAILED
+                results[position].error = Exception(
+                    f"There's no folder_uid for the dashboard named {dashboard_path} available."
+                )
+            else:
+                deployments.append(
+                    (position, folder.get("uid"), dashboard_json, message)
+                )
+
+        return results, deployments
+
+    @staticmethod
+    def _create_the_deployed_dashboard_requests(deployments: list) -> list:
+        """The method includes a functionality to create the requests to extract the already deployed dashboards
+
+        Args:
+            deployments (list): Specify the pending deployments
+
+        Returns:
+            requests (list): Returns the requests of the dashboards that include a uid
+        """
+
+        return [
+            (f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_json.get('uid')}",)
+            for _, _, dashboard_json, _ in deployments
+            if dashboard_json.get("uid")
+        ]
+
+    @staticmethod
+    def _skip_the_unchanged_deployments(
+        deployments: list, deployed_dashboards: List[BatchResult], results: list
+    ) -> list:
+        """The method includes a functionality to skip the deployments whose dashboard content and folder match the already deployed dashboard
+
+        Args:
+            deployments (list): Specify the pending deployments
+            deployed_dashboards (List[BatchResult]): Specify the already deployed dashboards in the order of the deployments that include a uid
+            results (list): Specify the results of all dashboards
+
+        Returns:
+            deployments (list): Returns the remaining deployments
+        """
+
+        deployed_dashboards_iterator = iter(deployed_dashboards)
+        remaining_deployments: list = list()
+
+        for deployment in deployments:
+            position, folder_uid, dashboard_json, _ = deployment
+
+            if dashboard_json.get("uid"):
+                deployed_dashboard: any = next(deployed_dashboards_iterator).result
+
+                if (
+                    isinstance(deployed_dashboard, dict)
+                    and isinstance(deployed_dashboard.get("dashboard"), dict)
+                    and (deployed_dashboard.get("meta") or dict()).get("folderUid", "")
+                    == (folder_uid or "")
+                    and Dashboard.calculate_dashboard_hash(
+                        deployed_dashboard.get("dashboard")
+                    )
+                    == Dashboard.calculate_dashboard_hash(dashboard_json)
+                ):
+                    results[position].status = DeployStatus.SKIPPED
+                    results[position].result = deployed_dashboard
+                    continue
+
+            remaining_deployments.append(deployment)
+
+        return remaining_deployments
+
+    @staticmethod
+    def _create_the_deployment_requests(deployments: list, overwrite: bool) -> list:
+        """The method includes a functionality to create the deployment requests of the dashboards
+
+        Args:
+            deployments (list): Specify the pending deployments
+            overwrite (bool): Should the already existing dashboards be overwritten
+
+        Returns:
+            requests (list): Returns the deployment requests
+        """
+
+        return [
+            Dashboard._create_the_dashboard_request(
+                folder_uid, dashboard_json, message, overwrite
+            )
+            for _, folder_uid, dashboard_json, message in deployments
+        ]
+
+    @staticmethod
+    def _collect_the_deployment_results(
+        deployments: list, batch_results: List[BatchResult], results: list
+    ):
+        """The method includes a functionality to attach the deployment results to the results of the dashboards
+
+        Args:
+            deployments (list): Specify the deployments
+            batch_results (List[BatchResult]): Specify the results of the deployment requests in the order of the deployments
+            results (list): Specify the results of all dashboards
+
+        Returns:
+            None
+        """
+
+        for (position, _, _, _), batch_result in zip(deployments, batch_results):
+            results[position].result = batch_result.result
+
+            if batch_result.error is not None:
+                results[position].status = DeployStatus.FAILED
+                results[position].error = batch_result.error
+            elif (
+                not isinstance(batch_result.result, dict)
+                or batch_result.result.get("status") != "success"
+            ):
+                logging.error(f"Check the error: {batch_result.result}.")
+                results[position].status = DeployStatus.FAILED
+                results[position].error = Exception(
+                    f"Check the error: {batch_result.result}."
+                )
+            else:
+                results[position].dashboard_uid = batch_result.result.get(
+                    "uid", results[position].dashboard_uid
+                )
+
     def delete_dashboard_by_name_and_path(
         self, dashboard_name: str, dashboard_path: str
     ):
@@ -94,20 +329,13 @@ class Dashboard:
                 dashboard_name, dashboard_path
             )
 
-            if len(dashboard_uid) != 0:
-                api_call: dict = Api(self.grafana_api_model).call_the_api(
-                    f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid.get('uid')}",
-                    RequestsMethods.DELETE,
-                )
-
-                if f"Dashboard {dashboard_name} deleted" != api_call.get("message"):
-                    logging.error(f"Please, check the error: {api_call}.")
-                    raise Exception
-                else:
-                    logging.info("You successfully destroyed the dashboard.")
-            else:
-                logging.error("Nothing to delete. There is no dashboard available.")
-                raise ValueError
+            Api.check_the_api_call_message(
+                Api(self.grafana_api_model).call_the_api(
+                    *Dashboard._create_the_dashboard_deletion_request(dashboard_uid)
+                ),
+                f"Dashboard {dashboard_name} deleted",
+                "You successfully destroyed the dashboard.",
+            )
         else:
             logging.error("There is no dashboard_name or dashboard_path defined.")
             raise ValueError
@@ -126,19 +354,12 @@ class Dashboard:
             api_call (dict): Returns the dashboard
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}"
-            )
-
-            if api_call.get("dashboard") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard uid defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_uid_request(uid)
+            ),
+            "dashboard",
+        )
 
     def get_dashboard_home(self) -> dict:
         """The method includes a functionality to get the home dashboard
@@ -150,16 +371,13 @@ class Dashboard:
             api_call (dict): Returns the home dashboard
         """
 
-        api_call: dict = Api(self.grafana_api_model).call_the_api(
-            f"{APIEndpoints.DASHBOARDS.value}/home"
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DASHBOARDS.value}/home"
+            ),
+            "dashboard",
         )
 
-        if api_call.get("dashboard") is None:
-            logging.error(f"Please, check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
-
     def get_dashboard_tags(self) -> list:
         """The method includes a functionality to get the all tags of all dashboards
 
@@ -170,16 +388,13 @@ class Dashboard:
             api_call (list): Returns all dashboard tags
         """
 
-        api_call: list = Api(self.grafana_api_model).call_the_api(
-            f"{APIEndpoints.DASHBOARDS.value}/tags"
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DASHBOARDS.value}/tags"
+            ),
+            "term",
         )
 
-        if api_call == list() or api_call[0].get("term") is None:
-            logging.error(f"Please, check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
-
     def get_dashboard_uid_and_id_by_name_and_folder(
         self, dashboard_name: str, dashboard_path: str
     ) -> dict:
@@ -202,36 +417,14 @@ class Dashboard:
                 self.grafana_api_model
             ).get_folder_uid_by_dashboard_path(dashboard_path)
 
-            folder_query_parameter: str = f"folderUIDs={folder_uid}"
-            if folder_uid is None:
-                folder_query_parameter = ""
-
-            search_query: str = (
-                f"{APIEndpoints.SEARCH.value}?{Api.prepare_api_string(folder_query_parameter)}query={dashboard_name}"
+            return Dashboard._get_the_dashboard_uid_and_id(
+                Api(self.grafana_api_model).call_the_api(
+                    *Dashboard._create_the_dashboard_search_request(
+                        dashboard_name, folder_uid
+                    )
+                ),
+                dashboard_name,
             )
-            dashboard_meta: list = Api(self.grafana_api_model).call_the_api(
-                search_query
-            )
-
-            for dashboard_meta_object in dashboard_meta:
-                if dashboard_meta_object.get("title") is not None:
-                    if dashboard_meta_object.get("title") == dashboard_name:
-                        if (
-                            dashboard_meta_object.get("uid") is not None
-                            and dashboard_meta_object.get("id") is not None
-                        ):
-                            return dict(
-                                {
-                                    "uid": dashboard_meta_object.get("uid"),
-                                    "id": dashboard_meta_object.get("id"),
-                                }
-                            )
-                        else:
-                            logging.error("There is no uid or id defined.")
-                            raise ValueError
-                else:
-                    logging.error("There is no title defined.")
-                    raise ValueError
         else:
             logging.error("There is no dashboard_name or dashboard_path defined.")
             raise ValueError
@@ -250,19 +443,12 @@ class Dashboard:
             api_call (list): Returns the dashboard permissions of a dashboard as list
         """
 
-        if id != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/id/{id}/permissions"
-            )
-
-            if api_call == list() or api_call[0].get("role") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard id defined.")
-            raise ValueError
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_permissions_request(id=id)
+            ),
+            "role",
+        )
 
     def get_dashboard_permissions_by_uid(self, uid: str) -> list:
         """The method includes a functionality to extract the dashboard permissions based on the specified uid
@@ -278,19 +464,12 @@ class Dashboard:
             api_call (list): Returns the dashboard permissions of a dashboard as list
         """
 
-        if len(uid) != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/permissions"
-            )
-
-            if api_call == list() or api_call[0].get("role") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard uid defined.")
-            raise ValueError
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_permissions_request(uid=uid)
+            ),
+            "role",
+        )
 
     def update_dashboard_permissions(self, id: int, permission_json: dict):
         """The method includes a functionality to update the dashboard permissions based on the specified id and the permission json document
@@ -307,21 +486,15 @@ class Dashboard:
             None
         """
 
-        if id != 0 and len(permission_json) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/id/{id}/permissions",
-                RequestsMethods.POST,
-                json.dumps(permission_json),
-            )
-
-            if api_call.get("message") != "Dashboard permissions updated":
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully modified the dashboard permissions.")
-        else:
-            logging.error("There is no dashboard id or permission json defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_permissions_request(
+                    id=id, permission_json=permission_json
+                )
+            ),
+            "Dashboard permissions updated",
+            "You successfully modified the dashboard permissions.",
+        )
 
     def update_dashboard_permissions_by_uid(self, uid: str, permission_json: dict):
         """The method includes a functionality to update the dashboard permissions based on the specified uid and the permission json document
@@ -338,21 +511,15 @@ class Dashboard:
             None
         """
 
-        if len(uid) != 0 and len(permission_json) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/permissions",
-                RequestsMethods.POST,
-                json.dumps(permission_json),
-            )
-
-            if api_call.get("message") != "Dashboard permissions updated":
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully modified the dashboard permissions.")
-        else:
-            logging.error("There is no dashboard uid or permission json defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_permissions_request(
+                    uid=uid, permission_json=permission_json
+                )
+            ),
+            "Dashboard permissions updated",
+            "You successfully modified the dashboard permissions.",
+        )
 
     def get_dashboard_versions(self, id: int) -> list:
         """The method includes a functionality to extract the versions of a dashboard based on the specified id
@@ -368,19 +535,12 @@ class Dashboard:
             api_call (list): Returns all dashboard versions of a dashboard as list
         """
 
-        if id != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/id/{id}/versions",
-            )
-
-            if api_call == list() or api_call[0].get("id") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard id defined.")
-            raise ValueError
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_versions_request(id=id)
+            ),
+            "id",
+        )
 
     def get_dashboard_versions_by_uid(self, uid: str) -> list:
         """The method includes a functionality to extract the versions of a dashboard based on the specified uid
@@ -396,19 +556,12 @@ class Dashboard:
             api_call (list): Returns all dashboard versions of a dashboard as list
         """
 
-        if len(uid) != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/versions",
-            )
-
-            if api_call == list() or api_call[0].get("uid") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard uid defined.")
-            raise ValueError
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_versions_request(uid=uid)
+            ),
+            "uid",
+        )
 
     def get_dashboard_version(self, id: int, version_id: int) -> dict:
         """The method includes a functionality to extract a specified version of a dashboard based on the specified dashboard id and a version_id of the dashboard
@@ -425,19 +578,14 @@ class Dashboard:
             api_call (list): Returns a dashboard version of a dashboard as dict
         """
 
-        if id != 0 and version_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/id/{id}/versions/{version_id}",
-            )
-
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard id or version_id defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_versions_request(
+                    id=id, version_id=version_id
+                )
+            ),
+            "id",
+        )
 
     def get_dashboard_version_by_uid(self, uid: str, version_id: int) -> dict:
         """The method includes a functionality to extract a specified version of a dashboard based on the specified dashboard uid and a version_id of the dashboard
@@ -454,19 +602,14 @@ class Dashboard:
             api_call (list): Returns a dashboard version of a dashboard as dict
         """
 
-        if len(uid) != 0 and version_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/versions/{version_id}",
-            )
-
-            if api_call == dict() or api_call.get("uid") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard uid or version_id defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_versions_request(
+                    uid=uid, version_id=version_id
+                )
+            ),
+            "uid",
+        )
 
     def restore_dashboard_version(self, id: int, version: dict):
         """The method includes a functionality to restore a specified version of a dashboard based on the specified dashboard id and a version as dict of the dashboard
@@ -483,24 +626,11 @@ class Dashboard:
             None
         """
 
-        if id != 0 and version != dict():
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/id/{id}/restore",
-                RequestsMethods.POST,
-                json.dumps(version),
+        Dashboard._check_the_dashboard_restore(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_restore_request(version, id=id)
             )
-
-            if (
-                api_call.get("status") != "success"
-                or api_call.get("message") is not None
-            ):
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully restored the dashboard.")
-        else:
-            logging.error("There is no dashboard id or version_id defined.")
-            raise ValueError
+        )
 
     def restore_dashboard_version_by_uid(self, uid: str, version: dict):
         """The method includes a functionality to restore a specified version of a dashboard based on the specified dashboard uid and a version as dict of the dashboard
@@ -517,24 +647,11 @@ class Dashboard:
             None
         """
 
-        if len(uid) != 0 and version != dict():
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/restore",
-                RequestsMethods.POST,
-                json.dumps(version),
+        Dashboard._check_the_dashboard_restore(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_restore_request(version, uid=uid)
             )
-
-            if (
-                api_call.get("status") != "success"
-                or api_call.get("message") is not None
-            ):
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully restored the dashboard.")
-        else:
-            logging.error("There is no dashboard uid or version_id defined.")
-            raise ValueError
+        )
 
     def calculate_dashboard_diff(
         self,
@@ -556,39 +673,18 @@ class Dashboard:
         Returns:
             api_call (str): Returns the difference of the two specified dashboards
         """
-        possible_diff_types: list = ["basic", "json"]
-
-        if diff_type.lower() in possible_diff_types:
-            if (
-                dashboard_id_and_version_base != dict()
-                and dashboard_id_and_version_new != 0
-            ):
-                diff_object: dict = dict()
-                diff_object.update({"base": dashboard_id_and_version_base})
-                diff_object.update({"new": dashboard_id_and_version_new})
-                diff_object.update({"diffType": diff_type.lower()})
 
-                api_call: any = Api(self.grafana_api_model).call_the_api(
-                    f"{APIEndpoints.DASHBOARDS.value}/calculate-diff",
-                    RequestsMethods.POST,
-                    json.dumps(diff_object),
-                )
+        api_call: any = Api(self.grafana_api_model).call_the_api(
+            *Dashboard._create_the_dashboard_diff_request(
+                dashboard_id_and_version_base, dashboard_id_and_version_new, diff_type
+            )
+        )
 
-                if api_call.status_code != 200:
-                    logging.error(f"Check the error: {api_call.text}.")
-                    raise Exception
-                else:
-                    return api_call.text
-            else:
-                logging.error(
-                    "There is no dashboard_uid_and_version_base or dashboard_uid_and_version_new defined."
-                )
-                raise ValueError
+        if api_call.status_code != 200:
+            logging.error(f"Check the error: {api_call.text}.")
+            raise Exception
         else:
-            logging.error(
-                f"The diff_type: {diff_type.lower()} is not valid. Please specify a valid value."
-            )
-            raise ValueError
+            return api_call.text
 
     def get_public_dashboards(self, per_page: int = None, page: int = None) -> dict:
         """The method includes a functionality to get all public available dashboards
@@ -608,30 +704,13 @@ class Dashboard:
             api_call (dict): Returns all public available dashboards
         """
 
-        optional_parts: str = "?"
-
-        if per_page is not None:
-            optional_parts += f"perpage={per_page}"
-
-        if page is not None:
-            if len(optional_parts) > 1:
-                optional_parts += "&"
-
-            optional_parts += f"page={page}"
-
-        if len(optional_parts) == 1:
-            optional_parts: str = ""
-
-        api_call: dict = Api(self.grafana_api_model).call_the_api(
-            f"{APIEndpoints.DASHBOARDS.value}/public-dashboards{optional_parts}",
+        return Api.check_the_api_call_type(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboards_request(per_page, page)
+            ),
+            dict,
         )
 
-        if isinstance(api_call, dict) is False or api_call == dict():
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
-
     def get_public_dashboard_by_uid(
         self,
         dashboard_uid: str,
@@ -653,19 +732,12 @@ class Dashboard:
             api_call (dict): Returns the corresponding public available dashboard
         """
 
-        if dashboard_uid is not None and len(dashboard_uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid}/public-dashboards",
-            )
-
-            if isinstance(api_call, dict) is False or api_call == dict():
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard uid defined.")
-            raise ValueError
+        return Api.check_the_api_call_type(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboard_request(dashboard_uid)
+            ),
+            dict,
+        )
 
     def create_public_dashboard(
         self, dashboard_uid: str, public_dashboard: PublicDashboard = PublicDashboard()
@@ -688,49 +760,22 @@ class Dashboard:
             api_call (dict): Returns the corresponding public available dashboard
         """
 
-        if (
-            dashboard_uid is not None
-            and len(dashboard_uid) != 0
-            and public_dashboard is not None
-        ):
-            public_dashboard_result: dict = dict(
-                {
-                    "uid": public_dashboard.uid,
-                    "accessToken": public_dashboard.access_token,
-                    "timeSelectionEnabled": public_dashboard.time_selection_enabled,
-                    "isEnabled": public_dashboard.is_enabled,
-                    "annotationsEnabled": public_dashboard.annotations_enabled,
-                    "share": public_dashboard.share,
-                }
-            )
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid}/public-dashboards",
-                RequestsMethods.POST,
-                json.dumps(public_dashboard_result),
-                response_status_code=True,
-            )
-
-            status_code: int = api_call.get("status")
-            public_dashboard_status_dict: dict = dict(
+        return Dashboard._check_the_public_dashboard_response(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboard_creation_request(
+                    dashboard_uid, public_dashboard
+                ),
+                response_status_code=True,
+            ),
+            dict(
                 {
                     400: "Dashboard is already public.",
                     401: "Unauthorized.",
                     403: "Access denied.",
                     404: "Dashboard not found.",
                 }
-            )
-
-            if status_code == 200 and (
-                isinstance(api_call, dict) is True or api_call != dict()
-            ):
-                return api_call
-            elif 400 <= status_code <= 404:
-                logging.error(public_dashboard_status_dict.get(status_code))
-                raise Exception
-        else:
-            logging.error("There is no dashboard uid or public dashboard defined.")
-            raise ValueError
+            ),
+        )
 
     def update_public_dashboard(
         self,
@@ -763,63 +808,27 @@ class Dashboard:
             api_call (dict): Returns the corresponding public available dashboard
         """
 
-        if (
-            dashboard_uid is not None
-            and len(dashboard_uid) != 0
-            and public_dashboard_uid is not None
-            and len(public_dashboard_uid) != 0
-        ):
-            public_dashboard_result: dict = dict()
-
-            if time_selection_enabled is not None:
-                public_dashboard_result.update(
-                    {"timeSelectionEnabled": time_selection_enabled}
-                )
-
-            if is_enabled is not None:
-                public_dashboard_result.update({"isEnabled": is_enabled})
-
-            if annotations_enabled is not None:
-                public_dashboard_result.update(
-                    {"annotationsEnabled": annotations_enabled}
-                )
-
-            if share is not None:
-                public_dashboard_result.update({"share": share})
-
-            if public_dashboard_result == dict():
-                logging.error(
-                    "There is no values for the update of the public dashboard defined."
-                )
-                raise ValueError
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid}/public-dashboards/{public_dashboard_uid}",
-                RequestsMethods.PATCH,
-                json.dumps(public_dashboard_result),
+        return Dashboard._check_the_public_dashboard_response(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboard_update_request(
+                    dashboard_uid,
+                    public_dashboard_uid,
+                    time_selection_enabled,
+                    is_enabled,
+                    annotations_enabled,
+                    share,
+                ),
                 response_status_code=True,
-            )
-
-            status_code: int = api_call.get("status")
-            public_dashboard_status_dict: dict = dict(
+            ),
+            dict(
                 {
                     400: "Dashboard is already public.",
                     401: "Unauthorized.",
                     403: "Access denied.",
                     404: "Public dashboard not found.",
                 }
-            )
-
-            if status_code == 200 and (
-                isinstance(api_call, dict) is True or api_call != dict()
-            ):
-                return api_call
-            elif 400 <= status_code <= 404:
-                logging.error(public_dashboard_status_dict.get(status_code))
-                raise Exception
-        else:
-            logging.error("There is no dashboard uid or public dashboard defined.")
-            raise ValueError
+            ),
+        )
 
     def delete_public_dashboard(
         self,
@@ -844,31 +853,1239 @@ class Dashboard:
             None
         """
 
-        if (
-            dashboard_uid is not None
-            and len(dashboard_uid) != 0
-            and public_dashboard_uid is not None
-            and len(public_dashboard_uid) != 0
-        ):
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid}/public-dashboards/{public_dashboard_uid}",
-                RequestsMethods.DELETE,
+        Dashboard._check_the_public_dashboard_response(
+            Api(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboard_deletion_request(
+                    dashboard_uid, public_dashboard_uid
+                ),
                 response_status_code=True,
-            )
-
-            status_code: int = api_call.get("status")
-            public_dashboard_status_dict: dict = dict(
+            ),
+            dict(
                 {
                     401: "Unauthorized.",
                     403: "Access denied.",
                 }
+            ),
+            "You successfully deleted the public dashboard.",
+        )
+
+    @staticmethod
+    def _create_the_dashboard_request(
+        folder_uid: str, dashboard_json: dict, message: str, overwrite: bool
+    ) -> tuple:
+        """The method includes a functionality to create the request to create or update a dashboard
+
+        Args:
+            folder_uid (str): Specify the uid of the dashboard folder or None for the General folder
+            dashboard_json (dict): Specify the inner dashboard JSON object
+            message (str): Specify the message that should be displayed inside the dashboard
+            overwrite (bool): Specify if an existing dashboard should be overwritten
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        dashboard_json_complete: dict = {
+            "dashboard": dashboard_json,
+            "message": message,
+            "overwrite": overwrite,
+        }
+
+        if folder_uid is not None:
+            dashboard_json_complete["folderUid"] = folder_uid
+
+        return (
+            f"{APIEndpoints.DASHBOARDS.value}/db",
+            RequestsMethods.POST,
+            dashboard_json_complete,
+        )
+
+    @staticmethod
+    def _check_the_dashboard_deployment(api_call: dict):
+        """The method includes a functionality to check the result of a dashboard deployment
+
+        Args:
+            api_call (dict): Specify the result of the API call
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if api_call.get("status") != "success":
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+        else:
+            logging.info("You successfully deployed the dashboard.")
+
+    @staticmethod
+    def _create_the_dashboard_deletion_request(dashboard_uid: dict) -> tuple:
+        """The method includes a functionality to create the request to delete a dashboard
+
+        Args:
+            dashboard_uid (dict): Specify the uid and the id of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(dashboard_uid) != 0:
+            return (
+                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid.get('uid')}",
+                RequestsMethods.DELETE,
             )
+        else:
+            logging.error("Nothing to delete. There is no dashboard available.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_dashboard_uid_request(uid: str) -> tuple:
+        """The method includes a functionality to create the request to get a dashboard specified by the uid
+
+        Args:
+            uid (str): Specify the uid of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
 
-            if status_code == 200:
-                logging.info("You successfully deleted the public dashboard.")
-            elif 401 <= status_code <= 403:
-                logging.error(public_dashboard_status_dict.get(status_code))
-                raise Exception
+        if len(uid) != 0:
+            return (f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}",)
         else:
-            logging.error("There is no dashboard uid or public dashboard defined.")
+            logging.error("There is no dashboard uid defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_dashboard_search_request(
+        dashboard_name: str, folder_uid: str
+    ) -> tuple:
+        """The method includes a functionality to create the request to search a dashboard specified by the name inside a folder
+
+        Args:
+            dashboard_name (str): Specify the name of the dashboard
+            folder_uid (str): Specify the uid of the dashboard folder or None for the General folder
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        folder_query_parameter: str = f"folderUIDs={folder_uid}"
+
+        if folder_uid is None:
+            folder_query_parameter = ""
+
+        return (
+            f"{APIEndpoints.SEARCH.value}?{Api.prepare_api_string(folder_query_parameter)}query={dashboard_name}",
+        )
+
+    @staticmethod
+    def _get_the_dashboard_uid_and_id(
+        dashboard_meta: list, dashboard_name: str
+    ) -> dict:
+        """The method includes a functionality to extract the uid and the id of a dashboard specified by the name from the search result
+
+        Args:
+            dashboard_meta (list): Specify the search result
+            dashboard_name (str): Specify the name of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            dashboard_uid_and_id (dict): Returns the uid and the id of the dashboard
+        """
+
+        for dashboard_meta_object in dashboard_meta:
+            if dashboard_meta_object.get("title") is not None:
+                if dashboard_meta_object.get("title") == dashboard_name:
+                    if (
+                        dashboard_meta_object.get("uid") is not None
+                        and dashboard_meta_object.get("id") is not None
+                    ):
+                        return dict(
+                            {
+                                "uid": dashboard_meta_object.get("uid"),
+                                "id": dashboard_meta_object.get("id"),
+                            }
+                        )
+                    else:
+                        logging.error("There is no uid or id defined.")
+                        raise ValueError
+            else:
+                logging.error("There is no title defined.")
+                raise ValueError
+
+    @staticmethod
+    def _create_the_dashboard_endpoint(id: int = None, uid: str = None) -> str:
+        """The method includes a functionality to create the endpoint of a dashboard specified by the id or the uid
+
+        Args:
+            id (int): Specify the id of the dashboard (default None)
+            uid (str): Specify the uid of the dashboard (default None)
+
+        Returns:
+            endpoint (str): Returns the endpoint of the dashboard or None if the id or the uid is not defined
+        """
+
+        if uid is not None:
+            return f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}" if len(uid) != 0 else None
+        else:
+            return f"{APIEndpoints.DASHBOARDS.value}/id/{id}" if id != 0 else None
+
+    @staticmethod
+    def _create_the_dashboard_permissions_request(
+        id: int = None, uid: str = None, permission_json: dict = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to get or to update the permissions of a dashboard specified by the id or the uid
+
+        Args:
+            id (int): Specify the id of the dashboard (default None)
+            uid (str): Specify the uid of the dashboard (default None)
+            permission_json (dict): Specify the inner permission JSON object of an update (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        endpoint: str = Dashboard._create_the_dashboard_endpoint(id, uid)
+        identifier: str = "id" if uid is None else "uid"
+
+        if permission_json is None:
+            if endpoint is not None:
+                return (f"{endpoint}/permissions",)
+            else:
+                logging.error(f"There is no dashboard {identifier} defined.")
+                raise ValueError
+        elif endpoint is not None and len(permission_json) != 0:
+            return (f"{endpoint}/permissions", RequestsMethods.POST, permission_json)
+        else:
+            logging.error(
+                f"There is no dashboard {identifier} or permission json defined."
+            )
+            raise ValueError
+
+    @staticmethod
+    def _create_the_dashboard_versions_request(
+        id: int = None, uid: str = None, version_id: int = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to get all versions or a version of a dashboard specified by the id or the uid
+
+        Args:
+            id (int): Specify the id of the dashboard (default None)
+            uid (str): Specify the uid of the dashboard (default None)
+            version_id (int): Specify the version id of the dashboard or None for all versions (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        endpoint: str = Dashboard._create_the_dashboard_endpoint(id, uid)
+        identifier: str = "id" if uid is None else "uid"
+
+        if version_id is None:
+            if endpoint is not None:
+                return (f"{endpoint}/versions",)
+            else:
+                logging.error(f"There is no dashboard {identifier} defined.")
+                raise ValueError
+        elif endpoint is not None and version_id != 0:
+            return (f"{endpoint}/versions/{version_id}",)
+        else:
+            logging.error(f"There is no dashboard {identifier} or version_id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_dashboard_restore_request(
+        version: dict, id: int = None, uid: str = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to restore a dashboard specified by the id or the uid to a version
+
+        Args:
+            version (dict): Specify the version_id of the dashboard
+            id (int): Specify the id of the dashboard (default None)
+            uid (str): Specify the uid of the dashboard (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        endpoint: str = Dashboard._create_the_dashboard_endpoint(id, uid)
+
+        if endpoint is not None and version != dict():
+            return (f"{endpoint}/restore", RequestsMethods.POST, version)
+        else:
+            logging.error(
+                f"There is no dashboard {'id' if uid is None else 'uid'} or version_id defined."
+            )
+            raise ValueError
+
+    @staticmethod
+    def _check_the_dashboard_restore(api_call: dict):
+        """The method includes a functionality to check the result of a dashboard restore
+
+        Args:
+            api_call (dict): Specify the result of the API call
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if api_call.get("status") != "success" or api_call.get("message") is not None:
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+        else:
+            logging.info("You successfully restored the dashboard.")
+
+    @staticmethod
+    def _create_the_dashboard_diff_request(
+        dashboard_id_and_version_base: dict,
+        dashboard_id_and_version_new: dict,
+        diff_type: str,
+    ) -> tuple:
+        """The method includes a functionality to create the request to calculate the diff between two dashboard versions
+
+        Args:
+            dashboard_id_and_version_base (dict): Specify the dashboard id and version of the base dashboard
+            dashboard_id_and_version_new (dict): Specify the dashboard id and version of the new dashboard
+            diff_type (str): Specify the diff type. It is possible to use basic or json as diff type
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        possible_diff_types: list = ["basic", "json"]
+
+        if diff_type.lower() in possible_diff_types:
+            if (
+                dashboard_id_and_version_base != dict()
+                and dashboard_id_and_version_new != 0
+            ):
+                diff_object: dict = dict()
+                diff_object.update({"base": dashboard_id_and_version_base})
+                diff_object.update({"new": dashboard_id_and_version_new})
+                diff_object.update({"diffType": diff_type.lower()})
+
+                return (
+                    f"{APIEndpoints.DASHBOARDS.value}/calculate-diff",
+                    RequestsMethods.POST,
+                    diff_object,
+                )
+            else:
+                logging.error(
+                    "There is no dashboard_uid_and_version_base or dashboard_uid_and_version_new defined."
+                )
+                raise ValueError
+        else:
+            logging.error(
+                f"The diff_type: {diff_type.lower()} is not valid. Please specify a valid value."
+            )
             raise ValueError
+
+    @staticmethod
+    def _create_the_public_dashboards_request(
+        per_page: int = None, page: int = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to get the public dashboards
+
+        Args:
+            per_page (int): Specify the number of the public dashboards per page (default None)
+            page (int): Specify the page of the public dashboards (default None)
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        optional_parts: str = "?"
+
+        if per_page is not None:
+            optional_parts += f"perpage={per_page}"
+
+        if page is not None:
+            if len(optional_parts) > 1:
+                optional_parts += "&"
+            optional_parts += f"page={page}"
+
+        if len(optional_parts) == 1:
+            optional_parts: str = ""
+
+        return (f"{APIEndpoints.DASHBOARDS.value}/public-dashboards{optional_parts}",)
+
+    @staticmethod
+    def _create_the_public_dashboard_request(dashboard_uid: str) -> tuple:
+        """The method includes a functionality to create the request to get the public dashboard specified by the dashboard uid
+
+        Args:
+            dashboard_uid (str): Specify the dashboard uid
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if dashboard_uid is not None and len(dashboard_uid) != 0:
+            return (
+                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid}/public-dashboards",
+            )
+        else:
+            logging.error("There is no dashboard uid defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_public_dashboard_creation_request(
+        dashboard_uid: str, public_dashboard: PublicDashboard
+    ) -> tuple:
+        """The method includes a functionality to create the request to create a public dashboard
+
+        Args:
+            dashboard_uid (str): Specify the dashboard uid
+            public_dashboard (PublicDashboard): Specify the public dashboard configuration
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if (
+            dashboard_uid is not None
+            and len(dashboard_uid) != 0
+            and public_dashboard is not None
+        ):
+            public_dashboard_result: dict = dict(
+                {
+                    "uid": public_dashboard.uid,
+                    "accessToken": public_dashboard.access_token,
+                    "timeSelectionEnabled": public_dashboard.time_selection_enabled,
+                    "isEnabled": public_dashboard.is_enabled,
+                    "annotationsEnabled": public_dashboard.annotations_enabled,
+                    "share": public_dashboard.share,
+                }
+            )
+
+            return (
+                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid}/public-dashboards",
+                RequestsMethods.POST,
+                public_dashboard_result,
+            )
+        else:
+            logging.error("There is no dashboard uid or public dashboard defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_public_dashboard_update_request(
+        dashboard_uid: str,
+        public_dashboard_uid: str,
+        time_selection_enabled: bool = None,
+        is_enabled: bool = None,
+        annotations_enabled: bool = None,
+        share: str = None,
+    ) -> tuple:
+        """The method includes a functionality to create the request to update a public dashboard
+
+        Args:
+            dashboard_uid (str): Specify the dashboard uid
+            public_dashboard_uid (str): Specify the public dashboard uid
+            time_selection_enabled (bool): Specify if the time selection is enabled (default None)
+            is_enabled (bool): Specify if the public dashboard is enabled (default None)
+            annotations_enabled (bool): Specify if the annotations are enabled (default None)
+            share (str): Specify the share type of the public dashboard (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if (
+            dashboard_uid is not None
+            and len(dashboard_uid) != 0
+            and public_dashboard_uid is not None
+            and len(public_dashboard_uid) != 0
+        ):
+            public_dashboard_result: dict = dict()
+
+            if time_selection_enabled is not None:
+                public_dashboard_result.update(
+                    {"timeSelectionEnabled": time_selection_enabled}
+                )
+
+            if is_enabled is not None:
+                public_dashboard_result.update({"isEnabled": is_enabled})
+
+            if annotations_enabled is not None:
+                public_dashboard_result.update(
+                    {"annotationsEnabled": annotations_enabled}
+                )
+
+            if share is not None:
+                public_dashboard_result.update({"share": share})
+
+            if public_dashboard_result == dict():
+                logging.error(
+                    "There is no values for the update of the public dashboard defined."
+                )
+                raise ValueError
+
+            return (
+                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid}/public-dashboards/{public_dashboard_uid}",
+                RequestsMethods.PATCH,
+                public_dashboard_result,
+            )
+        else:
+            logging.error("There is no dashboard uid or public dashboard defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_public_dashboard_deletion_request(
+        dashboard_uid: str, public_dashboard_uid: str
+    ) -> tuple:
+        """The method includes a functionality to create the request to delete a public dashboard
+
+        Args:
+            dashboard_uid (str): Specify the dashboard uid
+            public_dashboard_uid (str): Specify the public dashboard uid
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if (
+            dashboard_uid is not None
+            and len(dashboard_uid) != 0
+            and public_dashboard_uid is not None
+            and len(public_dashboard_uid) != 0
+        ):
+            return (
+                f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid}/public-dashboards/{public_dashboard_uid}",
+                RequestsMethods.DELETE,
+                None,
+            )
+        else:
+            logging.error("There is no dashboard uid or public dashboard defined.")
+            raise ValueError
+
+    @staticmethod
+    def _check_the_public_dashboard_response(
+        api_call: dict, status_messages: dict, info: str = None
+    ) -> dict:
+        """The method includes a functionality to check the result of a public dashboard modification
+
+        Args:
+            api_call (dict): Specify the result of the API call including the status code
+            status_messages (dict): Specify the error messages by the status code
+            info (str): Specify the optional message that is logged for a successful modification (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the result of the API call
+        """
+
+        status_code: int = api_call.get("status")
+
+        if status_code == 200 and (
+            isinstance(api_call, dict) is True or api_call != dict()
+        ):
+            if info is not None:
+                logging.info(info)
+            return api_call
+        elif min(status_messages) <= status_code <= max(status_messages):
+            logging.error(status_messages.get(status_code))
+            raise Exception
+
+
+class AsyncDashboard:
+    """The class includes all necessary methods to access the Grafana dashboard API endpoints asynchronously
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    async def create_or_update_dashboard(
+        self,
+        dashboard_path: str,
+        dashboard_json: dict,
+        message: str,
+        overwrite: bool = False,
+    ):
+        """The method includes a functionality to create the specified dashboard
+
+        Args:
+            dashboard_path (str): Specify the dashboard path in which the dashboard is to be placed
+            dashboard_json (dict): Specify the inserted dashboard as dict
+            message (str): Specify the message that should be injected as commit message inside the dashboard
+            overwrite (bool): Should the already existing dashboard be overwritten (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if len(dashboard_path) != 0 and dashboard_json != dict() and len(message) != 0:
+            folder_uid: str = await AsyncFolder(
+                self.grafana_api_model
+            ).get_folder_uid_by_dashboard_path(dashboard_path)
+
+            Dashboard._check_the_dashboard_deployment(
+                await AsyncApi(self.grafana_api_model).call_the_api(
+                    *Dashboard._create_the_dashboard_request(
+                        folder_uid, dashboard_json, message, overwrite
+                    )
+                )
+            )
+        else:
+            logging.error(
+                "There is no dashboard_path or dashboard_json or message defined."
+            )
+            raise ValueError
+
+    async def deploy_many(
+        self,
+        dashboards: Iterable,
+        overwrite: bool = False,
+        max_workers: int = None,
+        skip_unchanged: bool = True,
+    ) -> List[DashboardDeployResult]:
+        """The method includes a functionality to deploy multiple dashboards. The dashboard paths are resolved once by the folder index, the dashboards whose content hash matches the already deployed dashboard are skipped and the remaining dashboards are deployed concurrently
+
+        Args:
+            dashboards (Iterable): Specify the dashboards as tuples of the dashboard path, the dashboard as dict and the commit message
+            overwrite (bool): Should the already existing dashboards be overwritten (default False)
+            max_workers (int): Specify the maximum number of concurrent requests. By default, the maximum concurrency of the model is used (default None)
+            skip_unchanged (bool): Specify if the dashboards with an unchanged content should be skipped. The check requires a uid inside the dashboard (default True)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            results (List[DashboardDeployResult]): Returns the result of every dashboard deployment in the order of the dashboards
+        """
+
+        batch_executor: BatchExecutor = BatchExecutor(
+            self.grafana_api_model, max_workers
+        )
+        results, deployments = Dashboard._prepare_the_deployments(
+            list(dashboards),
+            await AsyncFolder(self.grafana_api_model).get_folder_index(),
+        )
+
+        if skip_unchanged:
+            deployments = Dashboard._skip_the_unchanged_deployments(
+                deployments,
+                await batch_executor.execute_async(
+                    Dashboard._create_the_deployed_dashboard_requests(deployments)
+                ),
+                results,
+            )
+
+        Dashboard._collect_the_deployment_results(
+            deployments,
+            await batch_executor.execute_async(
+                Dashboard._create_the_deployment_requests(deployments, overwrite)
+            ),
+            results,
+        )
+
+        return results
+
+    async def delete_dashboard_by_name_and_path(
+        self, dashboard_name: str, dashboard_path: str
+    ):
+        """The method includes a functionality to delete the specified dashboard inside the model
+
+        Args:
+            dashboard_name (str): Specify the dashboard name of the deleted dashboard
+            dashboard_path (str): Specify the dashboard path in which the dashboard is to be placed
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if len(dashboard_name) != 0 and len(dashboard_path) != 0:
+            dashboard_uid: dict = await self.get_dashboard_uid_and_id_by_name_and_folder(
+                dashboard_name, dashboard_path
+            )
+
+            Api.check_the_api_call_message(
+                await AsyncApi(self.grafana_api_model).call_the_api(
+                    *Dashboard._create_the_dashboard_deletion_request(dashboard_uid)
+                ),
+                f"Dashboard {dashboard_name} deleted",
+                "You successfully destroyed the dashboard.",
+            )
+        else:
+            logging.error("There is no dashboard_name or dashboard_path defined.")
+            raise ValueError
+
+    async def get_dashboard_by_uid(self, uid: str) -> dict:
+        """The method includes a functionality to get the dashboard from the specified uid
+
+        Args:
+            uid (str): Specify the uid of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the dashboard
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_uid_request(uid)
+            ),
+            "dashboard",
+        )
+
+    async def get_dashboard_home(self) -> dict:
+        """The method includes a functionality to get the home dashboard
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the home dashboard
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DASHBOARDS.value}/home"
+            ),
+            "dashboard",
+        )
+
+    async def get_dashboard_tags(self) -> list:
+        """The method includes a functionality to get the all tags of all dashboards
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns all dashboard tags
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DASHBOARDS.value}/tags"
+            ),
+            "term",
+        )
+
+    async def get_dashboard_uid_and_id_by_name_and_folder(
+        self, dashboard_name: str, dashboard_path: str
+    ) -> dict:
+        """The method includes a functionality to extract the dashboard uid specified inside the model
+
+        Args:
+            dashboard_name (str): Specify the dashboard name of the dashboard
+            dashboard_path (str): Specify the dashboard path of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the dashboard uid and the id
+        """
+
+        if len(dashboard_name) != 0 and len(dashboard_path) != 0:
+            folder_uid: str = await AsyncFolder(
+                self.grafana_api_model
+            ).get_folder_uid_by_dashboard_path(dashboard_path)
+
+            return Dashboard._get_the_dashboard_uid_and_id(
+                await AsyncApi(self.grafana_api_model).call_the_api(
+                    *Dashboard._create_the_dashboard_search_request(
+                        dashboard_name, folder_uid
+                    )
+                ),
+                dashboard_name,
+            )
+        else:
+            logging.error("There is no dashboard_name or dashboard_path defined.")
+            raise ValueError
+
+    async def get_dashboard_permissions(self, id: int) -> list:
+        """The method includes a functionality to extract the dashboard permissions based on the specified id
+
+        Args:
+            id (int): Specify the id of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns the dashboard permissions of a dashboard as list
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_permissions_request(id=id)
+            ),
+            "role",
+        )
+
+    async def get_dashboard_permissions_by_uid(self, uid: str) -> list:
+        """The method includes a functionality to extract the dashboard permissions based on the specified uid
+
+        Args:
+            uid (str): Specify the uid of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns the dashboard permissions of a dashboard as list
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_permissions_request(uid=uid)
+            ),
+            "role",
+        )
+
+    async def update_dashboard_permissions(self, id: int, permission_json: dict):
+        """The method includes a functionality to update the dashboard permissions based on the specified id and the permission json document
+
+        Args:
+            id (int): Specify the id of the dashboard
+            permission_json (dict): Specify the inserted permissions as dict
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_permissions_request(
+                    id=id, permission_json=permission_json
+                )
+            ),
+            "Dashboard permissions updated",
+            "You successfully modified the dashboard permissions.",
+        )
+
+    async def update_dashboard_permissions_by_uid(self, uid: str, permission_json: dict):
+        """The method includes a functionality to update the dashboard permissions based on the specified uid and the permission json document
+
+        Args:
+            uid (str): Specify the uid of the dashboard
+            permission_json (dict): Specify the inserted permissions as dict
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_permissions_request(
+                    uid=uid, permission_json=permission_json
+                )
+            ),
+            "Dashboard permissions updated",
+            "You successfully modified the dashboard permissions.",
+        )
+
+    async def get_dashboard_versions(self, id: int) -> list:
+        """The method includes a functionality to extract the versions of a dashboard based on the specified id
+
+        Args:
+            id (int): Specify the id of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns all dashboard versions of a dashboard as list
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_versions_request(id=id)
+            ),
+            "id",
+        )
+
+    async def get_dashboard_versions_by_uid(self, uid: str) -> list:
+        """The method includes a functionality to extract the versions of a dashboard based on the specified uid
+
+        Args:
+            uid (str): Specify the id of the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns all dashboard versions of a dashboard as list
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_versions_request(uid=uid)
+            ),
+            "uid",
+        )
+
+    async def get_dashboard_version(self, id: int, version_id: int) -> dict:
+        """The method includes a functionality to extract a specified version of a dashboard based on the specified dashboard id and a version_id of the dashboard
+
+        Args:
+            id (int): Specify the id of the dashboard
+            version_id (int): Specify the version_id of a dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns a dashboard version of a dashboard as dict
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_versions_request(
+                    id=id, version_id=version_id
+                )
+            ),
+            "id",
+        )
+
+    async def get_dashboard_version_by_uid(self, uid: str, version_id: int) -> dict:
+        """The method includes a functionality to extract a specified version of a dashboard based on the specified dashboard uid and a version_id of the dashboard
+
+        Args:
+            uid (str): Specify the uid of the dashboard
+            version_id (int): Specify the version_id of a dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns a dashboard version of a dashboard as dict
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_versions_request(
+                    uid=uid, version_id=version_id
+                )
+            ),
+            "uid",
+        )
+
+    async def restore_dashboard_version(self, id: int, version: dict):
+        """The method includes a functionality to restore a specified version of a dashboard based on the specified dashboard id and a version as dict of the dashboard
+
+        Args:
+            id (int): Specify the id of the dashboard
+            version (dict): Specify the version_id of a dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Dashboard._check_the_dashboard_restore(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_restore_request(version, id=id)
+            )
+        )
+
+    async def restore_dashboard_version_by_uid(self, uid: str, version: dict):
+        """The method includes a functionality to restore a specified version of a dashboard based on the specified dashboard uid and a version as dict of the dashboard
+
+        Args:
+            uid (str): Specify the uid of the dashboard
+            version (dict): Specify the version_id of a dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Dashboard._check_the_dashboard_restore(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_dashboard_restore_request(version, uid=uid)
+            )
+        )
+
+    async def calculate_dashboard_diff(
+        self,
+        dashboard_id_and_version_base: dict,
+        dashboard_id_and_version_new: dict,
+        diff_type: str = "json",
+    ) -> str:
+        """The method includes a functionality to calculate the diff of specified versions of a dashboard based on the specified dashboard uid and the selected version of the base dashboard and the new dashboard and the diff type (basic or json)
+
+        Args:
+            dashboard_id_and_version_base (dict): Specify the version and id of the base dashboard
+            dashboard_id_and_version_new (dict): Specify the version and id of the new dashboard
+            diff_type (str): Specify the diff type (basic or json) (default json)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (str): Returns the difference of the two specified dashboards
+        """
+
+        api_call: any = await AsyncApi(self.grafana_api_model).call_the_api(
+            *Dashboard._create_the_dashboard_diff_request(
+                dashboard_id_and_version_base, dashboard_id_and_version_new, diff_type
+            )
+        )
+
+        if api_call.status_code != 200:
+            logging.error(f"Check the error: {api_call.text}.")
+            raise Exception
+        else:
+            return api_call.text
+
+    async def get_public_dashboards(self, per_page: int = None, page: int = None) -> dict:
+        """The method includes a functionality to get all public available dashboards
+
+        Required Permissions:
+            Action: dashboards:read
+            Scope: dashboards:uid:<dashboard UID>
+
+        Args:
+            per_page (int): Specify the value per page size
+            page (int): Specify the page
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns all public available dashboards
+        """
+
+        return Api.check_the_api_call_type(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboards_request(per_page, page)
+            ),
+            dict,
+        )
+
+    async def get_public_dashboard_by_uid(
+        self,
+        dashboard_uid: str,
+    ) -> dict:
+        """The method includes a functionality to get a public available dashboard specified by dashboard_uid
+
+        Required Permissions:
+            Action: dashboards:read
+            Scope: dashboards:uid:<dashboard UID>
+
+        Args:
+            dashboard_uid (str): Specify the dashboard_uid
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the corresponding public available dashboard
+        """
+
+        return Api.check_the_api_call_type(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboard_request(dashboard_uid)
+            ),
+            dict,
+        )
+
+    async def create_public_dashboard(
+        self, dashboard_uid: str, public_dashboard: PublicDashboard = PublicDashboard()
+    ) -> dict:
+        """The method includes a functionality to create a public available dashboard
+
+        Required Permissions:
+            Action: dashboards.public:write
+            Scope: dashboards:uid:<dashboard UID>
+
+        Args:
+            dashboard_uid (str): Specify the dashboard_uid
+            public_dashboard (PublicDashboard): Specify the optional public dashboard object
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the corresponding public available dashboard
+        """
+
+        return Dashboard._check_the_public_dashboard_response(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboard_creation_request(
+                    dashboard_uid, public_dashboard
+                ),
+                response_status_code=True,
+            ),
+            dict(
+                {
+                    400: "Dashboard is already public.",
+                    401: "Unauthorized.",
+                    403: "Access denied.",
+                    404: "Dashboard not found.",
+                }
+            ),
+        )
+
+    async def update_public_dashboard(
+        self,
+        dashboard_uid: str,
+        public_dashboard_uid: str,
+        time_selection_enabled: bool = None,
+        is_enabled: bool = None,
+        annotations_enabled: bool = None,
+        share: str = None,
+    ) -> dict:
+        """The method includes a functionality to update a public available dashboard
+
+        Required Permissions:
+            Action: dashboards.public:write
+            Scope: dashboards:uid:<dashboard UID>
+
+        Args:
+            dashboard_uid (str): Specify the dashboard_uid
+            public_dashboard_uid (str): Specify the public_dashboard_uid
+            time_selection_enabled (bool): Specify the optional enablement of the time picker inside the public dashboard (default None)
+            is_enabled (bool): Specify the optional enablement of the public dashboard (default None)
+            annotations_enabled (bool): Specify the optional enablement of the annotations inside the public dashboard (default None)
+            share (str): Specify the optional share mode of the public dashboard (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the corresponding public available dashboard
+        """
+
+        return Dashboard._check_the_public_dashboard_response(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboard_update_request(
+                    dashboard_uid,
+                    public_dashboard_uid,
+                    time_selection_enabled,
+                    is_enabled,
+                    annotations_enabled,
+                    share,
+                ),
+                response_status_code=True,
+            ),
+            dict(
+                {
+                    400: "Dashboard is already public.",
+                    401: "Unauthorized.",
+                    403: "Access denied.",
+                    404: "Public dashboard not found.",
+                }
+            ),
+        )
+
+    async def delete_public_dashboard(
+        self,
+        dashboard_uid: str,
+        public_dashboard_uid: str,
+    ):
+        """The method includes a functionality to delete a public available dashboard
+
+        Required Permissions:
+            Action: dashboards.public:write
+            Scope: dashboards:uid:<dashboard UID>
+
+        Args:
+            dashboard_uid (str): Specify the dashboard_uid
+            public_dashboard_uid (str): Specify the public_dashboard_uid
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Dashboard._check_the_public_dashboard_response(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Dashboard._create_the_public_dashboard_deletion_request(
+                    dashboard_uid, public_dashboard_uid
+                ),
+                response_status_code=True,
+            ),
+            dict(
+                {
+                    401: "Unauthorized.",
+                    403: "Access denied.",
+                }
+            ),
+            "You successfully deleted the public dashboard.",
+        )
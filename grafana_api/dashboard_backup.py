@@ -0,0 +1,587 @@
+import io
+import os
+import re
+import logging
+import tarfile
+from typing import Generator, List
+
+from .api import Api, BatchExecutor
+from .model import (
+    APIModel,
+    APIEndpoints,
+    ExportFormat,
+    FolderIndex,
+    DeployStatus,
+    DashboardDeployResult,
+)
+from .folder import Folder
+from .dashboard import Dashboard
+
+
+class DashboardBackup:
+    """The class includes all necessary methods to export and to import all dashboards of the organization
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    def export_dashboards(
+        self,
+        target_path: str,
+        export_format: ExportFormat = ExportFormat.DIRECTORY,
+        results_per_page: int = 100,
+        max_workers: int = None,
+    ) -> int:
+        """The method includes a functionality to export all dashboards of the organization. The dashboards are enumerated page by page, the dashboards of a page are requested concurrently and are streamed to a directory tree that mirrors the folder hierarchy, to a JSON Lines file or to a tar archive. Only the dashboards of the current and the prefetched next page are held in memory
+
+        Args:
+            target_path (str): Specify the target directory or the target file of the export
+            export_format (ExportFormat): Specify the format of the export (default ExportFormat.DIRECTORY)
+            results_per_page (int): Specify the number of dashboards per page (default 100)
+            max_workers (int): Specify the maximum number of concurrent requests. By default, the maximum concurrency of the model is used (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            exported_dashboards (int): Returns the number of the exported dashboards
+        """
+
+        if len(target_path) != 0 and isinstance(export_format, ExportFormat):
+            folder_paths: dict = DashboardBackup._get_the_folder_paths(
+                Folder(self.grafana_api_model).get_folder_index()
+            )
+            dashboards: Generator[dict, None, None] = self._get_the_dashboards(
+                results_per_page, max_workers
+            )
+
+            if export_format == ExportFormat.DIRECTORY:
+                return self._export_to_directory(
+                    target_path, dashboards, folder_paths
+                )
+            elif export_format == ExportFormat.JSONL:
+                return self._export_to_jsonl(target_path, dashboards)
+            else:
+                return self._export_to_tar(target_path, dashboards, folder_paths)
+        else:
+            logging.error("There is no target_path or valid export_format defined.")
+            raise ValueError
+
+    def import_dashboards(
+        self,
+        source_path: str,
+        import_format: ExportFormat = ExportFormat.DIRECTORY,
+        manifest_path: str = None,
+        verify_versions: bool = False,
+        message: str = "Imported dashboard",
+        max_workers: int = None,
+    ) -> List[DashboardDeployResult]:
+        """The method includes a functionality to incrementally import the dashboards of an export. The dashboards whose content hash matches the hash inside the manifest are skipped without an API call. Optionally, the server version of these dashboards is compared with the version inside the manifest. All other dashboards are only deployed, if their content differs from the server. The folder paths of the deployed dashboards that are not existing are created before the deployment. The content hash and the server version of every imported dashboard are recorded inside the manifest
+
+        Args:
+            source_path (str): Specify the source directory or the source file of the import
+            import_format (ExportFormat): Specify the format of the import (default ExportFormat.DIRECTORY)
+            manifest_path (str): Specify the path of the manifest file that maps the dashboard uids to the content hash and the version. The file is created, if it's not existing (default None)
+            verify_versions (bool): Specify if the server version of the dashboards that are unchanged according to the manifest should be compared with the version inside the manifest (default False)
+            message (str): Specify the message that should be injected as commit message inside the dashboards (default Imported dashboard)
+            max_workers (int): Specify the maximum number of concurrent requests. By default, the maximum concurrency of the model is used (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            results (List[DashboardDeployResult]): Returns the result of every dashboard import in the order of the source
+        """
+
+        if len(source_path) != 0 and isinstance(import_format, ExportFormat):
+            folder_index: FolderIndex = Folder(
+                self.grafana_api_model
+            ).get_folder_index()
+            manifest: dict = self._read_the_manifest(manifest_path)
+            dashboards: list = list(
+                self._read_the_dashboards(
+                    source_path,
+                    import_format,
+                    DashboardBackup._get_the_folder_paths(folder_index),
+                )
+            )
+
+            results: list = [None] * len(dashboards)
+            deployments: list = list()
+            unchanged_dashboards: list = list()
+
+            for position, (dashboard_path, dashboard_json) in enumerate(dashboards):
+                manifest_entry: dict = manifest.get(dashboard_json.get("uid")) or dict()
+
+                if manifest_entry.get("hash") == Dashboard.calculate_dashboard_hash(
+                    dashboard_json
+                ):
+                    unchanged_dashboards.append((position, dashboard_path, dashboard_json))
+                else:
+                    deployments.append((position, dashboard_path, dashboard_json))
+
+            if verify_versions:
+                deployed_dashboards: list = BatchExecutor(
+                    self.grafana_api_model, max_workers
+                ).execute(
+                    [
+                        (
+                            f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_json.get('uid')}",
+                        )
+                        for _, _, dashboard_json in unchanged_dashboards
+                    ]
+                )
+
+                verified_dashboards: list = list()
+                for unchanged_dashboard, deployed_dashboard in zip(
+                    unchanged_dashboards, deployed_dashboards
+                ):
+                    deployed_meta: dict = (
+                        deployed_dashboard.result.get("meta") or dict()
+                        if isinstance(deployed_dashboard.result, dict)
+                        else dict()
+                    )
+                    manifest_version: any = manifest.get(
+                        unchanged_dashboard[2].get("uid")
+                    ).get("version")
+
+                    if (
+                        deployed_meta.get("version") is not None
+                        and deployed_meta.get("version") == manifest_version
+                    ):
+                        verified_dashboards.append(unchanged_dashboard)
+                    else:
+                        deployments.append(unchanged_dashboard)
+
+                unchanged_dashboards = verified_dashboards
+
+            for position, dashboard_path, dashboard_json in unchanged_dashboards:
+                results[position] = DashboardDeployResult(
+                    dashboard_path, dashboard_json.get("uid"), DeployStatus.SKIPPED
+                )
+
+            deployments.sort(key=lambda deployment: deployment[0])
+            self._create_the_missing_folders(
+                [dashboard_path for _, dashboard_path, _ in deployments], folder_index
+            )
+
+            for (position, _, dashboard_json), result in zip(
+                deployments,
+                Dashboard(self.grafana_api_model).deploy_many(
+                    [
+                        (dashboard_path, dashboard_json, message)
+                        for _, dashboard_path, dashboard_json in deployments
+                    ],
+                    overwrite=True,
+                    max_workers=max_workers,
+                ),
+            ):
+                results[position] = result
+                DashboardBackup._update_the_manifest(manifest, dashboard_json, result)
+
+            self._write_the_manifest(manifest_path, manifest)
+
+            return results
+        else:
+            logging.error("There is no source_path or valid import_format defined.")
+            raise ValueError
+
+    def _get_the_dashboards(
+        self, results_per_page: int = 100, max_workers: int = None
+    ) -> Generator[dict, None, None]:
+        """The method includes a functionality to lazily extract all dashboards of the organization page by page. The dashboards of a page are requested concurrently and the next page is prefetched while the current page is consumed
+
+        Args:
+            results_per_page (int): Specify the number of dashboards per page (default 100)
+            max_workers (int): Specify the maximum number of concurrent requests (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            dashboards (Generator[dict, None, None]): Returns the dashboards including the corresponding meta information
+        """
+
+        batch_executor: BatchExecutor = BatchExecutor(
+            self.grafana_api_model, max_workers
+        )
+        dashboard: Dashboard = Dashboard(self.grafana_api_model)
+
+        def get_page(page: int) -> tuple:
+            search_results: list = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.SEARCH.value}?type=dash-db&limit={results_per_page}&page={page}"
+            )
+
+            if not isinstance(search_results, list):
+                logging.error(f"Check the error: {search_results}.")
+                raise Exception
+            elif search_results == list():
+                return list(), None
+
+            dashboards: list = list()
+            for result in batch_executor.execute(
+                [
+                    (dashboard.get_dashboard_by_uid, search_result.get("uid"))
+                    for search_result in search_results
+                ]
+            ):
+                if result.error is not None:
+                    raise result.error
+                dashboards.append(result.result)
+
+            return dashboards, None
+
+        return Api.iterate_the_pages(get_page, results_per_page, prefetch=True)
+
+    def _read_the_dashboards(
+        self, source_path: str, import_format: ExportFormat, folder_paths: dict
+    ) -> Generator[tuple, None, None]:
+        """The method includes a functionality to lazily read the dashboards of an export. The dashboard path is taken from the folder uid of the dashboard meta information and, as fallback, from the location of the dashboard inside the directory tree or the tar archive
+
+        Args:
+            source_path (str): Specify the source directory or the source file
+            import_format (ExportFormat): Specify the format of the source
+            folder_paths (dict): Specify the full folder paths by the folder uid
+
+        Returns:
+            dashboards (Generator[tuple, None, None]): Returns the dashboard path and the dashboard as dict
+        """
+
+        if import_format == ExportFormat.DIRECTORY:
+            for directory, directories, files in os.walk(source_path):
+                directories.sort()
+
+                for file_name in sorted(files):
+                    if file_name.endswith(".json"):
+                        with open(os.path.join(directory, file_name), "rb") as file:
+                            yield DashboardBackup._get_the_dashboard(
+                                self.grafana_api_model.json_codec.loads(file.read()),
+                                os.path.relpath(directory, source_path).replace(
+                                    os.sep, "/"
+                                ),
+                                folder_paths,
+                            )
+        elif import_format == ExportFormat.JSONL:
+            with open(source_path, "rb") as file:
+                for line in file:
+                    if len(line.strip()) != 0:
+                        yield DashboardBackup._get_the_dashboard(
+                            self.grafana_api_model.json_codec.loads(line),
+                            None,
+                            folder_paths,
+                        )
+        else:
+            with tarfile.open(source_path) as archive:
+                for member in archive:
+                    if member.isfile() and member.name.endswith(".json"):
+                        yield DashboardBackup._get_the_dashboard(
+                            self.grafana_api_model.json_codec.loads(
+                                archive.extractfile(member).read()
+                            ),
+                            os.path.dirname(member.name),
+                            folder_paths,
+                        )
+
+    @staticmethod
+    def _get_the_dashboard(
+        content: dict, location_path: str, folder_paths: dict
+    ) -> tuple:
+        """The method includes a functionality to extract the dashboard path and the dashboard of an exported dashboard. The id of the dashboard is removed, because it's specific for the exporting Grafana instance
+
+        Args:
+            content (dict): Specify the exported dashboard with or without the meta information
+            location_path (str): Specify the relative directory of the dashboard inside the export or None
+            folder_paths (dict): Specify the full folder paths by the folder uid
+
+        Returns:
+            dashboard (tuple): Returns the dashboard path and the dashboard as dict
+        """
+
+        dashboard_json: dict = dict(content.get("dashboard", content))
+        dashboard_json.pop("id", None)
+
+        folder_uid: str = (content.get("meta") or dict()).get("folderUid")
+
+        if folder_uid in folder_paths:
+            dashboard_path: str = folder_paths.get(folder_uid)
+        elif location_path not in (None, "", "."):
+            dashboard_path: str = location_path
+        else:
+            dashboard_path: str = "General"
+
+        return dashboard_path, dashboard_json
+
+    def _create_the_missing_folders(
+        self, dashboard_paths: list, folder_index: FolderIndex
+    ):
+        """The method includes a functionality to create the folders of the dashboard paths that are not existing. The folders of a nested path are created segment by segment below the corresponding parent folder
+
+        Args:
+            dashboard_paths (list): Specify the dashboard paths e.g. Parent/Child
+            folder_index (FolderIndex): Specify the folder index
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        folder: Folder = Folder(self.grafana_api_model)
+        created_folders: dict = dict()
+
+        for dashboard_path in sorted(set(dashboard_paths)):
+            if (
+                len(dashboard_path) == 0
+                or dashboard_path == "General"
+                or folder_index.get_folder(dashboard_path) is not None
+            ):
+                continue
+
+            parent_uid: str = None
+            segments: list = dashboard_path.split("/")
+            for position, segment in enumerate(segments):
+                folder_path: str = "/".join(segments[: position + 1])
+                existing_folder: dict | None = created_folders.get(
+                    folder_path, folder_index.by_path.get(folder_path)
+                )
+
+                if existing_folder is None:
+                    existing_folder = folder.create_folder(segment, parent_uid=parent_uid)
+                    created_folders[folder_path] = existing_folder
+
+                parent_uid = existing_folder.get("uid")
+
+    def _read_the_manifest(self, manifest_path: str = None) -> dict:
+        """The method includes a functionality to read the manifest of the imported dashboards
+
+        Args:
+            manifest_path (str): Specify the path of the manifest file (default None)
+
+        Returns:
+            manifest (dict): Returns the content hash and the version by the dashboard uid
+        """
+
+        if manifest_path is None or not os.path.isfile(manifest_path):
+            return dict()
+
+        with open(manifest_path, "rb") as file:
+            return self.grafana_api_model.json_codec.loads(file.read())
+
+    def _write_the_manifest(self, manifest_path: str, manifest: dict):
+        """The method includes a functionality to atomically write the manifest of the imported dashboards
+
+        Args:
+            manifest_path (str): Specify the path of the manifest file
+            manifest (dict): Specify the content hash and the version by the dashboard uid
+
+        Returns:
+            None
+        """
+
+        if manifest_path is None:
+            return
+
+        with open(f"{manifest_path}.tmp", "wb") as file:
+            file.write(self._encode_the_dashboard(manifest))
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    @staticmethod
+    def _update_the_manifest(
+        manifest: dict, dashboard_json: dict, result: DashboardDeployResult
+    ):
+        """The method includes a functionality to record the content hash and the server version of a successfully imported dashboard inside the manifest
+
+        Args:
+            manifest (dict): Specify the content hash and the version by the dashboard uid
+            dashboard_json (dict): Specify the imported dashboard
+            result (DashboardDeployResult): Specify the result of the import
+
+        Returns:
+            None
+        """
+
+        if result.status == DeployStatus.FAILED or not isinstance(result.result, dict):
+            return
+
+        version: any = result.result.get("version")
+        if version is None:
+            version = (result.result.get("meta") or dict()).get("version")
+
+        manifest[result.dashboard_uid or dashboard_json.get("uid")] = dict(
+            {
+                "hash": Dashboard.calculate_dashboard_hash(dashboard_json),
+                "version": version,
+            }
+        )
+
+    @staticmethod
+    def _get_the_folder_paths(folder_index: FolderIndex) -> dict:
+        """The method includes a functionality to map the folder uids to the full folder paths
+
+        Args:
+            folder_index (FolderIndex): Specify the folder index
+
+        Returns:
+            folder_paths (dict): Returns the full folder paths by the folder uid
+        """
+
+        return {folder.get("uid"): path for path, folder in folder_index.by_path.items()}
+
+    @staticmethod
+    def _get_the_dashboard_file_path(dashboard: dict, folder_paths: dict) -> str:
+        """The method includes a functionality to create the relative file path of a dashboard that mirrors the folder hierarchy
+
+        Args:
+            dashboard (dict): Specify the dashboard including the corresponding meta information
+            folder_paths (dict): Specify the full folder paths by the folder uid
+
+        Returns:
+            file_path (str): Returns the relative file path of the dashboard
+        """
+
+        folder_uid: str = (dashboard.get("meta") or dict()).get("folderUid") or ""
+        folder_path: str = folder_paths.get(folder_uid, "General")
+
+        return "/".join(
+            [DashboardBackup._sanitize_the_path_segment(segment) for segment in folder_path.split("/")]
+            + [
+                f"{DashboardBackup._sanitize_the_path_segment(dashboard.get('dashboard').get('uid'))}.json"
+            ]
+        )
+
+    @staticmethod
+    def _sanitize_the_path_segment(segment: str) -> str:
+        """The method includes a functionality to replace the characters of a path segment that are not valid inside a file or directory name
+
+        Args:
+            segment (str): Specify the path segment
+
+        Returns:
+            segment (str): Returns the sanitized path segment
+        """
+
+        segment = re.sub(r'[\\/:*?"<>|\x00-\x1f]', "_", str(segment)).strip()
+
+        if segment in ("", ".", ".."):
+            return "_"
+        return segment
+
+    def _export_to_directory(
+        self,
+        target_path: str,
+        dashboards: Generator[dict, None, None],
+        folder_paths: dict,
+    ) -> int:
+        """The method includes a functionality to write every dashboard into a separate JSON file inside a directory tree that mirrors the folder hierarchy
+
+        Args:
+            target_path (str): Specify the target directory
+            dashboards (Generator[dict, None, None]): Specify the dashboards
+            folder_paths (dict): Specify the full folder paths by the folder uid
+
+        Returns:
+            exported_dashboards (int): Returns the number of the exported dashboards
+        """
+
+        exported_dashboards: int = 0
+
+        for dashboard in dashboards:
+            file_path: str = os.path.join(
+                target_path,
+                *DashboardBackup._get_the_dashboard_file_path(
+                    dashboard, folder_paths
+                ).split("/"),
+            )
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            with open(file_path, "wb") as file:
+                file.write(self._encode_the_dashboard(dashboard))
+
+            exported_dashboards += 1
+
+        return exported_dashboards
+
+    def _export_to_jsonl(
+        self, target_path: str, dashboards: Generator[dict, None, None]
+    ) -> int:
+        """The method includes a functionality to write every dashboard as a separate line into a JSON Lines file
+
+        Args:
+            target_path (str): Specify the target file
+            dashboards (Generator[dict, None, None]): Specify the dashboards
+
+        Returns:
+            exported_dashboards (int): Returns the number of the exported dashboards
+        """
+
+        exported_dashboards: int = 0
+
+        with open(target_path, "wb") as file:
+            for dashboard in dashboards:
+                file.write(
+                    self._encode_the_dashboard(dashboard)
+                )
+                file.write(b"\n")
+                exported_dashboards += 1
+
+        return exported_dashboards
+
+    def _export_to_tar(
+        self,
+        target_path: str,
+        dashboards: Generator[dict, None, None],
+        folder_paths: dict,
+    ) -> int:
+        """The method includes a functionality to write every dashboard as a separate JSON file into a tar archive that mirrors the folder hierarchy. The archive is gzip compressed if the target file ends with .gz or .tgz
+
+        Args:
+            target_path (str): Specify the target file
+            dashboards (Generator[dict, None, None]): Specify the dashboards
+            folder_paths (dict): Specify the full folder paths by the folder uid
+
+        Returns:
+            exported_dashboards (int): Returns the number of the exported dashboards
+        """
+
+        exported_dashboards: int = 0
+        mode: str = "w:gz" if target_path.endswith((".gz", ".tgz")) else "w"
+
+        with tarfile.open(target_path, mode) as archive:
+            for dashboard in dashboards:
+                content: bytes = self._encode_the_dashboard(dashboard)
+                tar_info: tarfile.TarInfo = tarfile.TarInfo(
+                    DashboardBackup._get_the_dashboard_file_path(
+                        dashboard, folder_paths
+                    )
+                )
+                tar_info.size = len(content)
+                archive.addfile(tar_info, io.BytesIO(content))
+                exported_dashboards += 1
+
+        return exported_dashboards
+
+    def _encode_the_dashboard(self, dashboard: dict) -> bytes:
+        """The method includes a functionality to serialize a dashboard to JSON bytes by the JSON codec of the model
+
+        Args:
+            dashboard (dict): Specify the dashboard
+
+        Returns:
+            content (bytes): Returns the serialized dashboard
+        """
+
+        content: any = self.grafana_api_model.json_codec.dumps(dashboard)
+
+        if isinstance(content, str):
+            return content.encode("utf-8")
+        return content
@@ -1,5 +1,9 @@
-import json
+import asyncio
+import calendar
+import datetime
 import logging
+import re
+from typing import Iterator
 
 from .model import (
     APIModel,
@@ -7,8 +11,16 @@ from .model import (
     RequestsMethods,
     DatasourceCache,
     DatasourcePermission,
+    DatasourceRegistry,
+    DataFrameDecoder,
+    DatasourceQueryRequest,
+    QueryResultCache,
+    JSONCodec,
+    BatchResult,
+    DEFAULT_CHUNK_SIZE_MS,
+    MAX_CHUNKS,
 )
-from .api import Api
+from .api import Api, AsyncApi, BatchExecutor
 
 
 class Datasource:
@@ -40,16 +52,48 @@ class Datasource:
             api_call (list): Returns the list of all datasources
         """
 
-        api_call: list = Api(self.grafana_api_model).call_the_api(
-            APIEndpoints.DATASOURCES.value,
-            RequestsMethods.GET,
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                APIEndpoints.DATASOURCES.value,
+                RequestsMethods.GET,
+            ),
+            "id",
         )
 
-        if api_call == list() or api_call[0].get("id") is None:
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
+    def get_datasource_registry(self, refresh: bool = False) -> DatasourceRegistry:
+        """The method includes a functionality to get the datasource registry of the model. The registry is built by a single request of all datasources, is shared by all datasource lookups of the model and is rebuilt, if it's expired or a refresh is requested. The registered datasources are the datasource summaries of the datasource list endpoint
+
+        Args:
+            refresh (bool): Specify if the registry should be rebuilt independent of the time to live (default False)
+
+        Required Permissions:
+            Action: datasources:read
+            Scope: datasources:*
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasource_registry (DatasourceRegistry): Returns the datasource registry
+        """
+
+        datasource_registry: DatasourceRegistry = (
+            self.grafana_api_model.datasource_registry
+        )
+
+        with datasource_registry.lock:
+            if refresh or not datasource_registry.is_valid():
+                api_call: list = Api(self.grafana_api_model).call_the_api(
+                    APIEndpoints.DATASOURCES.value,
+                    RequestsMethods.GET,
+                )
+
+                datasource_registry.update(
+                    Datasource._check_the_datasources(api_call),
+                    self.grafana_api_model.datasource_registry_ttl,
+                )
+
+        return datasource_registry
 
     def get_datasource_by_id(self, datasource_id: int) -> dict:
         """The method includes a functionality to get the datasource specified by the datasource id
@@ -69,20 +113,12 @@ class Datasource:
             api_call (dict): Returns a datasource
         """
 
-        if datasource_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}",
-                RequestsMethods.GET,
-            )
-
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no datasource_id defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(datasource_id=datasource_id)
+            ),
+            "id",
+        )
 
     def get_datasource_by_uid(self, uid: str) -> dict:
         """The method includes a functionality to get the datasource specified by the datasource uid
@@ -102,23 +138,15 @@ class Datasource:
             api_call (dict): Returns a datasource
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/uid/{uid}",
-                RequestsMethods.GET,
-            )
-
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no uid defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(uid=uid)
+            ),
+            "id",
+        )
 
     def get_datasource_by_name(self, name: str) -> dict:
-        """The method includes a functionality to get the datasource specified by the datasource name
+        """The method includes a functionality to get the datasource specified by the datasource name. The requested datasource is added to a valid datasource registry of the model
 
         Args:
             name (str): Specify the name of the datasource
@@ -135,23 +163,20 @@ class Datasource:
             api_call (dict): Returns a datasource
         """
 
-        if len(name) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/name/{name}",
-                RequestsMethods.GET,
-            )
+        api_call: dict = Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(name=name)
+            ),
+            "id",
+        )
 
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no name defined.")
-            raise ValueError
+        Datasource._register_the_named_datasource(
+            self.grafana_api_model.datasource_registry, api_call
+        )
+        return api_call
 
     def get_datasource_id_by_name(self, name: str) -> int:
-        """The method includes a functionality to get the datasource id specified by the datasource name
+        """The method includes a functionality to get the datasource id specified by the datasource name. The datasource id is looked up inside the datasource registry of the model and is only requested, if the datasource is not registered or the caching of the registry is disabled
 
         Args:
             name (str): Specify the name of the datasource
@@ -169,16 +194,22 @@ class Datasource:
         """
 
         if len(name) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/id/{name}",
-                RequestsMethods.GET,
-            )
+            if self.grafana_api_model.datasource_registry_ttl > 0:
+                datasource: dict | None = Datasource._get_the_registered_datasource(
+                    self.get_datasource_registry(), name
+                )
 
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return int(api_call.get("id"))
+                if datasource is not None:
+                    return int(datasource.get("id"))
+
+            api_call: dict = Api.check_the_api_call(
+                Api(self.grafana_api_model).call_the_api(
+                    f"{APIEndpoints.DATASOURCES.value}/id/{name}",
+                    RequestsMethods.GET,
+                ),
+                "id",
+            )
+            return int(api_call.get("id"))
         else:
             logging.error("There is no name defined.")
             raise ValueError
@@ -200,21 +231,16 @@ class Datasource:
             None
         """
 
-        if data_source != dict():
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                APIEndpoints.DATASOURCES.value,
-                RequestsMethods.POST,
-                json.dumps(data_source),
-            )
-
-            if api_call.get("message") != "Datasource added":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully created a datasource.")
-        else:
-            logging.error("There is no data_source defined.")
-            raise ValueError
+        Datasource._register_the_datasource(
+            self.grafana_api_model.datasource_registry,
+            Api.check_the_api_call_message(
+                Api(self.grafana_api_model).call_the_api(
+                    *Datasource._create_the_datasource_creation_request(data_source)
+                ),
+                "Datasource added",
+                "You successfully created a datasource.",
+            ),
+        )
 
     def update_datasource(self, data_source: dict, datasource_id: int = 0, datasource_uid: str | None = None):
         """The method includes a functionality to update a datasource specified by the datasource as dict and the datasource id/ datasource uid
@@ -236,25 +262,18 @@ class Datasource:
             None
         """
 
-        if data_source != dict() and (datasource_id != 0 or datasource_uid is not None):
-            if datasource_uid is not None:
-                endpoint = f"{APIEndpoints.DATASOURCES.value}/uid/{datasource_uid}"
-            else:
-                endpoint = f"{APIEndpoints.DATASOURCES.value}/{datasource_id}"
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                endpoint,
-                RequestsMethods.PUT,
-                json.dumps(data_source),
-            )
-
-            if api_call.get("message") != "Datasource updated":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully updated a datasource.")
-        else:
-            logging.error("There is no datasource_id, dashboard_uid or data_source defined.")
-            raise ValueError
+        Datasource._register_the_datasource(
+            self.grafana_api_model.datasource_registry,
+            Api.check_the_api_call_message(
+                Api(self.grafana_api_model).call_the_api(
+                    *Datasource._create_the_datasource_update_request(
+                        data_source, datasource_id, datasource_uid
+                    )
+                ),
+                "Datasource updated",
+                "You successfully updated a datasource.",
+            ),
+        )
 
     def delete_datasource_by_id(self, datasource_id: int):
         """The method includes a functionality to delete a datasource specified by the datasource id
@@ -274,23 +293,18 @@ class Datasource:
             None
         """
 
-        if datasource_id != 0 :
-            endpoint = f"{APIEndpoints.DATASOURCES.value}/{datasource_id}"
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                endpoint,
-                RequestsMethods.DELETE,
-            )
-
-            if api_call.get("message") != "Data source deleted":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully deleted a datasource.")
-                return
-        else:
-            logging.error("There is no datasource_id defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(
+                    RequestsMethods.DELETE, datasource_id=datasource_id
+                )
+            ),
+            "Data source deleted",
+            "You successfully deleted a datasource.",
+        )
+        Datasource._unregister_the_datasource(
+            self.grafana_api_model.datasource_registry, datasource_id=datasource_id
+        )
 
     def delete_datasource_by_uid(self, uid: str):
         """The method includes a functionality to delete a datasource specified by the datasource uid
@@ -310,20 +324,18 @@ class Datasource:
             None
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/uid/{uid}",
-                RequestsMethods.DELETE,
-            )
-
-            if api_call.get("message") != "Data source deleted":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully deleted a datasource.")
-        else:
-            logging.error("There is no uid defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(
+                    RequestsMethods.DELETE, uid=uid
+                )
+            ),
+            "Data source deleted",
+            "You successfully deleted a datasource.",
+        )
+        Datasource._unregister_the_datasource(
+            self.grafana_api_model.datasource_registry, uid=uid
+        )
 
     def delete_datasource_by_name(self, name: str):
         """The method includes a functionality to delete a datasource specified by the datasource name
@@ -343,23 +355,25 @@ class Datasource:
             None
         """
 
-        if len(name) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/name/{name}",
-                RequestsMethods.DELETE,
-            )
-
-            if api_call.get("message") != "Data source deleted":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully deleted a datasource.")
-        else:
-            logging.error("There is no name defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(
+                    RequestsMethods.DELETE, name=name
+                )
+            ),
+            "Data source deleted",
+            "You successfully deleted a datasource.",
+        )
+        Datasource._unregister_the_datasource(
+            self.grafana_api_model.datasource_registry, name=name
+        )
 
     def query_datasource_by_id(
-        self, time: str, to: str, datasource_queries: list
+        self,
+        time: str,
+        to: str,
+        datasource_queries: list,
+        data_frame_decoder: DataFrameDecoder = None,
     ) -> dict:
         """The method includes a functionality to execute a queries inside the datasource itself specified by the datasource id
 
@@ -367,52 +381,31 @@ class Datasource:
             time (str): Specify the name of the absolute in epoch timestamps in milliseconds or relative using Grafana time units. For example, now-1h
             to (str): Specify the name of the absolute in epoch timestamps in milliseconds or relative using Grafana time units. For example, now-1h
             datasource_queries (list): Specify a list of execution queries based on the DatasourceQuery class
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder to convert the data frames of the results into columns (default None)
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (dict): Returns the result of the specified query
+            api_call (dict): Returns the result of the specified query. If a data_frame_decoder is specified, the list of the decoded DataFrame objects is returned grouped by the reference id
         """
 
-        if len(time) != 0 and len(to) != 0 and datasource_queries != list():
-            datasource_queries_json_list: list = list()
-
-            for datasource_query in datasource_queries:
-                if datasource_query.datasource_id != 0:
-                    datasource_query_json_dict: dict = dict(
-                        {
-                            "refId": datasource_query.ref_id,
-                            "intervalMs": datasource_query.interval_ms,
-                            "maxDataPoints": datasource_query.max_data_points,
-                            "datasourceId": datasource_query.datasource_id,
-                            "rawSql": datasource_query.raw_sql,
-                            "format": datasource_query.output_format,
-                        }
-                    )
-                    datasource_queries_json_list.append(datasource_query_json_dict)
-                else:
-                    logging.error("There is no datasource_id defined.")
-                    raise ValueError
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                APIEndpoints.DATASOURCE_LEGACY_QUERY.value,
-                RequestsMethods.POST,
-                json.dumps(datasource_queries_json_list),
-            )
-
-            if api_call == dict() or api_call.get("results") == dict():
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call.get("results")
-        else:
-            logging.error("There is no time, to or datasource_queries defined.")
-            raise ValueError
+        return Datasource._get_the_query_results(
+            Api(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_legacy_query_request(
+                    time, to, datasource_queries
+                )
+            ),
+            data_frame_decoder,
+        )
 
     def query_datasource_by_uid(
-        self, time: str, to: str, datasource_queries: list
+        self,
+        time: str,
+        to: str,
+        datasource_queries: list,
+        data_frame_decoder: DataFrameDecoder = None,
     ) -> dict:
         """The method includes a functionality to execute a queries inside the datasource itself specified by the datasource uid
 
@@ -420,260 +413,1590 @@ class Datasource:
             time (str): Specify the name of the absolute in epoch timestamps in milliseconds or relative using Grafana time units. For example, now-1h
             to (str): Specify the name of the absolute in epoch timestamps in milliseconds or relative using Grafana time units. For example, now-1h
             datasource_queries (list): Specify a list of execution queries based on the DatasourceQuery class
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder to convert the data frames of the results into columns (default None)
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (dict): Returns the result of the specified query
+            api_call (dict): Returns the result of the specified query. If a data_frame_decoder is specified, the list of the decoded DataFrame objects is returned grouped by the reference id
         """
 
         if len(time) != 0 and len(to) != 0 and datasource_queries != list():
-            datasource_queries_json_list: list = list()
-
-            for datasource_query in datasource_queries:
-                if len(datasource_query.datasource_uid) != 0:
-                    datasource_query_json_dict: dict = dict(
-                        {
-                            "refId": datasource_query.ref_id,
-                            "intervalMs": datasource_query.interval_ms,
-                            "maxDataPoints": datasource_query.max_data_points,
-                            "datasourceUid": datasource_query.datasource_uid,
-                            "rawSql": datasource_query.raw_sql,
-                            "format": datasource_query.output_format,
-                        }
-                    )
-                    datasource_queries_json_list.append(datasource_query_json_dict)
-                else:
-                    logging.error("There is no datasource_uid defined.")
-                    raise ValueError
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                APIEndpoints.DATASOURCE_QUERY.value,
-                RequestsMethods.POST,
-                json.dumps(datasource_queries_json_list),
+            return self.query_datasources(
+                Datasource._create_the_datasource_query_request(
+                    time, to, datasource_queries
+                ),
+                data_frame_decoder,
             )
-
-            if api_call == dict() or api_call.get("results") == dict():
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call.get("results")
         else:
             logging.error("There is no time, to or datasource_queries defined.")
             raise ValueError
 
-
-class DatasourcePermissions:
-    """The class includes all necessary methods to access the Grafana datasource permissions API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights
-
-    HINT: Note Grafana Enterprise API need required permissions if fine-grained access control is enabled
-
-    Args:
-        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
-
-    Attributes:
-        grafana_api_model (APIModel): This is where we store the grafana_api_model
-    """
-
-    def __init__(self, grafana_api_model: APIModel):
-        self.grafana_api_model = grafana_api_model
-
-    def get_datasource_permissions_by_uid(self, uid: str) -> list:
-        """The method includes a functionality to get the datasource permissions specified by the datasource uid. The functionality is a Grafana ENTERPRISE feature
+    def query_datasources(
+        self,
+        datasource_query_request: DatasourceQueryRequest,
+        data_frame_decoder: DataFrameDecoder = None,
+    ) -> dict:
+        """The method includes a functionality to execute multiple queries of different datasources and query languages in a single round-trip. If a query result cache is used, the results of settled time ranges are cached. A time range that ends at now is never settled, so please use the chunked queries to reuse the results of a moving time range
 
         Args:
-            uid (str): Specify the uid of the datasource
-
-        Required Permissions:
-            Action: datasources.permissions:read
-            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+            datasource_query_request (DatasourceQueryRequest): Specify the request with the time range and the queries
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder to convert the data frames of the results into columns (default None)
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (list): Returns the datasource permissions
+            api_call (dict): Returns the results of the queries grouped by the reference id. If a data_frame_decoder is specified, the list of the decoded DataFrame objects is returned grouped by the reference id
         """
 
-        if len(uid) != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCE_PERMISSIONS.value}/{uid}",
-            )
+        Datasource._check_the_query_request(datasource_query_request)
 
-            status_code: int = (
-                api_call[0].get("status")
-                if isinstance(api_call, list)
-                else api_call.get("status")
-            )
+        query_result_cache: QueryResultCache = (
+            self.grafana_api_model.query_result_cache
+        )
+        cache_payload: dict | None = Datasource._create_the_query_cache_payload(
+            datasource_query_request, query_result_cache
+        )
+        api_call: dict | None = Datasource._get_the_cached_query_result(
+            query_result_cache, self.grafana_api_model.json_codec, cache_payload
+        )
 
-            datasource_permissions_status_dict: dict = dict(
-                {
-                    401: "Unauthorized.",
-                    403: "Access Denied.",
-                    500: "Internal error.",
-                }
+        if api_call is None:
+            api_call = Api(self.grafana_api_model).call_the_api(
+                APIEndpoints.DATASOURCE_QUERY.value,
+                RequestsMethods.POST,
+                datasource_query_request.to_json(),
+            )
+            Datasource._cache_the_query_result(
+                query_result_cache,
+                self.grafana_api_model.json_codec,
+                cache_payload,
+                api_call,
             )
 
-            if status_code == 200:
-                return api_call
-            elif 401 <= status_code <= 500:
-                logging.error(datasource_permissions_status_dict.get(status_code))
-                raise Exception
-            else:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-        else:
-            logging.error("There is no uid defined.")
-            raise ValueError
+        return Datasource._get_the_query_results(api_call, data_frame_decoder)
 
-    def update_datasource_user_access_by_uid(
-        self, uid: str, id: int, datasource_user_permission: DatasourcePermission
-    ):
-        """The method includes a functionality to update the datasource permission specified by the datasource uid and the user id. The functionality is a Grafana ENTERPRISE feature
+    def query_datasource_by_uid_in_chunks(
+        self,
+        time: any,
+        to: any,
+        datasource_queries: list,
+        chunk_size_ms: int = None,
+        max_workers: int = None,
+        data_frame_decoder: DataFrameDecoder = None,
+        max_chunks: int = MAX_CHUNKS,
+    ) -> dict:
+        """The method includes a functionality to execute the queries of a long time range inside the datasource specified by the datasource uid. The time range is split into chunks, that are queried concurrently and the frames of the chunks are stitched together in the order of the time range
 
         Args:
-            uid (str): Specify the uid of the datasource
-            id (int): Specify the id of the user
-            datasource_user_permission (DatasourcePermission): Specify the datasource user permission
-
-        Required Permissions:
-            Action: datasources.permissions:write
-            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+            time (any): Specify the start of the time range as epoch timestamp in milliseconds, as datetime or relative using Grafana time units. For example, now-1y
+            to (any): Specify the end of the time range as epoch timestamp in milliseconds, as datetime or relative using Grafana time units. For example, now
+            datasource_queries (list): Specify a list of execution queries based on the DatasourceQuery class
+            chunk_size_ms (int): Specify the time range of a chunk in milliseconds. By default, the smallest interval_ms multiplied by the max_data_points of the queries is used, but at least one day (default None)
+            max_workers (int): Specify the maximum number of concurrent requests. By default, the maximum concurrency of the model is used (default None)
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder to convert the data frames of the results into columns (default None)
+            max_chunks (int): Specify the maximum number of chunks. A time range that needs more chunks is rejected (default 1000)
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            None
+            api_call (dict): Returns the stitched result of the specified query. If a data_frame_decoder is specified, the list of the decoded DataFrame objects is returned grouped by the reference id
         """
 
-        if (
-            len(uid) != 0
-            and id != 0
-            and datasource_user_permission.permission is not None
-        ):
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCE_PERMISSIONS.value}/{uid}/users/{id}",
+        batch_executor: BatchExecutor = BatchExecutor(
+            self.grafana_api_model, max_workers
+        )
+        query_result_cache: QueryResultCache = self.grafana_api_model.query_result_cache
+        requests: list = Datasource._create_the_chunk_requests(
+            time, to, datasource_queries, chunk_size_ms, max_chunks
+        )
+        cached_results: list = Datasource._get_the_cached_chunk_results(
+            query_result_cache, self.grafana_api_model.json_codec, requests
+        )
+        chunk_results: list = batch_executor.execute(
+            [
+                request
+                for request, cached_result in zip(requests, cached_results)
+                if cached_result is None
+            ]
+        )
+        results: dict = Datasource._stitch_the_chunk_results(
+            Datasource._merge_the_chunk_results(
+                query_result_cache,
+                self.grafana_api_model.json_codec,
+                requests,
+                cached_results,
+                chunk_results,
+            )
+        )
+
+        if data_frame_decoder is not None:
+            return data_frame_decoder.decode_the_results(results)
+
+        return results
+
+    @staticmethod
+    def _check_the_datasources(api_call: list) -> list:
+        """The method includes a functionality to check the result of the datasource list endpoint
+
+        Args:
+            api_call (list): Specify the result of the datasource list endpoint
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasources (list): Returns the list of all datasources
+        """
+
+        if not isinstance(api_call, list) or (
+            len(api_call) != 0 and api_call[0].get("id") is None
+        ):
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+
+        return api_call
+
+    @staticmethod
+    def _create_the_datasource_request(
+        method: RequestsMethods = RequestsMethods.GET,
+        datasource_id: int = 0,
+        uid: str = None,
+        name: str = None,
+    ) -> tuple:
+        """The method includes a functionality to create the request to get or to delete a datasource specified by the datasource_id, the uid or the name
+
+        Args:
+            method (RequestsMethods): Specify the method of the request (default RequestsMethods.GET)
+            datasource_id (int): Specify the id of the datasource (default 0)
+            uid (str): Specify the uid of the datasource (default None)
+            name (str): Specify the name of the datasource (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if uid is not None:
+            if len(uid) != 0:
+                return f"{APIEndpoints.DATASOURCES.value}/uid/{uid}", method
+            else:
+                logging.error("There is no uid defined.")
+                raise ValueError
+        elif name is not None:
+            if len(name) != 0:
+                return f"{APIEndpoints.DATASOURCES.value}/name/{name}", method
+            else:
+                logging.error("There is no name defined.")
+                raise ValueError
+        elif datasource_id != 0:
+            return f"{APIEndpoints.DATASOURCES.value}/{datasource_id}", method
+        else:
+            logging.error("There is no datasource_id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_datasource_creation_request(data_source: dict) -> tuple:
+        """The method includes a functionality to create the request to create a datasource
+
+        Args:
+            data_source (dict): Specify the datasource
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if data_source != dict():
+            return APIEndpoints.DATASOURCES.value, RequestsMethods.POST, data_source
+        else:
+            logging.error("There is no data_source defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_datasource_update_request(
+        data_source: dict, datasource_id: int = 0, datasource_uid: str | None = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to update a datasource specified by the datasource_id or the datasource_uid
+
+        Args:
+            data_source (dict): Specify the datasource
+            datasource_id (int): Specify the id of the datasource (default 0)
+            datasource_uid (str | None): Specify the uid of the datasource (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if data_source != dict() and (datasource_id != 0 or datasource_uid is not None):
+            if datasource_uid is not None:
+                endpoint = f"{APIEndpoints.DATASOURCES.value}/uid/{datasource_uid}"
+            else:
+                endpoint = f"{APIEndpoints.DATASOURCES.value}/{datasource_id}"
+
+            return endpoint, RequestsMethods.PUT, data_source
+        else:
+            logging.error(
+                "There is no datasource_id, dashboard_uid or data_source defined."
+            )
+            raise ValueError
+
+    @staticmethod
+    def _create_the_legacy_query_request(
+        time: str, to: str, datasource_queries: list
+    ) -> tuple:
+        """The method includes a functionality to create the request to query datasources specified by the datasource_id over the legacy query endpoint
+
+        Args:
+            time (str): Specify the time range start of the query
+            to (str): Specify the time range end of the query
+            datasource_queries (list): Specify the list of the datasource queries
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(time) != 0 and len(to) != 0 and datasource_queries != list():
+            for datasource_query in datasource_queries:
+                if datasource_query.datasource_id == 0:
+                    logging.error("There is no datasource_id defined.")
+                    raise ValueError
+
+            datasource_query_request: DatasourceQueryRequest = DatasourceQueryRequest(
+                time, to, list(datasource_queries)
+            )
+
+            return (
+                APIEndpoints.DATASOURCE_LEGACY_QUERY.value,
+                RequestsMethods.POST,
+                datasource_query_request.to_json(legacy=True),
+            )
+        else:
+            logging.error("There is no time, to or datasource_queries defined.")
+            raise ValueError
+
+    @staticmethod
+    def _check_the_query_request(datasource_query_request: DatasourceQueryRequest):
+        """The method includes a functionality to check that the time range and the queries of a datasource query request are defined
+
+        Args:
+            datasource_query_request (DatasourceQueryRequest): Specify the datasource query request
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            None
+        """
+
+        if (
+            len(str(datasource_query_request.time)) == 0
+            or len(str(datasource_query_request.to)) == 0
+            or datasource_query_request.queries == list()
+        ):
+            logging.error("There is no time, to or queries defined.")
+            raise ValueError
+
+    @staticmethod
+    def _get_the_query_results(
+        api_call: dict, data_frame_decoder: DataFrameDecoder = None
+    ) -> dict:
+        """The method includes a functionality to check the result of a datasource query and to extract the query results
+
+        Args:
+            api_call (dict): Specify the result of the API call
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder of the data frames (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            results (dict): Returns the query results or the decoded query results
+        """
+
+        if api_call == dict() or api_call.get("results") == dict():
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+        elif data_frame_decoder is not None:
+            return data_frame_decoder.decode_the_results(api_call.get("results"))
+        else:
+            return api_call.get("results")
+
+    @staticmethod
+    def _register_the_datasource(
+        datasource_registry: DatasourceRegistry, api_call: dict
+    ):
+        """The method includes a functionality to update the datasource registry in place with the datasource of a create or update response. If the response includes no datasource, the registry is invalidated
+
+        Args:
+            datasource_registry (DatasourceRegistry): Specify the datasource registry
+            api_call (dict): Specify the result of the create or update API call
+
+        Returns:
+            None
+        """
+
+        with datasource_registry.lock:
+            if isinstance(api_call.get("datasource"), dict):
+                datasource_registry.put(api_call.get("datasource"))
+            else:
+                datasource_registry.invalidate()
+
+    @staticmethod
+    def _unregister_the_datasource(
+        datasource_registry: DatasourceRegistry,
+        datasource_id: int = None,
+        uid: str = None,
+        name: str = None,
+    ):
+        """The method includes a functionality to remove a deleted datasource from the datasource registry in place. The datasource is looked up by the specified id, uid or name
+
+        Args:
+            datasource_registry (DatasourceRegistry): Specify the datasource registry
+            datasource_id (int): Specify the id of the deleted datasource (default None)
+            uid (str): Specify the uid of the deleted datasource (default None)
+            name (str): Specify the name of the deleted datasource (default None)
+
+        Returns:
+            None
+        """
+
+        with datasource_registry.lock:
+            datasource_registry.remove(
+                datasource_registry.by_id.get(datasource_id)
+                or datasource_registry.by_uid.get(uid)
+                or datasource_registry.by_name.get(name)
+            )
+
+    @staticmethod
+    def _get_the_registered_datasource(
+        datasource_registry: DatasourceRegistry, name: str
+    ) -> dict | None:
+        """The method includes a functionality to look up a datasource by the name inside the datasource registry
+
+        Args:
+            datasource_registry (DatasourceRegistry): Specify the datasource registry
+            name (str): Specify the name of the datasource
+
+        Returns:
+            datasource (dict | None): Returns the registered datasource or None if there is no corresponding datasource
+        """
+
+        with datasource_registry.lock:
+            return datasource_registry.by_name.get(name)
+
+    @staticmethod
+    def _register_the_named_datasource(
+        datasource_registry: DatasourceRegistry, api_call: dict
+    ):
+        """The method includes a functionality to add a datasource, that was requested by the name, to a valid datasource registry
+
+        Args:
+            datasource_registry (DatasourceRegistry): Specify the datasource registry
+            api_call (dict): Specify the requested datasource
+
+        Returns:
+            None
+        """
+
+        with datasource_registry.lock:
+            if datasource_registry.is_valid():
+                datasource_registry.put(api_call)
+
+    @staticmethod
+    def _create_the_datasource_query_request(
+        time: any, to: any, datasource_queries: list
+    ) -> DatasourceQueryRequest:
+        """The method includes a functionality to create the request of the queries specified by the datasource uid
+
+        Args:
+            time (any): Specify the start of the time range
+            to (any): Specify the end of the time range
+            datasource_queries (list): Specify a list of execution queries based on the DatasourceQuery class
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (DatasourceQueryRequest): Returns the request of the queries
+        """
+
+        for datasource_query in datasource_queries:
+            if len(datasource_query.datasource_uid) == 0:
+                logging.error("There is no datasource_uid defined.")
+                raise ValueError
+
+        return DatasourceQueryRequest(time, to, list(datasource_queries))
+
+    @staticmethod
+    def _create_the_query_cache_payload(
+        datasource_query_request: DatasourceQueryRequest,
+        query_result_cache: QueryResultCache | None,
+    ) -> dict | None:
+        """The method includes a functionality to create the payload of the cache key of a query request. The time range of the payload is converted to epoch timestamps and widened to multiples of the smallest interval of the queries, so that the cache key doesn't change inside an interval. The request itself is sent with the specified time range
+
+        Args:
+            datasource_query_request (DatasourceQueryRequest): Specify the request with the time range and the queries
+            query_result_cache (QueryResultCache | None): Specify the optional query result cache
+
+        Raises:
+            ValueError: A query is not valid
+
+        Returns:
+            payload (dict | None): Returns the payload of the cache key or None, if no query result cache is used or the time range isn't supported e.g. now/d
+        """
+
+        if query_result_cache is None:
+            return None
+
+        now: datetime.datetime = datetime.datetime.now(datetime.timezone.utc)
+        start: int | None = Datasource._get_the_epoch_milliseconds(
+            datasource_query_request.time, now
+        )
+        end: int | None = Datasource._get_the_epoch_milliseconds(
+            datasource_query_request.to, now
+        )
+
+        if start is None or end is None:
+            return None
+
+        interval_ms: int = max(
+            min(query.interval_ms for query in datasource_query_request.queries), 1
+        )
+        payload: dict = datasource_query_request.to_json()
+        payload["from"] = str(start // interval_ms * interval_ms)
+        payload["to"] = str(-(-end // interval_ms) * interval_ms)
+
+        return payload
+
+    @staticmethod
+    def _get_the_cached_query_result(
+        query_result_cache: QueryResultCache | None,
+        json_codec: JSONCodec,
+        payload: dict | None,
+    ) -> dict | None:
+        """The method includes a functionality to get the cached result of a query request
+
+        Args:
+            query_result_cache (QueryResultCache | None): Specify the optional query result cache
+            json_codec (JSONCodec): Specify the JSON codec of the model
+            payload (dict | None): Specify the payload of the cache key. None skips the cache
+
+        Returns:
+            api_call (dict | None): Returns the cached result or None
+        """
+
+        if query_result_cache is None or payload is None:
+            return None
+
+        content: bytes | None = query_result_cache.get(
+            QueryResultCache.create_the_key(payload)
+        )
+
+        return None if content is None else json_codec.loads(content)
+
+    @staticmethod
+    def _cache_the_query_result(
+        query_result_cache: QueryResultCache | None,
+        json_codec: JSONCodec,
+        payload: dict | None,
+        api_call: any,
+    ):
+        """The method includes a functionality to cache the result of a query request. Only successful results of settled time ranges are cached
+
+        Args:
+            query_result_cache (QueryResultCache | None): Specify the optional query result cache
+            json_codec (JSONCodec): Specify the JSON codec of the model
+            payload (dict | None): Specify the payload of the cache key. None skips the cache
+            api_call (any): Specify the result of the query request
+
+        Returns:
+            None
+        """
+
+        if (
+            query_result_cache is None
+            or payload is None
+            or not str(payload.get("to")).isdigit()
+            or not query_result_cache.is_settled(int(payload.get("to")))
+            or not isinstance(api_call, dict)
+            or not isinstance(api_call.get("results"), dict)
+            or len(api_call.get("results")) == 0
+            or any(
+                result.get("error") is not None
+                for result in api_call.get("results").values()
+            )
+        ):
+            return
+
+        content: str | bytes = json_codec.dumps(api_call)
+        query_result_cache.put(
+            QueryResultCache.create_the_key(payload),
+            content.encode("utf-8") if isinstance(content, str) else content,
+        )
+
+    @staticmethod
+    def _get_the_cached_chunk_results(
+        query_result_cache: QueryResultCache | None,
+        json_codec: JSONCodec,
+        requests: list,
+    ) -> list:
+        """The method includes a functionality to get the cached results of the chunk requests
+
+        Args:
+            query_result_cache (QueryResultCache | None): Specify the optional query result cache
+            json_codec (JSONCodec): Specify the JSON codec of the model
+            requests (list): Specify the chunk requests
+
+        Returns:
+            cached_results (list): Returns the cached result or None of every chunk request
+        """
+
+        return [
+            Datasource._get_the_cached_query_result(
+                query_result_cache, json_codec, request[2]
+            )
+            for request in requests
+        ]
+
+    @staticmethod
+    def _merge_the_chunk_results(
+        query_result_cache: QueryResultCache | None,
+        json_codec: JSONCodec,
+        requests: list,
+        cached_results: list,
+        chunk_results: list,
+    ) -> list:
+        """The method includes a functionality to merge the cached and the queried results of the chunk requests in the order of the chunks. The successfully queried chunks are cached
+
+        Args:
+            query_result_cache (QueryResultCache | None): Specify the optional query result cache
+            json_codec (JSONCodec): Specify the JSON codec of the model
+            requests (list): Specify the chunk requests
+            cached_results (list): Specify the cached result or None of every chunk request
+            chunk_results (list): Specify the batch results of the chunk requests without a cached result
+
+        Returns:
+            chunk_results (list): Returns the batch results of all chunk requests
+        """
+
+        queried_results: Iterator[BatchResult] = iter(chunk_results)
+        merged_results: list = list()
+
+        for request, cached_result in zip(requests, cached_results):
+            if cached_result is not None:
+                merged_results.append(BatchResult(request, cached_result))
+                continue
+
+            chunk_result: BatchResult = next(queried_results)
+            if chunk_result.error is None:
+                Datasource._cache_the_query_result(
+                    query_result_cache,
+                    json_codec,
+                    chunk_result.request[2],
+                    chunk_result.result,
+                )
+            merged_results.append(chunk_result)
+
+        return merged_results
+
+    @staticmethod
+    def _get_the_epoch_milliseconds(
+        value: any, now: datetime.datetime
+    ) -> int | None:
+        """The method includes a functionality to convert a time specification to an epoch timestamp in milliseconds
+
+        Args:
+            value (any): Specify the time as epoch timestamp in milliseconds, as datetime or relative using Grafana time units e.g. now-7d
+            now (datetime.datetime): Specify the current time of the relative time specifications
+
+        Returns:
+            timestamp (int | None): Returns the epoch timestamp in milliseconds or None, if the time specification is not supported e.g. now/d
+        """
+
+        if isinstance(value, datetime.datetime):
+            return int(value.timestamp() * 1000)
+        elif isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+            return int(value)
+
+        match: re.Match | None = (
+            re.fullmatch(r"now(?:([+-])(\d+)([smhdwMy]))?", value.strip())
+            if isinstance(value, str)
+            else None
+        )
+
+        if match is None:
+            return None
+        elif match.group(1) is None:
+            return int(now.timestamp() * 1000)
+
+        amount: int = int(match.group(2)) * (-1 if match.group(1) == "-" else 1)
+        unit: str = match.group(3)
+
+        if unit in "My":
+            months: int = amount * (12 if unit == "y" else 1)
+            month_index: int = now.year * 12 + now.month - 1 + months
+            year, month = divmod(month_index, 12)
+            time_point: datetime.datetime = now.replace(
+                year=year,
+                month=month + 1,
+                day=min(now.day, calendar.monthrange(year, month + 1)[1]),
+            )
+        else:
+            time_point: datetime.datetime = now + datetime.timedelta(
+                seconds=amount
+                * dict({"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800})[unit]
+            )
+
+        return int(time_point.timestamp() * 1000)
+
+    @staticmethod
+    def _create_the_chunk_requests(
+        time: any,
+        to: any,
+        datasource_queries: list,
+        chunk_size_ms: int = None,
+        max_chunks: int = MAX_CHUNKS,
+    ) -> list:
+        """The method includes a functionality to split the time range of the queries into chunks and to create the corresponding query requests. The chunk boundaries are aligned to multiples of the chunk size and the chunks don't overlap
+
+        Args:
+            time (any): Specify the start of the time range
+            to (any): Specify the end of the time range
+            datasource_queries (list): Specify a list of execution queries based on the DatasourceQuery class
+            chunk_size_ms (int): Specify the time range of a chunk in milliseconds (default None)
+            max_chunks (int): Specify the maximum number of chunks (default 1000)
+
+        Raises:
+            ValueError: Missed specifying a necessary value or the time range needs more than the maximum number of chunks
+
+        Returns:
+            requests (list): Returns the query requests of the chunks in the order of the time range
+        """
+
+        if time is None or to is None or datasource_queries == list():
+            logging.error("There is no time, to or datasource_queries defined.")
+            raise ValueError
+
+        now: datetime.datetime = datetime.datetime.now(datetime.timezone.utc)
+        start: int | None = Datasource._get_the_epoch_milliseconds(time, now)
+        end: int | None = Datasource._get_the_epoch_milliseconds(to, now)
+
+        if start is None or end is None:
+            logging.error(f"The time range {time} to {to} is not supported.")
+            raise ValueError
+
+        if chunk_size_ms is None:
+            chunk_size_ms = max(
+                min(
+                    datasource_query.interval_ms * datasource_query.max_data_points
+                    for datasource_query in datasource_queries
+                ),
+                DEFAULT_CHUNK_SIZE_MS,
+            )
+
+        if end <= start or chunk_size_ms is None or chunk_size_ms <= 0:
+            logging.error("The time range or the chunk size is not valid.")
+            raise ValueError
+
+        aligned_boundaries: range = range(
+            (start // chunk_size_ms + 1) * chunk_size_ms, end, chunk_size_ms
+        )
+
+        if len(aligned_boundaries) + 1 > max_chunks:
+            logging.error(
+                f"The time range needs more than {max_chunks} chunks. Please increase the chunk_size_ms."
+            )
+            raise ValueError
+
+        datasource_queries_json_list: list = (
+            Datasource._create_the_datasource_query_request(
+                start, end, datasource_queries
+            ).to_json()
+        ).get("queries")
+        boundaries: list = [start]
+        boundaries.extend(aligned_boundaries)
+        boundaries.append(end + 1)
+
+        return [
+            (
+                APIEndpoints.DATASOURCE_QUERY.value,
+                RequestsMethods.POST,
+                dict(
+                    {
+                        "from": str(chunk_start),
+                        "to": str(chunk_end - 1),
+                        "queries": datasource_queries_json_list,
+                    }
+                ),
+            )
+            for chunk_start, chunk_end in zip(boundaries, boundaries[1:])
+        ]
+
+    @staticmethod
+    def _stitch_the_chunk_results(chunk_results: list) -> dict:
+        """The method includes a functionality to stitch the results of the chunks together. The frames of a reference id with the same name and fields are concatenated in the order of the chunks
+
+        Args:
+            chunk_results (list): Specify the batch results of the chunks in the order of the time range
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            results (dict): Returns the stitched results grouped by the reference id
+        """
+
+        results: dict = dict()
+        frames_by_key: dict = dict()
+
+        for chunk_result in chunk_results:
+            if chunk_result.error is not None:
+                logging.error(f"Check the error: {chunk_result.error!r}.")
+                raise chunk_result.error
+
+            api_call: dict = chunk_result.result
+            if api_call == dict() or not isinstance(api_call.get("results"), dict):
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+
+            for ref_id, result in api_call.get("results").items():
+                stitched_result: dict = results.setdefault(
+                    ref_id, dict({"status": result.get("status"), "frames": list()})
+                )
+
+                if result.get("error") is not None:
+                    stitched_result.setdefault("error", result.get("error"))
+                    stitched_result["status"] = result.get("status")
+
+                for frame in result.get("frames") or []:
+                    frame_key: tuple = Datasource._get_the_frame_key(ref_id, frame)
+                    stitched_frame: dict | None = frames_by_key.get(frame_key)
+
+                    if stitched_frame is None:
+                        frames_by_key[frame_key] = frame
+                        stitched_result.get("frames").append(frame)
+                    else:
+                        Datasource._append_the_frame(stitched_frame, frame)
+
+        return results
+
+    @staticmethod
+    def _get_the_frame_key(ref_id: str, frame: dict) -> tuple:
+        """The method includes a functionality to create the key of a frame, that identifies the same frame inside the results of different chunks
+
+        Args:
+            ref_id (str): Specify the reference id of the frame
+            frame (dict): Specify the frame
+
+        Returns:
+            key (tuple): Returns the reference id, the frame name and the names, types and labels of the fields
+        """
+
+        schema: dict = frame.get("schema") or dict()
+
+        return (
+            ref_id,
+            schema.get("name"),
+            tuple(
+                (
+                    schema_field.get("name"),
+                    schema_field.get("type"),
+                    tuple(sorted((schema_field.get("labels") or dict()).items())),
+                )
+                for schema_field in schema.get("fields") or []
+            ),
+        )
+
+    @staticmethod
+    def _append_the_frame(stitched_frame: dict, frame: dict):
+        """The method includes a functionality to append the values of a frame to the values of the same frame of the previous chunks. The indexes of the NaN, Inf and NegInf entities are shifted and missing nanoseconds are filled
+
+        Args:
+            stitched_frame (dict): Specify the frame of the previous chunks
+            frame (dict): Specify the frame of the current chunk
+
+        Returns:
+            None
+        """
+
+        data: dict = frame.get("data") or dict()
+        values: list = data.get("values") or []
+
+        if len(values) == 0 or len(values[0]) == 0:
+            return
+
+        stitched_data: dict = stitched_frame.setdefault("data", dict())
+        if len(stitched_data.get("values") or []) == 0:
+            stitched_data["values"] = [list() for _ in values]
+
+        stitched_values: list = stitched_data.get("values")
+        length: int = len(stitched_values[0])
+
+        for index, field_values in enumerate(values):
+            stitched_values[index].extend(field_values)
+
+        for index, field_entities in enumerate(data.get("entities") or []):
+            if field_entities:
+                stitched_entities: list = stitched_data.get("entities") or [
+                    None for _ in values
+                ]
+                stitched_data["entities"] = stitched_entities
+                stitched_entities[index] = stitched_entities[index] or dict()
+
+                for entity, indexes in field_entities.items():
+                    stitched_entities[index].setdefault(entity, list()).extend(
+                        entity_index + length for entity_index in indexes or []
+                    )
+
+        if data.get("nanos") is None and stitched_data.get("nanos") is None:
+            return
+
+        stitched_nanos: list = stitched_data.get("nanos") or [None for _ in values]
+        stitched_data["nanos"] = stitched_nanos
+        nanos: list = data.get("nanos") or [None for _ in values]
+
+        for index, field_nanos in enumerate(nanos):
+            if field_nanos is None and stitched_nanos[index] is None:
+                continue
+            elif stitched_nanos[index] is None:
+                stitched_nanos[index] = [0] * length
+
+            stitched_nanos[index].extend(
+                field_nanos if field_nanos is not None else [0] * len(values[index])
+            )
+
+
+class DatasourcePermissions:
+    """The class includes all necessary methods to access the Grafana datasource permissions API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights
+
+    HINT: Note Grafana Enterprise API need required permissions if fine-grained access control is enabled
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    def get_datasource_permissions_by_uid(self, uid: str) -> list:
+        """The method includes a functionality to get the datasource permissions specified by the datasource uid. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            uid (str): Specify the uid of the datasource
+
+        Required Permissions:
+            Action: datasources.permissions:read
+            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns the datasource permissions
+        """
+
+        if len(uid) != 0:
+            api_call: list = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCE_PERMISSIONS.value}/{uid}",
+            )
+
+            status_code: int = (
+                api_call[0].get("status")
+                if isinstance(api_call, list)
+                else api_call.get("status")
+            )
+
+            datasource_permissions_status_dict: dict = dict(
+                {
+                    401: "Unauthorized.",
+                    403: "Access Denied.",
+                    500: "Internal error.",
+                }
+            )
+
+            if status_code == 200:
+                return api_call
+            elif 401 <= status_code <= 500:
+                logging.error(datasource_permissions_status_dict.get(status_code))
+                raise Exception
+            else:
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+        else:
+            logging.error("There is no uid defined.")
+            raise ValueError
+
+    def update_datasource_user_access_by_uid(
+        self, uid: str, id: int, datasource_user_permission: DatasourcePermission
+    ):
+        """The method includes a functionality to update the datasource permission specified by the datasource uid and the user id. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            uid (str): Specify the uid of the datasource
+            id (int): Specify the id of the user
+            datasource_user_permission (DatasourcePermission): Specify the datasource user permission
+
+        Required Permissions:
+            Action: datasources.permissions:write
+            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if (
+            len(uid) != 0
+            and id != 0
+            and datasource_user_permission.permission is not None
+        ):
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCE_PERMISSIONS.value}/{uid}/users/{id}",
+                RequestsMethods.POST,
+                {"permission": datasource_user_permission.permission},
+                response_status_code=True,
+            )
+
+            status_code: int = api_call.get("status")
+
+            datasource_permissions_status_dict: dict = dict(
+                {
+                    400: "Permission cannot be added, see response body for details.",
+                    401: "Unauthorized.",
+                    403: "Access Denied.",
+                }
+            )
+
+            if status_code == 200 and api_call.get("message") == "Permission updated":
+                logging.info("You successfully updated the datasource user permission.")
+            elif status_code == 200 and api_call.get("message") == "Permission removed":
+                logging.info("You successfully removed the datasource user permission.")
+            elif 400 == status_code:
+                logging.error(
+                    f"{datasource_permissions_status_dict.get(status_code)} | Response: {api_call}"
+                )
+                raise Exception
+            elif 401 <= status_code <= 403:
+                logging.error(datasource_permissions_status_dict.get(status_code))
+                raise Exception
+            else:
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+        else:
+            logging.error(
+                "There is no uid, id or datasource_user_permission object defined."
+            )
+            raise ValueError
+
+    def update_datasource_team_access_by_uid(
+        self, uid: str, id: int, datasource_team_permission: DatasourcePermission
+    ):
+        """The method includes a functionality to update the datasource permission specified by the datasource uid and the team id. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            uid (str): Specify the uid of the datasource
+            id (int): Specify the id of the team
+            datasource_team_permission (DatasourcePermission): Specify the datasource team permission
+
+        Required Permissions:
+            Action: datasources.permissions:write
+            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if (
+            len(uid) != 0
+            and id != 0
+            and datasource_team_permission.permission is not None
+        ):
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCE_PERMISSIONS.value}/{uid}/teams/{id}",
+                RequestsMethods.POST,
+                {"permission": datasource_team_permission.permission},
+                response_status_code=True,
+            )
+
+            status_code: int = api_call.get("status")
+
+            datasource_permissions_status_dict: dict = dict(
+                {
+                    400: "Permission cannot be added, see response body for details.",
+                    401: "Unauthorized.",
+                    403: "Access Denied.",
+                }
+            )
+
+            if status_code == 200 and api_call.get("message") == "Permission updated":
+                logging.info("You successfully updated the datasource team permission.")
+            elif status_code == 200 and api_call.get("message") == "Permission removed":
+                logging.info("You successfully removed the datasource team permission.")
+            elif 400 == status_code:
+                logging.error(
+                    f"{datasource_permissions_status_dict.get(status_code)} | Response: {api_call}"
+                )
+                raise Exception
+            elif 401 <= status_code <= 403:
+                logging.error(datasource_permissions_status_dict.get(status_code))
+                raise Exception
+            else:
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+        else:
+            logging.error(
+                "There is no uid, id or datasource_team_permission object defined."
+            )
+            raise ValueError
+
+    def update_datasource_basic_role_access_by_uid(
+        self,
+        uid: str,
+        build_in_role_name: str,
+        datasource_team_permission: DatasourcePermission,
+    ):
+        """The method includes a functionality to update the datasource permission specified by the datasource uid and the build in role name. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            uid (str): Specify the uid of the datasource
+            build_in_role_name (str): Specify the build in role name
+            datasource_team_permission (DatasourcePermission): Specify the datasource team permission
+
+        Required Permissions:
+            Action: datasources.permissions:write
+            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if (
+            len(uid) != 0
+            and len(build_in_role_name) != 0
+            and datasource_team_permission.permission is not None
+        ):
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCE_PERMISSIONS.value}/{uid}/builtInRoles/{build_in_role_name}",
                 RequestsMethods.POST,
-                json.dumps({"permission": datasource_user_permission.permission}),
+                {"permission": datasource_team_permission.permission},
                 response_status_code=True,
             )
 
-            status_code: int = api_call.get("status")
+            status_code: int = api_call.get("status")
+
+            datasource_permissions_status_dict: dict = dict(
+                {
+                    400: "Permission cannot be added, see response body for details.",
+                    401: "Unauthorized.",
+                    403: "Access Denied.",
+                }
+            )
+
+            if status_code == 200 and api_call.get("message") == "Permission updated":
+                logging.info(
+                    "You successfully updated the datasource build in role name permission."
+                )
+            elif status_code == 200 and api_call.get("message") == "Permission removed":
+                logging.info(
+                    "You successfully removed the datasource build in role name permission."
+                )
+            elif 400 == status_code:
+                logging.error(
+                    f"{datasource_permissions_status_dict.get(status_code)} | Response: {api_call}"
+                )
+                raise Exception
+            elif 401 <= status_code <= 403:
+                logging.error(datasource_permissions_status_dict.get(status_code))
+                raise Exception
+            else:
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+        else:
+            logging.error(
+                "There is no uid, build_in_role_name or datasource_team_permission object defined."
+            )
+            raise ValueError
+
+
+class DatasourceLegacyPermissions:
+    """The class includes all necessary methods to access the Grafana legacy datasource permissions API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights
+
+    HINT: Note Grafana Enterprise API need required permissions if fine-grained access control is enabled
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    def enable_datasource_permissions(self, datasource_id: int):
+        """The method includes a functionality to enable datasource permissions specified by the datasource id. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            datasource_id (int): Specify the id of the datasource
+
+        Required Permissions:
+            Action: datasources.permissions:write
+            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if datasource_id != 0:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/enable-permissions",
+                RequestsMethods.POST,
+                {},
+            )
+
+            if api_call.get("message") != "Datasource permissions enabled":
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+            else:
+                logging.info("You successfully enabled the datasource permissions.")
+        else:
+            logging.error("There is no datasource_id defined.")
+            raise ValueError
+
+    def disable_datasource_permissions(self, datasource_id: int):
+        """The method includes a functionality to disable datasource permissions specified by the datasource id. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            datasource_id (int): Specify the id of the datasource
+
+        Required Permissions:
+            Action: datasources.permissions:write
+            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if datasource_id != 0:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/disable-permissions",
+                RequestsMethods.POST,
+                {},
+            )
+
+            if api_call.get("message") != "Datasource permissions disabled":
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+            else:
+                logging.info("You successfully disabled the datasource permissions.")
+        else:
+            logging.error("There is no datasource_id defined.")
+            raise ValueError
+
+    def get_datasource_permissions(self, datasource_id: int) -> dict:
+        """The method includes a functionality to get the datasource permissions specified by the datasource id. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            datasource_id (int): Specify the id of the datasource
+
+        Required Permissions:
+            Action: datasources.permissions:read
+            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the datasource permissions
+        """
+
+        if datasource_id != 0:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/permissions",
+                RequestsMethods.GET,
+            )
+
+            if api_call == dict() or api_call.get("datasourceId") is None:
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+            else:
+                return api_call
+        else:
+            logging.error("There is no datasource_id defined.")
+            raise ValueError
+
+    def add_datasource_permissions(
+        self, datasource_id: int, datasource_permission: dict
+    ):
+        """The method includes a functionality to add datasource permission specified by the datasource id and the datasource permission dict. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            datasource_id (int): Specify the id of the datasource
+            datasource_permission (dict): Specify the permission of the datasource
+
+        Required Permissions:
+            Action: datasources.permissions:write
+            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if datasource_id != 0 and datasource_permission != dict():
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/permissions",
+                RequestsMethods.POST,
+                datasource_permission,
+            )
+
+            if api_call.get("message") != "Datasource permission added":
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+            else:
+                logging.info("You successfully added a datasource permission.")
+        else:
+            logging.error("There is no datasource_id or datasource_permission defined.")
+            raise ValueError
+
+    def delete_datasource_permissions(self, datasource_id: int, permission_id: int):
+        """The method includes a functionality to delete datasource permission specified by the datasource id and the permission id. The functionality is a Grafana ENTERPRISE feature
+
+        Args:
+            datasource_id (int): Specify the id of the datasource
+            permission_id (id): Specify the permission id
+
+        Required Permissions:
+            Action: datasources.permissions:write
+            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if datasource_id != 0 and permission_id != 0:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/permissions/{permission_id}",
+                RequestsMethods.DELETE,
+            )
+
+            if api_call.get("message") != "Datasource permission removed":
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+            else:
+                logging.info("You successfully removed a datasource permission.")
+        else:
+            logging.error("There is no datasource_id or permission_id defined.")
+            raise ValueError
 
-            datasource_permissions_status_dict: dict = dict(
-                {
-                    400: "Permission cannot be added, see response body for details.",
-                    401: "Unauthorized.",
-                    403: "Access Denied.",
-                }
+
+class DatasourceQueryResourceCaching:
+    """The class includes all necessary methods to access the Grafana datasource query and resource caching API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights. The functionality is a Grafana ENTERPRISE feature
+
+    HINT: Note Grafana Enterprise API need required permissions if fine-grained access control is enabled
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    def get_datasource_cache(self, uid: str) -> dict:
+        """The method includes a functionality to get the datasource cache config specified by the datasource uid
+
+        Args:
+            uid (str): Specify the uid of the datasource
+
+        Required Permissions:
+            Action: datasources.caching:write
+            Scope: datasources:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns a datasource
+        """
+
+        if len(uid) != 0:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache",
             )
 
-            if status_code == 200 and api_call.get("message") == "Permission updated":
-                logging.info("You successfully updated the datasource user permission.")
-            elif status_code == 200 and api_call.get("message") == "Permission removed":
-                logging.info("You successfully removed the datasource user permission.")
-            elif 400 == status_code:
-                logging.error(
-                    f"{datasource_permissions_status_dict.get(status_code)} | Response: {api_call}"
-                )
+            if api_call == dict() or api_call.get("dataSourceID") is None:
+                logging.error(f"Check the error: {api_call}.")
                 raise Exception
-            elif 401 <= status_code <= 403:
-                logging.error(datasource_permissions_status_dict.get(status_code))
+            else:
+                return api_call
+        else:
+            logging.error("There is no uid defined.")
+            raise ValueError
+
+    def enable_datasource_cache(self, uid: str) -> dict:
+        """The method includes a functionality to enable the datasource cache specified by the datasource uid
+
+        Args:
+            uid (str): Specify the uid of the datasource
+
+        Required Permissions:
+            Action: datasources.caching:read
+            Scope: datasources:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns a datasource
+        """
+
+        if len(uid) != 0:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache/enable",
+                RequestsMethods.POST,
+            )
+
+            if api_call == dict() or api_call.get("dataSourceID") is None:
+                logging.error(f"Check the error: {api_call}.")
                 raise Exception
             else:
+                return api_call
+        else:
+            logging.error("There is no uid defined.")
+            raise ValueError
+
+    def disable_datasource_cache(self, uid: str) -> dict:
+        """The method includes a functionality to disable the datasource cache specified by the datasource uid
+
+        Args:
+            uid (str): Specify the uid of the datasource
+
+        Required Permissions:
+            Action: datasources.caching:write
+            Scope: datasources:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns a datasource
+        """
+
+        if len(uid) != 0:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache/disable",
+                RequestsMethods.POST,
+            )
+
+            if api_call == dict() or api_call.get("dataSourceID") is None:
                 logging.error(f"Check the error: {api_call}.")
                 raise Exception
+            else:
+                return api_call
         else:
-            logging.error(
-                "There is no uid, id or datasource_user_permission object defined."
+            logging.error("There is no uid defined.")
+            raise ValueError
+
+    def clean_datasource_cache(self, uid: str) -> dict:
+        """The method includes a functionality to clean the datasource cache of all data sources with caching enabled. The uid of the datasource will only be used to return the configuration for that data source
+
+        Args:
+            uid (str): Specify the uid of the datasource
+
+        Required Permissions:
+            Action: datasources.caching:write
+            Scope: datasources:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns a datasource
+        """
+
+        if len(uid) != 0:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache/clean",
+                RequestsMethods.POST,
             )
+
+            if api_call == dict() or api_call.get("dataSourceID") is None:
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+            else:
+                return api_call
+        else:
+            logging.error("There is no uid defined.")
             raise ValueError
 
-    def update_datasource_team_access_by_uid(
-        self, uid: str, id: int, datasource_team_permission: DatasourcePermission
-    ):
-        """The method includes a functionality to update the datasource permission specified by the datasource uid and the team id. The functionality is a Grafana ENTERPRISE feature
+    def update_datasource_cache(
+        self, uid: str, datasource_cache: DatasourceCache
+    ) -> dict:
+        """The method includes a functionality to update the datasource cache specified by the datasource uid
 
         Args:
             uid (str): Specify the uid of the datasource
-            id (int): Specify the id of the team
-            datasource_team_permission (DatasourcePermission): Specify the datasource team permission
+            datasource_cache (DatasourceCache): Specif the datasource cache object
 
         Required Permissions:
-            Action: datasources.permissions:write
-            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+            Action: datasources.caching:write
+            Scope: datasources:*
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            None
+            api_call (dict): Returns a datasource
         """
 
         if (
             len(uid) != 0
-            and id != 0
-            and datasource_team_permission.permission is not None
+            and datasource_cache is not None
+            and datasource_cache.datasource_id != 0
+            and len(datasource_cache.datasource_uid) != 0
+            and datasource_cache.enabled is not None
+            and datasource_cache.use_default_ttl is not None
+            and datasource_cache.ttl_queries_ms != 0
+            and datasource_cache.ttl_resources_ms != 0
         ):
+            datasource_cache_object: dict = dict(
+                {
+                    "dataSourceID": datasource_cache.datasource_id,
+                    "dataSourceUID": datasource_cache.datasource_uid,
+                    "enabled": datasource_cache.enabled,
+                    "useDefaultTTL": datasource_cache.use_default_ttl,
+                    "ttlQueriesMs": datasource_cache.ttl_queries_ms,
+                    "ttlResourcesMs": datasource_cache.ttl_resources_ms,
+                }
+            )
+
             api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCE_PERMISSIONS.value}/{uid}/teams/{id}",
+                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache",
                 RequestsMethods.POST,
-                json.dumps({"permission": datasource_team_permission.permission}),
-                response_status_code=True,
+                datasource_cache_object,
             )
 
-            status_code: int = api_call.get("status")
+            if api_call == dict() or api_call.get("dataSourceID") is None:
+                logging.error(f"Check the error: {api_call}.")
+                raise Exception
+            else:
+                return api_call
+        else:
+            logging.error(
+                "There is no uid or the right datasource_cache object defined."
+            )
+            raise ValueError
 
-            datasource_permissions_status_dict: dict = dict(
-                {
-                    400: "Permission cannot be added, see response body for details.",
-                    401: "Unauthorized.",
-                    403: "Access Denied.",
-                }
+
+class DatasourceLabelBasedAccessControl:
+    """The class includes all necessary methods to access the Grafana datasource label based access control for teams API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights. The functionality is a Grafana Cloud feature. Only cloud Loki data sources are supported
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    def get_lbac_rules_for_datasource(self, uid: str) -> list:
+        """The method includes a functionality to get all datasource label based access control rules for team specified by the datasource uid
+
+        Args:
+            uid (str): Specify the uid of the datasource
+
+        Required Permissions:
+            Action: datasources:read
+            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns all LBAC rules
+        """
+
+        if len(uid) != 0:
+            api_call: list = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DATASOURCES.value}/{uid}/lbac/teams",
             )
 
-            if status_code == 200 and api_call.get("message") == "Permission updated":
-                logging.info("You successfully updated the datasource team permission.")
-            elif status_code == 200 and api_call.get("message") == "Permission removed":
-                logging.info("You successfully removed the datasource team permission.")
-            elif 400 == status_code:
-                logging.error(
-                    f"{datasource_permissions_status_dict.get(status_code)} | Response: {api_call}"
-                )
-                raise Exception
-            elif 401 <= status_code <= 403:
-                logging.error(datasource_permissions_status_dict.get(status_code))
-                raise Exception
-            else:
+            if api_call is None:
                 logging.error(f"Check the error: {api_call}.")
                 raise Exception
+            else:
+                return api_call
         else:
-            logging.error(
-                "There is no uid, id or datasource_team_permission object defined."
-            )
+            logging.error("There is no uid defined.")
             raise ValueError
 
-    def update_datasource_basic_role_access_by_uid(
-        self,
-        uid: str,
-        build_in_role_name: str,
-        datasource_team_permission: DatasourcePermission,
-    ):
-        """The method includes a functionality to update the datasource permission specified by the datasource uid and the build in role name. The functionality is a Grafana ENTERPRISE feature
+    def update_lbac_rules_for_datasource(self, uid: str) -> dict:
+        """The method includes a functionality to enable the datasource cache specified by the datasource uid
 
         Args:
             uid (str): Specify the uid of the datasource
-            build_in_role_name (str): Specify the build in role name
-            datasource_team_permission (DatasourcePermission): Specify the datasource team permission
 
         Required Permissions:
-            Action: datasources.permissions:write
+            Action: datasources:write, datasources.permissions:write
             Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
 
         Raises:
@@ -681,59 +2004,27 @@ class DatasourcePermissions:
             Exception: Unspecified error by executing the API call
 
         Returns:
-            None
+            api_call (dict): Returns a datasource
         """
 
-        if (
-            len(uid) != 0
-            and len(build_in_role_name) != 0
-            and datasource_team_permission.permission is not None
-        ):
+        if len(uid) != 0:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCE_PERMISSIONS.value}/{uid}/builtInRoles/{build_in_role_name}",
+                f"{APIEndpoints.DATASOURCES.value}/{uid}/lbac/teams",
                 RequestsMethods.POST,
-                json.dumps({"permission": datasource_team_permission.permission}),
-                response_status_code=True,
             )
 
-            status_code: int = api_call.get("status")
-
-            datasource_permissions_status_dict: dict = dict(
-                {
-                    400: "Permission cannot be added, see response body for details.",
-                    401: "Unauthorized.",
-                    403: "Access Denied.",
-                }
-            )
-
-            if status_code == 200 and api_call.get("message") == "Permission updated":
-                logging.info(
-                    "You successfully updated the datasource build in role name permission."
-                )
-            elif status_code == 200 and api_call.get("message") == "Permission removed":
-                logging.info(
-                    "You successfully removed the datasource build in role name permission."
-                )
-            elif 400 == status_code:
-                logging.error(
-                    f"{datasource_permissions_status_dict.get(status_code)} | Response: {api_call}"
-                )
-                raise Exception
-            elif 401 <= status_code <= 403:
-                logging.error(datasource_permissions_status_dict.get(status_code))
-                raise Exception
-            else:
+            if api_call == dict() or api_call.get("dataSourceID") is None:
                 logging.error(f"Check the error: {api_call}.")
                 raise Exception
+            else:
+                return api_call
         else:
-            logging.error(
-                "There is no uid, build_in_role_name or datasource_team_permission object defined."
-            )
+            logging.error("There is no uid defined.")
             raise ValueError
 
 
-class DatasourceLegacyPermissions:
-    """The class includes all necessary methods to access the Grafana legacy datasource permissions API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights
+class AsyncDatasource:
+    """The class includes all necessary methods to access the Grafana datasource API endpoints asynchronously. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights
 
     HINT: Note Grafana Enterprise API need required permissions if fine-grained access control is enabled
 
@@ -747,48 +2038,73 @@ class DatasourceLegacyPermissions:
     def __init__(self, grafana_api_model: APIModel):
         self.grafana_api_model = grafana_api_model
 
-    def enable_datasource_permissions(self, datasource_id: int):
-        """The method includes a functionality to enable datasource permissions specified by the datasource id. The functionality is a Grafana ENTERPRISE feature
+    async def get_all_datasources(self) -> list:
+        """The method includes a functionality to get all datasources
+
+        Required Permissions:
+            Action: datasources:read
+            Scope: datasources:*
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns the list of all datasources
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                APIEndpoints.DATASOURCES.value,
+                RequestsMethods.GET,
+            ),
+            "id",
+        )
+
+    async def get_datasource_registry(
+        self, refresh: bool = False
+    ) -> DatasourceRegistry:
+        """The method includes a functionality to get the datasource registry of the model. The registry is built by a single request of all datasources, is shared by all datasource lookups of the model and is rebuilt, if it's expired or a refresh is requested. The registered datasources are the datasource summaries of the datasource list endpoint
 
         Args:
-            datasource_id (int): Specify the id of the datasource
+            refresh (bool): Specify if the registry should be rebuilt independent of the time to live (default False)
 
         Required Permissions:
-            Action: datasources.permissions:write
-            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+            Action: datasources:read
+            Scope: datasources:*
 
         Raises:
-            ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            None
+            datasource_registry (DatasourceRegistry): Returns the datasource registry
         """
 
-        if datasource_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/enable-permissions",
-                RequestsMethods.POST,
-                json.dumps({}),
+        datasource_registry: DatasourceRegistry = (
+            self.grafana_api_model.datasource_registry
+        )
+
+        if refresh or not datasource_registry.is_valid():
+            api_call: list = await AsyncApi(self.grafana_api_model).call_the_api(
+                APIEndpoints.DATASOURCES.value,
+                RequestsMethods.GET,
             )
+            datasources: list = Datasource._check_the_datasources(api_call)
 
-            if api_call.get("message") != "Datasource permissions enabled":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully enabled the datasource permissions.")
-        else:
-            logging.error("There is no datasource_id defined.")
-            raise ValueError
+            with datasource_registry.lock:
+                datasource_registry.update(
+                    datasources, self.grafana_api_model.datasource_registry_ttl
+                )
 
-    def disable_datasource_permissions(self, datasource_id: int):
-        """The method includes a functionality to disable datasource permissions specified by the datasource id. The functionality is a Grafana ENTERPRISE feature
+        return datasource_registry
+
+    async def get_datasource_by_id(self, datasource_id: int) -> dict:
+        """The method includes a functionality to get the datasource specified by the datasource id
 
         Args:
             datasource_id (int): Specify the id of the datasource
 
         Required Permissions:
-            Action: datasources.permissions:write
+            Action: datasources:read
             Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
 
         Raises:
@@ -796,105 +2112,118 @@ class DatasourceLegacyPermissions:
             Exception: Unspecified error by executing the API call
 
         Returns:
-            None
+            api_call (dict): Returns a datasource
         """
 
-        if datasource_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/disable-permissions",
-                RequestsMethods.POST,
-                json.dumps({}),
-            )
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(datasource_id=datasource_id)
+            ),
+            "id",
+        )
 
-            if api_call.get("message") != "Datasource permissions disabled":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully disabled the datasource permissions.")
-        else:
-            logging.error("There is no datasource_id defined.")
-            raise ValueError
+    async def get_datasource_by_uid(self, uid: str) -> dict:
+        """The method includes a functionality to get the datasource specified by the datasource uid
 
-    def get_datasource_permissions(self, datasource_id: int) -> dict:
-        """The method includes a functionality to get the datasource permissions specified by the datasource id. The functionality is a Grafana ENTERPRISE feature
+        Args:
+            uid (str): Specify the uid of the datasource
+
+        Required Permissions:
+            Action: datasources:read
+            Scope: [datasources:*, datasources:uid:*, datasources:uid:<uid>]
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns a datasource
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(uid=uid)
+            ),
+            "id",
+        )
+
+    async def get_datasource_by_name(self, name: str) -> dict:
+        """The method includes a functionality to get the datasource specified by the datasource name. The requested datasource is added to a valid datasource registry of the model
 
         Args:
-            datasource_id (int): Specify the id of the datasource
+            name (str): Specify the name of the datasource
 
         Required Permissions:
-            Action: datasources.permissions:read
-            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+            Action: datasources:read
+            Scope: [datasources:*, datasources:name:*, datasources:name:<name>]
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (dict): Returns the datasource permissions
+            api_call (dict): Returns a datasource
         """
 
-        if datasource_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/permissions",
-                RequestsMethods.GET,
-            )
+        api_call: dict = Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(name=name)
+            ),
+            "id",
+        )
 
-            if api_call == dict() or api_call.get("datasourceId") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no datasource_id defined.")
-            raise ValueError
+        Datasource._register_the_named_datasource(
+            self.grafana_api_model.datasource_registry, api_call
+        )
+        return api_call
 
-    def add_datasource_permissions(
-        self, datasource_id: int, datasource_permission: dict
-    ):
-        """The method includes a functionality to add datasource permission specified by the datasource id and the datasource permission dict. The functionality is a Grafana ENTERPRISE feature
+    async def get_datasource_id_by_name(self, name: str) -> int:
+        """The method includes a functionality to get the datasource id specified by the datasource name. The datasource id is looked up inside the datasource registry of the model and is only requested, if the datasource is not registered or the caching of the registry is disabled
 
         Args:
-            datasource_id (int): Specify the id of the datasource
-            datasource_permission (dict): Specify the permission of the datasource
+            name (str): Specify the name of the datasource
 
         Required Permissions:
-            Action: datasources.permissions:write
-            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+            Action: datasources:read
+            Scope: [datasources:*, datasources:name:*, datasources:name:<name>]
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            None
+            api_call (int): Returns a datasource id
         """
 
-        if datasource_id != 0 and datasource_permission != dict():
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/permissions",
-                RequestsMethods.POST,
-                json.dumps(datasource_permission),
-            )
+        if len(name) != 0:
+            if self.grafana_api_model.datasource_registry_ttl > 0:
+                datasource: dict | None = Datasource._get_the_registered_datasource(
+                    await self.get_datasource_registry(), name
+                )
 
-            if api_call.get("message") != "Datasource permission added":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully added a datasource permission.")
+                if datasource is not None:
+                    return int(datasource.get("id"))
+
+            api_call: dict = Api.check_the_api_call(
+                await AsyncApi(self.grafana_api_model).call_the_api(
+                    f"{APIEndpoints.DATASOURCES.value}/id/{name}",
+                    RequestsMethods.GET,
+                ),
+                "id",
+            )
+            return int(api_call.get("id"))
         else:
-            logging.error("There is no datasource_id or datasource_permission defined.")
+            logging.error("There is no name defined.")
             raise ValueError
 
-    def delete_datasource_permissions(self, datasource_id: int, permission_id: int):
-        """The method includes a functionality to delete datasource permission specified by the datasource id and the permission id. The functionality is a Grafana ENTERPRISE feature
+    async def create_datasource(self, data_source: dict):
+        """The method includes a functionality to create a datasource specified by the datasource as dict
 
         Args:
-            datasource_id (int): Specify the id of the datasource
-            permission_id (id): Specify the permission id
+            data_source (dict): Specify the datasource as dict
 
         Required Permissions:
-            Action: datasources.permissions:write
-            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
+            Action: datasources:create
 
         Raises:
             ValueError: Missed specifying a necessary value
@@ -904,302 +2233,340 @@ class DatasourceLegacyPermissions:
             None
         """
 
-        if datasource_id != 0 and permission_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/permissions/{permission_id}",
-                RequestsMethods.DELETE,
-            )
-
-            if api_call.get("message") != "Datasource permission removed":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully removed a datasource permission.")
-        else:
-            logging.error("There is no datasource_id or permission_id defined.")
-            raise ValueError
+        Datasource._register_the_datasource(
+            self.grafana_api_model.datasource_registry,
+            Api.check_the_api_call_message(
+                await AsyncApi(self.grafana_api_model).call_the_api(
+                    *Datasource._create_the_datasource_creation_request(data_source)
+                ),
+                "Datasource added",
+                "You successfully created a datasource.",
+            ),
+        )
 
+    async def update_datasource(self, data_source: dict, datasource_id: int = 0, datasource_uid: str | None = None):
+        """The method includes a functionality to update a datasource specified by the datasource as dict and the datasource id/ datasource uid
 
-class DatasourceQueryResourceCaching:
-    """The class includes all necessary methods to access the Grafana datasource query and resource caching API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights. The functionality is a Grafana ENTERPRISE feature
+        Args:
+            data_source (dict): Specify the datasource as dict
+            datasource_id (int): Specify the id of the datasource (default 0)
+            datasource_uid (str): Specify the uid of the datasource (default None)
 
-    HINT: Note Grafana Enterprise API need required permissions if fine-grained access control is enabled
+        Required Permissions:
+            Action: datasources:write
+            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
 
-    Args:
-        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
 
-    Attributes:
-        grafana_api_model (APIModel): This is where we store the grafana_api_model
-    """
+        Returns:
+            None
+        """
 
-    def __init__(self, grafana_api_model: APIModel):
-        self.grafana_api_model = grafana_api_model
+        Datasource._register_the_datasource(
+            self.grafana_api_model.datasource_registry,
+            Api.check_the_api_call_message(
+                await AsyncApi(self.grafana_api_model).call_the_api(
+                    *Datasource._create_the_datasource_update_request(
+                        data_source, datasource_id, datasource_uid
+                    )
+                ),
+                "Datasource updated",
+                "You successfully updated a datasource.",
+            ),
+        )
 
-    def get_datasource_cache(self, uid: str) -> dict:
-        """The method includes a functionality to get the datasource cache config specified by the datasource uid
+    async def delete_datasource_by_id(self, datasource_id: int):
+        """The method includes a functionality to delete a datasource specified by the datasource id
 
         Args:
-            uid (str): Specify the uid of the datasource
+            datasource_id (int): Specify the id of the datasource
 
         Required Permissions:
-            Action: datasources.caching:write
-            Scope: datasources:*
+            Action: datasources:delete
+            Scope: [datasources:*, datasources:id:*, datasources:id:<id>]
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (dict): Returns a datasource
+            None
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache",
-            )
-
-            if api_call == dict() or api_call.get("dataSourceID") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no uid defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(
+                    RequestsMethods.DELETE, datasource_id=datasource_id
+                )
+            ),
+            "Data source deleted",
+            "You successfully deleted a datasource.",
+        )
+        Datasource._unregister_the_datasource(
+            self.grafana_api_model.datasource_registry, datasource_id=datasource_id
+        )
 
-    def enable_datasource_cache(self, uid: str) -> dict:
-        """The method includes a functionality to enable the datasource cache specified by the datasource uid
+    async def delete_datasource_by_uid(self, uid: str):
+        """The method includes a functionality to delete a datasource specified by the datasource uid
 
         Args:
             uid (str): Specify the uid of the datasource
 
         Required Permissions:
-            Action: datasources.caching:read
-            Scope: datasources:*
+            Action: datasources:delete
+            Scope: [datasources:*, datasources:uid:*, datasources:uid:<uid>]
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (dict): Returns a datasource
+            None
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache/enable",
-                RequestsMethods.POST,
-            )
-
-            if api_call == dict() or api_call.get("dataSourceID") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no uid defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(
+                    RequestsMethods.DELETE, uid=uid
+                )
+            ),
+            "Data source deleted",
+            "You successfully deleted a datasource.",
+        )
+        Datasource._unregister_the_datasource(
+            self.grafana_api_model.datasource_registry, uid=uid
+        )
 
-    def disable_datasource_cache(self, uid: str) -> dict:
-        """The method includes a functionality to disable the datasource cache specified by the datasource uid
+    async def delete_datasource_by_name(self, name: str):
+        """The method includes a functionality to delete a datasource specified by the datasource name
 
         Args:
-            uid (str): Specify the uid of the datasource
+            name (str): Specify the name of the datasource
 
         Required Permissions:
-            Action: datasources.caching:write
-            Scope: datasources:*
+            Action: datasources:delete
+            Scope: [datasources:*, datasources:name:*, datasources:name:<name>]
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (dict): Returns a datasource
+            None
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache/disable",
-                RequestsMethods.POST,
-            )
-
-            if api_call == dict() or api_call.get("dataSourceID") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no uid defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_datasource_request(
+                    RequestsMethods.DELETE, name=name
+                )
+            ),
+            "Data source deleted",
+            "You successfully deleted a datasource.",
+        )
+        Datasource._unregister_the_datasource(
+            self.grafana_api_model.datasource_registry, name=name
+        )
 
-    def clean_datasource_cache(self, uid: str) -> dict:
-        """The method includes a functionality to clean the datasource cache of all data sources with caching enabled. The uid of the datasource will only be used to return the configuration for that data source
+    async def query_datasource_by_id(
+        self,
+        time: str,
+        to: str,
+        datasource_queries: list,
+        data_frame_decoder: DataFrameDecoder = None,
+    ) -> dict:
+        """The method includes a functionality to execute a queries inside the datasource itself specified by the datasource id
 
         Args:
-            uid (str): Specify the uid of the datasource
+            time (str): Specify the name of the absolute in epoch timestamps in milliseconds or relative using Grafana time units. For example, now-1h
+            to (str): Specify the name of the absolute in epoch timestamps in milliseconds or relative using Grafana time units. For example, now-1h
+            datasource_queries (list): Specify a list of execution queries based on the DatasourceQuery class
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder to convert the data frames of the results into columns (default None)
 
-        Required Permissions:
-            Action: datasources.caching:write
-            Scope: datasources:*
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the result of the specified query. If a data_frame_decoder is specified, the list of the decoded DataFrame objects is returned grouped by the reference id
+        """
+
+        return Datasource._get_the_query_results(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Datasource._create_the_legacy_query_request(
+                    time, to, datasource_queries
+                )
+            ),
+            data_frame_decoder,
+        )
+
+    async def query_datasource_by_uid(
+        self,
+        time: str,
+        to: str,
+        datasource_queries: list,
+        data_frame_decoder: DataFrameDecoder = None,
+    ) -> dict:
+        """The method includes a functionality to execute a queries inside the datasource itself specified by the datasource uid
+
+        Args:
+            time (str): Specify the name of the absolute in epoch timestamps in milliseconds or relative using Grafana time units. For example, now-1h
+            to (str): Specify the name of the absolute in epoch timestamps in milliseconds or relative using Grafana time units. For example, now-1h
+            datasource_queries (list): Specify a list of execution queries based on the DatasourceQuery class
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder to convert the data frames of the results into columns (default None)
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (dict): Returns a datasource
+            api_call (dict): Returns the result of the specified query. If a data_frame_decoder is specified, the list of the decoded DataFrame objects is returned grouped by the reference id
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache/clean",
-                RequestsMethods.POST,
+        if len(time) != 0 and len(to) != 0 and datasource_queries != list():
+            return await self.query_datasources(
+                Datasource._create_the_datasource_query_request(
+                    time, to, datasource_queries
+                ),
+                data_frame_decoder,
             )
-
-            if api_call == dict() or api_call.get("dataSourceID") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
         else:
-            logging.error("There is no uid defined.")
+            logging.error("There is no time, to or datasource_queries defined.")
             raise ValueError
 
-    def update_datasource_cache(
-        self, uid: str, datasource_cache: DatasourceCache
+    async def query_datasources(
+        self,
+        datasource_query_request: DatasourceQueryRequest,
+        data_frame_decoder: DataFrameDecoder = None,
     ) -> dict:
-        """The method includes a functionality to update the datasource cache specified by the datasource uid
+        """The method includes a functionality to execute multiple queries of different datasources and query languages in a single round-trip. If a query result cache is used, the results of settled time ranges are cached. A time range that ends at now is never settled, so please use the chunked queries to reuse the results of a moving time range
 
         Args:
-            uid (str): Specify the uid of the datasource
-            datasource_cache (DatasourceCache): Specif the datasource cache object
-
-        Required Permissions:
-            Action: datasources.caching:write
-            Scope: datasources:*
+            datasource_query_request (DatasourceQueryRequest): Specify the request with the time range and the queries
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder to convert the data frames of the results into columns (default None)
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (dict): Returns a datasource
+            api_call (dict): Returns the results of the queries grouped by the reference id. If a data_frame_decoder is specified, the list of the decoded DataFrame objects is returned grouped by the reference id
         """
 
-        if (
-            len(uid) != 0
-            and datasource_cache is not None
-            and datasource_cache.datasource_id != 0
-            and len(datasource_cache.datasource_uid) != 0
-            and datasource_cache.enabled is not None
-            and datasource_cache.use_default_ttl is not None
-            and datasource_cache.ttl_queries_ms != 0
-            and datasource_cache.ttl_resources_ms != 0
-        ):
-            datasource_cache_object: dict = dict(
-                {
-                    "dataSourceID": datasource_cache.datasource_id,
-                    "dataSourceUID": datasource_cache.datasource_uid,
-                    "enabled": datasource_cache.enabled,
-                    "useDefaultTTL": datasource_cache.use_default_ttl,
-                    "ttlQueriesMs": datasource_cache.ttl_queries_ms,
-                    "ttlResourcesMs": datasource_cache.ttl_resources_ms,
-                }
-            )
+        Datasource._check_the_query_request(datasource_query_request)
 
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{uid}/cache",
+        query_result_cache: QueryResultCache = (
+            self.grafana_api_model.query_result_cache
+        )
+        cache_payload: dict | None = Datasource._create_the_query_cache_payload(
+            datasource_query_request, query_result_cache
+        )
+        api_call: dict | None = await self._run_the_query_result_cache(
+            Datasource._get_the_cached_query_result,
+            query_result_cache,
+            self.grafana_api_model.json_codec,
+            cache_payload,
+        )
+
+        if api_call is None:
+            api_call = await AsyncApi(self.grafana_api_model).call_the_api(
+                APIEndpoints.DATASOURCE_QUERY.value,
                 RequestsMethods.POST,
-                json.dumps(datasource_cache_object),
+                datasource_query_request.to_json(),
             )
-
-            if api_call == dict() or api_call.get("dataSourceID") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error(
-                "There is no uid or the right datasource_cache object defined."
+            await self._run_the_query_result_cache(
+                Datasource._cache_the_query_result,
+                query_result_cache,
+                self.grafana_api_model.json_codec,
+                cache_payload,
+                api_call,
             )
-            raise ValueError
-
-
-class DatasourceLabelBasedAccessControl:
-    """The class includes all necessary methods to access the Grafana datasource label based access control for teams API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights. The functionality is a Grafana Cloud feature. Only cloud Loki data sources are supported
 
-    Args:
-        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
-
-    Attributes:
-        grafana_api_model (APIModel): This is where we store the grafana_api_model
-    """
-
-    def __init__(self, grafana_api_model: APIModel):
-        self.grafana_api_model = grafana_api_model
+        return Datasource._get_the_query_results(api_call, data_frame_decoder)
 
-    def get_lbac_rules_for_datasource(self, uid: str) -> list:
-        """The method includes a functionality to get all datasource label based access control rules for team specified by the datasource uid
+    async def query_datasource_by_uid_in_chunks(
+        self,
+        time: any,
+        to: any,
+        datasource_queries: list,
+        chunk_size_ms: int = None,
+        max_workers: int = None,
+        data_frame_decoder: DataFrameDecoder = None,
+        max_chunks: int = MAX_CHUNKS,
+    ) -> dict:
+        """The method includes a functionality to execute the queries of a long time range inside the datasource specified by the datasource uid. The time range is split into chunks, that are queried concurrently and the frames of the chunks are stitched together in the order of the time range
 
         Args:
-            uid (str): Specify the uid of the datasource
-
-        Required Permissions:
-            Action: datasources:read
-            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+            time (any): Specify the start of the time range as epoch timestamp in milliseconds, as datetime or relative using Grafana time units. For example, now-1y
+            to (any): Specify the end of the time range as epoch timestamp in milliseconds, as datetime or relative using Grafana time units. For example, now
+            datasource_queries (list): Specify a list of execution queries based on the DatasourceQuery class
+            chunk_size_ms (int): Specify the time range of a chunk in milliseconds. By default, the smallest interval_ms multiplied by the max_data_points of the queries is used, but at least one day (default None)
+            max_workers (int): Specify the maximum number of concurrent requests. By default, the maximum concurrency of the model is used (default None)
+            data_frame_decoder (DataFrameDecoder): Specify the optional decoder to convert the data frames of the results into columns (default None)
+            max_chunks (int): Specify the maximum number of chunks. A time range that needs more chunks is rejected (default 1000)
 
         Raises:
             ValueError: Missed specifying a necessary value
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (list): Returns all LBAC rules
+            api_call (dict): Returns the stitched result of the specified query. If a data_frame_decoder is specified, the list of the decoded DataFrame objects is returned grouped by the reference id
         """
 
-        if len(uid) != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{uid}/lbac/teams",
+        batch_executor: BatchExecutor = BatchExecutor(
+            self.grafana_api_model, max_workers
+        )
+        query_result_cache: QueryResultCache = self.grafana_api_model.query_result_cache
+        requests: list = Datasource._create_the_chunk_requests(
+            time, to, datasource_queries, chunk_size_ms, max_chunks
+        )
+        cached_results: list = await self._run_the_query_result_cache(
+            Datasource._get_the_cached_chunk_results,
+            query_result_cache,
+            self.grafana_api_model.json_codec,
+            requests,
+        )
+        chunk_results: list = await batch_executor.execute_async(
+            [
+                request
+                for request, cached_result in zip(requests, cached_results)
+                if cached_result is None
+            ]
+        )
+        results: dict = Datasource._stitch_the_chunk_results(
+            await self._run_the_query_result_cache(
+                Datasource._merge_the_chunk_results,
+                query_result_cache,
+                self.grafana_api_model.json_codec,
+                requests,
+                cached_results,
+                chunk_results,
             )
+        )
 
-            if api_call is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no uid defined.")
-            raise ValueError
-
-    def update_lbac_rules_for_datasource(self, uid: str) -> dict:
-        """The method includes a functionality to enable the datasource cache specified by the datasource uid
+        if data_frame_decoder is not None:
+            return data_frame_decoder.decode_the_results(results)
 
-        Args:
-            uid (str): Specify the uid of the datasource
+        return results
 
-        Required Permissions:
-            Action: datasources:write, datasources.permissions:write
-            Scope: [datasources:*, datasources:uid:*, datasources:uid:<id>]
+    async def _run_the_query_result_cache(self, function: callable, *args) -> any:
+        """The method includes a functionality to execute a function of the query result cache. If the cache is persisted inside a directory, the function is executed inside a worker thread, so that the file I/O doesn't block the event loop
 
-        Raises:
-            ValueError: Missed specifying a necessary value
-            Exception: Unspecified error by executing the API call
+        Args:
+            function (callable): Specify the function of the query result cache
+            *args: Specify the arguments of the function
 
         Returns:
-            api_call (dict): Returns a datasource
+            result (any): Returns the result of the function
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.DATASOURCES.value}/{uid}/lbac/teams",
-                RequestsMethods.POST,
-            )
+        query_result_cache: QueryResultCache | None = (
+            self.grafana_api_model.query_result_cache
+        )
 
-            if api_call == dict() or api_call.get("dataSourceID") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no uid defined.")
-            raise ValueError
+        if query_result_cache is None or query_result_cache.path is None:
+            return function(*args)
+
+        return await asyncio.to_thread(function, *args)
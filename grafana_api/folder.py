@@ -1,10 +1,9 @@
 import logging
-import json
 
 import httpx
 
-from .api import Api
-from .model import APIModel, APIEndpoints, RequestsMethods
+from .api import Api, AsyncApi, BatchExecutor
+from .model import APIModel, APIEndpoints, RequestsMethods, FolderIndex
 
 
 class Folder:
@@ -20,8 +19,10 @@ class Folder:
     def __init__(self, grafana_api_model: APIModel):
         self.grafana_api_model = grafana_api_model
 
-    def get_folders(self, limit: int = 1000, nested_folders: bool = False) -> list:
-        """The method includes a functionality to extract all folders inside the organization
+    def get_folders(
+        self, limit: int = 1000, nested_folders: bool = False, max_workers: int = None
+    ) -> list:
+        """The method includes a functionality to extract all folders inside the organization. The nested folders are discovered breadth-first and the folders of each tree level are requested concurrently
 
         Required Permissions:
             Action: folders:read
@@ -30,6 +31,7 @@ class Folder:
         Args:
             limit (int): Specify the limit of folders that should be extracted (default 1000)
             nested_folders (bool): Specify if nested folders should be extracted (default False)
+            max_workers (int): Specify the maximum number of concurrent requests per tree level. By default, the maximum concurrency of the model is used (default None)
 
         Raises:
             Exception: Unspecified error by executing the API call
@@ -38,6 +40,57 @@ class Folder:
             api_call (list): Returns all folders including nested ones
         """
 
+        folders_raw: list = self._get_top_level_folders(limit)
+
+        nested_folders_by_parent: dict = dict()
+        if nested_folders:
+            nested_folders_by_parent = self._get_nested_folders_by_parent(
+                [folder.get("uid") for folder in folders_raw], max_workers
+            )
+
+        return Folder._create_folder_list(folders_raw, nested_folders_by_parent)
+
+    def get_folder_tree(self, limit: int = 1000, max_workers: int = None) -> list:
+        """The method includes a functionality to extract the folder hierarchy inside the organization. The nested folders are discovered breadth-first and the folders of each tree level are requested concurrently
+
+        Required Permissions:
+            Action: folders:read
+            Scope: folders:*
+
+        Args:
+            limit (int): Specify the limit of folders that should be extracted (default 1000)
+            max_workers (int): Specify the maximum number of concurrent requests per tree level. By default, the maximum concurrency of the model is used (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_tree (list): Returns the top level folders. Every folder includes the id, uid, title, parentUid and the children folders
+        """
+
+        folders_raw: list = self._get_top_level_folders(limit)
+        nested_folders_by_parent: dict = self._get_nested_folders_by_parent(
+            [folder.get("uid") for folder in folders_raw], max_workers
+        )
+
+        return [
+            self._create_folder_tree_node(folder, None, nested_folders_by_parent)
+            for folder in folders_raw
+        ]
+
+    def _get_top_level_folders(self, limit: int = 1000) -> list:
+        """The method includes a functionality to extract the top level folders inside the organization
+
+        Args:
+            limit (int): Specify the limit of folders that should be extracted (default 1000)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folders_raw (list): Returns the top level folders
+        """
+
         folders_raw: list = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.SEARCH.value}?folderIds=0"
         )
@@ -47,42 +100,189 @@ class Folder:
                 f"{APIEndpoints.FOLDERS.value}?limit={limit}"
             )
 
-        if folders_raw == list() or folders_raw[0].get("id") is None:
-            logging.error(f"Please, check the error: {folders_raw}.")
-            raise Exception
+        return Api.check_the_api_call_items(folders_raw, "id")
+
+    def _get_nested_folders(self, parent_uid: str, max_workers: int = None) -> list:
+        """Retrieve all nested folders for a given parent folder
+
+        Args:
+            parent_uid (str): The uid of the parent folder
+            max_workers (int): Specify the maximum number of concurrent requests per tree level (default None)
+
+        Returns:
+            all_nested (list): All nested folders under the parent, recursively
+        """
+
+        return self._flatten_nested_folders(
+            parent_uid, self._get_nested_folders_by_parent([parent_uid], max_workers)
+        )
+
+    def _get_nested_folders_by_parent(
+        self, parent_uids: list, max_workers: int = None
+    ) -> dict:
+        """The method includes a functionality to discover all nested folders breadth-first. The children of all folders of a tree level are requested concurrently with a bounded number of workers
+
+        Args:
+            parent_uids (list): Specify the uids of the parent folders of the first tree level
+            max_workers (int): Specify the maximum number of concurrent requests per tree level (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            nested_folders_by_parent (dict): Returns the children folders by the uid of the parent folder
+        """
+
+        nested_folders_by_parent: dict = dict()
+        batch_executor: BatchExecutor = BatchExecutor(
+            self.grafana_api_model, max_workers
+        )
+        level: list = list(dict.fromkeys(parent_uids))
+
+        while len(level) != 0:
+            level = Folder._add_the_nested_folders(
+                nested_folders_by_parent,
+                level,
+                batch_executor.execute(Folder._create_the_nested_folder_requests(level)),
+            )
+
+        return nested_folders_by_parent
+
+    @staticmethod
+    def _create_folder_list(folders_raw: list, nested_folders_by_parent: dict) -> list:
+        """The method includes a functionality to create the flat list of all folders. Every top level folder is followed by the corresponding nested folders
+
+        Args:
+            folders_raw (list): Specify the top level folders
+            nested_folders_by_parent (dict): Specify the children folders by the uid of the parent folder
+
+        Returns:
+            folders (list): Returns all folders including the General folder and the nested ones
+        """
 
         folders: list = [{"id": 0, "uid": "", "title": "General"}]
         for folder in folders_raw:
             folders.append({"id": folder.get("id"), "uid": folder.get("uid"), "title": folder.get("title")})
-
-            if nested_folders:
-                folders.extend(self._get_nested_folders(folder.get("uid")))
+            folders.extend(
+                Folder._flatten_nested_folders(
+                    folder.get("uid"), nested_folders_by_parent
+                )
+            )
 
         return folders
 
-    def _get_nested_folders(self, parent_uid: str) -> list:
-        """Recursively retrieve nested folders for a given parent folder
+    @staticmethod
+    def _create_folder_paths(folders_raw: list, nested_folders_by_parent: dict) -> dict:
+        """The method includes a functionality to create the full paths of all folders e.g. Parent/Child for nested folders
 
         Args:
-            parent_uid (str): The uid of the parent folder
+            folders_raw (list): Specify the top level folders
+            nested_folders_by_parent (dict): Specify the children folders by the uid of the parent folder
 
         Returns:
-            all_nested (list): All nested folders under the parent, recursively
+            folder_paths (dict): Returns the folders by the full folder path
         """
 
-        nested_folders: list = Api(self.grafana_api_model).call_the_api(
-            f"{APIEndpoints.FOLDERS.value}?parentUid={parent_uid}"
-        )
+        folder_paths: dict = dict()
+        visited_uids: set = set()
+        level: list = [
+            (
+                folder.get("title"),
+                {"id": folder.get("id"), "uid": folder.get("uid"), "title": folder.get("title")},
+            )
+            for folder in folders_raw
+        ]
+
+        while len(level) != 0:
+            next_level: list = list()
+            for path, folder in level:
+                if folder.get("uid") in visited_uids:
+                    continue
+
+                visited_uids.add(folder.get("uid"))
+                folder_paths[path] = folder
+                next_level.extend(
+                    (f"{path}/{child.get('title')}", child)
+                    for child in nested_folders_by_parent.get(folder.get("uid"), list())
+                )
+
+            level = next_level
+
+        return folder_paths
+
+    @staticmethod
+    def _flatten_nested_folders(
+        parent_uid: str, nested_folders_by_parent: dict, visited_uids: set = None
+    ) -> list:
+        """The method includes a functionality to flatten the nested folders of a parent folder. The direct children are followed by the nested folders of each child
+
+        Args:
+            parent_uid (str): Specify the uid of the parent folder
+            nested_folders_by_parent (dict): Specify the children folders by the uid of the parent folder
+            visited_uids (set): Specify the already flattened folder uids to skip cycles inside the folder hierarchy (default None)
+
+        Returns:
+            all_nested (list): Returns all nested folders under the parent
+        """
+
+        if visited_uids is None:
+            visited_uids = set()
 
-        if nested_folders == list():
-            return []
+        visited_uids.add(parent_uid)
+        nested_folders: list = [
+            folder
+            for folder in nested_folders_by_parent.get(parent_uid, list())
+            if folder.get("uid") not in visited_uids
+        ]
+        visited_uids.update(folder.get("uid") for folder in nested_folders)
 
         all_nested: list = list(nested_folders)
         for folder in nested_folders:
-            all_nested.extend(self._get_nested_folders(folder.get("uid")))
+            all_nested.extend(
+                Folder._flatten_nested_folders(
+                    folder.get("uid"), nested_folders_by_parent, visited_uids
+                )
+            )
 
         return all_nested
 
+    @staticmethod
+    def _create_folder_tree_node(
+        folder: dict,
+        parent_uid: str,
+        nested_folders_by_parent: dict,
+        visited_uids: set = None,
+    ) -> dict:
+        """The method includes a functionality to create a folder tree node including all children folders
+
+        Args:
+            folder (dict): Specify the folder
+            parent_uid (str): Specify the uid of the parent folder
+            nested_folders_by_parent (dict): Specify the children folders by the uid of the parent folder
+            visited_uids (set): Specify the folder uids of the current branch to skip cycles inside the folder hierarchy (default None)
+
+        Returns:
+            node (dict): Returns the folder tree node
+        """
+
+        visited_uids = (visited_uids or set()) | {folder.get("uid")}
+
+        return dict(
+            {
+                "id": folder.get("id"),
+                "uid": folder.get("uid"),
+                "title": folder.get("title"),
+                "parentUid": parent_uid,
+                "children": [
+                    Folder._create_folder_tree_node(
+                        child, folder.get("uid"), nested_folders_by_parent, visited_uids
+                    )
+                    for child in nested_folders_by_parent.get(folder.get("uid"), list())
+                    if child.get("uid") not in visited_uids
+                ],
+            }
+        )
+
     def get_folder_by_uid(self, uid: str) -> dict:
         """The method includes a functionality to extract all folder information specified by the uid of the folder
 
@@ -101,19 +301,12 @@ class Folder:
             api_call (dict): Returns a folder
         """
 
-        if len(uid) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.FOLDERS.value}/{uid}"
-            )
-
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no dashboard uid defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Folder._create_the_folder_request(uid)
+            ),
+            "id",
+        )
 
     def get_folder_by_id(self, id: int) -> dict:
         """The method includes a functionality to extract all folder information specified by the id of the folder
@@ -133,19 +326,12 @@ class Folder:
             api_call (dict): Returns a folder
         """
 
-        if id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.FOLDERS.value}/id/{id}",
-            )
-
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no folder id defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Folder._create_the_folder_id_request(id)
+            ),
+            "id",
+        )
 
     def create_folder(
         self, title: str, uid: str = None, parent_uid: str = None
@@ -169,30 +355,12 @@ class Folder:
             api_call (dict): Returns a newly created folder
         """
 
-        if len(title) != 0:
-            folder_information: dict = dict()
-            folder_information.update({"title": title})
-
-            if uid is not None and len(uid) != 0:
-                folder_information.update({"uid": uid})
-
-            if parent_uid is not None and len(parent_uid) != 0:
-                folder_information.update({"parentUid": parent_uid})
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                APIEndpoints.FOLDERS.value,
-                RequestsMethods.POST,
-                json.dumps(folder_information),
-            )
+        api_call: dict = Api(self.grafana_api_model).call_the_api(
+            *Folder._create_the_folder_creation_request(title, uid, parent_uid)
+        )
+        self.grafana_api_model.folder_index.invalidate()
 
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no folder uid or title defined.")
-            raise ValueError
+        return Api.check_the_api_call(api_call, "id")
 
     def update_folder(
         self, title: str, uid: str, version: int = 0, overwrite: bool = False
@@ -217,32 +385,12 @@ class Folder:
             api_call (dict): Returns an updated folder
         """
 
-        if overwrite is True:
-            version = None
-
-        if len(title) != 0 and version != 0 and len(uid) != 0:
-            folder_information: dict = dict()
-            folder_information.update({"title": title})
-            folder_information.update({"overwrite": overwrite})
-            folder_information.update({"uid": uid})
-
-            if version is not None:
-                folder_information.update({"version": version})
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.FOLDERS.value}/{uid}",
-                RequestsMethods.PUT,
-                json.dumps(folder_information),
-            )
+        api_call: dict = Api(self.grafana_api_model).call_the_api(
+            *Folder._create_the_folder_update_request(title, uid, version, overwrite)
+        )
+        self.grafana_api_model.folder_index.invalidate()
 
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no folder title, version or uid defined.")
-            raise ValueError
+        return Api.check_the_api_call(api_call, "id")
 
     def move_folder(self, uid: str, parent_uid: str = None):
         """The method includes a functionality to move a folder inside the organization specified by the defined uid. This feature is only relevant if nested folders are enabled
@@ -263,26 +411,12 @@ class Folder:
             api_call (dict): Returns the moved folder
         """
 
-        if len(uid) != 0:
-            folder_information: dict = dict()
-
-            if parent_uid is not None and len(parent_uid) != 0:
-                folder_information.update({"parentUid": parent_uid})
-
-            api_call = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.FOLDERS.value}/{uid}/move",
-                RequestsMethods.POST,
-                json.dumps(folder_information),
-            )
+        api_call: dict = Api(self.grafana_api_model).call_the_api(
+            *Folder._create_the_folder_move_request(uid, parent_uid)
+        )
+        self.grafana_api_model.folder_index.invalidate()
 
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no folder uid defined.")
-            raise ValueError
+        return Api.check_the_api_call(api_call, "id")
 
     def delete_folder(self, uid: str):
         """The method includes a functionality to delete a folder inside the organization specified by the defined uid
@@ -302,26 +436,12 @@ class Folder:
             None
         """
 
-        if len(uid) != 0:
-            api_call = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.FOLDERS.value}/{uid}",
-                RequestsMethods.DELETE,
-            )
+        api_call: any = Api(self.grafana_api_model).call_the_api(
+            *Folder._create_the_folder_deletion_request(uid)
+        )
+        self.grafana_api_model.folder_index.invalidate()
 
-            if (
-                isinstance(api_call, dict)
-                and api_call.get("message") != "Folder deleted"
-            ):
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            elif isinstance(api_call, httpx.Response) and api_call.status_code != 200:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully destroyed the folder.")
-        else:
-            logging.error("There is no folder uid defined.")
-            raise ValueError
+        Folder._check_the_folder_deletion(api_call)
 
     def get_folder_permissions(self, uid: str) -> list:
         """The method includes a functionality to extract the folder permissions inside the organization specified by the defined uid
@@ -341,20 +461,12 @@ class Folder:
             api_call (list): Returns a list of folder permissions
         """
 
-        if len(uid) != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.FOLDERS.value}/{uid}/permissions",
-                RequestsMethods.GET,
-            )
-
-            if api_call == list() or api_call[0].get("folderId") is None:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no folder uid defined.")
-            raise ValueError
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *Folder._create_the_folder_permissions_request(uid)
+            ),
+            "folderId",
+        )
 
     def update_folder_permissions(self, uid: str, permission_json: dict):
         """The method includes a functionality to update the folder permissions based on the specified uid and the permission json document
@@ -375,27 +487,46 @@ class Folder:
             None
         """
 
-        if len(uid) != 0 and len(permission_json) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.FOLDERS.value}/{uid}/permissions",
-                RequestsMethods.POST,
-                json.dumps(permission_json),
-            )
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Folder._create_the_folder_permissions_update_request(
+                    uid, permission_json
+                )
+            ),
+            ["Dashboard permissions updated", "Folder permissions updated"],
+            "You successfully modified the folder permissions.",
+        )
 
-            if api_call.get("message") not in [
-                "Dashboard permissions updated",
-                "Folder permissions updated",
-            ]:
-                logging.error(f"Please, check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully modified the folder permissions.")
-        else:
-            logging.error("There is no folder uid or permission json defined.")
-            raise ValueError
+    def get_folder_index(self) -> FolderIndex:
+        """The method includes a functionality to get the folder index of the model. The index is shared by all folder and dashboard lookups of the model and is rebuilt, if it's expired or invalidated by a folder modification
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_index (FolderIndex): Returns the folder index
+        """
+
+        folder_index: FolderIndex = self.grafana_api_model.folder_index
+
+        with folder_index.lock:
+            if not folder_index.is_valid():
+                generation: int = folder_index.generation
+                folders_raw: list = self._get_top_level_folders()
+                Folder._update_the_folder_index(
+                    folder_index,
+                    folders_raw,
+                    self._get_nested_folders_by_parent(
+                        [folder.get("uid") for folder in folders_raw]
+                    ),
+                    self.grafana_api_model.folder_index_ttl,
+                    generation,
+                )
+
+        return folder_index
 
     def get_folder_id_by_dashboard_path(self, dashboard_path: str) -> int:
-        """The method includes a functionality to extract the folder id specified inside model dashboard path
+        """The method includes a functionality to extract the folder id specified inside model dashboard path. The folder is looked up by the title or by the full path of a nested folder e.g. Parent/Child inside the folder index of the model
 
         Args:
             dashboard_path (str): Specify the dashboard path
@@ -408,30 +539,13 @@ class Folder:
             folder_id (int): Returns the folder id
         """
 
-        if dashboard_path.lower() == "general":
+        if Folder._is_the_general_folder(dashboard_path):
             return 0
 
-        if len(dashboard_path) != 0:
-            folders: list = self.get_all_folder_ids_uids_and_names()
-            folder_id: int = 0
-
-            for f in folders:
-                if dashboard_path == f.get("title"):
-                    folder_id = f.get("id")
-
-            if folder_id == 0:
-                logging.error(
-                    f"There's no folder_id for the dashboard named {dashboard_path} available."
-                )
-                raise Exception
-
-            return folder_id
-        else:
-            logging.error("There is no dashboard_path defined.")
-            raise ValueError
+        return Folder._get_the_folder_id(self.get_folder_index(), dashboard_path)
 
     def get_folder_uid_by_dashboard_path(self, dashboard_path: str) -> str:
-        """The method includes a functionality to extract the folder uid specified inside model dashboard path
+        """The method includes a functionality to extract the folder uid specified inside model dashboard path. The folder is looked up by the title or by the full path of a nested folder e.g. Parent/Child inside the folder index of the model
 
         Args:
             dashboard_path (str): Specify the dashboard path
@@ -444,24 +558,9 @@ class Folder:
             folder_uid (str): Returns the folder uid
         """
 
-        if len(dashboard_path) != 0:
-            folders: list = self.get_all_folder_ids_uids_and_names()
-            folder_uid: str | None = None
-
-            for f in folders:
-                if dashboard_path == f.get("title"):
-                    folder_uid = f.get("uid")
+        Folder._check_the_dashboard_path(dashboard_path)
 
-            if folder_uid is None:
-                logging.error(
-                    f"There's no folder_uid for the dashboard named {dashboard_path} available."
-                )
-                raise Exception
-
-            return folder_uid
-        else:
-            logging.error("There is no dashboard_path defined.")
-            raise ValueError
+        return Folder._get_the_folder_uid(self.get_folder_index(), dashboard_path)
 
     def get_all_folder_ids_uids_and_names(self, limit: int = 1000, nested_folders: bool = True) -> list:
         """The method extract all folder id, uid and names inside the complete organization. In addition, nested folders are also extracted by default
@@ -475,3 +574,847 @@ class Folder:
         """
 
         return self.get_folders(limit, nested_folders)
+
+    @staticmethod
+    def _create_the_nested_folder_requests(parent_uids: list) -> list:
+        """The method includes a functionality to create the requests of the children folders of a tree level
+
+        Args:
+            parent_uids (list): Specify the uids of the parent folders of the tree level
+
+        Returns:
+            requests (list): Returns the requests of the children folders
+        """
+
+        return [(f"{APIEndpoints.FOLDERS.value}?parentUid={uid}",) for uid in parent_uids]
+
+    @staticmethod
+    def _add_the_nested_folders(
+        nested_folders_by_parent: dict, parent_uids: list, results: list
+    ) -> list:
+        """The method includes a functionality to add the requested children folders of a tree level to the nested folders and to determine the next tree level. Folders that are already discovered are skipped
+
+        Args:
+            nested_folders_by_parent (dict): Specify the children folders by the uid of the parent folder
+            parent_uids (list): Specify the uids of the parent folders of the tree level
+            results (list): Specify the batch results of the children folders requests
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            parent_uids (list): Returns the uids of the parent folders of the next tree level
+        """
+
+        next_level: list = list()
+        for parent_uid, result in zip(parent_uids, results):
+            if result.error is not None:
+                raise result.error
+
+            nested_folders_by_parent[parent_uid] = list(result.result or [])
+            next_level.extend(
+                folder.get("uid")
+                for folder in nested_folders_by_parent[parent_uid]
+                if folder.get("uid") not in nested_folders_by_parent
+            )
+
+        return list(dict.fromkeys(next_level))
+
+    @staticmethod
+    def _update_the_folder_index(
+        folder_index: FolderIndex,
+        folders_raw: list,
+        nested_folders_by_parent: dict,
+        ttl: float,
+        generation: int,
+    ):
+        """The method includes a functionality to update the folder index with the requested folders
+
+        Args:
+            folder_index (FolderIndex): Specify the folder index
+            folders_raw (list): Specify the top level folders
+            nested_folders_by_parent (dict): Specify the children folders by the uid of the parent folder
+            ttl (float): Specify the time to live of the index in seconds
+            generation (int): Specify the generation of the index before the folders were requested
+
+        Returns:
+            None
+        """
+
+        folder_index.update(
+            Folder._create_folder_list(folders_raw, nested_folders_by_parent),
+            Folder._create_folder_paths(folders_raw, nested_folders_by_parent),
+            ttl,
+            generation,
+        )
+
+    @staticmethod
+    def _create_the_folder_request(uid: str) -> tuple:
+        """The method includes a functionality to create the request to get the folder specified by the uid
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(uid) != 0:
+            return (f"{APIEndpoints.FOLDERS.value}/{uid}",)
+        else:
+            logging.error("There is no dashboard uid defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_folder_id_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to get the folder specified by the id
+
+        Args:
+            id (int): Specify the id of the folder
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return (f"{APIEndpoints.FOLDERS.value}/id/{id}",)
+        else:
+            logging.error("There is no folder id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_folder_creation_request(
+        title: str, uid: str = None, parent_uid: str = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to create a new folder
+
+        Args:
+            title (str): Specify the title of the folder
+            uid (str): Specify the uid of the folder (default None)
+            parent_uid (str): Specify the parent_uid of the folder (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(title) != 0:
+            folder_information: dict = dict()
+            folder_information.update({"title": title})
+
+            if uid is not None and len(uid) != 0:
+                folder_information.update({"uid": uid})
+
+            if parent_uid is not None and len(parent_uid) != 0:
+                folder_information.update({"parentUid": parent_uid})
+
+            return (
+                APIEndpoints.FOLDERS.value,
+                RequestsMethods.POST,
+                folder_information,
+            )
+        else:
+            logging.error("There is no folder uid or title defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_folder_update_request(
+        title: str, uid: str, version: int = 0, overwrite: bool = False
+    ) -> tuple:
+        """The method includes a functionality to create the request to update a folder
+
+        Args:
+            title (str): Specify the title of the folder
+            uid (str): Specify the uid of the folder
+            version (int): Specify the version of the folder (default 0)
+            overwrite (bool): Should the already existing folder information be overwritten (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if overwrite is True:
+            version = None
+
+        if len(title) != 0 and version != 0 and len(uid) != 0:
+            folder_information: dict = dict()
+            folder_information.update({"title": title})
+            folder_information.update({"overwrite": overwrite})
+            folder_information.update({"uid": uid})
+
+            if version is not None:
+                folder_information.update({"version": version})
+
+            return (
+                f"{APIEndpoints.FOLDERS.value}/{uid}",
+                RequestsMethods.PUT,
+                folder_information,
+            )
+        else:
+            logging.error("There is no folder title, version or uid defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_folder_move_request(uid: str, parent_uid: str = None) -> tuple:
+        """The method includes a functionality to create the request to move a folder
+
+        Args:
+            uid (str): Specify the uid of the folder
+            parent_uid (str): Specify the parent_uid of the folder. If not specified, the folder is moved to the root (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(uid) != 0:
+            folder_information: dict = dict()
+
+            if parent_uid is not None and len(parent_uid) != 0:
+                folder_information.update({"parentUid": parent_uid})
+
+            return (
+                f"{APIEndpoints.FOLDERS.value}/{uid}/move",
+                RequestsMethods.POST,
+                folder_information,
+            )
+        else:
+            logging.error("There is no folder uid defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_folder_deletion_request(uid: str) -> tuple:
+        """The method includes a functionality to create the request to delete a folder
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(uid) != 0:
+            return f"{APIEndpoints.FOLDERS.value}/{uid}", RequestsMethods.DELETE
+        else:
+            logging.error("There is no folder uid defined.")
+            raise ValueError
+
+    @staticmethod
+    def _check_the_folder_deletion(api_call: any):
+        """The method includes a functionality to check the response of a folder deletion
+
+        Args:
+            api_call (any): Specify the result of the API call
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        if isinstance(api_call, dict) and api_call.get("message") != "Folder deleted":
+            logging.error(f"Please, check the error: {api_call}.")
+            raise Exception
+        elif isinstance(api_call, httpx.Response) and api_call.status_code != 200:
+            logging.error(f"Please, check the error: {api_call}.")
+            raise Exception
+        else:
+            logging.info("You successfully destroyed the folder.")
+
+    @staticmethod
+    def _create_the_folder_permissions_request(uid: str) -> tuple:
+        """The method includes a functionality to create the request to get the folder permissions
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(uid) != 0:
+            return f"{APIEndpoints.FOLDERS.value}/{uid}/permissions", RequestsMethods.GET
+        else:
+            logging.error("There is no folder uid defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_folder_permissions_update_request(
+        uid: str, permission_json: dict
+    ) -> tuple:
+        """The method includes a functionality to create the request to update the folder permissions
+
+        Args:
+            uid (str): Specify the uid of the folder
+            permission_json (dict): Specify the inserted permissions as dict
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(uid) != 0 and len(permission_json) != 0:
+            return (
+                f"{APIEndpoints.FOLDERS.value}/{uid}/permissions",
+                RequestsMethods.POST,
+                permission_json,
+            )
+        else:
+            logging.error("There is no folder uid or permission json defined.")
+            raise ValueError
+
+    @staticmethod
+    def _is_the_general_folder(dashboard_path: str) -> bool:
+        """The method includes a functionality to check if the dashboard path is the General folder. Other dashboard paths are validated
+
+        Args:
+            dashboard_path (str): Specify the dashboard path
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            general_folder (bool): Returns True if the dashboard path is the General folder
+        """
+
+        if dashboard_path.lower() == "general":
+            return True
+
+        Folder._check_the_dashboard_path(dashboard_path)
+        return False
+
+    @staticmethod
+    def _check_the_dashboard_path(dashboard_path: str):
+        """The method includes a functionality to check that the dashboard path is specified
+
+        Args:
+            dashboard_path (str): Specify the dashboard path
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            None
+        """
+
+        if len(dashboard_path) == 0:
+            logging.error("There is no dashboard_path defined.")
+            raise ValueError
+
+    @staticmethod
+    def _get_the_folder_id(folder_index: FolderIndex, dashboard_path: str) -> int:
+        """The method includes a functionality to look up the folder id of the dashboard path inside the folder index
+
+        Args:
+            folder_index (FolderIndex): Specify the folder index
+            dashboard_path (str): Specify the dashboard path
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_id (int): Returns the folder id
+        """
+
+        folder: dict | None = folder_index.get_folder(dashboard_path)
+        folder_id: int = 0 if folder is None else folder.get("id")
+
+        if folder_id == 0:
+            logging.error(
+                f"There's no folder_id for the dashboard named {dashboard_path} available."
+            )
+            raise Exception
+
+        return folder_id
+
+    @staticmethod
+    def _get_the_folder_uid(folder_index: FolderIndex, dashboard_path: str) -> str:
+        """The method includes a functionality to look up the folder uid of the dashboard path inside the folder index
+
+        Args:
+            folder_index (FolderIndex): Specify the folder index
+            dashboard_path (str): Specify the dashboard path
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_uid (str): Returns the folder uid
+        """
+
+        folder: dict | None = folder_index.get_folder(dashboard_path)
+        folder_uid: str | None = None if folder is None else folder.get("uid")
+
+        if folder_uid is None:
+            logging.error(
+                f"There's no folder_uid for the dashboard named {dashboard_path} available."
+            )
+            raise Exception
+
+        return folder_uid
+
+
+class AsyncFolder:
+    """The class includes all necessary methods to access the Grafana folder API endpoints asynchronously
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    async def get_folders(
+        self, limit: int = 1000, nested_folders: bool = False, max_workers: int = None
+    ) -> list:
+        """The method includes a functionality to extract all folders inside the organization. The nested folders are discovered breadth-first and the folders of each tree level are requested concurrently
+
+        Required Permissions:
+            Action: folders:read
+            Scope: folders:*
+
+        Args:
+            limit (int): Specify the limit of folders that should be extracted (default 1000)
+            nested_folders (bool): Specify if nested folders should be extracted (default False)
+            max_workers (int): Specify the maximum number of concurrent requests per tree level. By default, the maximum concurrency of the model is used (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns all folders including nested ones
+        """
+
+        folders_raw: list = await self._get_top_level_folders(limit)
+
+        nested_folders_by_parent: dict = dict()
+        if nested_folders:
+            nested_folders_by_parent = await self._get_nested_folders_by_parent(
+                [folder.get("uid") for folder in folders_raw], max_workers
+            )
+
+        return Folder._create_folder_list(folders_raw, nested_folders_by_parent)
+
+    async def get_folder_tree(
+        self, limit: int = 1000, max_workers: int = None
+    ) -> list:
+        """The method includes a functionality to extract the folder hierarchy inside the organization. The nested folders are discovered breadth-first and the folders of each tree level are requested concurrently
+
+        Required Permissions:
+            Action: folders:read
+            Scope: folders:*
+
+        Args:
+            limit (int): Specify the limit of folders that should be extracted (default 1000)
+            max_workers (int): Specify the maximum number of concurrent requests per tree level. By default, the maximum concurrency of the model is used (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_tree (list): Returns the top level folders. Every folder includes the id, uid, title, parentUid and the children folders
+        """
+
+        folders_raw: list = await self._get_top_level_folders(limit)
+        nested_folders_by_parent: dict = await self._get_nested_folders_by_parent(
+            [folder.get("uid") for folder in folders_raw], max_workers
+        )
+
+        return [
+            Folder._create_folder_tree_node(folder, None, nested_folders_by_parent)
+            for folder in folders_raw
+        ]
+
+    async def _get_top_level_folders(self, limit: int = 1000) -> list:
+        """The method includes a functionality to extract the top level folders inside the organization
+
+        Args:
+            limit (int): Specify the limit of folders that should be extracted (default 1000)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folders_raw (list): Returns the top level folders
+        """
+
+        folders_raw: list = await AsyncApi(self.grafana_api_model).call_the_api(
+            f"{APIEndpoints.SEARCH.value}?folderIds=0"
+        )
+
+        if len(folders_raw) == 0:
+            folders_raw: list = await AsyncApi(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.FOLDERS.value}?limit={limit}"
+            )
+
+        return Api.check_the_api_call_items(folders_raw, "id")
+
+    async def _get_nested_folders(
+        self, parent_uid: str, max_workers: int = None
+    ) -> list:
+        """Retrieve all nested folders for a given parent folder
+
+        Args:
+            parent_uid (str): The uid of the parent folder
+            max_workers (int): Specify the maximum number of concurrent requests per tree level (default None)
+
+        Returns:
+            all_nested (list): All nested folders under the parent, recursively
+        """
+
+        return Folder._flatten_nested_folders(
+            parent_uid,
+            await self._get_nested_folders_by_parent([parent_uid], max_workers),
+        )
+
+    async def _get_nested_folders_by_parent(
+        self, parent_uids: list, max_workers: int = None
+    ) -> dict:
+        """The method includes a functionality to discover all nested folders breadth-first. The children of all folders of a tree level are requested concurrently with a bounded number of requests
+
+        Args:
+            parent_uids (list): Specify the uids of the parent folders of the first tree level
+            max_workers (int): Specify the maximum number of concurrent requests per tree level (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            nested_folders_by_parent (dict): Returns the children folders by the uid of the parent folder
+        """
+
+        nested_folders_by_parent: dict = dict()
+        batch_executor: BatchExecutor = BatchExecutor(
+            self.grafana_api_model, max_workers
+        )
+        level: list = list(dict.fromkeys(parent_uids))
+
+        while len(level) != 0:
+            level = Folder._add_the_nested_folders(
+                nested_folders_by_parent,
+                level,
+                await batch_executor.execute_async(
+                    Folder._create_the_nested_folder_requests(level)
+                ),
+            )
+
+        return nested_folders_by_parent
+
+    async def get_folder_by_uid(self, uid: str) -> dict:
+        """The method includes a functionality to extract all folder information specified by the uid of the folder
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Required Permissions:
+            Action: folders:read
+            Scope: folders:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns a folder
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Folder._create_the_folder_request(uid)
+            ),
+            "id",
+        )
+
+    async def get_folder_by_id(self, id: int) -> dict:
+        """The method includes a functionality to extract all folder information specified by the id of the folder
+
+        Args:
+            id (int): Specify the id of the folder
+
+        Required Permissions:
+            Action: folders:read
+            Scope: folders:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns a folder
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Folder._create_the_folder_id_request(id)
+            ),
+            "id",
+        )
+
+    async def create_folder(
+        self, title: str, uid: str = None, parent_uid: str = None
+    ) -> dict:
+        """The method includes a functionality to create a new folder inside the organization specified by the defined title and the optional uid
+
+        Args:
+            title (str): Specify the title of the folder
+            uid (str): Specify the uid of the folder (default None)
+            parent_uid (str): Specify the parent_uid of the folder (default None)
+
+        Required Permissions:
+            Action: folders:create, folders:write
+            Scope: folders:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns a newly created folder
+        """
+
+        api_call: dict = await AsyncApi(self.grafana_api_model).call_the_api(
+            *Folder._create_the_folder_creation_request(title, uid, parent_uid)
+        )
+        self.grafana_api_model.folder_index.invalidate()
+
+        return Api.check_the_api_call(api_call, "id")
+
+    async def update_folder(
+        self, title: str, uid: str, version: int = 0, overwrite: bool = False
+    ) -> dict:
+        """The method includes a functionality to update a folder information inside the organization specified by the uid, the title, the version of the folder or if folder information be overwritten
+
+        Args:
+            title (str): Specify the title of the folder
+            uid (str): Specify the uid of the folder
+            version (int): Specify the version of the folder (default 0)
+            overwrite (bool): Should the already existing folder information be overwritten (default False)
+
+        Required Permissions:
+            Action: folders:write
+            Scope: folders:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns an updated folder
+        """
+
+        api_call: dict = await AsyncApi(self.grafana_api_model).call_the_api(
+            *Folder._create_the_folder_update_request(title, uid, version, overwrite)
+        )
+        self.grafana_api_model.folder_index.invalidate()
+
+        return Api.check_the_api_call(api_call, "id")
+
+    async def move_folder(self, uid: str, parent_uid: str = None):
+        """The method includes a functionality to move a folder inside the organization specified by the defined uid. This feature is only relevant if nested folders are enabled
+
+        Args:
+            uid (str): Specify the uid of the folder
+            parent_uid (str): Specify the parent_uid of the folder. If the value is None, then the folder is moved under the root (default None)
+
+        Required Permissions:
+            Action: folders:create, folders:write
+            Scope: folders:*, folders:uid:<destination folder UID>
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the moved folder
+        """
+
+        api_call: dict = await AsyncApi(self.grafana_api_model).call_the_api(
+            *Folder._create_the_folder_move_request(uid, parent_uid)
+        )
+        self.grafana_api_model.folder_index.invalidate()
+
+        return Api.check_the_api_call(api_call, "id")
+
+    async def delete_folder(self, uid: str):
+        """The method includes a functionality to delete a folder inside the organization specified by the defined uid
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Required Permissions:
+            Action: folders:delete
+            Scope: folders:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        api_call: any = await AsyncApi(self.grafana_api_model).call_the_api(
+            *Folder._create_the_folder_deletion_request(uid)
+        )
+        self.grafana_api_model.folder_index.invalidate()
+
+        Folder._check_the_folder_deletion(api_call)
+
+    async def get_folder_permissions(self, uid: str) -> list:
+        """The method includes a functionality to extract the folder permissions inside the organization specified by the defined uid
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Required Permissions:
+            Action: folders.permissions:read
+            Scope: folders:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns a list of folder permissions
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Folder._create_the_folder_permissions_request(uid)
+            ),
+            "folderId",
+        )
+
+    async def update_folder_permissions(self, uid: str, permission_json: dict):
+        """The method includes a functionality to update the folder permissions based on the specified uid and the permission json document
+
+        Args:
+            uid (str): Specify the uid of the folder
+            permission_json (dict): Specify the inserted permissions as dict
+
+        Required Permissions:
+            Action: folders.permissions:write
+            Scope: folders:*
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Folder._create_the_folder_permissions_update_request(
+                    uid, permission_json
+                )
+            ),
+            ["Dashboard permissions updated", "Folder permissions updated"],
+            "You successfully modified the folder permissions.",
+        )
+
+    async def get_folder_index(self) -> FolderIndex:
+        """The method includes a functionality to get the folder index of the model. The index is shared by all folder and dashboard lookups of the model and is rebuilt, if it's expired or invalidated by a folder modification
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_index (FolderIndex): Returns the folder index
+        """
+
+        folder_index: FolderIndex = self.grafana_api_model.folder_index
+
+        if not folder_index.is_valid():
+            generation: int = folder_index.generation
+            folders_raw: list = await self._get_top_level_folders()
+            nested_folders_by_parent: dict = await self._get_nested_folders_by_parent(
+                [folder.get("uid") for folder in folders_raw]
+            )
+
+            with folder_index.lock:
+                Folder._update_the_folder_index(
+                    folder_index,
+                    folders_raw,
+                    nested_folders_by_parent,
+                    self.grafana_api_model.folder_index_ttl,
+                    generation,
+                )
+
+        return folder_index
+
+    async def get_folder_id_by_dashboard_path(self, dashboard_path: str) -> int:
+        """The method includes a functionality to extract the folder id specified inside model dashboard path. The folder is looked up by the title or by the full path of a nested folder e.g. Parent/Child inside the folder index of the model
+
+        Args:
+            dashboard_path (str): Specify the dashboard path
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_id (int): Returns the folder id
+        """
+
+        if Folder._is_the_general_folder(dashboard_path):
+            return 0
+
+        return Folder._get_the_folder_id(await self.get_folder_index(), dashboard_path)
+
+    async def get_folder_uid_by_dashboard_path(self, dashboard_path: str) -> str:
+        """The method includes a functionality to extract the folder uid specified inside model dashboard path. The folder is looked up by the title or by the full path of a nested folder e.g. Parent/Child inside the folder index of the model
+
+        Args:
+            dashboard_path (str): Specify the dashboard path
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_uid (str): Returns the folder uid
+        """
+
+        Folder._check_the_dashboard_path(dashboard_path)
+
+        return Folder._get_the_folder_uid(await self.get_folder_index(), dashboard_path)
+
+    async def get_all_folder_ids_uids_and_names(self, limit: int = 1000, nested_folders: bool = True) -> list:
+        """The method extract all folder id, uid and names inside the complete organization. In addition, nested folders are also extracted by default
+
+        Args:
+            limit (int): Specify the limit of folders that should be extracted (default 1000)
+            nested_folders (bool): Specify if nested folders should be extracted (default True)
+
+        Returns:
+            folders (list): Returns a list of dicts with folder ids, uids and the corresponding names
+        """
+
+        return await self.get_folders(limit, nested_folders)
@@ -1,4 +1,3 @@
-import json
 import logging
 import re
 
@@ -163,7 +162,7 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.LEGACY_ALERTS.value}/{id}/pause",
                 RequestsMethods.POST,
-                json.dumps(json_complete),
+                json_complete,
             )
 
             if api_call.get(
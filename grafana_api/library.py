@@ -1,5 +1,5 @@
-import json
 import logging
+from typing import Generator
 
 from .model import APIModel, APIEndpoints, SortDirection, RequestsMethods
 from .api import Api
@@ -72,6 +72,52 @@ class Library:
         else:
             return api_call
 
+    def iter_library_elements(
+        self,
+        results_per_page: int = 100,
+        search_string: str = None,
+        kind: int = 1,
+        sort_direction: SortDirection = SortDirection.DESC,
+        types_filter: str = None,
+        exclude_uid: str = None,
+        folder_filter_ids: str = None,
+        prefetch: bool = False,
+    ) -> Generator[dict, None, None]:
+        """The method includes a functionality to lazily iterate over all library elements the authenticated user has permission to view. The pages are requested on demand
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 100)
+            search_string (str): Specify the search string (default None)
+            kind (int): Specify the kind of element to search for. Use 1 for library panels or 2 for library variables (default 1)
+            sort_direction (SortDirection): Specify the sort order of elements. Use alpha-asc for ascending and alpha-desc for descending sort order (default alpha-desc)
+            types_filter (str): Specify a comma separated list of types to filter the elements by (default None)
+            exclude_uid (str): Specify the element uid to exclude from search results (default None)
+            folder_filter_ids (str): Specify a comma separated list of folder ID(s) to filter the elements by (default None)
+            prefetch (bool): Specify if the next page should be prefetched concurrently while the current page is consumed (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            library_elements (Generator[dict, None, None]): Returns the library elements
+        """
+
+        def _get_page(page: int) -> tuple:
+            api_call: dict = self.get_all_library_elements(
+                results_per_page,
+                page,
+                search_string,
+                kind,
+                sort_direction,
+                types_filter,
+                exclude_uid,
+                folder_filter_ids,
+            ).get("result")
+            return api_call.get("elements"), api_call.get("totalCount")
+
+        return Api.iterate_the_pages(_get_page, results_per_page, prefetch)
+
     def get_library_element_by_uid(self, uid: str) -> dict:
         """The method includes a functionality to get a library element with the given uid
 
@@ -206,7 +252,7 @@ class Library:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.LIBRARY.value,
                 RequestsMethods.POST,
-                json.dumps(request_parameters),
+                request_parameters,
             )
 
             if api_call == dict() or api_call.get("result") is None:
@@ -273,7 +319,7 @@ class Library:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.LIBRARY.value}/{uid}",
                 RequestsMethods.PATCH,
-                json.dumps(request_parameters),
+                request_parameters,
             )
 
             if api_call == dict() or api_call.get("result") is None:
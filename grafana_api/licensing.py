@@ -1,4 +1,3 @@
-import json
 from httpx import Response
 import logging
 
@@ -47,7 +46,7 @@ class Licensing:
             logging.error(f"Check the error: {api_call}.")
             raise Exception
         else:
-            return json.loads(str(api_call.text))
+            return self.grafana_api_model.json_codec.loads(str(api_call.text))
 
     def manually_force_license_refresh(self):
         """The method includes a functionality to manually ask license issuer for a new token
@@ -66,7 +65,7 @@ class Licensing:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.LICENSING.value}/token/renew",
             RequestsMethods.POST,
-            json.dumps({}),
+            {},
         )
 
         if api_call == dict() or api_call.get("jti") is None:
@@ -1,8 +1,26 @@
+import os
 import ssl
+import array
+import json
+import hashlib
+import bisect
+import asyncio
+import time
+import random
+import threading
 import httpx
+from collections import OrderedDict
 from enum import Enum
-from typing import List, TypeVar, Union
+from typing import Callable, List, TypeVar, Union
 from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 Self = TypeVar("Self", bound="Route")
 
@@ -72,6 +90,1360 @@ class SortDirection(Enum):
     DESC = "alpha-desc"
 
 
+def _json_dumps(obj: any) -> bytes:
+    """The function includes a functionality to serialize an object to JSON bytes. The orjson library is used if it's installed, otherwise the standard json library
+
+    Args:
+        obj (any): Specify the object that should be serialized
+
+    Returns:
+        json (bytes): Returns the serialized object
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(value: Union[str, bytes]) -> any:
+    """The function includes a functionality to deserialize JSON bytes or a JSON string. The orjson library is used if it's installed, otherwise the standard json library
+
+    Args:
+        value (Union[str, bytes]): Specify the JSON bytes or string that should be deserialized
+
+    Returns:
+        obj (any): Returns the deserialized object
+    """
+
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+# The variables include the lazily created default SSL context that is shared by all models without a custom SSL context.
+_default_ssl_context: Union[ssl.SSLContext, None] = None
+_default_ssl_context_lock: threading.Lock = threading.Lock()
+
+
+def _get_the_default_ssl_context() -> ssl.SSLContext:
+    """The function includes a functionality to get the default SSL context. The context is created with the first call, so that the CA bundle is only loaded if a request is sent
+
+    Returns:
+        ssl_context (ssl.SSLContext): Returns the default SSL context
+    """
+
+    global _default_ssl_context
+
+    with _default_ssl_context_lock:
+        if _default_ssl_context is None:
+            _default_ssl_context = httpx.create_ssl_context()
+
+        return _default_ssl_context
+
+
+@dataclass
+class JSONCodec:
+    """The class includes the functions that are used to serialize the request payloads and to deserialize the responses of the Grafana API. By default, the orjson library is used if it's installed, otherwise the standard json library. Other libraries e.g. ujson can be injected by the corresponding functions
+
+    Args:
+        dumps (Callable[[any], Union[str, bytes]]): Specify the function to serialize a request payload (default orjson or json dumps)
+        loads (Callable[[Union[str, bytes]], any]): Specify the function to deserialize a response (default orjson or json loads)
+    """
+
+    dumps: Callable[[any], Union[str, bytes]] = _json_dumps
+    loads: Callable[[Union[str, bytes]], any] = _json_loads
+
+
+@dataclass
+class FolderIndex:
+    """The class includes the cached index of all folders inside the organization. The index maps the folder titles, the folder uids and the full folder paths e.g. Parent/Child of nested folders to the corresponding folders. The index expires after the time to live and is invalidated by the folder modifications
+
+    Args:
+        folders (list): Specify all folders inside the organization (default [])
+        by_title (dict): Specify the folders by the folder title (default {})
+        by_uid (dict): Specify the folders by the folder uid (default {})
+        by_path (dict): Specify the folders by the full folder path (default {})
+        expires_at (float): Specify the monotonic time in seconds when the index expires (default 0.0)
+        generation (int): Specify the generation of the index, that is increased by every invalidation (default 0)
+    """
+
+    folders: list = field(default_factory=list)
+    by_title: dict = field(default_factory=dict)
+    by_uid: dict = field(default_factory=dict)
+    by_path: dict = field(default_factory=dict)
+    expires_at: float = 0.0
+    generation: int = 0
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def is_valid(self) -> bool:
+        """The method includes a functionality to check if the index is still valid
+
+        Returns:
+            valid (bool): Returns True if the index is not expired
+        """
+
+        return time.monotonic() < self.expires_at
+
+    def update(
+        self, folders: list, by_path: dict, ttl: float, generation: int = None
+    ):
+        """The method includes a functionality to replace the content of the index. If the index was invalidated after the specified generation was read, the content is stored but the index stays expired, so that a folder modification during a rebuild isn't lost
+
+        Args:
+            folders (list): Specify all folders inside the organization
+            by_path (dict): Specify the folders by the full folder path
+            ttl (float): Specify the time to live of the index in seconds
+            generation (int): Specify the generation of the index before the folders were requested (default None)
+
+        Returns:
+            None
+        """
+
+        self.folders = list(folders)
+        self.by_title = {folder.get("title"): folder for folder in folders}
+        self.by_uid = {folder.get("uid"): folder for folder in folders}
+        self.by_path = dict(by_path)
+        self.expires_at = time.monotonic() + ttl
+
+        if generation is not None and generation != self.generation:
+            self.expires_at = 0.0
+
+    def invalidate(self):
+        """The method includes a functionality to invalidate the index. The index is rebuilt with the next lookup
+
+        Returns:
+            None
+        """
+
+        self.generation += 1
+        self.expires_at = 0.0
+
+    def get_folder(self, dashboard_path: str) -> Union[dict, None]:
+        """The method includes a functionality to look up a folder by the folder title or by the full folder path
+
+        Args:
+            dashboard_path (str): Specify the folder title or the full folder path e.g. Parent/Child
+
+        Returns:
+            folder (Union[dict, None]): Returns the folder or None if there is no corresponding folder
+        """
+
+        return self.by_title.get(dashboard_path, self.by_path.get(dashboard_path))
+
+
+@dataclass
+class DatasourceRegistry:
+    """The class includes the cached registry of all datasources inside the organization. The registry maps the datasource names, uids and ids to the corresponding datasources and groups the datasources by the type. The registry expires after the time to live and is updated in place by the datasource modifications
+
+    Args:
+        by_name (dict): Specify the datasources by the datasource name (default {})
+        by_uid (dict): Specify the datasources by the datasource uid (default {})
+        by_id (dict): Specify the datasources by the datasource id (default {})
+        by_type (dict): Specify the datasources by the datasource id grouped by the datasource type (default {})
+        expires_at (float): Specify the monotonic time in seconds when the registry expires (default 0.0)
+    """
+
+    by_name: dict = field(default_factory=dict)
+    by_uid: dict = field(default_factory=dict)
+    by_id: dict = field(default_factory=dict)
+    by_type: dict = field(default_factory=dict)
+    expires_at: float = 0.0
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def datasources(self) -> list:
+        """The property includes a functionality to get all datasources of the registry
+
+        Returns:
+            datasources (list): Returns all datasources
+        """
+
+        return list(self.by_id.values())
+
+    def is_valid(self) -> bool:
+        """The method includes a functionality to check if the registry is still valid
+
+        Returns:
+            valid (bool): Returns True if the registry is not expired
+        """
+
+        return time.monotonic() < self.expires_at
+
+    def update(self, datasources: list, ttl: float):
+        """The method includes a functionality to replace the content of the registry
+
+        Args:
+            datasources (list): Specify all datasources inside the organization
+            ttl (float): Specify the time to live of the registry in seconds
+
+        Returns:
+            None
+        """
+
+        self.by_name = dict()
+        self.by_uid = dict()
+        self.by_id = dict()
+        self.by_type = dict()
+
+        for datasource in datasources:
+            self.put(datasource)
+
+        self.expires_at = time.monotonic() + ttl
+
+    def invalidate(self):
+        """The method includes a functionality to invalidate the registry. The registry is rebuilt with the next lookup
+
+        Returns:
+            None
+        """
+
+        self.expires_at = 0.0
+
+    def put(self, datasource: dict):
+        """The method includes a functionality to add a datasource to the registry or to replace the registered datasource with the same id or uid
+
+        Args:
+            datasource (dict): Specify the datasource
+
+        Returns:
+            None
+        """
+
+        existing_datasource: Union[dict, None] = self.by_id.get(
+            datasource.get("id")
+        ) or self.by_uid.get(datasource.get("uid"))
+
+        if existing_datasource is not None:
+            self.remove(existing_datasource)
+
+        self.by_name[datasource.get("name")] = datasource
+        self.by_uid[datasource.get("uid")] = datasource
+        self.by_id[datasource.get("id")] = datasource
+        self.by_type.setdefault(datasource.get("type"), dict())[
+            datasource.get("id")
+        ] = datasource
+
+    def remove(self, datasource: Union[dict, None]):
+        """The method includes a functionality to remove a datasource from the registry
+
+        Args:
+            datasource (Union[dict, None]): Specify the registered datasource. None is ignored
+
+        Returns:
+            None
+        """
+
+        if datasource is None:
+            return
+
+        self.by_name.pop(datasource.get("name"), None)
+        self.by_uid.pop(datasource.get("uid"), None)
+        self.by_id.pop(datasource.get("id"), None)
+
+        datasources_by_id: dict = self.by_type.get(datasource.get("type"), dict())
+        datasources_by_id.pop(datasource.get("id"), None)
+        if len(datasources_by_id) == 0:
+            self.by_type.pop(datasource.get("type"), None)
+
+    def get_datasources_by_type(self, datasource_type: str) -> list:
+        """The method includes a functionality to get all datasources of a datasource type
+
+        Args:
+            datasource_type (str): Specify the type of the datasources e.g. prometheus
+
+        Returns:
+            datasources (list): Returns the datasources of the type
+        """
+
+        return list(self.by_type.get(datasource_type, dict()).values())
+
+
+@dataclass
+class CachedResponse:
+    """The class includes all necessary variables to describe a cached response of a GET request
+
+    Args:
+        response (httpx.Response): Specify the cached response
+        expires_at (float): Specify the monotonic time in seconds when the cached response expires
+    """
+
+    response: httpx.Response
+    expires_at: float
+
+    def is_fresh(self) -> bool:
+        """The method includes a functionality to check if the cached response is not expired
+
+        Returns:
+            fresh (bool): Returns True if the cached response is not expired
+        """
+
+        return time.monotonic() < self.expires_at
+
+    def get_the_conditional_headers(self) -> dict:
+        """The method includes a functionality to create the conditional request headers based on the ETag and the Last-Modified header of the cached response
+
+        Returns:
+            headers (dict): Returns the If-None-Match and the If-Modified-Since headers
+        """
+
+        headers: dict = dict()
+
+        if self.response.headers.get("ETag") is not None:
+            headers["If-None-Match"] = self.response.headers.get("ETag")
+        if self.response.headers.get("Last-Modified") is not None:
+            headers["If-Modified-Since"] = self.response.headers.get("Last-Modified")
+
+        return headers
+
+
+@dataclass
+class ResponseCache:
+    """The class includes an in-memory LRU cache for the responses of GET requests. Expired responses that include an ETag or a Last-Modified header are revalidated by a conditional request, all other expired responses are requested again. Every modifying request of the model clears the cache
+
+    Args:
+        ttl (float): Specify the time to live of a cached response in seconds (default 30.0)
+        max_entries (int): Specify the maximum number of cached responses. The least recently used response is evicted first (default 1024)
+    """
+
+    ttl: float = 30.0
+    max_entries: int = 1024
+    entries: OrderedDict = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @staticmethod
+    def create_the_key(api_url: str, headers: dict) -> tuple:
+        """The method includes a functionality to create the cache key of a request. The key includes all request headers sorted by the case-insensitive header name, so requests with different headers e.g. a different Accept or user header don't share a cached response
+
+        Args:
+            api_url (str): Specify the url of the request
+            headers (dict): Specify the headers of the request
+
+        Returns:
+            key (tuple): Returns the cache key of the request
+        """
+
+        return api_url, tuple(
+            sorted((str(name).lower(), str(value)) for name, value in headers.items())
+        )
+
+    def get(self, key: tuple) -> Union[CachedResponse, None]:
+        """The method includes a functionality to get a cached response. Expired responses without a validator are removed
+
+        Args:
+            key (tuple): Specify the cache key of the request
+
+        Returns:
+            cached_response (Union[CachedResponse, None]): Returns the cached response or None
+        """
+
+        with self.lock:
+            cached_response: Union[CachedResponse, None] = self.entries.get(key)
+
+            if cached_response is None:
+                return None
+
+            if (
+                not cached_response.is_fresh()
+                and len(cached_response.get_the_conditional_headers()) == 0
+            ):
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return cached_response
+
+    def put(self, key: tuple, response: httpx.Response):
+        """The method includes a functionality to cache a response and to evict the least recently used responses
+
+        Args:
+            key (tuple): Specify the cache key of the request
+            response (httpx.Response): Specify the response
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.entries[key] = CachedResponse(response, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > max(self.max_entries, 0):
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """The method includes a functionality to remove all cached responses
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.entries.clear()
+
+
+@dataclass
+class QueryResultCache:
+    """The class includes an LRU cache for the results of the datasource queries. The results are cached as JSON and keyed by the datasource uids, the normalized queries and the time range, that is aligned to the chunk size or the query interval. Only the results of time ranges, that end before the settle time, are cached, so the recent tail of a time range is always requested again. Optionally, the results are persisted inside a directory and are reused across processes
+
+    Args:
+        max_entries (int): Specify the maximum number of cached results. The least recently used result is evicted first (default 1024)
+        path (str): Specify the optional directory to persist the cached results. Otherwise, the results are only cached in memory (default None)
+        settle_time_ms (int): Specify the time in milliseconds after that the data of a time range is considered final and can be cached (default 60000)
+    """
+
+    max_entries: int = 1024
+    path: str = None
+    settle_time_ms: int = 60000
+    entries: OrderedDict = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+
+            with os.scandir(self.path) as directory_entries:
+                files: list = sorted(
+                    (
+                        directory_entry
+                        for directory_entry in directory_entries
+                        if directory_entry.is_file()
+                        and directory_entry.name.endswith(".json")
+                    ),
+                    key=lambda directory_entry: directory_entry.stat().st_mtime,
+                )
+
+            for file in files:
+                self.entries[file.name[: -len(".json")]] = None
+
+            with self.lock:
+                self._evict_the_entries()
+
+    @staticmethod
+    def create_the_key(payload: dict) -> str:
+        """The method includes a functionality to create the cache key of a query request. The key is independent of the order of the keys inside the queries
+
+        Args:
+            payload (dict): Specify the JSON payload of the query request including the time range and the queries
+
+        Returns:
+            key (str): Returns the cache key of the query request
+        """
+
+        return hashlib.sha256(
+            json.dumps(
+                payload, sort_keys=True, separators=(",", ":"), default=str
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def is_settled(self, to: int) -> bool:
+        """The method includes a functionality to check if the data of a time range is considered final and can be cached
+
+        Args:
+            to (int): Specify the end of the time range as epoch timestamp in milliseconds
+
+        Returns:
+            settled (bool): Returns True if the time range ends before the settle time
+        """
+
+        return to <= time.time() * 1000 - self.settle_time_ms
+
+    def get(self, key: str) -> Union[bytes, None]:
+        """The method includes a functionality to get a cached result
+
+        Args:
+            key (str): Specify the cache key of the query request
+
+        Returns:
+            content (Union[bytes, None]): Returns the cached result as JSON or None
+        """
+
+        with self.lock:
+            if key not in self.entries:
+                return None
+
+            content: Union[bytes, None] = self.entries.get(key)
+
+            if content is None:
+                try:
+                    with open(self._get_the_file_path(key), "rb") as file:
+                        content = file.read()
+                    os.utime(self._get_the_file_path(key))
+                except OSError:
+                    del self.entries[key]
+                    return None
+
+            self.entries.move_to_end(key)
+            return content
+
+    def put(self, key: str, content: bytes):
+        """The method includes a functionality to cache a result and to evict the least recently used results
+
+        Args:
+            key (str): Specify the cache key of the query request
+            content (bytes): Specify the result as JSON
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            if self.path is not None:
+                temporary_file_path: str = f"{self._get_the_file_path(key)}.tmp"
+                with open(temporary_file_path, "wb") as file:
+                    file.write(content)
+                os.replace(temporary_file_path, self._get_the_file_path(key))
+
+            self.entries[key] = content if self.path is None else None
+            self.entries.move_to_end(key)
+            self._evict_the_entries()
+
+    def clear(self):
+        """The method includes a functionality to remove all cached results including the persisted results
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            while len(self.entries) != 0:
+                self._remove_the_entry(self.entries.popitem(last=False)[0])
+
+    def _evict_the_entries(self):
+        """The method includes a functionality to evict the least recently used results, if the cache exceeds the maximum number of results
+
+        Returns:
+            None
+        """
+
+        while len(self.entries) > max(self.max_entries, 0):
+            self._remove_the_entry(self.entries.popitem(last=False)[0])
+
+    def _remove_the_entry(self, key: str):
+        """The method includes a functionality to remove the persisted result of an evicted key
+
+        Args:
+            key (str): Specify the cache key of the query request
+
+        Returns:
+            None
+        """
+
+        if self.path is not None:
+            try:
+                os.remove(self._get_the_file_path(key))
+            except FileNotFoundError:
+                pass
+
+    def _get_the_file_path(self, key: str) -> str:
+        """The method includes a functionality to get the path of the persisted result
+
+        Args:
+            key (str): Specify the cache key of the query request
+
+        Returns:
+            path (str): Returns the path of the persisted result
+        """
+
+        return os.path.join(self.path, f"{key}.json")
+
+
+@dataclass
+class RetryPolicy:
+    """The class includes all necessary variables to retry failed requests with an exponential backoff and jitter. Requests are retried if the response status code is retryable or if a transport error occurs. Only idempotent methods are retried, except for rate limited requests (429), because they are not processed by Grafana
+
+    Args:
+        max_retries (int): Specify the maximum number of retries of a request (default 3)
+        backoff_factor (float): Specify the base delay in seconds that is doubled with every retry (default 0.5)
+        max_backoff (float): Specify the maximum delay between two retries in seconds (default 30.0)
+        jitter (bool): Specify if the delay should be randomized between zero and the exponential backoff (default True)
+        status_codes (tuple): Specify the retryable response status codes (default (429, 502, 503, 504))
+        methods (tuple): Specify the methods that are retried independent of the status code (default ("GET", "PUT", "DELETE"))
+        respect_retry_after (bool): Specify if the delay of the Retry-After header should be respected (default True)
+        max_retry_after (float): Specify the maximum respected delay of the Retry-After header in seconds (default 120.0)
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    status_codes: tuple = (429, 502, 503, 504)
+    methods: tuple = ("GET", "PUT", "DELETE")
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+
+    def is_retryable(
+        self,
+        method: str,
+        status_code: int = None,
+        error: Exception = None,
+    ) -> bool:
+        """The method includes a functionality to check if a request should be retried
+
+        Args:
+            method (str): Specify the method of the request
+            status_code (int): Specify the status code of the response (default None)
+            error (Exception): Specify the error of the request (default None)
+
+        Returns:
+            retryable (bool): Returns True if the request should be retried
+        """
+
+        if error is not None:
+            return isinstance(error, httpx.TransportError) and method in self.methods
+
+        if status_code not in self.status_codes:
+            return False
+
+        return status_code == 429 or method in self.methods
+
+    def get_the_backoff(self, attempt: int, response: httpx.Response = None) -> float:
+        """The method includes a functionality to calculate the delay before the next retry
+
+        Args:
+            attempt (int): Specify the number of the already executed retries
+            response (httpx.Response): Specify the optional response that includes the Retry-After header (default None)
+
+        Returns:
+            backoff (float): Returns the delay in seconds
+        """
+
+        if self.respect_retry_after and response is not None:
+            retry_after: Union[float, None] = RetryPolicy._parse_the_retry_after(
+                response.headers.get("Retry-After")
+            )
+
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        backoff: float = min(self.max_backoff, self.backoff_factor * (2**attempt))
+
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    @staticmethod
+    def _parse_the_retry_after(retry_after: str = None) -> Union[float, None]:
+        """The method includes a functionality to parse the Retry-After header that includes either the delay in seconds or an HTTP date
+
+        Args:
+            retry_after (str): Specify the value of the Retry-After header (default None)
+
+        Returns:
+            retry_after (Union[float, None]): Returns the delay in seconds or None
+        """
+
+        if retry_after is None:
+            return None
+
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            return max(
+                (
+                    parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)
+                ).total_seconds(),
+                0.0,
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+@dataclass
+class TokenBucket:
+    """The class includes a thread-safe token bucket. A request reserves a token and receives the delay until the token is available, so that the waiting itself happens outside the lock in threads and in the event loop
+
+    Args:
+        requests_per_second (float): Specify the number of tokens that are refilled per second
+        burst (int): Specify the maximum number of tokens (default 1)
+
+    Raises:
+        ValueError: Missed specifying a valid requests_per_second value
+    """
+
+    requests_per_second: float
+    burst: int = 1
+    tokens: float = field(default=None, init=False, repr=False, compare=False)
+    updated_at: float = field(
+        default_factory=time.monotonic, init=False, repr=False, compare=False
+    )
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.requests_per_second is None or self.requests_per_second <= 0:
+            raise ValueError
+
+        self.burst = max(int(self.burst), 1)
+        self.tokens = float(self.burst)
+
+    def reserve(self) -> float:
+        """The method includes a functionality to reserve a token
+
+        Returns:
+            delay (float): Returns the delay in seconds until the reserved token is available
+        """
+
+        with self.lock:
+            now: float = time.monotonic()
+            self.tokens = min(
+                float(self.burst),
+                self.tokens + (now - self.updated_at) * self.requests_per_second,
+            )
+            self.updated_at = now
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.requests_per_second
+
+
+@dataclass
+class RateLimiter:
+    """The class includes a client-side rate limiter that is respected by all requests of the model in synchronous, asynchronous and threaded mode. Every request consumes a token of the global bucket and additionally a token of the bucket of the longest matching endpoint prefix
+
+    Args:
+        requests_per_second (float): Specify the number of requests per second of all requests
+        burst (int): Specify the number of requests that can be sent at once (default 1)
+        endpoint_limits (dict): Specify optional limits by the endpoint prefix e.g. {APIEndpoints.SEARCH: (5, 1)} as tuples of the requests per second and the burst (default {})
+    """
+
+    requests_per_second: float
+    burst: int = 1
+    endpoint_limits: dict = field(default_factory=dict)
+    buckets: dict = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.buckets = dict({None: TokenBucket(self.requests_per_second, self.burst)})
+
+        for endpoint, (requests_per_second, burst) in self.endpoint_limits.items():
+            prefix: str = (
+                endpoint.value if isinstance(endpoint, APIEndpoints) else str(endpoint)
+            )
+            self.buckets[prefix] = TokenBucket(requests_per_second, burst)
+
+    def reserve(self, api_url: str) -> float:
+        """The method includes a functionality to reserve the tokens of a request
+
+        Args:
+            api_url (str): Specify the url or the path of the request
+
+        Returns:
+            delay (float): Returns the delay in seconds until the request can be sent
+        """
+
+        path: str = urlsplit(api_url).path
+        matching_prefixes: list = [
+            prefix
+            for prefix in self.buckets.keys()
+            if prefix is not None
+            and (path == prefix or path.startswith(f"{prefix.rstrip('/')}/"))
+        ]
+
+        delay: float = self.buckets.get(None).reserve()
+        if len(matching_prefixes) != 0:
+            delay = max(
+                delay, self.buckets.get(max(matching_prefixes, key=len)).reserve()
+            )
+
+        return delay
+
+    def acquire(self, api_url: str):
+        """The method includes a functionality to wait until a request can be sent
+
+        Args:
+            api_url (str): Specify the url or the path of the request
+
+        Returns:
+            None
+        """
+
+        delay: float = self.reserve(api_url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, api_url: str):
+        """The method includes a functionality to wait asynchronously until a request can be sent
+
+        Args:
+            api_url (str): Specify the url or the path of the request
+
+        Returns:
+            None
+        """
+
+        delay: float = self.reserve(api_url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class CircuitState(Enum):
+    """The class includes all possible states of the circuit breaker"""
+
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half_open"
+
+
+class CircuitBreakerOpenError(Exception):
+    """The class includes the error that is raised, if a request is rejected by an open circuit breaker"""
+
+
+@dataclass
+class CircuitBreaker:
+    """The class includes a thread-safe circuit breaker for all requests of the model. The circuit opens after the specified number of consecutive failed requests and rejects all requests immediately. After the recovery timeout, a limited number of half-open probe requests are sent. A successful probe closes the circuit and a failed probe opens it again. Transport errors and the failure status codes count as failures
+
+    Args:
+        failure_threshold (int): Specify the number of consecutive failed requests that open the circuit (default 5)
+        recovery_timeout (float): Specify the time in seconds until an open circuit allows the half-open probe requests (default 30.0)
+        half_open_max_calls (int): Specify the maximum number of concurrent half-open probe requests (default 1)
+        failure_status_codes (tuple): Specify the response status codes that count as failures (default (500, 502, 503, 504))
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    failure_status_codes: tuple = (500, 502, 503, 504)
+    state: CircuitState = field(default=CircuitState.CLOSED, init=False, compare=False)
+    consecutive_failures: int = field(default=0, init=False, compare=False)
+    opened_at: float = field(default=None, init=False, compare=False)
+    half_open_calls: int = field(default=0, init=False, repr=False, compare=False)
+    rejected_requests: int = field(default=0, init=False, compare=False)
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def get_the_state(self) -> CircuitState:
+        """The method includes a functionality to get the current state of the circuit
+
+        Returns:
+            state (CircuitState): Returns the current state of the circuit
+        """
+
+        with self.lock:
+            self._update_the_state()
+            return self.state
+
+    def get_the_statistics(self) -> dict:
+        """The method includes a functionality to get the statistics of the circuit breaker for monitoring purposes
+
+        Returns:
+            statistics (dict): Returns the state, the consecutive failures, the rejected requests and the seconds since the circuit opened
+        """
+
+        with self.lock:
+            self._update_the_state()
+            return dict(
+                {
+                    "state": self.state.value,
+                    "consecutive_failures": self.consecutive_failures,
+                    "rejected_requests": self.rejected_requests,
+                    "open_since_seconds": (
+                        None
+                        if self.opened_at is None
+                        else time.monotonic() - self.opened_at
+                    ),
+                }
+            )
+
+    def before_request(self):
+        """The method includes a functionality to check if a request is allowed by the circuit
+
+        Raises:
+            CircuitBreakerOpenError: The request is rejected by the open circuit
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self._update_the_state()
+
+            if self.state == CircuitState.CLOSED:
+                return
+
+            if (
+                self.state == CircuitState.HALF_OPEN
+                and self.half_open_calls < self.half_open_max_calls
+            ):
+                self.half_open_calls += 1
+                return
+
+            self.rejected_requests += 1
+            state: CircuitState = self.state
+
+        raise CircuitBreakerOpenError(
+            f"The circuit is {state.value}. The request is rejected."
+        )
+
+    def record_response(self, status_code: int):
+        """The method includes a functionality to record the response of a request
+
+        Args:
+            status_code (int): Specify the status code of the response
+
+        Returns:
+            None
+        """
+
+        if status_code in self.failure_status_codes:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self):
+        """The method includes a functionality to record a successful request and to close the circuit
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.state = CircuitState.CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self.half_open_calls = 0
+
+    def record_failure(self):
+        """The method includes a functionality to record a failed request and to open the circuit, if the failure threshold is reached or a half-open probe failed
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.consecutive_failures += 1
+
+            if (
+                self.state == CircuitState.HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+                self.half_open_calls = 0
+
+    def _update_the_state(self):
+        """The method includes a functionality to switch an open circuit to half-open after the recovery timeout. The lock must be held by the caller
+
+        Returns:
+            None
+        """
+
+        if (
+            self.state == CircuitState.OPEN
+            and time.monotonic() - self.opened_at >= self.recovery_timeout
+        ):
+            self.state = CircuitState.HALF_OPEN
+            self.half_open_calls = 0
+
+
+@dataclass
+class RequestEvent:
+    """The class includes all necessary variables to describe a single HTTP request attempt for the request hooks
+
+    Args:
+        method (str): Specify the used method
+        api_url (str): Specify the used api url
+        attempt (int): Specify the number of the already executed retries of the request (default 0)
+        request_bytes (int): Specify the size of the request content in bytes (default 0)
+        started_at (float): Specify the monotonic start time of the attempt (default time.monotonic())
+        status_code (int): Specify the status code of the response (default None)
+        response_bytes (int): Specify the size of the response content in bytes (default 0)
+        duration (float): Specify the duration of the attempt in seconds (default None)
+        error (Exception): Specify the error of the attempt (default None)
+    """
+
+    method: str
+    api_url: str
+    attempt: int = 0
+    request_bytes: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    status_code: int = None
+    response_bytes: int = 0
+    duration: float = None
+    error: Exception = None
+
+
+class RequestHook:
+    """The class includes the interface of the request hooks of the model. The hooks are called synchronously for every HTTP request attempt, including the retries, of synchronous and asynchronous API calls. Responses that are served by the response cache and requests that are rejected by the circuit breaker do not reach the network and are not reported. Please override the corresponding methods to implement a custom hook"""
+
+    def before_request(self, event: RequestEvent):
+        """The method includes a functionality that is called before the request is sent
+
+        Args:
+            event (RequestEvent): Specify the event of the request
+
+        Returns:
+            None
+        """
+
+    def after_response(self, event: RequestEvent, response: httpx.Response):
+        """The method includes a functionality that is called after the response is received
+
+        Args:
+            event (RequestEvent): Specify the event of the request
+            response (httpx.Response): Specify the received response
+
+        Returns:
+            None
+        """
+
+    def on_error(self, event: RequestEvent, error: Exception):
+        """The method includes a functionality that is called, if the request failed with an error
+
+        Args:
+            event (RequestEvent): Specify the event of the request
+            error (Exception): Specify the error of the request
+
+        Returns:
+            None
+        """
+
+
+# The constant includes the default upper bounds of the latency histogram buckets in seconds.
+DEFAULT_LATENCY_BUCKETS: tuple = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# The constant includes the path segments that are followed by a request parameter e.g. /api/dashboards/uid/<uid>.
+PARAMETER_PATH_SEGMENTS: tuple = ("uid", "name", "login", "email", "id", "tag", "key")
+
+
+@dataclass
+class EndpointMetrics:
+    """The class includes all collected metrics of an endpoint
+
+    Args:
+        buckets (tuple): Specify the upper bounds of the latency histogram buckets in seconds
+        requests (int): Specify the number of the request attempts (default 0)
+        errors (int): Specify the number of the request attempts that failed with an error (default 0)
+        retries (int): Specify the number of the retried request attempts (default 0)
+        request_bytes (int): Specify the number of the sent content bytes (default 0)
+        response_bytes (int): Specify the number of the received content bytes (default 0)
+        status_codes (dict): Specify the number of the responses by the status code (default {})
+        latency_counts (list): Specify the number of the request attempts by the latency histogram bucket. The last entry counts the attempts above the last bucket (default [0, ...])
+        latency_sum (float): Specify the sum of the latencies in seconds (default 0.0)
+    """
+
+    buckets: tuple
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    status_codes: dict = field(default_factory=dict)
+    latency_counts: list = None
+    latency_sum: float = 0.0
+
+    def __post_init__(self):
+        if self.latency_counts is None:
+            self.latency_counts = [0] * (len(self.buckets) + 1)
+
+    def record(self, event: RequestEvent):
+        """The method includes a functionality to record a finished request attempt
+
+        Args:
+            event (RequestEvent): Specify the event of the finished request attempt
+
+        Returns:
+            None
+        """
+
+        self.requests += 1
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes
+
+        if event.attempt > 0:
+            self.retries += 1
+
+        if event.error is not None:
+            self.errors += 1
+        elif event.status_code is not None:
+            self.status_codes[event.status_code] = (
+                self.status_codes.get(event.status_code, 0) + 1
+            )
+
+        if event.duration is not None:
+            self.latency_sum += event.duration
+            self.latency_counts[bisect.bisect_left(self.buckets, event.duration)] += 1
+
+    def get_the_cumulative_latency_counts(self) -> dict:
+        """The method includes a functionality to get the cumulative latency histogram
+
+        Returns:
+            latency_counts (dict): Returns the number of the request attempts less than or equal to the upper bound of every bucket. The key +Inf includes all attempts
+        """
+
+        cumulative_latency_counts: dict = dict()
+        count: int = 0
+
+        for bucket, latency_count in zip(
+            list(self.buckets) + ["+Inf"], self.latency_counts
+        ):
+            count += latency_count
+            cumulative_latency_counts[bucket] = count
+
+        return cumulative_latency_counts
+
+
+@dataclass
+class MetricsCollector(RequestHook):
+    """The class includes a thread-safe request hook that collects the latency histogram, the status codes, the sent and received bytes and the retries of every endpoint. Endpoints are identified by the method and the path of the request. Numeric path segments, segments with digits and segments that follow one of the PARAMETER_PATH_SEGMENTS are replaced by placeholders, so that e.g. all dashboard uids share one endpoint. The metrics can be exported as dictionary or in the Prometheus text format
+
+    Args:
+        buckets (tuple): Specify the upper bounds of the latency histogram buckets in seconds (default DEFAULT_LATENCY_BUCKETS)
+        endpoint_resolver (Callable[[str], str]): Specify an optional function that maps the api url of a request to the endpoint (default None)
+    """
+
+    buckets: tuple = DEFAULT_LATENCY_BUCKETS
+    endpoint_resolver: Callable[[str], str] = None
+    endpoints: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.buckets = tuple(sorted(self.buckets))
+
+    def after_response(self, event: RequestEvent, response: httpx.Response):
+        """The method includes a functionality to record the response of a request attempt
+
+        Args:
+            event (RequestEvent): Specify the event of the request
+            response (httpx.Response): Specify the received response
+
+        Returns:
+            None
+        """
+
+        self._record(event)
+
+    def on_error(self, event: RequestEvent, error: Exception):
+        """The method includes a functionality to record the error of a request attempt
+
+        Args:
+            event (RequestEvent): Specify the event of the request
+            error (Exception): Specify the error of the request
+
+        Returns:
+            None
+        """
+
+        self._record(event)
+
+    def get_the_endpoint(self, api_url: str) -> str:
+        """The method includes a functionality to get the endpoint of an api url
+
+        Args:
+            api_url (str): Specify the api url of the request
+
+        Returns:
+            endpoint (str): Returns the endpoint
+        """
+
+        if self.endpoint_resolver is not None:
+            return self.endpoint_resolver(api_url)
+
+        segments: list = urlsplit(api_url).path.split("/")
+        endpoint_segments: list = list()
+
+        for index, segment in enumerate(segments):
+            if segment.isdigit():
+                endpoint_segments.append("{id}")
+            elif index > 2 and (
+                segments[index - 1] in PARAMETER_PATH_SEGMENTS
+                or any(character.isdigit() for character in segment)
+            ):
+                endpoint_segments.append("{param}")
+            else:
+                endpoint_segments.append(segment)
+
+        return "/".join(endpoint_segments)
+
+    def get_the_metrics(self) -> dict:
+        """The method includes a functionality to get the collected metrics as dictionary
+
+        Returns:
+            metrics (dict): Returns the metrics by the method and the endpoint e.g. {"GET /api/folders": {...}}
+        """
+
+        with self.lock:
+            return dict(
+                {
+                    f"{method} {endpoint}": dict(
+                        {
+                            "method": method,
+                            "endpoint": endpoint,
+                            "requests": endpoint_metrics.requests,
+                            "errors": endpoint_metrics.errors,
+                            "retries": endpoint_metrics.retries,
+                            "request_bytes": endpoint_metrics.request_bytes,
+                            "response_bytes": endpoint_metrics.response_bytes,
+                            "status_codes": dict(endpoint_metrics.status_codes),
+                            "latency": dict(
+                                {
+                                    "count": endpoint_metrics.requests,
+                                    "sum": endpoint_metrics.latency_sum,
+                                    "buckets": endpoint_metrics.get_the_cumulative_latency_counts(),
+                                }
+                            ),
+                        }
+                    )
+                    for (method, endpoint), endpoint_metrics in self.endpoints.items()
+                }
+            )
+
+    def get_the_prometheus_metrics(self, prefix: str = "grafana_api") -> str:
+        """The method includes a functionality to get the collected metrics in the Prometheus text exposition format
+
+        Args:
+            prefix (str): Specify the prefix of the metric names (default grafana_api)
+
+        Returns:
+            metrics (str): Returns the metrics in the Prometheus text exposition format
+        """
+
+        metrics: dict = self.get_the_metrics()
+        lines: list = list()
+
+        lines.append(
+            f"# HELP {prefix}_request_duration_seconds The latency of the requests in seconds"
+        )
+        lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+        for endpoint_metrics in metrics.values():
+            labels: str = MetricsCollector._create_the_prometheus_labels(
+                endpoint_metrics
+            )
+            for bucket, count in endpoint_metrics["latency"]["buckets"].items():
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bucket}"}} {count}'
+                )
+            lines.append(
+                f"{prefix}_request_duration_seconds_sum{{{labels}}} {endpoint_metrics['latency']['sum']}"
+            )
+            lines.append(
+                f"{prefix}_request_duration_seconds_count{{{labels}}} {endpoint_metrics['latency']['count']}"
+            )
+
+        lines.append(f"# HELP {prefix}_responses_total The number of the responses")
+        lines.append(f"# TYPE {prefix}_responses_total counter")
+        for endpoint_metrics in metrics.values():
+            labels: str = MetricsCollector._create_the_prometheus_labels(
+                endpoint_metrics
+            )
+            for status_code, count in sorted(endpoint_metrics["status_codes"].items()):
+                lines.append(
+                    f'{prefix}_responses_total{{{labels},status_code="{status_code}"}} {count}'
+                )
+
+        for name, key, description in (
+            ("request_errors_total", "errors", "The number of the failed requests"),
+            ("request_retries_total", "retries", "The number of the retried requests"),
+            ("request_bytes_total", "request_bytes", "The number of the sent bytes"),
+            (
+                "response_bytes_total",
+                "response_bytes",
+                "The number of the received bytes",
+            ),
+        ):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for endpoint_metrics in metrics.values():
+                labels: str = MetricsCollector._create_the_prometheus_labels(
+                    endpoint_metrics
+                )
+                lines.append(f"{prefix}_{name}{{{labels}}} {endpoint_metrics[key]}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """The method includes a functionality to reset all collected metrics
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.endpoints.clear()
+
+    def _record(self, event: RequestEvent):
+        """The method includes a functionality to record a finished request attempt
+
+        Args:
+            event (RequestEvent): Specify the event of the finished request attempt
+
+        Returns:
+            None
+        """
+
+        key: tuple = (event.method, self.get_the_endpoint(event.api_url))
+
+        with self.lock:
+            endpoint_metrics: EndpointMetrics = self.endpoints.get(key)
+
+            if endpoint_metrics is None:
+                endpoint_metrics = EndpointMetrics(self.buckets)
+                self.endpoints[key] = endpoint_metrics
+
+            endpoint_metrics.record(event)
+
+    @staticmethod
+    def _create_the_prometheus_labels(endpoint_metrics: dict) -> str:
+        """The method includes a functionality to create the Prometheus labels of an endpoint
+
+        Args:
+            endpoint_metrics (dict): Specify the metrics of the endpoint
+
+        Returns:
+            labels (str): Returns the escaped labels
+        """
+
+        return ",".join(
+            f'{label}="{MetricsCollector._escape_the_prometheus_label_value(endpoint_metrics[label])}"'
+            for label in ("method", "endpoint")
+        )
+
+    @staticmethod
+    def _escape_the_prometheus_label_value(value: str) -> str:
+        """The method includes a functionality to escape a Prometheus label value
+
+        Args:
+            value (str): Specify the label value
+
+        Returns:
+            value (str): Returns the escaped label value
+        """
+
+        return (
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+
+
 @dataclass
 class APIModel:
     """The class includes all necessary variables to establish a connection to the Grafana API endpoints
@@ -83,11 +1455,25 @@ class APIModel:
         password (str): Specify the password of the Grafana system
         timeout (float): Specify the timeout of the Grafana system
         headers (dict): Specify the headers of the Grafana system
-        http2_support (bool): Specify if you want to use HTTP/2
-        ssl_context (ssl.SSLContext): Specify the custom ssl context of the Grafana system
+        http2_support (bool): Specify if you want to use HTTP/2. In the HTTP/2 mode, all concurrent requests of the model are multiplexed over the long-lived connections specified by http2_max_connections
+        ssl_context (ssl.SSLContext): Specify the custom ssl context of the Grafana system. By default, a shared default ssl context is created with the first request (default None)
         num_pools (int): Specify the number of the connection pool
         retries (any): Specify the number of the retries. Please use False as parameter to disable the retries
         follow_redirects (bool): Specify if redirections should be followed (default True)
+        keepalive_expiry (float): Specify the time in seconds that an idle connection is kept alive (default 5.0)
+        http2_max_connections (int): Specify the number of the multiplexed connections in the HTTP/2 mode (default 1)
+        http2_max_concurrent_streams (int): Specify the maximum number of concurrent requests per multiplexed connection in the HTTP/2 mode. The lower limit of the Grafana server is respected additionally (default 100)
+        json_codec (JSONCodec): Specify the JSON codec that is used to serialize the request payloads and to deserialize the responses (default JSONCodec())
+        folder_index_ttl (float): Specify the time to live of the folder index in seconds. Please use 0 to disable the caching of the folder index (default 60.0)
+        datasource_registry_ttl (float): Specify the time to live of the datasource registry in seconds. Please use 0 to disable the caching of the datasource registry (default 60.0)
+        response_cache (ResponseCache): Specify the optional cache for the responses of GET requests (default None)
+        query_result_cache (QueryResultCache): Specify the optional cache for the results of the datasource queries (default None)
+        retry_policy (RetryPolicy): Specify the optional policy to retry requests with a retryable response status code or a transport error (default None)
+        rate_limiter (RateLimiter): Specify the optional client-side rate limiter of all requests (default None)
+        circuit_breaker (CircuitBreaker): Specify the optional circuit breaker of all requests (default None)
+        request_hooks (list): Specify the optional request hooks e.g. a MetricsCollector that are called for every HTTP request attempt of the model (default [])
+
+    The model owns the HTTP clients that are shared by all API calls of the model. The clients are created with the first API call and are closed by calling close() and aclose() or by using the model as (asynchronous) context manager. The model also owns the folder index that is shared by the folder and dashboard lookups of the model and the datasource registry that is shared by the datasource lookups of the model
     """
 
     host: str
@@ -97,10 +1483,116 @@ class APIModel:
     headers: dict = None
     timeout: float = 10.0
     http2_support: bool = False
-    ssl_context: ssl.SSLContext = httpx.create_ssl_context()
+    ssl_context: ssl.SSLContext = None
     num_pools: int = 10
     retries: any = 10
     follow_redirects: bool = True
+    keepalive_expiry: float = 5.0
+    http2_max_connections: int = 1
+    http2_max_concurrent_streams: int = 100
+    json_codec: JSONCodec = field(default_factory=JSONCodec)
+    folder_index_ttl: float = 60.0
+    datasource_registry_ttl: float = 60.0
+    response_cache: ResponseCache = None
+    query_result_cache: QueryResultCache = None
+    retry_policy: RetryPolicy = None
+    rate_limiter: RateLimiter = None
+    circuit_breaker: CircuitBreaker = None
+    request_hooks: list = field(default_factory=list)
+    http_client: httpx.Client = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    http_client_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    async_http_client: httpx.AsyncClient = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    async_http_client_loop: asyncio.AbstractEventLoop = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    async_http_client_close_tasks: set = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    stream_semaphore: threading.BoundedSemaphore = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    async_stream_semaphore: asyncio.Semaphore = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    folder_index: FolderIndex = field(
+        default_factory=FolderIndex, init=False, repr=False, compare=False
+    )
+    datasource_registry: DatasourceRegistry = field(
+        default_factory=DatasourceRegistry, init=False, repr=False, compare=False
+    )
+
+    def get_the_ssl_context(self) -> ssl.SSLContext:
+        """The method includes a functionality to get the SSL context of the model. If no custom SSL context is specified, the shared default SSL context is used
+
+        Returns:
+            ssl_context (ssl.SSLContext): Returns the SSL context
+        """
+
+        if self.ssl_context is not None:
+            return self.ssl_context
+
+        return _get_the_default_ssl_context()
+
+    def get_the_max_concurrency(self) -> int:
+        """The method includes a functionality to get the maximum number of concurrent requests of the model. In the HTTP/2 mode, the multiplexed streams of all connections are used and otherwise, the number of the connection pool
+
+        Returns:
+            max_concurrency (int): Returns the maximum number of concurrent requests
+        """
+
+        if self.http2_support:
+            return self.http2_max_connections * self.http2_max_concurrent_streams
+
+        return self.num_pools
+
+    def close(self):
+        """The method includes a functionality to close the shared HTTP client of the model. A new client is created with the next API call
+
+        Returns:
+            None
+        """
+
+        with self.http_client_lock:
+            if self.http_client is not None:
+                self.http_client.close()
+                self.http_client = None
+
+    async def aclose(self):
+        """The method includes a functionality to close the shared asynchronous HTTP client of the model. A new client is created with the next asynchronous API call
+
+        Returns:
+            None
+        """
+
+        if self.async_http_client is not None:
+            async_http_client: httpx.AsyncClient = self.async_http_client
+            self.async_http_client = None
+            self.async_http_client_loop = None
+            self.async_stream_semaphore = None
+            await async_http_client.aclose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+        self.close()
+
+
+DEFAULT_CHUNK_SIZE_MS: int = 86400000
+MAX_CHUNKS: int = 1000
 
 
 @dataclass
@@ -108,13 +1600,15 @@ class DatasourceQuery:
     """The class includes all necessary variables to specify a query for the datasource search endpoint
 
     Args:
-        raw_sql (str): Specify the raw SQL string to search inside the Grafana system
+        raw_sql (str): Specify the raw SQL string to search inside the Grafana system. Please use an empty string for the datasources without SQL queries e.g. Prometheus, Loki or InfluxDB Flux and specify the query by the model
         datasource_id (int): Specify the id of the data source (default 0)
         datasource_uid (str): Specify the uid of the data source (default "")
         ref_id (str): Specify a reference id of the search command (default A)
         interval_ms (int): Specify the time interval in milliseconds of output format (default 1000)
         max_data_points (int): Specify maximum amount of data points that dashboard panel can render (default 100)
         output_format (str): Specify the output format of the query (default time_series)
+        datasource_type (str): Specify the optional type of the data source e.g. prometheus (default None)
+        model (dict): Specify the optional datasource specific query model that is merged into the query e.g. {"expr": "up"} for Prometheus or {"query": "..."} for InfluxDB Flux (default None)
     """
 
     raw_sql: str
@@ -124,6 +1618,141 @@ class DatasourceQuery:
     interval_ms: int = 1000
     max_data_points: int = 100
     output_format: str = "time_series"
+    datasource_type: str = None
+    model: dict = None
+
+    def to_json(self, legacy: bool = False) -> dict:
+        """The method includes a functionality to create the JSON of the query. The datasource is referenced by the uid or, if no uid is specified, by the datasource id. The legacy query endpoint only supports the datasource id
+
+        Args:
+            legacy (bool): Specify if the query is created for the legacy query endpoint (default False)
+
+        Raises:
+            ValueError: Missed specifying the datasource uid or id
+
+        Returns:
+            query (dict): Returns the JSON of the query
+        """
+
+        query: dict = dict(
+            {
+                "refId": self.ref_id,
+                "intervalMs": self.interval_ms,
+                "maxDataPoints": self.max_data_points,
+            }
+        )
+
+        if legacy:
+            if self.datasource_id == 0:
+                raise ValueError
+            query["datasourceId"] = self.datasource_id
+        elif len(self.datasource_uid) != 0:
+            query["datasource"] = dict({"uid": self.datasource_uid})
+            if self.datasource_type is not None:
+                query["datasource"]["type"] = self.datasource_type
+        elif self.datasource_id != 0:
+            query["datasourceId"] = self.datasource_id
+        else:
+            raise ValueError
+
+        if len(self.raw_sql) != 0:
+            query["rawSql"] = self.raw_sql
+            query["format"] = self.output_format
+
+        if self.model is not None:
+            query.update(self.model)
+
+        return query
+
+
+@dataclass
+class DatasourceQueryRequest:
+    """The class includes all necessary variables to specify a request of multiple queries, e.g. of different datasources and query languages, that are executed in a single round-trip
+
+    Args:
+        time (str): Specify the start of the time range as epoch timestamp in milliseconds or relative using Grafana time units. For example, now-1h (default now-1h)
+        to (str): Specify the end of the time range as epoch timestamp in milliseconds or relative using Grafana time units. For example, now (default now)
+        queries (list): Specify the queries based on the DatasourceQuery class (default [])
+    """
+
+    time: str = "now-1h"
+    to: str = "now"
+    queries: list = field(default_factory=list)
+
+    def add_query(
+        self,
+        datasource_uid: str,
+        model: dict,
+        ref_id: str = None,
+        datasource_type: str = None,
+        interval_ms: int = 1000,
+        max_data_points: int = 100,
+    ) -> "DatasourceQueryRequest":
+        """The method includes a functionality to add a query with a datasource specific query model to the request
+
+        Args:
+            datasource_uid (str): Specify the uid of the data source
+            model (dict): Specify the datasource specific query model e.g. {"expr": "up"} for Prometheus
+            ref_id (str): Specify the reference id of the query. By default, the next free letter is used (default None)
+            datasource_type (str): Specify the optional type of the data source e.g. prometheus (default None)
+            interval_ms (int): Specify the time interval in milliseconds of output format (default 1000)
+            max_data_points (int): Specify maximum amount of data points that dashboard panel can render (default 100)
+
+        Returns:
+            request (DatasourceQueryRequest): Returns the request to chain the calls
+        """
+
+        self.queries.append(
+            DatasourceQuery(
+                "",
+                datasource_uid=datasource_uid,
+                ref_id=ref_id if ref_id is not None else self._get_the_next_ref_id(),
+                interval_ms=interval_ms,
+                max_data_points=max_data_points,
+                datasource_type=datasource_type,
+                model=model,
+            )
+        )
+        return self
+
+    def to_json(self, legacy: bool = False) -> dict:
+        """The method includes a functionality to create the JSON payload of the request
+
+        Args:
+            legacy (bool): Specify if the payload is created for the legacy query endpoint, that references the datasources by the id (default False)
+
+        Raises:
+            ValueError: Missed specifying the datasource uid or id of a query
+
+        Returns:
+            payload (dict): Returns the JSON payload of the request
+        """
+
+        return dict(
+            {
+                "from": str(self.time),
+                "to": str(self.to),
+                "queries": [query.to_json(legacy) for query in self.queries],
+            }
+        )
+
+    def _get_the_next_ref_id(self) -> str:
+        """The method includes a functionality to get the next free reference id. The letters A to Z are used first
+
+        Returns:
+            ref_id (str): Returns the reference id
+        """
+
+        ref_ids: set = {query.ref_id for query in self.queries}
+        index: int = 0
+
+        while True:
+            ref_id: str = (
+                chr(ord("A") + index) if index < 26 else f"Q{index - 25}"
+            )
+            if ref_id not in ref_ids:
+                return ref_id
+            index += 1
 
 
 @dataclass
@@ -890,3 +2519,369 @@ class ReportBrandingSettings:
     email_footer_mode: str
     email_footer_text: str = None
     email_footer_link: str = None
+
+
+@dataclass
+class BatchResult:
+    """The class includes all necessary variables to describe the result of a single request of a batch execution
+
+    Args:
+        request (any): Specify the executed request
+        result (any): Specify the result of the request (default None)
+        error (Exception): Specify the error that occurred by executing the request (default None)
+    """
+
+    request: any
+    result: any = None
+    error: Exception = None
+
+
+class DeployStatus(Enum):
+    """The class includes all possible states of a dashboard deployment"""
+
+    DEPLOYED: str = "deployed"
+    SKIPPED: str = "skipped"
+    FAILED: str = "failed"
+
+
+@dataclass
+class DashboardDeployResult:
+    """The class includes all necessary variables to describe the result of a single dashboard deployment
+
+    Args:
+        dashboard_path (str): Specify the dashboard path in which the dashboard is to be placed
+        dashboard_uid (str): Specify the uid of the dashboard (default None)
+        status (DeployStatus): Specify the state of the deployment (default DeployStatus.DEPLOYED)
+        result (any): Specify the result of the deployment API call (default None)
+        error (Exception): Specify the error that occurred by deploying the dashboard (default None)
+    """
+
+    dashboard_path: str
+    dashboard_uid: str = None
+    status: DeployStatus = DeployStatus.DEPLOYED
+    result: any = None
+    error: Exception = None
+
+
+class ExportFormat(Enum):
+    """The class includes all supported formats of the dashboard export"""
+
+    DIRECTORY: str = "directory"
+    JSONL: str = "jsonl"
+    TAR: str = "tar"
+
+
+class DataFrameBackend(Enum):
+    """The class includes all supported column types of the decoded data frames"""
+
+    ARRAY: str = "array"
+    NUMPY: str = "numpy"
+
+
+@dataclass
+class DataFrameField:
+    """The class includes all necessary variables to describe a column of a decoded Grafana data frame
+
+    Args:
+        name (str): Specify the name of the field
+        type (str): Specify the Grafana type of the field e.g. time, number, string or boolean
+        values (any): Specify the values of the field. Time values are epoch timestamps in nanoseconds, numeric values with nulls are floats with NaN
+        labels (dict): Specify the labels of the field (default None)
+        config (dict): Specify the display config of the field (default None)
+    """
+
+    name: str
+    type: str
+    values: any
+    labels: dict = None
+    config: dict = None
+
+
+@dataclass
+class DataFrame:
+    """The class includes all necessary variables to describe a decoded Grafana data frame with one column per field
+
+    Args:
+        name (str): Specify the name of the frame (default None)
+        ref_id (str): Specify the reference id of the query of the frame (default None)
+        fields (list): Specify the fields of the frame as DataFrameField (default [])
+        meta (dict): Specify the meta information of the frame (default None)
+    """
+
+    name: str = None
+    ref_id: str = None
+    fields: list = field(default_factory=list)
+    meta: dict = None
+
+    def __len__(self) -> int:
+        return 0 if len(self.fields) == 0 else len(self.fields[0].values)
+
+    def get_the_field(self, name: str) -> Union[DataFrameField, None]:
+        """The method includes a functionality to get the first field of the frame specified by the name
+
+        Args:
+            name (str): Specify the name of the field
+
+        Returns:
+            field (Union[DataFrameField, None]): Returns the field or None if there is no corresponding field
+        """
+
+        for data_frame_field in self.fields:
+            if data_frame_field.name == name:
+                return data_frame_field
+
+        return None
+
+    def to_pandas(self) -> any:
+        """The method includes a functionality to convert the frame to a pandas DataFrame with one column per field. Time fields are converted to UTC timestamps
+
+        Raises:
+            ImportError: The pandas library is not installed
+
+        Returns:
+            data_frame (pandas.DataFrame): Returns the pandas DataFrame
+        """
+
+        import numpy
+        import pandas
+
+        columns: dict = dict()
+
+        for index, data_frame_field in enumerate(self.fields):
+            values: any = data_frame_field.values
+
+            if data_frame_field.type == "time" and isinstance(values, list):
+                values = pandas.to_datetime(values, unit="ns", utc=True)
+            elif data_frame_field.type == "time":
+                values = pandas.to_datetime(
+                    numpy.asarray(values).astype("datetime64[ns]"), utc=True
+                )
+            elif isinstance(values, array.array):
+                values = numpy.frombuffer(values, dtype=values.typecode)
+
+            columns[index] = values
+
+        data_frame = pandas.DataFrame(columns, copy=False)
+        data_frame.columns = [data_frame_field.name for data_frame_field in self.fields]
+        return data_frame
+
+
+@dataclass
+class DataFrameDecoder:
+    """The class includes a functionality to decode the data frames of the Grafana query results into columns. The values of every field are converted at once into a compact typed column e.g. array("d") or a NumPy array instead of per row objects
+
+    Args:
+        backend (DataFrameBackend): Specify the column type of the decoded fields. The NumPy backend requires the numpy library (default DataFrameBackend.ARRAY)
+    """
+
+    backend: DataFrameBackend = DataFrameBackend.ARRAY
+
+    # The constants map the numeric Grafana frame types to the typecodes of the array module and to the NumPy dtypes.
+    _ARRAY_TYPECODES = dict(
+        {
+            "int8": "b",
+            "uint8": "B",
+            "int16": "h",
+            "uint16": "H",
+            "int32": "i",
+            "uint32": "I",
+            "int64": "q",
+            "uint64": "Q",
+            "float32": "f",
+            "float64": "d",
+        }
+    )
+    _ENTITY_VALUES = dict(
+        {"NaN": float("nan"), "Inf": float("inf"), "NegInf": float("-inf")}
+    )
+
+    def decode_the_results(self, results: dict) -> dict:
+        """The method includes a functionality to decode all frames of the query results
+
+        Args:
+            results (dict): Specify the results of the query API call grouped by the reference id
+
+        Raises:
+            ValueError: A query result includes an error
+            ImportError: The library of the backend is not installed
+
+        Returns:
+            frames (dict): Returns the list of the decoded frames grouped by the reference id
+        """
+
+        decoded_results: dict = dict()
+
+        for ref_id, result in results.items():
+            if result.get("error") is not None:
+                raise ValueError(f"The query {ref_id} failed: {result.get('error')}")
+
+            decoded_results[ref_id] = [
+                self.decode_the_frame(frame) for frame in result.get("frames") or []
+            ]
+
+        return decoded_results
+
+    def decode_the_frame(self, frame: dict) -> DataFrame:
+        """The method includes a functionality to decode a data frame of the Grafana JSON wire format
+
+        Args:
+            frame (dict): Specify the frame with the schema and the data values
+
+        Raises:
+            ImportError: The library of the backend is not installed
+
+        Returns:
+            data_frame (DataFrame): Returns the decoded frame
+        """
+
+        schema: dict = frame.get("schema") or dict()
+        data: dict = frame.get("data") or dict()
+        fields: list = schema.get("fields") or []
+        values: list = data.get("values") or [[] for _ in fields]
+        entities: list = data.get("entities") or [None for _ in fields]
+        nanos: list = data.get("nanos") or [None for _ in fields]
+
+        return DataFrame(
+            schema.get("name"),
+            schema.get("refId"),
+            [
+                DataFrameField(
+                    schema_field.get("name"),
+                    schema_field.get("type"),
+                    self._decode_the_values(
+                        schema_field, values[index], entities[index], nanos[index]
+                    ),
+                    schema_field.get("labels"),
+                    schema_field.get("config"),
+                )
+                for index, schema_field in enumerate(fields)
+            ],
+            schema.get("meta"),
+        )
+
+    def _decode_the_values(
+        self, schema_field: dict, values: list, entities: dict, nanos: list
+    ) -> any:
+        """The method includes a functionality to decode the values of a field into a column
+
+        Args:
+            schema_field (dict): Specify the schema of the field
+            values (list): Specify the values of the field
+            entities (dict): Specify the indexes of the NaN, Inf and NegInf values of the field
+            nanos (list): Specify the additional nanoseconds of the time values of the field
+
+        Returns:
+            values (any): Returns the column of the field
+        """
+
+        field_type: str = schema_field.get("type")
+        frame_type: str = (schema_field.get("typeInfo") or dict()).get("frame", "")
+        has_nulls: bool = None in values
+
+        if field_type == "time":
+            if self.backend == DataFrameBackend.NUMPY and not has_nulls:
+                return DataFrameDecoder._create_the_numpy_time_column(values, nanos)
+
+            values = [
+                None if value is None else value * 1_000_000 for value in values
+            ]
+            if nanos is not None:
+                values = [
+                    None if value is None else value + nano
+                    for value, nano in zip(values, nanos)
+                ]
+            typecode: str = "q"
+        elif field_type == "number":
+            typecode: str = DataFrameDecoder._ARRAY_TYPECODES.get(
+                frame_type.lstrip("*"), "d"
+            )
+            if has_nulls or entities is not None:
+                typecode = "d"
+        else:
+            typecode: str = None
+
+        if self.backend == DataFrameBackend.NUMPY:
+            return DataFrameDecoder._create_the_numpy_column(
+                values, typecode, field_type, entities
+            )
+
+        if typecode is None or (has_nulls and typecode != "d"):
+            return values
+
+        if typecode == "d" and has_nulls:
+            values = [float("nan") if value is None else value for value in values]
+
+        column: array.array = array.array(typecode, values)
+        DataFrameDecoder._set_the_entities(column, entities)
+        return column
+
+    @staticmethod
+    def _create_the_numpy_time_column(values: list, nanos: Union[list, None]) -> any:
+        """The method includes a functionality to create a NumPy datetime array of the time values of a field without nulls. The epoch milliseconds are converted vectorized
+
+        Args:
+            values (list): Specify the time values of the field in epoch milliseconds
+            nanos (Union[list, None]): Specify the additional nanoseconds of the time values of the field
+
+        Raises:
+            ImportError: The numpy library is not installed
+
+        Returns:
+            values (numpy.ndarray): Returns the column of the field
+        """
+
+        import numpy
+
+        column = numpy.array(values, dtype="int64") * 1_000_000
+        if nanos is not None:
+            column += numpy.array(nanos, dtype="int64")
+
+        return column.view("datetime64[ns]")
+
+    @staticmethod
+    def _create_the_numpy_column(
+        values: list, typecode: Union[str, None], field_type: str, entities: dict
+    ) -> any:
+        """The method includes a functionality to create a NumPy array of the values of a field
+
+        Args:
+            values (list): Specify the values of the field
+            typecode (Union[str, None]): Specify the array typecode of the field or None for an object column
+            field_type (str): Specify the Grafana type of the field
+            entities (dict): Specify the indexes of the NaN, Inf and NegInf values of the field
+
+        Raises:
+            ImportError: The numpy library is not installed
+
+        Returns:
+            values (numpy.ndarray): Returns the column of the field
+        """
+
+        import numpy
+
+        if field_type == "time":
+            return numpy.array(values, dtype="datetime64[ns]")
+        elif field_type == "boolean" and None not in values:
+            return numpy.array(values, dtype=bool)
+        elif typecode is None:
+            return numpy.array(values, dtype=object)
+
+        column = numpy.array(values, dtype=typecode)
+        DataFrameDecoder._set_the_entities(column, entities)
+        return column
+
+    @staticmethod
+    def _set_the_entities(column: any, entities: Union[dict, None]):
+        """The method includes a functionality to set the NaN, Inf and NegInf values of a column, that are encoded as null inside the JSON values
+
+        Args:
+            column (any): Specify the float column of the field
+            entities (Union[dict, None]): Specify the indexes of the NaN, Inf and NegInf values of the field
+
+        Returns:
+            None
+        """
+
+        for entity, indexes in (entities or dict()).items():
+            for index in indexes or []:
+                column[index] = DataFrameDecoder._ENTITY_VALUES.get(entity)
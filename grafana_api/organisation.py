@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import APIModel, APIEndpoints, RequestsMethods
@@ -113,7 +112,7 @@ class Organisation:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ORGANISATION.value}/users/{user_id}",
                 RequestsMethods.PATCH,
-                json.dumps(dict({"role": role})),
+                dict({"role": role}),
             )
 
             if api_call.get("message") != "Organization user updated":
@@ -180,7 +179,7 @@ class Organisation:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.ORGANISATION.value,
                 RequestsMethods.PUT,
-                json.dumps(dict({"name": name})),
+                dict({"name": name}),
             )
 
             if api_call.get("message") != "Organization updated":
@@ -217,7 +216,7 @@ class Organisation:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ORGANISATION.value}/users",
                 RequestsMethods.POST,
-                json.dumps(dict({"loginOrEmail": login_or_email, "role": role})),
+                dict({"loginOrEmail": login_or_email, "role": role}),
             )
 
             if api_call.get("message") != "User added to organization":
@@ -356,7 +355,7 @@ class OrganisationAdmin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.ORGANISATIONS.value,
                 RequestsMethods.POST,
-                json.dumps(dict({"name": name})),
+                dict({"name": name}),
             )
 
             if api_call.get("message") != "Organization created":
@@ -391,7 +390,7 @@ class OrganisationAdmin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ORGANISATIONS.value}/{org_id}",
                 RequestsMethods.PUT,
-                json.dumps(dict({"name": name})),
+                dict({"name": name}),
             )
 
             if api_call.get("message") != "Organization updated":
@@ -492,7 +491,7 @@ class OrganisationAdmin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ORGANISATIONS.value}/{org_id}/users",
                 RequestsMethods.POST,
-                json.dumps(dict({"loginOrEmail": login_or_email, "role": role})),
+                dict({"loginOrEmail": login_or_email, "role": role}),
             )
 
             if api_call.get("message") != "User added to organization":
@@ -528,7 +527,7 @@ class OrganisationAdmin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ORGANISATIONS.value}/{org_id}/users/{user_id}",
                 RequestsMethods.PATCH,
-                json.dumps(dict({"role": role})),
+                dict({"role": role}),
             )
 
             if api_call.get("message") != "Organization user updated":
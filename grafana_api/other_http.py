@@ -1,10 +1,8 @@
+import base64
 import logging
-from typing import Union
-import asyncio
+from typing import Generator
 
-from httpx import AsyncClient, Client, BasicAuth, Response
-
-import json
+from httpx import Client, BasicAuth, Response
 
 from .model import APIModel, APIEndpoints
 from .api import Api
@@ -74,13 +72,13 @@ class OtherHTTP:
             api_call (dict): Returns the health information
         """
 
-        http = Api(self.grafana_api_model).create_the_http_api_client()
+        http = Api(self.grafana_api_model).get_the_http_api_client()
 
         http_result = self._basic_get_call_without_token_auth(
             http, f"{self.grafana_api_model.host}/api/health"
         )
 
-        api_call: dict = json.loads(http_result.text)
+        api_call: dict = self.grafana_api_model.json_codec.loads(http_result.text)
 
         if api_call == dict() or api_call.get("commit") is None:
             logging.error(f"Check the error: {api_call}.")
@@ -104,7 +102,7 @@ class OtherHTTP:
             api_call (str): Returns the metrics information
         """
 
-        http = Api(self.grafana_api_model).create_the_http_api_client()
+        http = Api(self.grafana_api_model).get_the_http_api_client()
 
         basic_auth = None
         if basic_auth_username is not None and basic_auth_password is not None:
@@ -120,6 +118,49 @@ class OtherHTTP:
         else:
             return api_call
 
+    def iter_metrics(
+        self, basic_auth_username: str = None, basic_auth_password: str = None
+    ) -> Generator[str, None, None]:
+        """The method includes a functionality to stream the Grafana metrics information line by line
+
+        Args:
+            basic_auth_username (str): Specify the optional basic auth username
+            basic_auth_password (str): Specify the optional basic auth password
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            lines (Generator[str, None, None]): Returns the lines of the metrics information
+        """
+
+        api: Api = Api(self.grafana_api_model)
+
+        headers: dict = dict()
+        if basic_auth_username is not None and basic_auth_password is not None:
+            credentials: str = base64.b64encode(
+                str.encode(f"{basic_auth_username}:{basic_auth_password}")
+            ).decode("utf-8")
+            headers.update({"Authorization": f"Basic {credentials}"})
+
+        response: Response = api._send_the_uncached_http_request(
+            api.get_the_http_api_client(),
+            "GET",
+            f"{self.grafana_api_model.host}/metrics",
+            headers,
+            stream=True,
+        )
+
+        try:
+            if response.is_error:
+                response.read()
+                logging.error(f"Check the error: {response.text}.")
+                raise Exception
+
+            yield from response.iter_lines()
+        finally:
+            response.close()
+
     def get_plugin_metrics(
         self,
         plugin_id: str,
@@ -141,7 +182,7 @@ class OtherHTTP:
             api_call (str): Returns the metrics information
         """
 
-        http = Api(self.grafana_api_model).create_the_http_api_client()
+        http = Api(self.grafana_api_model).get_the_http_api_client()
 
         basic_auth = None
         if basic_auth_username is not None and basic_auth_password is not None:
@@ -163,12 +204,12 @@ class OtherHTTP:
             raise ValueError
 
     def _basic_get_call_without_token_auth(
-        self, http: Union[Client, AsyncClient], url: str, basic_auth: BasicAuth = None
+        self, http: Client, url: str, basic_auth: BasicAuth = None
     ) -> Response:
         """The method includes a functionality to perform a basic GET call to an endpoint with optional BasicAuth
 
         Args:
-            http (Union[Client, AsyncClient]): Specify the used client
+            http (Client): Specify the used client
             url (str): Specify the url of the performed api call
             basic_auth (BasicAuth): Specify the optional basic auth credentials (default None)
 
@@ -180,14 +221,6 @@ class OtherHTTP:
         """
 
         try:
-            if self.grafana_api_model.http2_support:
-
-                async def _execute_async_http_requests():
-                    async with http:
-                        return await http.request("GET", url, auth=basic_auth)
-
-                return asyncio.run(_execute_async_http_requests())
-            else:
-                return http.request("GET", url, auth=basic_auth)
+            return http.request("GET", url, auth=basic_auth)
         except Exception as e:
             raise e
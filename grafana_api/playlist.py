@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -175,14 +174,12 @@ class Playlist:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.PLAYLISTS.value}",
                 RequestsMethods.POST,
-                json.dumps(
-                    dict(
-                        {
-                            "name": playlist.name,
-                            "interval": playlist.interval,
-                            "items": items,
-                        }
-                    )
+                dict(
+                    {
+                        "name": playlist.name,
+                        "interval": playlist.interval,
+                        "items": items,
+                    }
                 ),
             )
 
@@ -226,14 +223,12 @@ class Playlist:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.PLAYLISTS.value}/{playlist_uid}",
                 RequestsMethods.PUT,
-                json.dumps(
-                    dict(
-                        {
-                            "name": playlist.name,
-                            "interval": playlist.interval,
-                            "items": items,
-                        }
-                    )
+                dict(
+                    {
+                        "name": playlist.name,
+                        "interval": playlist.interval,
+                        "items": items,
+                    }
                 ),
             )
 
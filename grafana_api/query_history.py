@@ -1,5 +1,5 @@
-import json
 import logging
+from typing import Generator
 
 from .model import (
     APIModel,
@@ -56,13 +56,11 @@ class QueryHistory:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.QUERY_HISTORY.value,
                 RequestsMethods.POST,
-                json.dumps(
-                    dict(
-                        {
-                            "datasourceUid": datasource_uid,
-                            "queries": queries_json_list,
-                        }
-                    )
+                dict(
+                    {
+                        "datasourceUid": datasource_uid,
+                        "queries": queries_json_list,
+                    }
                 ),
             )
 
@@ -126,6 +124,46 @@ class QueryHistory:
             logging.error("There is no datasource_uids or search_string defined.")
             raise ValueError
 
+    def iter_query_history(
+        self,
+        datasource_uids: list,
+        search_string: str,
+        sort: str = "time-desc",
+        only_starred: bool = False,
+        results_per_page: int = 100,
+        prefetch: bool = False,
+    ) -> Generator[dict, None, None]:
+        """The method includes a functionality to lazily iterate over all queries of the query history that match the search. The pages are requested on demand
+
+        Args:
+            datasource_uids (list): Specify the datasource uid
+            search_string (str): Specify the search string to filter the result
+            sort (str): Specify the sorting order e.g. time-asc or time-desc (default time-desc)
+            only_starred (bool): Specify if queries that are starred should be used for the search (default false)
+            results_per_page (int): Specify the results_per_page as integer (default 100)
+            prefetch (bool): Specify if the next page should be prefetched concurrently while the current page is consumed (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            queries (Generator[dict, None, None]): Returns the queries of the query history
+        """
+
+        def _get_page(page: int) -> tuple:
+            api_call: dict = self.search_query_history(
+                datasource_uids,
+                search_string,
+                sort,
+                only_starred,
+                page,
+                results_per_page,
+            ).get("result")
+            return api_call.get("queryHistory"), api_call.get("totalCount")
+
+        return Api.iterate_the_pages(_get_page, results_per_page, prefetch)
+
     def delete_query_history(self, uid: str):
         """The method includes a functionality to delete a query inside the query history
 
@@ -173,7 +211,7 @@ class QueryHistory:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.QUERY_HISTORY.value}/{uid}",
                 RequestsMethods.PATCH,
-                json.dumps({"comment": comment}),
+                {"comment": comment},
             )
 
             if api_call == dict() or api_call.get("result") is None:
@@ -203,7 +241,7 @@ class QueryHistory:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.QUERY_HISTORY.value}/star/{uid}",
                 RequestsMethods.POST,
-                json.dumps({}),
+                {},
             )
 
             if api_call == dict() or api_call.get("result") is None:
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import APIModel, APIEndpoints, RequestsMethods, CustomRole
@@ -204,7 +203,7 @@ class RBAC:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.RBAC.value}/roles",
                 RequestsMethods.POST,
-                json.dumps(role_object),
+                role_object,
                 response_status_code=True,
             )
 
@@ -292,7 +291,7 @@ class RBAC:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.RBAC.value}/roles/{uid}",
                 RequestsMethods.PUT,
-                json.dumps(role_object),
+                role_object,
                 response_status_code=True,
             )
 
@@ -496,7 +495,7 @@ class RBAC:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.RBAC.value}/users/{user_id}/roles",
                 RequestsMethods.POST,
-                json.dumps({"global": global_assignment, "roleUid": role_uid}),
+                {"global": global_assignment, "roleUid": role_uid},
                 response_status_code=True,
             )
 
@@ -612,7 +611,7 @@ class RBAC:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.RBAC.value}/users/{user_id}/roles{additional_parameters}",
                 RequestsMethods.PUT,
-                json.dumps({"global": global_assignment, "roleUids": role_uids}),
+                {"global": global_assignment, "roleUids": role_uids},
                 response_status_code=True,
             )
 
@@ -769,7 +768,7 @@ class RBAC:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.RBAC.value}/users/{service_account_id}/roles",
                 RequestsMethods.POST,
-                json.dumps({"global": global_assignment, "roleUid": role_uid}),
+                {"global": global_assignment, "roleUid": role_uid},
                 response_status_code=True,
             )
 
@@ -898,7 +897,7 @@ class RBAC:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.RBAC.value}/users/{service_account_id}/roles{additional_parameters}",
                 RequestsMethods.PUT,
-                json.dumps({"global": global_assignment, "roleUids": role_uids}),
+                {"global": global_assignment, "roleUids": role_uids},
                 response_status_code=True,
             )
 
@@ -1005,7 +1004,7 @@ class RBAC:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.RBAC.value}/teams/{team_id}/roles",
                 RequestsMethods.POST,
-                json.dumps({"roleUid": role_uid}),
+                {"roleUid": role_uid},
                 response_status_code=True,
             )
 
@@ -1119,7 +1118,7 @@ class RBAC:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.RBAC.value}/teams/{team_id}/roles{additional_parameters}",
                 RequestsMethods.PUT,
-                json.dumps({"roleUids": role_uids}),
+                {"roleUids": role_uids},
                 response_status_code=True,
             )
 
@@ -1166,7 +1165,7 @@ class RBAC:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.RBAC.value}/roles/hard-reset",
             RequestsMethods.POST,
-            json.dumps({"BasicRoles": True}),
+            {"BasicRoles": True},
             response_status_code=True,
         )
 
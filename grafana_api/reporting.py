@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import Union
 
@@ -140,7 +139,7 @@ class Reporting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.REPORTING.value,
                 RequestsMethods.POST,
-                json.dumps(report_object),
+                report_object,
                 response_status_code=True,
             )
 
@@ -191,7 +190,7 @@ class Reporting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.REPORTING.value}/{id}",
                 RequestsMethods.PUT,
-                json.dumps(report_object),
+                report_object,
                 response_status_code=True,
             )
 
@@ -307,7 +306,7 @@ class Reporting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.REPORTING.value}/email",
                 RequestsMethods.POST,
-                json.dumps(result),
+                result,
                 response_status_code=True,
             )
 
@@ -435,7 +434,7 @@ class Reporting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.REPORTING.value}/settings",
                 RequestsMethods.POST,
-                json.dumps(report_branding_settings_object),
+                report_branding_settings_object,
                 response_status_code=True,
             )
 
@@ -488,7 +487,7 @@ class Reporting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.REPORTING.value}/test-email",
                 RequestsMethods.POST,
-                json.dumps(report_object),
+                report_object,
             )
 
             status_code: int = api_call.get("status")
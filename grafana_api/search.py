@@ -1,6 +1,7 @@
 import logging
+from typing import AsyncGenerator, Generator
 
-from .api import Api
+from .api import Api, AsyncApi
 from .model import APIModel, APIEndpoints
 
 
@@ -31,14 +32,101 @@ class Search:
             api_call (list): Returns the list of query the results
         """
 
+        return Api.check_the_api_call_type(
+            Api(self.grafana_api_model).call_the_api(
+                *Search._create_the_search_request(search_query)
+            ),
+            list,
+        )
+
+    def iter_search(self, search_query: str) -> Generator[dict, None, None]:
+        """The method includes a functionality to execute a custom query and to stream the results
+
+        Args:
+            search_query (str): Specify the inserted query as string
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            results (Generator[dict, None, None]): Returns the query results
+        """
+
+        yield from Api(self.grafana_api_model).iterate_the_json_items(
+            *Search._create_the_search_request(search_query)
+        )
+
+    @staticmethod
+    def _create_the_search_request(search_query: str) -> tuple:
+        """The method includes a functionality to create the request of a custom query
+
+        Args:
+            search_query (str): Specify the inserted query as string
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
         if len(search_query) != 0:
-            result: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.SEARCH.value}?{search_query}"
-            )
-            if result == list():
-                raise Exception
-            else:
-                return result
+            return (f"{APIEndpoints.SEARCH.value}?{search_query}",)
         else:
             logging.error("There is no search_query defined.")
             raise ValueError
+
+
+class AsyncSearch:
+    """The class includes all necessary methods to access the Grafana search API endpoints asynchronously
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    async def search(self, search_query: str) -> list:
+        """The method includes a functionality to execute a custom query
+
+        Args:
+            search_query (str): Specify the inserted query as string
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns the list of query the results
+        """
+
+        return Api.check_the_api_call_type(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Search._create_the_search_request(search_query)
+            ),
+            list,
+        )
+
+    async def iter_search(self, search_query: str) -> AsyncGenerator[dict, None]:
+        """The method includes a functionality to execute a custom query and to stream the results
+
+        Args:
+            search_query (str): Specify the inserted query as string
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            results (AsyncGenerator[dict, None]): Returns the query results
+        """
+
+        async for result in AsyncApi(self.grafana_api_model).iterate_the_json_items(
+            *Search._create_the_search_request(search_query)
+        ):
+            yield result
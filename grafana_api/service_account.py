@@ -1,5 +1,5 @@
-import json
 import logging
+from typing import Generator
 
 from .api import Api
 from .model import APIModel, APIEndpoints, RequestsMethods
@@ -56,6 +56,34 @@ class ServiceAccount:
         else:
             return api_call
 
+    def iter_service_accounts(
+        self, results_per_page: int = 1000, query: str = None, prefetch: bool = False
+    ) -> Generator[dict, None, None]:
+        """The method includes a functionality to lazily iterate over all service accounts specified by the optional results_per_page and query. The pages are requested on demand
+
+        Required Permissions:
+            Action: serviceaccounts:read
+            Scope: global:serviceaccounts:*
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 1000)
+            query (str): Specify the query (default None)
+            prefetch (bool): Specify if the next page should be prefetched concurrently while the current page is consumed (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            service_accounts (Generator[dict, None, None]): Returns the service accounts
+        """
+
+        def _get_page(page: int) -> tuple:
+            api_call: dict = self.search_service_account(results_per_page, page, query)
+            return api_call.get("serviceAccounts"), api_call.get("totalCount")
+
+        return Api.iterate_the_pages(_get_page, results_per_page, prefetch)
+
     def get_service_account_by_id(self, id: int) -> dict:
         """The method includes a functionality to get a service account specified by the id
 
@@ -111,7 +139,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.SERVICE_ACCOUNTS.value,
                 RequestsMethods.POST,
-                json.dumps(dict({"name": name, "role": role})),
+                dict({"name": name, "role": role}),
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -147,7 +175,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SERVICE_ACCOUNTS.value}/{id}",
                 RequestsMethods.PATCH,
-                json.dumps(dict({"name": name, "role": role})),
+                dict({"name": name, "role": role}),
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -248,7 +276,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SERVICE_ACCOUNTS.value}/{id}/tokens",
                 RequestsMethods.POST,
-                json.dumps(dict({"name": name, "role": role})),
+                dict({"name": name, "role": role}),
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -311,7 +339,7 @@ class ServiceAccount:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.SERVICE_ACCOUNTS.value}/migrate",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if (
@@ -347,7 +375,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SERVICE_ACCOUNTS.value}/migrate/{key_id}",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
 
             if api_call.get("message") != "Service accounts migrated":
@@ -402,7 +430,7 @@ class ServiceAccount:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.SERVICE_ACCOUNTS.value}/hideApiKeys",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.get("message") != "API keys hidden":
@@ -434,7 +462,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SERVICE_ACCOUNTS.value}/{id}/revert/{key_id}",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
 
             if api_call.get("message") != "reverted service account to API key":
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import APIModel, APIEndpoints, RequestsMethods
@@ -36,7 +35,7 @@ class ShortUrl:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.SHORT_URLS.value,
                 RequestsMethods.POST,
-                json.dumps(dict({"path": path})),
+                dict({"path": path}),
             )
 
             if api_call == dict() or api_call.get("url") is None:
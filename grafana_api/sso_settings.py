@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import Union
 
@@ -144,18 +143,16 @@ class SSOSettings:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SSO_SETTINGS.value}/{provider}",
                 RequestsMethods.PUT,
-                json.dumps(
-                    dict(
-                        {
-                            "settings": {
-                                "apiUrl": sso_setting.api_url,
-                                "clientId": sso_setting.client_id,
-                                "clientSecret": sso_setting.client_secret,
-                                "enabled": sso_setting.enabled,
-                                "scopes": sso_setting.scopes,
-                            }
+                dict(
+                    {
+                        "settings": {
+                            "apiUrl": sso_setting.api_url,
+                            "clientId": sso_setting.client_id,
+                            "clientSecret": sso_setting.client_secret,
+                            "enabled": sso_setting.enabled,
+                            "scopes": sso_setting.scopes,
                         }
-                    )
+                    }
                 ),
                 response_status_code=True,
             )
@@ -1,5 +1,5 @@
-import json
 import logging
+from typing import AsyncGenerator, Generator
 
 from .model import (
     APIModel,
@@ -7,7 +7,7 @@ from .model import (
     RequestsMethods,
     TeamObject,
 )
-from .api import Api
+from .api import Api, AsyncApi
 
 
 class Team:
@@ -46,22 +46,40 @@ class Team:
             api_call (dict): Returns the organization teams
         """
 
-        api_request_url: str = (
-            f"{APIEndpoints.TEAMS.value}/search?perpage={results_per_page}&page={pages}"
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_search_request(results_per_page, pages, query)
+            ),
+            "totalCount",
         )
 
-        if query is not None and len(query) != 0:
-            api_request_url: str = f"{api_request_url}&query={query}"
+    def iter_teams(
+        self, results_per_page: int = 1000, query: str = None, prefetch: bool = False
+    ) -> Generator[dict, None, None]:
+        """The method includes a functionality to lazily iterate over all organization teams specified by the optional results_per_page and query. The pages are requested on demand
 
-        api_call: dict = Api(self.grafana_api_model).call_the_api(
-            api_request_url,
-        )
+        Required Permissions:
+            Action: teams:read
+            Scope: teams:*
 
-        if api_call == dict() or api_call.get("totalCount") is None:
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 1000)
+            query (str): Specify the query (default None)
+            prefetch (bool): Specify if the next page should be prefetched concurrently while the current page is consumed (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            teams (Generator[dict, None, None]): Returns the organization teams
+        """
+
+        def _get_page(page: int) -> tuple:
+            api_call: dict = self.search_team(results_per_page, page, query)
+            return api_call.get("teams"), api_call.get("totalCount")
+
+        return Api.iterate_the_pages(_get_page, results_per_page, prefetch)
 
     def get_team_by_id(self, id: int) -> dict:
         """The method includes a functionality to get the organization team specified by the id
@@ -81,19 +99,12 @@ class Team:
             api_call (dict): Returns the organization team
         """
 
-        if id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}",
-            )
-
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no id defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_request(id)
+            ),
+            "id",
+        )
 
     def add_team(self, team: TeamObject) -> int:
         """The method includes a functionality to add an organization team specified by the TeamObject
@@ -113,21 +124,13 @@ class Team:
              team_id (int): Returns the team id
         """
 
-        if team is not None:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}",
-                RequestsMethods.POST,
-                json.dumps(dict({"name": team.name, "email": team.name})),
-            )
-
-            if api_call.get("message") != "Team created":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return int(api_call.get("teamId"))
-        else:
-            logging.error("There is no team defined.")
-            raise ValueError
+        api_call: dict = Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_creation_request(team)
+            ),
+            "Team created",
+        )
+        return int(api_call.get("teamId"))
 
     def update_team(self, id: int, name: str, email: str):
         """The method includes a functionality to update an organization team specified by the team_id, name and email
@@ -149,21 +152,13 @@ class Team:
             None
         """
 
-        if id != 0 and len(name) != 0 and len(email) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}",
-                RequestsMethods.PUT,
-                json.dumps(dict({"name": name, "email": email})),
-            )
-
-            if api_call.get("message") != "Team updated":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully updated the team.")
-        else:
-            logging.error("There is no id, name or email defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_update_request(id, name, email)
+            ),
+            "Team updated",
+            "You successfully updated the team.",
+        )
 
     def delete_team_by_id(self, id: int):
         """The method includes a functionality to delete an organization team specified by the team_id
@@ -183,20 +178,13 @@ class Team:
             None
         """
 
-        if id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}",
-                RequestsMethods.DELETE,
-            )
-
-            if api_call.get("message") != "Team deleted":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully deleted the team.")
-        else:
-            logging.error("There is no id defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_deletion_request(id)
+            ),
+            "Team deleted",
+            "You successfully deleted the team.",
+        )
 
     def get_team_members(self, id: int) -> list:
         """The method includes a functionality to get all organization team users specified by the team_id
@@ -216,19 +204,12 @@ class Team:
             api_call (list): Returns the organization team members
         """
 
-        if id != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}/members",
-            )
-
-            if api_call == list() or api_call[0].get("userId") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no id defined.")
-            raise ValueError
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_members_request(id)
+            ),
+            "userId",
+        )
 
     def add_team_member(self, id: int, user_id: int):
         """The method includes a functionality to add an organization team user specified by the team_id and the user_id
@@ -249,21 +230,13 @@ class Team:
             None
         """
 
-        if id != 0 and user_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}/members",
-                RequestsMethods.POST,
-                json.dumps(dict({"userId": user_id})),
-            )
-
-            if api_call.get("message") != "Member added to Team":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully added a team member.")
-        else:
-            logging.error("There is no id or user_id defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_member_addition_request(id, user_id)
+            ),
+            "Member added to Team",
+            "You successfully added a team member.",
+        )
 
     def delete_team_member(self, id: int, user_id: int):
         """The method includes a functionality to delete an organization team user specified by the team_id and the user_id
@@ -284,20 +257,13 @@ class Team:
             None
         """
 
-        if id != 0 and user_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}/members/{user_id}",
-                RequestsMethods.DELETE,
-            )
-
-            if api_call.get("message") != "Team Member removed":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully removed a team member.")
-        else:
-            logging.error("There is no id or user_id defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_member_removal_request(id, user_id)
+            ),
+            "Team Member removed",
+            "You successfully removed a team member.",
+        )
 
     def get_team_preferences(self, id: int) -> dict:
         """The method includes a functionality to get the organization team preferences specified by the team_id
@@ -317,19 +283,12 @@ class Team:
             api_call (dict): Returns the organization team preferences
         """
 
-        if id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}/preferences",
-            )
-
-            if isinstance(api_call, dict) is False or api_call == dict():
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no id defined.")
-            raise ValueError
+        return Api.check_the_api_call_type(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_preferences_request(id)
+            ),
+            dict,
+        )
 
     def update_team_preferences(
         self,
@@ -360,40 +319,15 @@ class Team:
             None
         """
 
-        if id != 0 and (
-            theme is not None
-            or (home_dashboard_id != 0 or home_dashboard_uid is not None)
-            or timezone is not None
-        ):
-            team_preferences: dict = dict()
-
-            if theme is not None:
-                team_preferences.update(dict({"theme": theme}))
-
-            if home_dashboard_id != 0 and isinstance(home_dashboard_id, int):
-                team_preferences.update(dict({"homeDashboardId": home_dashboard_id}))
-            else:
-                team_preferences.update({"homeDashboardUID": home_dashboard_uid})
-
-            if timezone is not None:
-                team_preferences.update(dict({"timezone": timezone}))
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}/preferences",
-                RequestsMethods.PUT,
-                json.dumps(team_preferences),
-            )
-
-            if api_call.get("message") != "Preferences updated":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully updated the team preferences.")
-        else:
-            logging.error(
-                "There is no id, theme, home_dashboard_id or timezone defined."
-            )
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_preferences_update_request(
+                    id, theme, timezone, home_dashboard_id, home_dashboard_uid
+                )
+            ),
+            "Preferences updated",
+            "You successfully updated the team preferences.",
+        )
 
     def get_external_groups(
         self,
@@ -416,19 +350,12 @@ class Team:
             api_call (list): Returns the organization team groups
         """
 
-        if id != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}/groups",
-            )
-
-            if isinstance(api_call, list) is False or api_call == list():
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no team_id defined.")
-            raise ValueError
+        return Api.check_the_api_call_type(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_external_groups_request(id)
+            ),
+            list,
+        )
 
     def add_external_group(
         self,
@@ -453,33 +380,22 @@ class Team:
             None
         """
 
-        if id != 0 and team_group is not None and len(team_group) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}/groups",
-                RequestsMethods.POST,
-                json.dumps(dict({"groupId": team_group})),
+        Team._check_the_external_group_response(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_external_group_addition_request(id, team_group),
                 response_status_code=True,
-            )
-
-            status_code: int = api_call.get("status")
-
-            external_group_status_dict: dict = dict(
+            ),
+            "Group added to Team",
+            dict(
                 {
                     400: "Group is already added to this team.",
                     401: "Unauthorized.",
                     403: "Permission denied.",
                     404: "Team not found.",
                 }
-            )
-
-            if status_code == 200 and api_call.get("message") == "Group added to Team":
-                logging.info("You successfully added the team group.")
-            elif 400 <= status_code <= 404:
-                logging.error(external_group_status_dict.get(status_code))
-                raise Exception
-        else:
-            logging.error("There is no id or team group defined.")
-            raise ValueError
+            ),
+            "You successfully added the team group.",
+        )
 
     def remove_external_group(
         self,
@@ -504,28 +420,797 @@ class Team:
             None
         """
 
-        if id != 0 and team_group is not None and len(team_group) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.TEAMS.value}/{id}/groups??groupId={team_group.encode('UTF-8')}",
-                RequestsMethods.DELETE,
+        Team._check_the_external_group_response(
+            Api(self.grafana_api_model).call_the_api(
+                *Team._create_the_external_group_removal_request(id, team_group),
                 response_status_code=True,
-            )
-
-            status_code: int = api_call.get("status")
-
-            external_group_status_dict: dict = dict(
+            ),
+            "Team Group removed",
+            dict(
                 {
                     401: "Unauthorized.",
                     403: "Permission denied.",
                     404: "Team not found/Group not found.",
                 }
+            ),
+            "You successfully removed the team group.",
+        )
+
+    @staticmethod
+    def _create_the_team_search_request(
+        results_per_page: int, pages: int, query: str = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to search the organization teams
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer
+            pages (int): Specify the pages as integer
+            query (str): Specify the query (default None)
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        api_request_url: str = (
+            f"{APIEndpoints.TEAMS.value}/search?perpage={results_per_page}&page={pages}"
+        )
+
+        if query is not None and len(query) != 0:
+            api_request_url: str = f"{api_request_url}&query={query}"
+
+        return (api_request_url,)
+
+    @staticmethod
+    def _create_the_team_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to get the organization team specified by the id
+
+        Args:
+            id (int): Specify the id of the team
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return (f"{APIEndpoints.TEAMS.value}/{id}",)
+        else:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_team_creation_request(team: TeamObject) -> tuple:
+        """The method includes a functionality to create the request to add an organization team
+
+        Args:
+            team (TeamObject): Specify the team
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if team is not None:
+            return (
+                f"{APIEndpoints.TEAMS.value}",
+                RequestsMethods.POST,
+                dict({"name": team.name, "email": team.name}),
             )
+        else:
+            logging.error("There is no team defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_team_update_request(id: int, name: str, email: str) -> tuple:
+        """The method includes a functionality to create the request to update an organization team
+
+        Args:
+            id (int): Specify the team id
+            name (str): Specify the team name
+            email (str): Specify the team email
+
+        Raises:
+            ValueError: Missed specifying a necessary value
 
-            if status_code == 200 and api_call.get("message") == "Team Group removed":
-                logging.info("You successfully removed the team group.")
-            elif 400 <= status_code <= 404:
-                logging.error(external_group_status_dict.get(status_code))
-                raise Exception
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0 and len(name) != 0 and len(email) != 0:
+            return (
+                f"{APIEndpoints.TEAMS.value}/{id}",
+                RequestsMethods.PUT,
+                dict({"name": name, "email": email}),
+            )
         else:
-            logging.error("There is no id or team group defined.")
+            logging.error("There is no id, name or email defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_team_deletion_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to delete an organization team
+
+        Args:
+            id (int): Specify the team id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return f"{APIEndpoints.TEAMS.value}/{id}", RequestsMethods.DELETE
+        else:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_team_members_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to get the organization team users
+
+        Args:
+            id (int): Specify the team id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return (f"{APIEndpoints.TEAMS.value}/{id}/members",)
+        else:
+            logging.error("There is no id defined.")
             raise ValueError
+
+    @staticmethod
+    def _create_the_team_member_addition_request(id: int, user_id: int) -> tuple:
+        """The method includes a functionality to create the request to add an organization team user
+
+        Args:
+            id (int): Specify the team id
+            user_id (int): Specify the user id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0 and user_id != 0:
+            return (
+                f"{APIEndpoints.TEAMS.value}/{id}/members",
+                RequestsMethods.POST,
+                dict({"userId": user_id}),
+            )
+        else:
+            logging.error("There is no id or user_id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_team_member_removal_request(id: int, user_id: int) -> tuple:
+        """The method includes a functionality to create the request to delete an organization team user
+
+        Args:
+            id (int): Specify the team id
+            user_id (int): Specify the user id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0 and user_id != 0:
+            return (
+                f"{APIEndpoints.TEAMS.value}/{id}/members/{user_id}",
+                RequestsMethods.DELETE,
+            )
+        else:
+            logging.error("There is no id or user_id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_team_preferences_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to get the organization team preferences
+
+        Args:
+            id (int): Specify the team id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return (f"{APIEndpoints.TEAMS.value}/{id}/preferences",)
+        else:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_team_preferences_update_request(
+        id: int,
+        theme: str = None,
+        timezone: str = None,
+        home_dashboard_id: int = 0,
+        home_dashboard_uid: str = None,
+    ) -> tuple:
+        """The method includes a functionality to create the request to update the organization team preferences
+
+        Args:
+            id (int): Specify the team id
+            theme (str): Specify the team theme e.g. light or dark (default Grafana None)
+            timezone (str): Specify the team timezone e.g. utc or browser (default Grafana None)
+            home_dashboard_id (int): Specify the home team dashboard by id (default 0)
+            home_dashboard_uid (str): Specify the home team dashboard by uid (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0 and (
+            theme is not None
+            or (home_dashboard_id != 0 or home_dashboard_uid is not None)
+            or timezone is not None
+        ):
+            team_preferences: dict = dict()
+
+            if theme is not None:
+                team_preferences.update(dict({"theme": theme}))
+
+            if home_dashboard_id != 0 and isinstance(home_dashboard_id, int):
+                team_preferences.update(dict({"homeDashboardId": home_dashboard_id}))
+            else:
+                team_preferences.update({"homeDashboardUID": home_dashboard_uid})
+
+            if timezone is not None:
+                team_preferences.update(dict({"timezone": timezone}))
+
+            return (
+                f"{APIEndpoints.TEAMS.value}/{id}/preferences",
+                RequestsMethods.PUT,
+                team_preferences,
+            )
+        else:
+            logging.error(
+                "There is no id, theme, home_dashboard_id or timezone defined."
+            )
+            raise ValueError
+
+    @staticmethod
+    def _create_the_external_groups_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to get the team groups
+
+        Args:
+            id (int): Specify the team id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return (f"{APIEndpoints.TEAMS.value}/{id}/groups",)
+        else:
+            logging.error("There is no team_id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_external_group_addition_request(id: int, team_group: str) -> tuple:
+        """The method includes a functionality to create the request to add a group to the team
+
+        Args:
+            id (int): Specify the team id
+            team_group (str): Specify the team group
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0 and team_group is not None and len(team_group) != 0:
+            return (
+                f"{APIEndpoints.TEAMS.value}/{id}/groups",
+                RequestsMethods.POST,
+                dict({"groupId": team_group}),
+            )
+        else:
+            logging.error("There is no id or team group defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_external_group_removal_request(id: int, team_group: str) -> tuple:
+        """The method includes a functionality to create the request to remove a group from the team
+
+        Args:
+            id (int): Specify the team id
+            team_group (str): Specify the team group
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0 and team_group is not None and len(team_group) != 0:
+            return (
+                f"{APIEndpoints.TEAMS.value}/{id}/groups??groupId={team_group.encode('UTF-8')}",
+                RequestsMethods.DELETE,
+            )
+        else:
+            logging.error("There is no id or team group defined.")
+            raise ValueError
+
+    @staticmethod
+    def _check_the_external_group_response(
+        api_call: dict, message: str, status_messages: dict, info: str
+    ):
+        """The method includes a functionality to check the response of a team group modification
+
+        Args:
+            api_call (dict): Specify the result of the API call including the status code
+            message (str): Specify the expected message of a successful modification
+            status_messages (dict): Specify the error messages by the status code
+            info (str): Specify the message that is logged for a successful modification
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        status_code: int = api_call.get("status")
+
+        if status_code == 200 and api_call.get("message") == message:
+            logging.info(info)
+        elif 400 <= status_code <= 404:
+            logging.error(status_messages.get(status_code))
+            raise Exception
+
+
+class AsyncTeam:
+    """The class includes all necessary methods to access the Grafana team API endpoints asynchronously. Be aware that all functionalities inside the class only working with the corresponding access rights, please check the following page for details: https://grafana.com/docs/grafana/latest/http_api/team/#team-api & https://grafana.com/docs/grafana/latest/developers/http_api/team_sync/#team-sync-api
+
+    HINT: Note Grafana Enterprise API need required permissions if fine-grained access control is enabled
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    async def search_team(
+        self, results_per_page: int = 1000, pages: int = 1, query: str = None
+    ) -> dict:
+        """The method includes a functionality to get the organization teams specified by the optional pagination functionality
+
+        Required Permissions:
+            Action: teams:read
+            Scope: teams:*
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 1000)
+            pages (int): Specify the pages as integer (default 1)
+            query (str): Specify the query (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the organization teams
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_search_request(results_per_page, pages, query)
+            ),
+            "totalCount",
+        )
+
+    def iter_teams(
+        self, results_per_page: int = 1000, query: str = None, prefetch: bool = False
+    ) -> AsyncGenerator[dict, None]:
+        """The method includes a functionality to lazily iterate over all organization teams specified by the optional results_per_page and query. The pages are requested on demand
+
+        Required Permissions:
+            Action: teams:read
+            Scope: teams:*
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 1000)
+            query (str): Specify the query (default None)
+            prefetch (bool): Specify if the next page should be prefetched concurrently while the current page is consumed (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            teams (AsyncGenerator[dict, None]): Returns the organization teams
+        """
+
+        async def _get_page(page: int) -> tuple:
+            api_call: dict = await self.search_team(results_per_page, page, query)
+            return api_call.get("teams"), api_call.get("totalCount")
+
+        return AsyncApi.iterate_the_pages(_get_page, results_per_page, prefetch)
+
+    async def get_team_by_id(self, id: int) -> dict:
+        """The method includes a functionality to get the organization team specified by the id
+
+        Required Permissions:
+            Action: teams:read
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the id of the team
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the organization team
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_request(id)
+            ),
+            "id",
+        )
+
+    async def add_team(self, team: TeamObject) -> int:
+        """The method includes a functionality to add an organization team specified by the TeamObject
+
+        Required Permissions:
+            Action: teams:create
+            Scope: N/A
+
+        Args:
+            team (TeamObject): Specify the team
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+             team_id (int): Returns the team id
+        """
+
+        api_call: dict = Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_creation_request(team)
+            ),
+            "Team created",
+        )
+        return int(api_call.get("teamId"))
+
+    async def update_team(self, id: int, name: str, email: str):
+        """The method includes a functionality to update an organization team specified by the team_id, name and email
+
+        Required Permissions:
+            Action: teams:write
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+            name (str): Specify the team name
+            email (str): Specify the team email
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_update_request(id, name, email)
+            ),
+            "Team updated",
+            "You successfully updated the team.",
+        )
+
+    async def delete_team_by_id(self, id: int):
+        """The method includes a functionality to delete an organization team specified by the team_id
+
+        Required Permissions:
+            Action: teams:delete
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_deletion_request(id)
+            ),
+            "Team deleted",
+            "You successfully deleted the team.",
+        )
+
+    async def get_team_members(self, id: int) -> list:
+        """The method includes a functionality to get all organization team users specified by the team_id
+
+        Required Permissions:
+            Action: teams.permissions:read
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns the organization team members
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_members_request(id)
+            ),
+            "userId",
+        )
+
+    async def add_team_member(self, id: int, user_id: int):
+        """The method includes a functionality to add an organization team user specified by the team_id and the user_id
+
+        Required Permissions:
+            Action: teams.permissions:write
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+            user_id (int): Specify the user id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_member_addition_request(id, user_id)
+            ),
+            "Member added to Team",
+            "You successfully added a team member.",
+        )
+
+    async def delete_team_member(self, id: int, user_id: int):
+        """The method includes a functionality to delete an organization team user specified by the team_id and the user_id
+
+        Required Permissions:
+            Action: teams.permissions:write
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+            user_id (int): Specify the user id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_member_removal_request(id, user_id)
+            ),
+            "Team Member removed",
+            "You successfully removed a team member.",
+        )
+
+    async def get_team_preferences(self, id: int) -> dict:
+        """The method includes a functionality to get the organization team preferences specified by the team_id
+
+        Required Permissions:
+            Action: teams:read
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the organization team preferences
+        """
+
+        return Api.check_the_api_call_type(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_preferences_request(id)
+            ),
+            dict,
+        )
+
+    async def update_team_preferences(
+        self,
+        id: int,
+        theme: str = None,
+        timezone: str = None,
+        home_dashboard_id: int = 0,
+        home_dashboard_uid: str = None,
+    ):
+        """The method includes a functionality to update the organization team preferences specified by the team_id, theme, timezone and home_dashboard_id or home_dashboard_uid
+
+        Required Permissions:
+            Action: teams:write
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+            theme (str): Specify the team theme e.g. light or dark (default Grafana None)
+            timezone (str): Specify the team timezone e.g. utc or browser (default Grafana None)
+            home_dashboard_id (int): Specify the home team dashboard by id (default 0)
+            home_dashboard_uid (str): Specify the home team dashboard by uid (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_team_preferences_update_request(
+                    id, theme, timezone, home_dashboard_id, home_dashboard_uid
+                )
+            ),
+            "Preferences updated",
+            "You successfully updated the team preferences.",
+        )
+
+    async def get_external_groups(
+        self,
+        id: int,
+    ) -> list:
+        """The method includes a functionality to get the team groups specified by the team_id. The functionality is a Grafana ENTERPRISE feature
+
+        Required Permissions:
+            Action: teams.permissions:read
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns the organization team groups
+        """
+
+        return Api.check_the_api_call_type(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_external_groups_request(id)
+            ),
+            list,
+        )
+
+    async def add_external_group(
+        self,
+        id: int,
+        team_group: str,
+    ):
+        """The method includes a functionality to add a group to the team specified by the team_id and the team_group. The functionality is a Grafana ENTERPRISE feature
+
+        Required Permissions:
+            Action: teams.permissions:write
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+            team_group (str): Specify the team group
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Team._check_the_external_group_response(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_external_group_addition_request(id, team_group),
+                response_status_code=True,
+            ),
+            "Group added to Team",
+            dict(
+                {
+                    400: "Group is already added to this team.",
+                    401: "Unauthorized.",
+                    403: "Permission denied.",
+                    404: "Team not found.",
+                }
+            ),
+            "You successfully added the team group.",
+        )
+
+    async def remove_external_group(
+        self,
+        id: int,
+        team_group: str,
+    ):
+        """The method includes a functionality to remove a group from a team specified by the team_id and the team_group. The functionality is a Grafana ENTERPRISE feature
+
+        Required Permissions:
+            Action: teams.permissions:write
+            Scope: teams:*
+
+        Args:
+            id (int): Specify the team id
+            team_group (str): Specify the team group
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Team._check_the_external_group_response(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *Team._create_the_external_group_removal_request(id, team_group),
+                response_status_code=True,
+            ),
+            "Team Group removed",
+            dict(
+                {
+                    401: "Unauthorized.",
+                    403: "Permission denied.",
+                    404: "Team not found/Group not found.",
+                }
+            ),
+            "You successfully removed the team group.",
+        )
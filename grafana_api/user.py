@@ -1,5 +1,5 @@
-import json
 import logging
+from typing import AsyncGenerator, Generator
 
 from .model import (
     APIModel,
@@ -7,7 +7,7 @@ from .model import (
     RequestsMethods,
     UserObject,
 )
-from .api import Api
+from .api import Api, AsyncApi
 
 
 class User:
@@ -49,23 +49,13 @@ class User:
             api_call (list): Returns the list of Grafana users
         """
 
-        api_request_url: str = (
-            f"{APIEndpoints.USERS.value}?perpage={results_per_page}&page={page}"
-        )
-
-        if sort is not None and len(sort) != 0:
-            api_request_url: str = f"{api_request_url}&sort={sort}"
-
-        api_call: list = Api(self.grafana_api_model).call_the_api(
-            api_request_url,
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *User._create_the_users_request(results_per_page, page, sort)
+            ),
+            "id",
         )
 
-        if api_call == list() or api_call[0].get("id") is None:
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
-
     def search_users_with_paging(
         self,
         results_per_page: int = 1000,
@@ -92,25 +82,49 @@ class User:
             api_call (dict): Returns the Grafana users
         """
 
-        api_request_url: str = (
-            f"{APIEndpoints.USERS.value}/search?perpage={results_per_page}&page={page}"
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *User._create_the_user_search_request(
+                    results_per_page, page, query, sort
+                )
+            ),
+            "users",
         )
 
-        if query is not None and len(query) != 0:
-            api_request_url: str = f"{api_request_url}&query={query}"
+    def iter_users(
+        self,
+        results_per_page: int = 1000,
+        query: str = None,
+        sort: str = None,
+        prefetch: bool = False,
+    ) -> Generator[dict, None, None]:
+        """The method includes a functionality to lazily iterate over all Grafana system users specified by the optional results_per_page, query and sort option. The pages are requested on demand
 
-        if sort is not None and len(sort) != 0:
-            api_request_url: str = f"{api_request_url}&sort={sort}"
+        Required Permissions:
+            Action: users:read
+            Scope: global.users:*
 
-        api_call: dict = Api(self.grafana_api_model).call_the_api(
-            api_request_url,
-        )
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 1000)
+            query (str): Specify the query (default None)
+            sort (str): Specify the sort option. Valid values are login-asc, login-desc, email-asc, email-desc, name-asc, name-desc, lastSeenAtAge-asc and lastSeenAtAge-desc (default None)
+            prefetch (bool): Specify if the next page should be prefetched concurrently while the current page is consumed (default False)
 
-        if api_call == dict() or api_call.get("users") is None:
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            users (Generator[dict, None, None]): Returns the Grafana users
+        """
+
+        def _get_page(page: int) -> tuple:
+            api_call: dict = self.search_users_with_paging(
+                results_per_page, page, query, sort
+            )
+            return api_call.get("users"), api_call.get("totalCount")
+
+        return Api.iterate_the_pages(_get_page, results_per_page, prefetch)
 
     def get_user_by_id(self, id: int) -> dict:
         """The method includes a functionality to get a specific user by the id
@@ -130,19 +144,12 @@ class User:
             api_call (dict): Returns the user information
         """
 
-        if id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.USERS.value}/{id}",
-            )
-
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no id defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *User._create_the_user_request(id)
+            ),
+            "id",
+        )
 
     def get_user_by_username_or_email(self, username_or_email: str) -> dict:
         """The method includes a functionality to get a specific user by the username_or_email
@@ -162,19 +169,12 @@ class User:
             api_call (dict): Returns the user information
         """
 
-        if len(username_or_email) != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.USERS.value}/lookup?loginOrEmail={username_or_email}",
-            )
-
-            if api_call == dict() or api_call.get("id") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no username_or_email defined.")
-            raise ValueError
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                *User._create_the_user_lookup_request(username_or_email)
+            ),
+            "id",
+        )
 
     def update_user(self, id: int, user: UserObject):
         """The method includes a functionality to update the specified user
@@ -195,30 +195,13 @@ class User:
             None
         """
 
-        if id != 0 and user is not None:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.USERS.value}/{id}",
-                RequestsMethods.PUT,
-                json.dumps(
-                    dict(
-                        {
-                            "email": user.email,
-                            "name": user.name,
-                            "login": user.login,
-                            "theme": user.theme,
-                        }
-                    )
-                ),
-            )
-
-            if api_call.get("message") != "User updated":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully modified the user.")
-        else:
-            logging.error("There is no id or user defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *User._create_the_user_update_request(id, user)
+            ),
+            "User updated",
+            "You successfully modified the user.",
+        )
 
     def get_user_organizations(self, id: int) -> list:
         """The method includes a functionality to get the specified user organizations
@@ -238,19 +221,12 @@ class User:
             api_call (list): Returns a list of the user bound organizations
         """
 
-        if id != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.USERS.value}/{id}/orgs",
-            )
-
-            if api_call == list() or api_call[0].get("orgId") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no id defined.")
-            raise ValueError
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *User._create_the_user_organizations_request(id)
+            ),
+            "orgId",
+        )
 
     def get_user_teams(self, id: int) -> list:
         """The method includes a functionality to get the specified user teams
@@ -270,19 +246,13 @@ class User:
             api_call (list): Returns a list of the user bound teams
         """
 
-        if id != 0:
-            api_call: list = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.USERS.value}/{id}/teams",
-            )
-
-            if api_call != list() and api_call[0].get("id") is None:
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                return api_call
-        else:
-            logging.error("There is no id defined.")
-            raise ValueError
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                *User._create_the_user_teams_request(id)
+            ),
+            "id",
+            allow_empty=True,
+        )
 
     def switch_specific_user_context(self, user_id: int, org_id: int):
         """The method includes a functionality to switch the user context to the given organization
@@ -299,18 +269,201 @@ class User:
             None
         """
 
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *User._create_the_user_context_request(user_id, org_id)
+            ),
+            "Active organization changed",
+            "You successfully updated active organization.",
+        )
+
+    @staticmethod
+    def _create_the_users_request(
+        results_per_page: int, page: int, sort: str = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to get the Grafana system users
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer
+            page (int): Specify the page as integer
+            sort (str): Specify the sort option (default None)
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        api_request_url: str = (
+            f"{APIEndpoints.USERS.value}?perpage={results_per_page}&page={page}"
+        )
+
+        if sort is not None and len(sort) != 0:
+            api_request_url: str = f"{api_request_url}&sort={sort}"
+
+        return (api_request_url,)
+
+    @staticmethod
+    def _create_the_user_search_request(
+        results_per_page: int, page: int, query: str = None, sort: str = None
+    ) -> tuple:
+        """The method includes a functionality to create the request to search the Grafana system users
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer
+            page (int): Specify the page as integer
+            query (str): Specify the query (default None)
+            sort (str): Specify the sort option (default None)
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        api_request_url: str = (
+            f"{APIEndpoints.USERS.value}/search?perpage={results_per_page}&page={page}"
+        )
+
+        if query is not None and len(query) != 0:
+            api_request_url: str = f"{api_request_url}&query={query}"
+
+        if sort is not None and len(sort) != 0:
+            api_request_url: str = f"{api_request_url}&sort={sort}"
+
+        return (api_request_url,)
+
+    @staticmethod
+    def _create_the_user_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to get the user specified by the user id
+
+        Args:
+            id (int): Specify the id of the user
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return (f"{APIEndpoints.USERS.value}/{id}",)
+        else:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_user_lookup_request(username_or_email: str) -> tuple:
+        """The method includes a functionality to create the request to get the user specified by the username or the email
+
+        Args:
+            username_or_email (str): Specify the username or the email of the user
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if len(username_or_email) != 0:
+            return (
+                f"{APIEndpoints.USERS.value}/lookup?loginOrEmail={username_or_email}",
+            )
+        else:
+            logging.error("There is no username_or_email defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_user_update_request(id: int, user: UserObject) -> tuple:
+        """The method includes a functionality to create the request to update the user
+
+        Args:
+            id (int): Specify the id of the user
+            user (UserObject): Specify the user object
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0 and user is not None:
+            return (
+                f"{APIEndpoints.USERS.value}/{id}",
+                RequestsMethods.PUT,
+                dict(
+                    {
+                        "email": user.email,
+                        "name": user.name,
+                        "login": user.login,
+                        "theme": user.theme,
+                    }
+                ),
+            )
+        else:
+            logging.error("There is no id or user defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_user_organizations_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to get the organizations of the user
+
+        Args:
+            id (int): Specify the id of the user
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return (f"{APIEndpoints.USERS.value}/{id}/orgs",)
+        else:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_user_teams_request(id: int) -> tuple:
+        """The method includes a functionality to create the request to get the teams of the user
+
+        Args:
+            id (int): Specify the id of the user
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if id != 0:
+            return (f"{APIEndpoints.USERS.value}/{id}/teams",)
+        else:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_user_context_request(user_id: int, org_id: int) -> tuple:
+        """The method includes a functionality to create the request to switch the organization of the user
+
+        Args:
+            user_id (int): Specify the id of the user
+            org_id (int): Specify the id of the organization
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
         if user_id != 0 and org_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
+            return (
                 f"{APIEndpoints.USERS.value}/{user_id}/using/{org_id}",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
-
-            if api_call.get("message") != "Active organization changed":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully updated active organization.")
         else:
             logging.error("There is no user_id or org_id defined.")
             raise ValueError
@@ -339,16 +492,13 @@ class CurrentUser:
             api_call (dict): Returns the user information
         """
 
-        api_call: dict = Api(self.grafana_api_model).call_the_api(
-            f"{APIEndpoints.USER.value}",
+        return Api.check_the_api_call(
+            Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.USER.value}",
+            ),
+            "id",
         )
 
-        if api_call == dict() or api_call.get("id") is None:
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
-
     def update_password(
         self, old_password: str, new_password: str, confirm_new_password: str
     ):
@@ -367,33 +517,15 @@ class CurrentUser:
             None
         """
 
-        if (
-            len(old_password) != 0
-            and len(new_password) != 0
-            and len(confirm_new_password) != 0
-        ):
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.USER.value}/password",
-                RequestsMethods.PUT,
-                json.dumps(
-                    dict(
-                        {
-                            "oldPassword": old_password,
-                            "newPassword": new_password,
-                            "confirmNew": confirm_new_password,
-                        }
-                    )
-                ),
-            )
-
-            if api_call.get("message") != "User password changed":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully updated the user password.")
-        else:
-            logging.error("There is no id defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *CurrentUser._create_the_password_update_request(
+                    old_password, new_password, confirm_new_password
+                )
+            ),
+            "User password changed",
+            "You successfully updated the user password.",
+        )
 
     def switch_current_user_context(self, org_id: int):
         """The method includes a functionality to switch the current user context to the given organization
@@ -409,21 +541,13 @@ class CurrentUser:
             None
         """
 
-        if org_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.USER.value}/using/{org_id}",
-                RequestsMethods.POST,
-                json.dumps(dict()),
-            )
-
-            if api_call.get("message") != "Active organization changed":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully updated active organization.")
-        else:
-            logging.error("There is no org_id defined.")
-            raise ValueError
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *CurrentUser._create_the_user_context_request(org_id)
+            ),
+            "Active organization changed",
+            "You successfully updated active organization.",
+        )
 
     def get_user_organizations(self) -> list:
         """The method includes a functionality to get the current user organizations
@@ -435,16 +559,13 @@ class CurrentUser:
             api_call (list): Returns a list of organizations
         """
 
-        api_call: list = Api(self.grafana_api_model).call_the_api(
-            f"{APIEndpoints.USER.value}/orgs",
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.USER.value}/orgs",
+            ),
+            "orgId",
         )
 
-        if api_call == list() or api_call[0].get("orgId") is None:
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
-
     def get_user_teams(self) -> list:
         """The method includes a functionality to get the current user teams
 
@@ -455,16 +576,14 @@ class CurrentUser:
             api_call (list): Returns a list of teams
         """
 
-        api_call: list = Api(self.grafana_api_model).call_the_api(
-            f"{APIEndpoints.USER.value}/teams",
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.USER.value}/teams",
+            ),
+            "id",
+            allow_empty=True,
         )
 
-        if api_call != list() and api_call[0].get("id") is None:
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
-
     def star_a_dashboard(self, dashboard_id: int = 0, dashboard_uid: str | None = None):
         """The method includes a functionality to star a dashboard for the current user
 
@@ -480,26 +599,17 @@ class CurrentUser:
             None
         """
 
-        if dashboard_uid is not None or dashboard_id != 0:
-            if dashboard_uid is not None:
-                endpoint = f"{APIEndpoints.USER.value}/stars/dashboard/uid/{dashboard_uid}"
-            else:
-                endpoint = f"{APIEndpoints.USER.value}/stars/dashboard/{dashboard_id}"
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                endpoint,
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                CurrentUser._create_the_dashboard_star_endpoint(
+                    dashboard_id, dashboard_uid
+                ),
                 RequestsMethods.POST,
-                json.dumps(dict()),
-            )
-
-            if api_call.get("message") != "Dashboard starred!":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully starred the corresponding dashboard.")
-        else:
-            logging.error("There is no dashboard_id or dashboard_uid defined.")
-            raise ValueError
+                dict(),
+            ),
+            "Dashboard starred!",
+            "You successfully starred the corresponding dashboard.",
+        )
 
     def unstar_a_dashboard(self, dashboard_id: int = 0, dashboard_uid: str | None = None):
         """The method includes a functionality to unstar a dashboard for the current user.
@@ -519,25 +629,16 @@ class CurrentUser:
             None
         """
 
-        if dashboard_uid is not None or dashboard_id != 0:
-            if dashboard_uid is not None:
-                endpoint = f"{APIEndpoints.USER.value}/stars/dashboard/uid/{dashboard_uid}"
-            else:
-                endpoint = f"{APIEndpoints.USER.value}/stars/dashboard/{dashboard_id}"
-
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                endpoint,
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                CurrentUser._create_the_dashboard_star_endpoint(
+                    dashboard_id, dashboard_uid
+                ),
                 RequestsMethods.DELETE,
-            )
-
-            if api_call.get("message") != "Dashboard unstarred":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully unstarred the corresponding dashboard.")
-        else:
-            logging.error("There is no dashboard_id or dashboard_uid defined.")
-            raise ValueError
+            ),
+            "Dashboard unstarred",
+            "You successfully unstarred the corresponding dashboard.",
+        )
 
     def get_auth_tokens(self) -> list:
         """The method includes a functionality to get the auth tokens for the current user
@@ -549,16 +650,13 @@ class CurrentUser:
             api_call (list): Returns a list of auth tokens of the current user
         """
 
-        api_call: list = Api(self.grafana_api_model).call_the_api(
-            f"{APIEndpoints.USER.value}/auth-tokens",
+        return Api.check_the_api_call_items(
+            Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.USER.value}/auth-tokens",
+            ),
+            "id",
         )
 
-        if api_call == list() or api_call[0].get("id") is None:
-            logging.error(f"Check the error: {api_call}.")
-            raise Exception
-        else:
-            return api_call
-
     def revoke_auth_token(self, auth_token_id: int):
         """The method includes a functionality to revoke a specified auth token of the current user
 
@@ -573,18 +671,600 @@ class CurrentUser:
             None
         """
 
-        if auth_token_id != 0:
-            api_call: dict = Api(self.grafana_api_model).call_the_api(
-                f"{APIEndpoints.USER.value}/revoke-auth-token",
-                RequestsMethods.POST,
-                json.dumps(dict({"authTokenId": auth_token_id})),
-            )
+        Api.check_the_api_call_message(
+            Api(self.grafana_api_model).call_the_api(
+                *CurrentUser._create_the_auth_token_revocation_request(auth_token_id)
+            ),
+            "User auth token revoked",
+            "You successfully revoked the corresponding token.",
+        )
 
-            if api_call.get("message") != "User auth token revoked":
-                logging.error(f"Check the error: {api_call}.")
-                raise Exception
-            else:
-                logging.info("You successfully revoked the corresponding token.")
-        else:
-            logging.error("There is no auth_token_id defined.")
-            raise ValueError
+    @staticmethod
+    def _create_the_password_update_request(
+        old_password: str, new_password: str, confirm_new_password: str
+    ) -> tuple:
+        """The method includes a functionality to create the request to update the password of the current user
+
+        Args:
+            old_password (str): Specify the old password
+            new_password (str): Specify the new password
+            confirm_new_password (str): Specify the new password for confirmation
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if (
+            len(old_password) != 0
+            and len(new_password) != 0
+            and len(confirm_new_password) != 0
+        ):
+            return (
+                f"{APIEndpoints.USER.value}/password",
+                RequestsMethods.PUT,
+                dict(
+                    {
+                        "oldPassword": old_password,
+                        "newPassword": new_password,
+                        "confirmNew": confirm_new_password,
+                    }
+                ),
+            )
+        else:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_user_context_request(org_id: int) -> tuple:
+        """The method includes a functionality to create the request to switch the organization of the current user
+
+        Args:
+            org_id (int): Specify the id of the organization
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if org_id != 0:
+            return (
+                f"{APIEndpoints.USER.value}/using/{org_id}",
+                RequestsMethods.POST,
+                dict(),
+            )
+        else:
+            logging.error("There is no org_id defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_dashboard_star_endpoint(
+        dashboard_id: int = 0, dashboard_uid: str | None = None
+    ) -> str:
+        """The method includes a functionality to create the endpoint to star or to unstar a dashboard specified by the dashboard uid or the dashboard id
+
+        Args:
+            dashboard_id (int): Specify the dashboard id (default 0)
+            dashboard_uid (str | None): Specify the dashboard uid (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            endpoint (str): Returns the endpoint of the dashboard star
+        """
+
+        if dashboard_uid is not None:
+            return f"{APIEndpoints.USER.value}/stars/dashboard/uid/{dashboard_uid}"
+        elif dashboard_id != 0:
+            return f"{APIEndpoints.USER.value}/stars/dashboard/{dashboard_id}"
+        else:
+            logging.error("There is no dashboard_id or dashboard_uid defined.")
+            raise ValueError
+
+    @staticmethod
+    def _create_the_auth_token_revocation_request(auth_token_id: int) -> tuple:
+        """The method includes a functionality to create the request to revoke an auth token of the current user
+
+        Args:
+            auth_token_id (int): Specify the id of the auth token
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            request (tuple): Returns the arguments of the API call
+        """
+
+        if auth_token_id != 0:
+            return (
+                f"{APIEndpoints.USER.value}/revoke-auth-token",
+                RequestsMethods.POST,
+                dict({"authTokenId": auth_token_id}),
+            )
+        else:
+            logging.error("There is no auth_token_id defined.")
+            raise ValueError
+
+
+class AsyncUser:
+    """The class includes all necessary methods to access the Grafana user API endpoints asynchronously. Be aware that all functionalities inside the class only working with basic authentication (username and password) and that the authenticated user is a Grafana Admin.
+
+    HINT: Note Grafana Enterprise API need required permissions if fine-grained access control is enabled
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    async def search_users(
+        self,
+        results_per_page: int = 1000,
+        page: int = 1,
+        sort: str = None,
+    ) -> list:
+        """The method includes a functionality to get all Grafana system users specified by the optional results_per_page, page and sort option
+
+        Required Permissions:
+            Action: users:read
+            Scope: global.users:*
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 1000)
+            page (int): Specify the page as integer (default 1)
+            sort (str): Specify the sort option. Valid values are login-asc, login-desc, email-asc, email-desc, name-asc, name-desc, lastSeenAtAge-asc and lastSeenAtAge-desc. By default, if sort is not specified, the user list will be ordered by login, email in ascending order (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns the list of Grafana users
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *User._create_the_users_request(results_per_page, page, sort)
+            ),
+            "id",
+        )
+
+    async def search_users_with_paging(
+        self,
+        results_per_page: int = 1000,
+        page: int = 1,
+        query: str = None,
+        sort: str = None,
+    ) -> dict:
+        """The method includes a functionality to get all Grafana system users specified by the optional results_per_page, page, query, sort and general paging functionality
+
+        Required Permissions:
+            Action: users:read
+            Scope: global.users:*
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 1000)
+            page (int): Specify the page as integer (default 1)
+            query (str): Specify the query (default None)
+            sort (str): Specify the sort option. Valid values are login-asc, login-desc, email-asc, email-desc, name-asc, name-desc, lastSeenAtAge-asc and lastSeenAtAge-desc. By default, if sort is not specified, the user list will be ordered by login, email in ascending order (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the Grafana users
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *User._create_the_user_search_request(
+                    results_per_page, page, query, sort
+                )
+            ),
+            "users",
+        )
+
+    def iter_users(
+        self,
+        results_per_page: int = 1000,
+        query: str = None,
+        sort: str = None,
+        prefetch: bool = False,
+    ) -> AsyncGenerator[dict, None]:
+        """The method includes a functionality to lazily iterate over all Grafana system users specified by the optional results_per_page, query and sort option. The pages are requested on demand
+
+        Required Permissions:
+            Action: users:read
+            Scope: global.users:*
+
+        Args:
+            results_per_page (int): Specify the results_per_page as integer (default 1000)
+            query (str): Specify the query (default None)
+            sort (str): Specify the sort option. Valid values are login-asc, login-desc, email-asc, email-desc, name-asc, name-desc, lastSeenAtAge-asc and lastSeenAtAge-desc (default None)
+            prefetch (bool): Specify if the next page should be prefetched concurrently while the current page is consumed (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            users (AsyncGenerator[dict, None]): Returns the Grafana users
+        """
+
+        async def _get_page(page: int) -> tuple:
+            api_call: dict = await self.search_users_with_paging(
+                results_per_page, page, query, sort
+            )
+            return api_call.get("users"), api_call.get("totalCount")
+
+        return AsyncApi.iterate_the_pages(_get_page, results_per_page, prefetch)
+
+    async def get_user_by_id(self, id: int) -> dict:
+        """The method includes a functionality to get a specific user by the id
+
+        Required Permissions:
+            Action: users:read
+            Scope: users:*
+
+        Args:
+            id (int): Specify the id of the user
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the user information
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *User._create_the_user_request(id)
+            ),
+            "id",
+        )
+
+    async def get_user_by_username_or_email(self, username_or_email: str) -> dict:
+        """The method includes a functionality to get a specific user by the username_or_email
+
+        Required Permissions:
+            Action: users:read
+            Scope: global.users:*
+
+        Args:
+            username_or_email (str): Specify the username_or_email of the user
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the user information
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *User._create_the_user_lookup_request(username_or_email)
+            ),
+            "id",
+        )
+
+    async def update_user(self, id: int, user: UserObject):
+        """The method includes a functionality to update the specified user
+
+        Required Permissions:
+            Action: users:write
+            Scope: users:*
+
+        Args:
+            id (int): Specify the id of the user
+            user (UserObject): Specify the used UserObject
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *User._create_the_user_update_request(id, user)
+            ),
+            "User updated",
+            "You successfully modified the user.",
+        )
+
+    async def get_user_organizations(self, id: int) -> list:
+        """The method includes a functionality to get the specified user organizations
+
+        Required Permissions:
+            Action: users:read
+            Scope: users:*
+
+        Args:
+            id (int): Specify the id of the user
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns a list of the user bound organizations
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *User._create_the_user_organizations_request(id)
+            ),
+            "orgId",
+        )
+
+    async def get_user_teams(self, id: int) -> list:
+        """The method includes a functionality to get the specified user teams
+
+        Required Permissions:
+            Action: users.teams:read
+            Scope: users:*
+
+        Args:
+            id (int): Specify the id of the user
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns a list of the user bound teams
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *User._create_the_user_teams_request(id)
+            ),
+            "id",
+            allow_empty=True,
+        )
+
+    async def switch_specific_user_context(self, user_id: int, org_id: int):
+        """The method includes a functionality to switch the user context to the given organization
+
+        Args:
+            user_id (int): Specify the user_id
+            org_id (int): Specify the org_id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *User._create_the_user_context_request(user_id, org_id)
+            ),
+            "Active organization changed",
+            "You successfully updated active organization.",
+        )
+
+
+class AsyncCurrentUser:
+    """The class includes all necessary methods to access the Grafana current user API endpoints asynchronously. Be aware that all functionalities inside the class maybe only working with basic authentication (username and password)
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    async def get_user(self) -> dict:
+        """The method includes a functionality to get the current user
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (dict): Returns the user information
+        """
+
+        return Api.check_the_api_call(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.USER.value}",
+            ),
+            "id",
+        )
+
+    async def update_password(
+        self, old_password: str, new_password: str, confirm_new_password: str
+    ):
+        """The method includes a functionality to update the current user password
+
+        Args:
+            old_password (str): Specify the old_password
+            new_password (str): Specify the new_password
+            confirm_new_password (str): Specify the confirm_new_password
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *CurrentUser._create_the_password_update_request(
+                    old_password, new_password, confirm_new_password
+                )
+            ),
+            "User password changed",
+            "You successfully updated the user password.",
+        )
+
+    async def switch_current_user_context(self, org_id: int):
+        """The method includes a functionality to switch the current user context to the given organization
+
+        Args:
+            org_id (int): Specify the organization id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *CurrentUser._create_the_user_context_request(org_id)
+            ),
+            "Active organization changed",
+            "You successfully updated active organization.",
+        )
+
+    async def get_user_organizations(self) -> list:
+        """The method includes a functionality to get the current user organizations
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns a list of organizations
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.USER.value}/orgs",
+            ),
+            "orgId",
+        )
+
+    async def get_user_teams(self) -> list:
+        """The method includes a functionality to get the current user teams
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns a list of teams
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.USER.value}/teams",
+            ),
+            "id",
+            allow_empty=True,
+        )
+
+    async def star_a_dashboard(self, dashboard_id: int = 0, dashboard_uid: str | None = None):
+        """The method includes a functionality to star a dashboard for the current user
+
+        Args:
+            dashboard_id (int): Specify the dashboard id (default 0)
+            dashboard_uid (str): Specify the dashboard uid (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                CurrentUser._create_the_dashboard_star_endpoint(
+                    dashboard_id, dashboard_uid
+                ),
+                RequestsMethods.POST,
+                dict(),
+            ),
+            "Dashboard starred!",
+            "You successfully starred the corresponding dashboard.",
+        )
+
+    async def unstar_a_dashboard(self, dashboard_id: int = 0, dashboard_uid: str | None = None):
+        """The method includes a functionality to unstar a dashboard for the current user.
+        Prefers the UID-based endpoint (Grafana 10+) when dashboard_uid is provided,
+        otherwise falls back to the legacy ID-based endpoint for backward compatibility.
+        At least one of dashboard_id (non-zero) or dashboard_uid must be supplied.
+
+        Args:
+            dashboard_id (int): Specify the dashboard id (default 0)
+            dashboard_uid (str): Specify the dashboard id (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                CurrentUser._create_the_dashboard_star_endpoint(
+                    dashboard_id, dashboard_uid
+                ),
+                RequestsMethods.DELETE,
+            ),
+            "Dashboard unstarred",
+            "You successfully unstarred the corresponding dashboard.",
+        )
+
+    async def get_auth_tokens(self) -> list:
+        """The method includes a functionality to get the auth tokens for the current user
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (list): Returns a list of auth tokens of the current user
+        """
+
+        return Api.check_the_api_call_items(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.USER.value}/auth-tokens",
+            ),
+            "id",
+        )
+
+    async def revoke_auth_token(self, auth_token_id: int):
+        """The method includes a functionality to revoke a specified auth token of the current user
+
+        Args:
+            auth_token_id (int): Specify the auth_token_id
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        Api.check_the_api_call_message(
+            await AsyncApi(self.grafana_api_model).call_the_api(
+                *CurrentUser._create_the_auth_token_revocation_request(auth_token_id)
+            ),
+            "User auth token revoked",
+            "You successfully revoked the corresponding token.",
+        )
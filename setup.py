@@ -30,6 +30,9 @@ setuptools.setup(
     install_requires=["httpx"],
     extras_require={
         "http2": ["httpx[http2]"],
+        "orjson": ["orjson"],
+        "numpy": ["numpy"],
+        "pandas": ["pandas"],
     },
     tests_require=["pytest-httpx", "pytest"],
     python_requires=">=3.8",
@@ -587,6 +587,43 @@ class AlertingTestCase(TestCase):
         with self.assertRaises(ValueError):
             alerting.get_prometheus_rules("")
 
+    @patch("grafana_api.api.Api.iterate_the_json_items")
+    def test_iter_prometheus_rule_groups(self, iterate_the_json_items_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        alerting: Alerting = Alerting(grafana_api_model=model)
+
+        iterate_the_json_items_mock.return_value = iter([{"name": "test"}])
+
+        self.assertEqual(
+            [{"name": "test"}], list(alerting.iter_prometheus_rule_groups())
+        )
+        iterate_the_json_items_mock.assert_called_once_with(
+            "/api/prometheus/grafana/api/v1/rules", ("data", "groups")
+        )
+
+    def test_iter_prometheus_rule_groups_no_recipient(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        alerting: Alerting = Alerting(grafana_api_model=model)
+
+        with self.assertRaises(ValueError):
+            list(alerting.iter_prometheus_rule_groups(""))
+
+    @patch("grafana_api.api.Api.iterate_the_json_items")
+    def test_iter_ruler_rules(self, iterate_the_json_items_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        alerting: Alerting = Alerting(grafana_api_model=model)
+
+        iterate_the_json_items_mock.return_value = iter([("test", [])])
+
+        self.assertEqual([("test", [])], list(alerting.iter_ruler_rules()))
+
+    def test_iter_ruler_rules_no_recipient(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        alerting: Alerting = Alerting(grafana_api_model=model)
+
+        with self.assertRaises(ValueError):
+            list(alerting.iter_ruler_rules(""))
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_prometheus_rules_no_rules_available(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
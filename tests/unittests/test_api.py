@@ -1,18 +1,40 @@
-from httpx import ConnectError, UnsupportedProtocol
+import asyncio
+import io
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+from httpx import ConnectError, ReadTimeout, UnsupportedProtocol
 
 import pytest
 from pytest_httpx import HTTPXMock
 from unittest import TestCase
-from unittest.mock import MagicMock, patch, Mock
-
-from grafana_api.model import APIModel, RequestsMethods
-from grafana_api.api import Api
+from unittest.mock import MagicMock, patch, Mock, AsyncMock
+
+from grafana_api.model import (
+    APIModel,
+    RequestsMethods,
+    JSONCodec,
+    ResponseCache,
+    RetryPolicy,
+    RateLimiter,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    CircuitState,
+    RequestHook,
+    MetricsCollector,
+)
+from grafana_api.api import Api, AsyncApi, BatchExecutor, JSONStreamParser
 
 
 class ApiTestCase(TestCase):
     model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
     api: Api = Api(grafana_api_model=model)
 
+    def tearDown(self):
+        self.model.close()
+
     def test_call_the_api_non_method(self):
         with self.assertRaises(Exception):
             self.api.call_the_api(api_call=MagicMock(), method=None)
@@ -28,7 +50,7 @@ class ApiTestCase(TestCase):
         )
         api: Api = Api(grafana_api_model=model)
 
-        httpx_client_mock.return_value.request.return_value.text = '{"status": 200}'
+        httpx_client_mock.return_value.request.return_value.content = b'{"status": 200}'
 
         self.assertEqual(
             200,
@@ -45,8 +67,8 @@ class ApiTestCase(TestCase):
         )
         api: Api = Api(grafana_api_model=model)
 
-        httpx_client_mock.return_value.request.return_value.text = (
-            '{"status": "success"}'
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
         )
 
         self.assertEqual(
@@ -64,13 +86,44 @@ class ApiTestCase(TestCase):
                     "Accept": "application/json",
                 }
             ),
-            httpx_client_mock.call_args[1]["headers"],
+            httpx_client_mock.return_value.request.call_args[1]["headers"],
+        )
+        self.assertEqual(dict({"X-Custom-Header": "custom_value"}), model.headers)
+
+    @patch("httpx.Client")
+    def test_call_the_api_reuse_http_client(self, httpx_client_mock):
+        model: APIModel = APIModel(host="https://test.test.de", token="test")
+        api: Api = Api(grafana_api_model=model)
+
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
+        )
+
+        api.call_the_api(api_call="/test")
+        Api(grafana_api_model=model).call_the_api(api_call="/test")
+
+        httpx_client_mock.assert_called_once()
+        self.assertEqual(2, httpx_client_mock.return_value.request.call_count)
+
+    @patch("httpx.Client")
+    def test_call_the_api_org_id_header(self, httpx_client_mock):
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
+        )
+
+        self.api.call_the_api(api_call=MagicMock(), org_id_header=1)
+
+        self.assertEqual(
+            "1",
+            httpx_client_mock.return_value.request.call_args[1]["headers"][
+                "X-Grafana-Org-Id"
+            ],
         )
 
     @patch("httpx.Client")
     def test_call_the_api_org_id(self, httpx_client_mock):
-        httpx_client_mock.return_value.request.return_value.text = (
-            '{"status": "success"}'
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
         )
 
         self.assertEqual(
@@ -80,8 +133,8 @@ class ApiTestCase(TestCase):
 
     @patch("httpx.Client")
     def test_call_the_api_disable_provenance(self, httpx_client_mock):
-        httpx_client_mock.return_value.request.return_value.text = (
-            '{"status": "success"}'
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
         )
 
         self.assertEqual(
@@ -93,8 +146,8 @@ class ApiTestCase(TestCase):
 
     @patch("httpx.Client")
     def test_call_the_api_get_valid(self, httpx_client_mock):
-        httpx_client_mock.return_value.request.return_value.text = (
-            '{"status": "success"}'
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
         )
 
         self.assertEqual(
@@ -108,8 +161,8 @@ class ApiTestCase(TestCase):
 
     @patch("httpx.Client")
     def test_call_the_api_put_valid(self, httpx_client_mock):
-        httpx_client_mock.return_value.request.return_value.text = (
-            '{"status": "success"}'
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
         )
 
         self.assertEqual(
@@ -121,14 +174,36 @@ class ApiTestCase(TestCase):
             )["status"],
         )
 
+    @patch("httpx.Client")
+    def test_call_the_api_post_serialize_json_complete(self, httpx_client_mock):
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
+        )
+
+        self.api.call_the_api(
+            api_call=MagicMock(),
+            method=RequestsMethods.POST,
+            json_complete=dict({"test": "test"}),
+        )
+
+        self.assertEqual(
+            dict({"test": "test"}),
+            self.model.json_codec.loads(
+                httpx_client_mock.return_value.request.call_args[1]["content"]
+            ),
+        )
+        self.assertIsInstance(
+            httpx_client_mock.return_value.request.call_args[1]["content"], bytes
+        )
+
     def test_call_the_api_put_not_valid(self):
         with self.assertRaises(Exception):
             self.api.call_the_api(api_call=MagicMock(), method=RequestsMethods.PUT)
 
     @patch("httpx.Client")
     def test_call_the_api_post_valid(self, httpx_client_mock):
-        httpx_client_mock.return_value.request.return_value.text = (
-            '{"status": "success"}'
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
         )
 
         self.assertEqual(
@@ -154,8 +229,8 @@ class ApiTestCase(TestCase):
 
     @patch("httpx.Client")
     def test_call_the_api_patch_valid(self, httpx_client_mock):
-        httpx_client_mock.return_value.request.return_value.text = (
-            '{"status": "success"}'
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"status": "success"}'
         )
 
         self.assertEqual(
@@ -181,8 +256,8 @@ class ApiTestCase(TestCase):
 
     @patch("httpx.Client")
     def test_call_the_api_delete_valid(self, httpx_client_mock):
-        httpx_client_mock.return_value.request.return_value.text = (
-            '{"message": "Deletion successful"}'
+        httpx_client_mock.return_value.request.return_value.content = (
+            b'{"message": "Deletion successful"}'
         )
 
         self.assertEqual(
@@ -198,7 +273,7 @@ class ApiTestCase(TestCase):
 
     def test_check_the_api_call_response(self):
         mock: Mock = Mock()
-        mock.text = '{"test": "test"}'
+        mock.content = b'{"test": "test"}'
 
         self.assertEqual(
             dict({"test": "test"}),
@@ -207,7 +282,7 @@ class ApiTestCase(TestCase):
 
     def test_check_the_api_call_response_no_error_message(self):
         mock: Mock = Mock()
-        mock.text = '{"message": "test"}'
+        mock.content = b'{"message": "test"}'
 
         self.assertEqual(
             dict({"message": "test"}),
@@ -216,6 +291,7 @@ class ApiTestCase(TestCase):
 
     def test_check_the_api_call_response_no_json_response_value(self):
         mock: Mock = Mock()
+        mock.content = b"test"
         mock.text = "test"
 
         self.assertEqual(
@@ -224,27 +300,20 @@ class ApiTestCase(TestCase):
 
     def test_check_the_api_call_response_exception(self):
         mock: Mock = Mock()
-        mock.text = '{"message": "invalid API key"}'
+        mock.content = b'{"message": "invalid API key"}'
 
         with self.assertRaises(ConnectError):
             self.api._check_the_api_call_response(response=mock)
 
-    @patch("grafana_api.api.Api._check_if_valid_json")
-    def test_check_the_api_call_response_valid_json(self, check_if_valid_json_mock):
-        check_if_valid_json_mock.return_value = True
-
+    def test_check_the_api_call_response_valid_json(self):
         mock: Mock = Mock()
-        mock.text = "{}"
+        mock.content = b"{}"
 
         self.assertEqual({}, self.api._check_the_api_call_response(response=mock))
 
-    @patch("grafana_api.api.Api._check_if_valid_json")
-    def test_check_the_api_call_response_no_valid_json_status_code_result(
-        self, check_if_valid_json_mock
-    ):
-        check_if_valid_json_mock.return_value = False
-
+    def test_check_the_api_call_response_no_valid_json_status_code_result(self):
         mock: Mock = Mock()
+        mock.content = b""
         mock.text = ""
         mock.status_code = 200
 
@@ -257,7 +326,7 @@ class ApiTestCase(TestCase):
 
     def test_check_the_api_call_response_return_status_code_dict(self):
         mock: Mock = Mock()
-        mock.text = '{"test": "test"}'
+        mock.content = b'{"test": "test"}'
         mock.status_code = 200
 
         self.assertEqual(
@@ -269,7 +338,7 @@ class ApiTestCase(TestCase):
 
     def test_check_the_api_call_response_return_status_code_list(self):
         mock: Mock = Mock()
-        mock.text = '[{"test": "test"}, {"test": "test"}]'
+        mock.content = b'[{"test": "test"}, {"test": "test"}]'
         mock.status_code = 200
 
         self.assertEqual(
@@ -282,12 +351,240 @@ class ApiTestCase(TestCase):
     def test_check_if_valid_json_null(self):
         self.assertEqual(False, self.api._check_if_valid_json("null"))
 
+    def test_decode_the_json(self):
+        self.assertEqual(
+            (True, dict({"test": "test"})), self.api._decode_the_json(b'{"test": "test"}')
+        )
+
+    def test_decode_the_json_no_valid_json(self):
+        self.assertEqual((False, None), self.api._decode_the_json(b""))
+        self.assertEqual((False, None), self.api._decode_the_json(b'""\n'))
+        self.assertEqual((False, None), self.api._decode_the_json(b"test"))
+
+    def test_check_the_api_call_response_single_decode(self):
+        json_loads_mock: MagicMock = MagicMock(return_value=dict({"message": "test"}))
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), json_codec=JSONCodec(loads=json_loads_mock)
+        )
+
+        mock: Mock = Mock()
+        mock.content = b'{"message": "test"}'
+        mock.status_code = 200
+
+        self.assertEqual(
+            dict({"message": "test", "status": 200}),
+            Api(model)._check_the_api_call_response(
+                response=mock, response_status_code=True
+            ),
+        )
+        json_loads_mock.assert_called_once_with(b'{"message": "test"}')
+
+    def test_iterate_the_pages(self):
+        pages: dict = dict({1: [1, 2], 2: [3, 4], 3: [5]})
+
+        self.assertEqual(
+            [1, 2, 3, 4, 5],
+            list(self.api.iterate_the_pages(lambda page: (pages[page], None), 2)),
+        )
+
+    def test_iterate_the_pages_total_count(self):
+        get_page_mock: MagicMock = MagicMock(
+            side_effect=[([1, 2], 4), ([3, 4], 4), ([], 4)]
+        )
+
+        self.assertEqual(
+            [1, 2, 3, 4],
+            list(self.api.iterate_the_pages(get_page_mock, 2, prefetch=True)),
+        )
+        self.assertEqual(2, get_page_mock.call_count)
+
+    def test_iterate_the_pages_no_valid_results_per_page(self):
+        with self.assertRaises(ValueError):
+            list(self.api.iterate_the_pages(MagicMock(), 0))
+
+    def test_iterate_the_pages_async(self):
+        pages: dict = dict({1: [1, 2], 2: [3, 4], 3: []})
+
+        async def _get_page(page: int) -> tuple:
+            return pages[page], None
+
+        async def _get_items(prefetch: bool):
+            return [
+                item
+                async for item in AsyncApi.iterate_the_pages(
+                    _get_page, 2, prefetch=prefetch
+                )
+            ]
+
+        self.assertEqual([1, 2, 3, 4], asyncio.run(_get_items(False)))
+        self.assertEqual([1, 2, 3, 4], asyncio.run(_get_items(True)))
+
     def test_prepare_api_string(self):
         self.assertEqual("test&", self.api.prepare_api_string("test"))
 
     def test_prepare_api_string_no_real_value(self):
         self.assertEqual("", self.api.prepare_api_string(""))
 
+    def test_check_the_api_call(self):
+        self.assertEqual({"id": 1}, Api.check_the_api_call({"id": 1}, "id"))
+
+    def test_check_the_api_call_error(self):
+        with self.assertRaises(Exception):
+            Api.check_the_api_call({"message": "error"}, "id")
+
+    def test_check_the_api_call_empty(self):
+        with self.assertRaises(Exception):
+            Api.check_the_api_call(dict(), "id")
+
+    def test_check_the_api_call_type(self):
+        self.assertEqual([{"id": 1}], Api.check_the_api_call_type([{"id": 1}], list))
+
+    def test_check_the_api_call_type_error(self):
+        with self.assertRaises(Exception):
+            Api.check_the_api_call_type({"id": 1}, list)
+
+    def test_check_the_api_call_type_empty(self):
+        with self.assertRaises(Exception):
+            Api.check_the_api_call_type(dict(), dict)
+
+    def test_check_the_api_call_items(self):
+        self.assertEqual([{"id": 1}], Api.check_the_api_call_items([{"id": 1}], "id"))
+
+    def test_check_the_api_call_items_error(self):
+        with self.assertRaises(Exception):
+            Api.check_the_api_call_items([{"message": "error"}], "id")
+
+    def test_check_the_api_call_items_empty(self):
+        with self.assertRaises(Exception):
+            Api.check_the_api_call_items(list(), "id")
+
+    def test_check_the_api_call_items_allow_empty(self):
+        self.assertEqual(
+            list(), Api.check_the_api_call_items(list(), "id", allow_empty=True)
+        )
+
+    def test_check_the_api_call_message(self):
+        self.assertEqual(
+            {"message": "Team updated"},
+            Api.check_the_api_call_message({"message": "Team updated"}, "Team updated"),
+        )
+
+    def test_check_the_api_call_message_list(self):
+        self.assertEqual(
+            {"message": "Folder deleted"},
+            Api.check_the_api_call_message(
+                {"message": "Folder deleted"}, ["Test deleted", "Folder deleted"]
+            ),
+        )
+
+    def test_check_the_api_call_message_error(self):
+        with self.assertRaises(Exception):
+            Api.check_the_api_call_message({"message": "error"}, "Team updated")
+
+    def test_get_the_http_api_client(self):
+        model: APIModel = APIModel(host="https://test.test.de", token="test")
+        api: Api = Api(grafana_api_model=model)
+
+        http = api.get_the_http_api_client()
+
+        self.assertIs(http, Api(grafana_api_model=model).get_the_http_api_client())
+
+        model.close()
+
+        self.assertTrue(http.is_closed)
+        self.assertIsNone(model.http_client)
+        self.assertIsNot(http, api.get_the_http_api_client())
+        model.close()
+
+    def test_get_the_http_api_client_http2(self):
+        model: APIModel = APIModel(
+            host="https://test.test.de",
+            token="test",
+            http2_support=True,
+            http2_max_connections=2,
+            http2_max_concurrent_streams=50,
+        )
+
+        with model:
+            http = Api(grafana_api_model=model).get_the_http_api_client()
+
+            self.assertEqual(2, http._transport._pool._max_connections)
+            self.assertEqual(100, model.stream_semaphore._value)
+
+    def test_get_the_http_api_client_no_http2(self):
+        with APIModel(host="https://test.test.de", token="test", num_pools=3) as model:
+            http = Api(grafana_api_model=model).get_the_http_api_client()
+
+            self.assertEqual(3, http._transport._pool._max_connections)
+            self.assertIsNone(model.stream_semaphore)
+
+
+class BatchExecutorTestCase(TestCase):
+    model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_execute(self, call_the_api_mock):
+        batch_executor: BatchExecutor = BatchExecutor(self.model, max_workers=2)
+
+        call_the_api_mock.side_effect = lambda api_call, *args: dict({"uid": api_call})
+
+        results = batch_executor.execute(
+            [("test1",), ("test2", RequestsMethods.GET), ("test3",)]
+        )
+
+        self.assertEqual(
+            ["test1", "test2", "test3"], [result.result["uid"] for result in results]
+        )
+        self.assertEqual([None, None, None], [result.error for result in results])
+
+    def test_execute_callables(self):
+        batch_executor: BatchExecutor = BatchExecutor(self.model)
+
+        def _get_value(value: int) -> int:
+            if value == 2:
+                raise ValueError
+            return value
+
+        results = batch_executor.execute(
+            [(_get_value, 1), (_get_value, 2), lambda: _get_value(3)]
+        )
+
+        self.assertEqual([1, None, 3], [result.result for result in results])
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual((_get_value, 2), results[1].request)
+
+    def test_execute_no_requests(self):
+        self.assertEqual(list(), BatchExecutor(self.model).execute(list()))
+
+    def test_execute_no_valid_max_workers(self):
+        with self.assertRaises(ValueError):
+            BatchExecutor(self.model, max_workers=0).execute([("test",)])
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_execute_async(self, call_the_api_mock):
+        batch_executor: BatchExecutor = BatchExecutor(self.model, max_workers=1)
+
+        call_the_api_mock.side_effect = [dict({"uid": "test1"}), Exception]
+        async_function_mock: AsyncMock = AsyncMock(return_value="test3")
+
+        results = asyncio.run(
+            batch_executor.execute_async(
+                [("test1",), ("test2",), async_function_mock, (len, "test")]
+            )
+        )
+
+        self.assertEqual(
+            [dict({"uid": "test1"}), None, "test3", 4],
+            [result.result for result in results],
+        )
+        self.assertIsInstance(results[1].error, Exception)
+
+    def test_execute_async_no_valid_max_workers(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(
+                BatchExecutor(self.model, max_workers=0).execute_async([("test",)])
+            )
+
 
 def test_call_the_api_http2_no_valid_method():
     model: APIModel = APIModel(
@@ -424,3 +721,812 @@ def test_call_the_api_http2_delete(httpx_mock: HTTPXMock):
         api.call_the_api(method=RequestsMethods.DELETE, api_call="/test")["message"]
         == "Deletion successful"
     )
+
+
+def test_async_call_the_api_get(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    model: APIModel = APIModel(host="https://test.com", token="test")
+    api: AsyncApi = AsyncApi(model)
+
+    async def _execute_async_api_call():
+        async with model:
+            return await api.call_the_api(api_call="/test")
+
+    assert asyncio.run(_execute_async_api_call())["status"] == "success"
+    assert model.async_http_client is None
+
+
+def test_async_call_the_api_multiple_event_loops():
+    class _RequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            content: bytes = b'{"status": "success"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server: ThreadingHTTPServer = ThreadingHTTPServer(
+        ("127.0.0.1", 0), _RequestHandler
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        model: APIModel = APIModel(
+            host=f"http://127.0.0.1:{server.server_address[1]}", token="test"
+        )
+
+        for _ in range(2):
+            assert (
+                asyncio.run(AsyncApi(model).call_the_api(api_call="/test"))["status"]
+                == "success"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_async_get_the_http_api_client_multiple_event_loops():
+    model: APIModel = APIModel(
+        host="https://test.com", token="test", http2_support=True
+    )
+
+    async def _get_the_http_api_client():
+        return (
+            AsyncApi(model).get_the_http_api_client(),
+            AsyncApi(model).get_the_http_api_client(),
+            model.async_stream_semaphore,
+        )
+
+    client, same_client, semaphore = asyncio.run(_get_the_http_api_client())
+    next_client, _, next_semaphore = asyncio.run(_get_the_http_api_client())
+
+    assert client is same_client
+    assert client is not next_client
+    assert semaphore is not next_semaphore
+
+
+def test_async_call_the_api_multiple_event_loops_closes_the_stale_client(
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(text='{"status": "success"}', is_reusable=True)
+
+    model: APIModel = APIModel(host="https://test.com", token="test")
+
+    async def _call_the_api():
+        await AsyncApi(model).call_the_api(api_call="/test")
+        return model.async_http_client
+
+    client: httpx.AsyncClient = asyncio.run(_call_the_api())
+    next_client: httpx.AsyncClient = asyncio.run(_call_the_api())
+
+    assert client is not next_client
+    assert client.is_closed is True
+    assert next_client.is_closed is False
+    assert len(model.async_http_client_close_tasks) == 0
+
+
+def test_async_get_the_http_api_client_assigned_client():
+    model: APIModel = APIModel(host="https://test.com", token="test")
+    client: httpx.AsyncClient = httpx.AsyncClient()
+    model.async_http_client = client
+
+    async def _get_the_http_api_client():
+        return (
+            AsyncApi(model).get_the_http_api_client(),
+            AsyncApi(model).get_the_http_api_client(),
+        )
+
+    assert asyncio.run(_get_the_http_api_client()) == (client, client)
+    assert model.async_http_client_loop is not None
+
+
+def test_async_call_the_api_post(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    model: APIModel = APIModel(host="https://test.com", token="test")
+    api: AsyncApi = AsyncApi(model)
+
+    async def _execute_async_api_call():
+        async with model:
+            return await api.call_the_api(
+                method=RequestsMethods.POST,
+                api_call="/test",
+                json_complete='{"test": "test"}',
+                org_id_header=1,
+            )
+
+    assert asyncio.run(_execute_async_api_call())["status"] == "success"
+    assert httpx_mock.get_request().headers["X-Grafana-Org-Id"] == "1"
+
+
+def test_async_call_the_api_post_no_json_complete():
+    model: APIModel = APIModel(host="https://test.com", token="test")
+    api: AsyncApi = AsyncApi(model)
+
+    async def _execute_async_api_call():
+        async with model:
+            return await api.call_the_api(
+                method=RequestsMethods.POST, api_call="/test", json_complete=None
+            )
+
+    with pytest.raises(Exception):
+        asyncio.run(_execute_async_api_call())
+
+
+def test_async_call_the_api_concurrent_calls(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}', is_reusable=True)
+
+    model: APIModel = APIModel(host="https://test.com", token="test")
+    api: AsyncApi = AsyncApi(model)
+
+    async def _execute_async_api_calls():
+        async with model:
+            results = await asyncio.gather(
+                *[api.call_the_api(api_call=f"/test/{i}") for i in range(5)]
+            )
+            return results, api.get_the_http_api_client()
+
+    results, http = asyncio.run(_execute_async_api_calls())
+
+    assert [result["status"] for result in results] == ["success"] * 5
+    assert len(httpx_mock.get_requests()) == 5
+    assert http.is_closed
+
+
+def test_call_the_api_response_cache(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com", token="test", response_cache=ResponseCache()
+    ) as model:
+        api: Api = Api(model)
+
+        assert api.call_the_api(api_call="/test")["status"] == "success"
+        assert api.call_the_api(api_call="/test")["status"] == "success"
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_call_the_api_response_cache_org_id_header(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}', is_reusable=True)
+
+    with APIModel(
+        host="https://test.com", token="test", response_cache=ResponseCache()
+    ) as model:
+        api: Api = Api(model)
+
+        api.call_the_api(api_call="/test", org_id_header=1)
+        api.call_the_api(api_call="/test", org_id_header=2)
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_call_the_api_response_cache_etag_revalidation(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}', headers={"ETag": '"1"'})
+    httpx_mock.add_response(status_code=304)
+
+    with APIModel(
+        host="https://test.com", token="test", response_cache=ResponseCache(ttl=0)
+    ) as model:
+        api: Api = Api(model)
+
+        assert api.call_the_api(api_call="/test")["status"] == "success"
+        assert api.call_the_api(api_call="/test")["status"] == "success"
+
+    assert httpx_mock.get_requests()[1].headers["If-None-Match"] == '"1"'
+
+
+def test_call_the_api_response_cache_expired(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "old"}')
+    httpx_mock.add_response(text='{"status": "new"}')
+
+    with APIModel(
+        host="https://test.com", token="test", response_cache=ResponseCache(ttl=0)
+    ) as model:
+        api: Api = Api(model)
+
+        assert api.call_the_api(api_call="/test")["status"] == "old"
+        assert api.call_the_api(api_call="/test")["status"] == "new"
+
+    assert "If-None-Match" not in httpx_mock.get_requests()[1].headers
+
+
+def test_call_the_api_response_cache_cleared_by_modification(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}', is_reusable=True)
+
+    with APIModel(
+        host="https://test.com", token="test", response_cache=ResponseCache()
+    ) as model:
+        api: Api = Api(model)
+
+        api.call_the_api(api_call="/test")
+        api.call_the_api(
+            api_call="/test", method=RequestsMethods.POST, json_complete="{}"
+        )
+        api.call_the_api(api_call="/test")
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_call_the_api_response_cache_error_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=500, text='{"message": "error"}')
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com", token="test", response_cache=ResponseCache()
+    ) as model:
+        api: Api = Api(model)
+
+        assert api.call_the_api(api_call="/test")["message"] == "error"
+        assert api.call_the_api(api_call="/test")["status"] == "success"
+
+
+def test_async_call_the_api_response_cache(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        text='{"status": "success"}', headers={"Last-Modified": "test"}
+    )
+    httpx_mock.add_response(status_code=304)
+
+    model: APIModel = APIModel(
+        host="https://test.com", token="test", response_cache=ResponseCache(ttl=0)
+    )
+    api: AsyncApi = AsyncApi(model)
+
+    async def _execute_async_api_calls():
+        async with model:
+            return [await api.call_the_api(api_call="/test") for _ in range(2)]
+
+    assert [result["status"] for result in asyncio.run(_execute_async_api_calls())] == [
+        "success"
+    ] * 2
+    assert httpx_mock.get_requests()[1].headers["If-Modified-Since"] == "test"
+
+
+def test_call_the_api_retry_policy(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        retry_policy=RetryPolicy(backoff_factor=0),
+    ) as model:
+        assert Api(model).call_the_api(api_call="/test")["status"] == "success"
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@patch("time.sleep")
+def test_call_the_api_retry_policy_retry_after(sleep_mock, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "7"})
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com", token="test", retry_policy=RetryPolicy()
+    ) as model:
+        assert (
+            Api(model).call_the_api(
+                api_call="/test", method=RequestsMethods.POST, json_complete="{}"
+            )["status"]
+            == "success"
+        )
+
+    sleep_mock.assert_called_once_with(7.0)
+
+
+def test_call_the_api_retry_policy_non_idempotent_method(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503, text='{"message": "error"}')
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        retry_policy=RetryPolicy(backoff_factor=0),
+    ) as model:
+        assert (
+            Api(model).call_the_api(
+                api_call="/test", method=RequestsMethods.POST, json_complete="{}"
+            )["message"]
+            == "error"
+        )
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_call_the_api_retry_policy_max_retries(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=502, text='{"message": "error"}', is_reusable=True)
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        retry_policy=RetryPolicy(max_retries=2, backoff_factor=0),
+    ) as model:
+        assert Api(model).call_the_api(api_call="/test")["message"] == "error"
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_call_the_api_retry_policy_transport_error(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(ReadTimeout("Test"))
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        retry_policy=RetryPolicy(backoff_factor=0),
+    ) as model:
+        assert Api(model).call_the_api(api_call="/test")["status"] == "success"
+
+
+def test_call_the_api_no_retry_policy(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(ReadTimeout("Test"))
+
+    with APIModel(host="https://test.com", token="test") as model:
+        with pytest.raises(ReadTimeout):
+            Api(model).call_the_api(api_call="/test")
+
+
+def test_async_call_the_api_retry_policy(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=504)
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    model: APIModel = APIModel(
+        host="https://test.com",
+        token="test",
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+
+    async def _execute_async_api_call():
+        async with model:
+            return await AsyncApi(model).call_the_api(api_call="/test")
+
+    assert asyncio.run(_execute_async_api_call())["status"] == "success"
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@patch("time.sleep")
+def test_call_the_api_rate_limiter(sleep_mock, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}', is_reusable=True)
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        rate_limiter=RateLimiter(requests_per_second=1, burst=2),
+    ) as model:
+        for _ in range(3):
+            Api(model).call_the_api(api_call="/api/search")
+
+    sleep_mock.assert_called_once()
+
+
+def test_async_call_the_api_rate_limiter(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}', is_reusable=True)
+
+    model: APIModel = APIModel(
+        host="https://test.com",
+        token="test",
+        rate_limiter=RateLimiter(requests_per_second=1, burst=1),
+    )
+
+    async def _execute_async_api_calls():
+        async with model:
+            with patch("asyncio.sleep", new_callable=AsyncMock) as sleep_mock:
+                await asyncio.gather(
+                    *[AsyncApi(model).call_the_api(api_call="/test") for _ in range(2)]
+                )
+                return sleep_mock
+
+    asyncio.run(_execute_async_api_calls()).assert_awaited_once()
+
+
+def test_call_the_api_circuit_breaker(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(ConnectError("Test"))
+    httpx_mock.add_response(status_code=503, text='{"message": "error"}')
+
+    circuit_breaker: CircuitBreaker = CircuitBreaker(failure_threshold=2)
+
+    with APIModel(
+        host="https://test.com", token="test", circuit_breaker=circuit_breaker
+    ) as model:
+        with pytest.raises(ConnectError):
+            Api(model).call_the_api(api_call="/test")
+        Api(model).call_the_api(api_call="/test")
+
+        with pytest.raises(CircuitBreakerOpenError):
+            Api(model).call_the_api(api_call="/test")
+
+    assert circuit_breaker.get_the_state() == CircuitState.OPEN
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_call_the_api_circuit_breaker_half_open(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    circuit_breaker: CircuitBreaker = CircuitBreaker(
+        failure_threshold=1, recovery_timeout=0
+    )
+    circuit_breaker.record_failure()
+
+    with APIModel(
+        host="https://test.com", token="test", circuit_breaker=circuit_breaker
+    ) as model:
+        assert Api(model).call_the_api(api_call="/test")["status"] == "success"
+
+    assert circuit_breaker.get_the_state() == CircuitState.CLOSED
+
+
+def test_async_call_the_api_circuit_breaker(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(ConnectError("Test"))
+
+    circuit_breaker: CircuitBreaker = CircuitBreaker(failure_threshold=1)
+    model: APIModel = APIModel(
+        host="https://test.com", token="test", circuit_breaker=circuit_breaker
+    )
+
+    async def _execute_async_api_calls():
+        async with model:
+            with pytest.raises(ConnectError):
+                await AsyncApi(model).call_the_api(api_call="/test")
+            with pytest.raises(CircuitBreakerOpenError):
+                await AsyncApi(model).call_the_api(api_call="/test")
+
+    asyncio.run(_execute_async_api_calls())
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_call_the_api_request_hooks(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503, text='{"message": "error"}')
+    httpx_mock.add_exception(ConnectError("Test"))
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    request_hook: MagicMock = MagicMock(spec=RequestHook)
+    metrics_collector: MetricsCollector = MetricsCollector()
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        retry_policy=RetryPolicy(backoff_factor=0),
+        request_hooks=[request_hook, metrics_collector],
+    ) as model:
+        Api(model).call_the_api(
+            api_call="/api/folders/1",
+            method=RequestsMethods.PUT,
+            json_complete='{"test": "test"}',
+        )
+
+    assert request_hook.before_request.call_count == 3
+    assert request_hook.after_response.call_count == 2
+    assert request_hook.on_error.call_count == 1
+
+    metrics: dict = metrics_collector.get_the_metrics()["PUT /api/folders/{id}"]
+    assert metrics["requests"] == 3
+    assert metrics["errors"] == 1
+    assert metrics["retries"] == 2
+    assert metrics["request_bytes"] == 48
+    assert metrics["response_bytes"] == len('{"message": "error"}{"status": "success"}')
+    assert metrics["status_codes"] == {200: 1, 503: 1}
+    assert metrics["latency"]["buckets"]["+Inf"] == 3
+
+
+def test_call_the_api_request_hooks_error(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    request_hook: MagicMock = MagicMock(spec=RequestHook)
+    request_hook.after_response.side_effect = Exception("Test")
+
+    with APIModel(
+        host="https://test.com", token="test", request_hooks=[request_hook]
+    ) as model:
+        assert Api(model).call_the_api(api_call="/test")["status"] == "success"
+
+
+def test_async_call_the_api_request_hooks(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    metrics_collector: MetricsCollector = MetricsCollector()
+    model: APIModel = APIModel(
+        host="https://test.com", token="test", request_hooks=[metrics_collector]
+    )
+
+    async def _execute_async_api_calls():
+        async with model:
+            await AsyncApi(model).call_the_api(api_call="/api/search")
+
+    asyncio.run(_execute_async_api_calls())
+
+    assert metrics_collector.get_the_metrics()["GET /api/search"]["status_codes"] == {
+        200: 1
+    }
+
+
+def test_call_the_api_http2_max_concurrent_streams(httpx_mock: HTTPXMock):
+    lock: threading.Lock = threading.Lock()
+    concurrent_requests: list = [0, 0]
+
+    def _callback(request: httpx.Request) -> httpx.Response:
+        with lock:
+            concurrent_requests[0] += 1
+            concurrent_requests[1] = max(concurrent_requests)
+        time.sleep(0.02)
+        with lock:
+            concurrent_requests[0] -= 1
+        return httpx.Response(200, text='{"status": "success"}')
+
+    httpx_mock.add_callback(_callback, is_reusable=True)
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        http2_support=True,
+        http2_max_concurrent_streams=2,
+    ) as model:
+        batch_executor: BatchExecutor = BatchExecutor(model, max_workers=6)
+        results = batch_executor.execute([("/test",)] * 6)
+
+    assert [result.error for result in results] == [None] * 6
+    assert concurrent_requests[1] == 2
+
+
+def test_async_call_the_api_http2_max_concurrent_streams(httpx_mock: HTTPXMock):
+    concurrent_requests: list = [0, 0]
+
+    async def _callback(request: httpx.Request) -> httpx.Response:
+        concurrent_requests[0] += 1
+        concurrent_requests[1] = max(concurrent_requests)
+        await asyncio.sleep(0.02)
+        concurrent_requests[0] -= 1
+        return httpx.Response(200, text='{"status": "success"}')
+
+    httpx_mock.add_callback(_callback, is_reusable=True)
+
+    model: APIModel = APIModel(
+        host="https://test.com",
+        token="test",
+        http2_support=True,
+        http2_max_concurrent_streams=3,
+    )
+
+    async def _execute_async_api_calls():
+        async with model:
+            return await BatchExecutor(model).execute_async([("/test",)] * 9)
+
+    results = asyncio.run(_execute_async_api_calls())
+
+    assert [result.error for result in results] == [None] * 9
+    assert concurrent_requests[1] == 3
+    assert model.async_stream_semaphore is None
+
+
+class JSONStreamParserTestCase(TestCase):
+    def test_feed_array(self):
+        document: str = '[{"uid": "a", "tags": ["x", "y"]}, 1, "b\\"c", null, true]'
+
+        for chunk_size in (1, 2, 3, 7, len(document)):
+            json_stream_parser: JSONStreamParser = JSONStreamParser()
+            items: list = list()
+
+            for index in range(0, len(document), chunk_size):
+                items.extend(
+                    json_stream_parser.feed(document[index : index + chunk_size])
+                )
+            items.extend(json_stream_parser.close())
+
+            self.assertEqual(
+                [{"uid": "a", "tags": ["x", "y"]}, 1, 'b"c', None, True], items
+            )
+
+    def test_feed_path(self):
+        json_stream_parser: JSONStreamParser = JSONStreamParser(("data", "groups"))
+
+        items: list = json_stream_parser.feed(
+            '{"status": "success", "skip": {"groups": [1]}, "data": {"groups": [{"name": '
+        )
+        items.extend(json_stream_parser.feed('"test"}, {"name": "test2"}]}}'))
+        items.extend(json_stream_parser.close())
+
+        self.assertEqual([{"name": "test"}, {"name": "test2"}], items)
+
+    def test_feed_object(self):
+        json_stream_parser: JSONStreamParser = JSONStreamParser()
+
+        items: list = json_stream_parser.feed('{"a": [1], "b": {"c": 2}}')
+        items.extend(json_stream_parser.close())
+
+        self.assertEqual([("a", [1]), ("b", {"c": 2})], items)
+
+    def test_feed_json_loads(self):
+        json_stream_parser: JSONStreamParser = JSONStreamParser(
+            json_loads=lambda value: dict({"value": value})
+        )
+
+        items: list = json_stream_parser.feed('[{"a": 1}]')
+
+        self.assertEqual([{"value": '{"a": 1}'}], items)
+
+    def test_feed_path_not_found(self):
+        json_stream_parser: JSONStreamParser = JSONStreamParser(("data",))
+
+        with self.assertRaises(ValueError):
+            json_stream_parser.feed('{"status": "error"}')
+            json_stream_parser.close()
+
+    def test_feed_invalid_document(self):
+        json_stream_parser: JSONStreamParser = JSONStreamParser()
+
+        with self.assertRaises(ValueError):
+            json_stream_parser.feed('[1, }')
+
+    def test_close_incomplete_document(self):
+        json_stream_parser: JSONStreamParser = JSONStreamParser()
+        json_stream_parser.feed('[{"a": 1}, {"b"')
+
+        with self.assertRaises(ValueError):
+            json_stream_parser.close()
+
+
+def test_stream_the_api(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with Api(
+        APIModel(host="https://test.com", token="test")
+    ).stream_the_api("/test") as response:
+        assert response.is_stream_consumed is False
+        assert b"".join(response.iter_bytes()) == b'{"status": "success"}'
+
+    assert response.is_closed is True
+
+
+def test_stream_the_api_http2_max_concurrent_streams(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    model: APIModel = APIModel(
+        host="https://test.com",
+        token="test",
+        http2_support=True,
+        http2_max_connections=1,
+        http2_max_concurrent_streams=1,
+    )
+
+    with Api(model).stream_the_api("/test") as response:
+        assert model.stream_semaphore.acquire(blocking=False) is False
+        assert b"".join(response.iter_bytes()) == b'{"status": "success"}'
+
+    assert model.stream_semaphore.acquire(blocking=False) is True
+
+
+def test_stream_the_api_error(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=500, text='{"message": "error"}')
+
+    with pytest.raises(Exception):
+        with Api(APIModel(host="https://test.com", token="test")).stream_the_api(
+            "/test"
+        ):
+            pass
+
+
+def test_stream_the_api_invalid_api_key(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=401, text='{"message": "invalid API key"}')
+
+    with pytest.raises(ConnectError):
+        with Api(APIModel(host="https://test.com", token="test")).stream_the_api(
+            "/test"
+        ):
+            pass
+
+
+def test_stream_the_api_post_clears_the_response_cache(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+    model: APIModel = APIModel(
+        host="https://test.com", token="test", response_cache=ResponseCache()
+    )
+    model.response_cache.put(("test",), httpx.Response(200, text="{}"))
+
+    with Api(model).stream_the_api(
+        "/test", RequestsMethods.POST, dict({"test": "test"})
+    ):
+        pass
+
+    assert httpx_mock.get_request().content == b'{"test":"test"}'
+    assert model.response_cache.get(("test",)) is None
+
+
+def test_iterate_the_json_items(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"data": {"groups": [{"name": "test"}, 1]}}')
+
+    assert list(
+        Api(APIModel(host="https://test.com", token="test")).iterate_the_json_items(
+            "/test", ("data", "groups")
+        )
+    ) == [{"name": "test"}, 1]
+
+
+def test_iterate_the_lines(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text="test 1\ntest 2\n")
+
+    assert list(
+        Api(APIModel(host="https://test.com", token="test")).iterate_the_lines("/test")
+    ) == ["test 1", "test 2"]
+
+
+def test_write_the_api_response(httpx_mock: HTTPXMock, tmp_path):
+    httpx_mock.add_response(content=b"test" * 1000, is_reusable=True)
+    api: Api = Api(APIModel(host="https://test.com", token="test"))
+    buffer: io.BytesIO = io.BytesIO()
+
+    assert api.write_the_api_response("/test", str(tmp_path / "test")) == 4000
+    assert api.write_the_api_response("/test", buffer) == 4000
+    assert (tmp_path / "test").read_bytes() == buffer.getvalue() == b"test" * 1000
+
+
+def test_async_iterate_the_json_items(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='[{"uid": "a"}, {"uid": "b"}]')
+
+    async def _collect_the_items():
+        async with APIModel(host="https://test.com", token="test") as model:
+            return [
+                item async for item in AsyncApi(model).iterate_the_json_items("/test")
+            ]
+
+    assert asyncio.run(_collect_the_items()) == [{"uid": "a"}, {"uid": "b"}]
+
+
+def test_async_iterate_the_lines(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text="test 1\ntest 2\n")
+
+    async def _collect_the_lines():
+        async with APIModel(host="https://test.com", token="test") as model:
+            return [line async for line in AsyncApi(model).iterate_the_lines("/test")]
+
+    assert asyncio.run(_collect_the_lines()) == ["test 1", "test 2"]
+
+
+def test_async_write_the_api_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(content=b"test" * 1000)
+    buffer: io.BytesIO = io.BytesIO()
+
+    async def _write_the_api_response():
+        async with APIModel(host="https://test.com", token="test") as model:
+            return await AsyncApi(model).write_the_api_response("/test", buffer)
+
+    assert asyncio.run(_write_the_api_response()) == 4000
+    assert buffer.getvalue() == b"test" * 1000
+
+
+def test_async_stream_the_api_http2_max_concurrent_streams(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    model: APIModel = APIModel(
+        host="https://test.com",
+        token="test",
+        http2_support=True,
+        http2_max_connections=1,
+        http2_max_concurrent_streams=1,
+    )
+
+    async def _stream_the_api():
+        async with AsyncApi(model).stream_the_api("/test") as response:
+            locked: bool = model.async_stream_semaphore.locked()
+            content: bytes = b"".join([chunk async for chunk in response.aiter_bytes()])
+
+        return locked, content, model.async_stream_semaphore.locked()
+
+    assert asyncio.run(_stream_the_api()) == (True, b'{"status": "success"}', False)
+
+
+def test_async_stream_the_api_error(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=500, text='{"message": "error"}')
+
+    async def _stream_the_api():
+        async with APIModel(host="https://test.com", token="test") as model:
+            async with AsyncApi(model).stream_the_api("/test"):
+                pass
+
+    with pytest.raises(Exception):
+        asyncio.run(_stream_the_api())
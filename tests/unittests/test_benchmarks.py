@@ -0,0 +1,21 @@
+from unittest import TestCase
+
+from benchmarks.mock_grafana import MockGrafana, MockGrafanaScale
+from benchmarks.run import MOCK_GRAFANA_HOST, run_the_benchmarks
+
+
+class BenchmarksTestCase(TestCase):
+    def test_run_the_benchmarks(self):
+        app: MockGrafana = MockGrafana(
+            MockGrafanaScale(
+                folders=2, subfolders=1, folder_depth=2, dashboards=3, users=3, teams=2
+            )
+        )
+
+        results: list = run_the_benchmarks(MOCK_GRAFANA_HOST, app, 1, 0, 2, True)
+
+        self.assertIn(
+            "async_folder.get_folders.nested", [result.name for result in results]
+        )
+        self.assertTrue(all(result.iterations == 1 for result in results))
+        self.assertTrue(all(result.requests > 0 for result in results))
@@ -1,9 +1,9 @@
-import json
+import asyncio
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from grafana_api.model import APIModel
-from grafana_api.dashboard import Dashboard
+from grafana_api.model import APIModel, FolderIndex, DeployStatus, RequestsMethods
+from grafana_api.dashboard import Dashboard, AsyncDashboard
 
 
 class DashboardTestCase(TestCase):
@@ -71,7 +71,7 @@ class DashboardTestCase(TestCase):
             message="test",
         )
 
-        payload = json.loads(call_the_api_mock.call_args[0][2])
+        payload = call_the_api_mock.call_args[0][2]
         self.assertNotIn("folderUid", payload)
 
     @patch("grafana_api.api.Api.call_the_api")
@@ -888,3 +888,244 @@ class DashboardTestCase(TestCase):
 
         call_the_api_mock.return_value = dict({"status": 500})
         self.assertEqual(None, dashboard.delete_public_dashboard("test", "test"))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_deploy_many(self, folder_index_mock, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        folder_index: FolderIndex = FolderIndex()
+        folder_index.update(
+            [{"id": 12, "uid": "test-uid", "title": "test"}], dict(), 60
+        )
+        folder_index_mock.return_value = folder_index
+
+        deployed_dashboards: dict = dict(
+            {
+                "/api/dashboards/uid/unchanged": dict(
+                    {
+                        "dashboard": {"id": 1, "uid": "unchanged", "version": 3},
+                        "meta": {"folderUid": "test-uid"},
+                    }
+                ),
+                "/api/dashboards/uid/changed": dict(
+                    {
+                        "dashboard": {"id": 2, "uid": "changed", "title": "old"},
+                        "meta": {"folderUid": "test-uid"},
+                    }
+                ),
+                "/api/dashboards/uid/new": dict({"message": "Dashboard not found"}),
+            }
+        )
+
+        def call_the_api(api_call, method=None, json_complete=None):
+            if api_call == "/api/dashboards/db":
+                return dict(
+                    {"status": "success", "uid": json_complete["dashboard"]["uid"]}
+                )
+            return deployed_dashboards.get(api_call)
+
+        call_the_api_mock.side_effect = call_the_api
+
+        results = dashboard.deploy_many(
+            [
+                ("test", {"uid": "unchanged"}, "test"),
+                ("test", {"uid": "changed", "title": "new"}, "test"),
+                ("test", {"uid": "new"}, "test"),
+                ("unknown", {"uid": "unknown"}, "test"),
+                ("", {"uid": "invalid"}, "test"),
+            ],
+            max_workers=2,
+        )
+
+        self.assertEqual(
+            [
+                DeployStatus.SKIPPED,
+                DeployStatus.DEPLOYED,
+                DeployStatus.DEPLOYED,
+                DeployStatus.FAILED,
+                DeployStatus.FAILED,
+            ],
+            [result.status for result in results],
+        )
+        self.assertEqual(
+            ["unchanged", "changed", "new", "unknown", "invalid"],
+            [result.dashboard_uid for result in results],
+        )
+        self.assertIsInstance(results[4].error, ValueError)
+        self.assertEqual(5, call_the_api_mock.call_count)
+        folder_index_mock.assert_called_once()
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_deploy_many_no_skip_unchanged(self, folder_index_mock, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        folder_index: FolderIndex = FolderIndex()
+        folder_index.update(
+            [{"id": 12, "uid": "test-uid", "title": "test"}], dict(), 60
+        )
+        folder_index_mock.return_value = folder_index
+        call_the_api_mock.return_value = dict({"status": "success"})
+
+        results = dashboard.deploy_many(
+            [("test", {"uid": "test"}, "test")], overwrite=True, skip_unchanged=False
+        )
+
+        self.assertEqual(DeployStatus.DEPLOYED, results[0].status)
+        call_the_api_mock.assert_called_once_with(
+            "/api/dashboards/db",
+            RequestsMethods.POST,
+            {
+                "dashboard": {"uid": "test"},
+                "message": "test",
+                "overwrite": True,
+                "folderUid": "test-uid",
+            },
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_deploy_many_error_response(self, folder_index_mock, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        folder_index: FolderIndex = FolderIndex()
+        folder_index.update(
+            [{"id": 12, "uid": "test-uid", "title": "test"}], dict(), 60
+        )
+        folder_index_mock.return_value = folder_index
+        call_the_api_mock.side_effect = [
+            dict({"status": "error"}),
+            Exception("Test"),
+        ]
+
+        results = dashboard.deploy_many(
+            [("test", {"title": "test"}, "test"), ("test", {"title": "test"}, "test")],
+            max_workers=1,
+        )
+
+        self.assertEqual(
+            [DeployStatus.FAILED, DeployStatus.FAILED],
+            [result.status for result in results],
+        )
+        self.assertEqual(dict({"status": "error"}), results[0].result)
+
+    def test_calculate_dashboard_hash(self):
+        self.assertEqual(
+            Dashboard.calculate_dashboard_hash({"id": 1, "version": 2, "uid": "test", "title": "test"}),
+            Dashboard.calculate_dashboard_hash({"title": "test", "uid": "test"}),
+        )
+        self.assertNotEqual(
+            Dashboard.calculate_dashboard_hash({"uid": "test", "title": "test"}),
+            Dashboard.calculate_dashboard_hash({"uid": "test", "title": "test2"}),
+        )
+
+
+class AsyncDashboardTestCase(TestCase):
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    @patch("grafana_api.folder.AsyncFolder.get_folder_index")
+    def test_deploy_many(self, folder_index_mock, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: AsyncDashboard = AsyncDashboard(grafana_api_model=model)
+
+        folder_index: FolderIndex = FolderIndex()
+        folder_index.update(
+            [{"id": 12, "uid": "test-uid", "title": "test"}], dict(), 60
+        )
+        folder_index_mock.return_value = folder_index
+        call_the_api_mock.side_effect = [
+            dict(
+                {
+                    "dashboard": {"id": 1, "uid": "unchanged"},
+                    "meta": {"folderUid": "test-uid"},
+                }
+            ),
+            dict({"message": "Dashboard not found"}),
+            dict({"status": "success", "uid": "new"}),
+        ]
+
+        results = asyncio.run(
+            dashboard.deploy_many(
+                [
+                    ("test", {"uid": "unchanged"}, "test"),
+                    ("test", {"uid": "new"}, "test"),
+                ],
+                max_workers=1,
+            )
+        )
+
+        self.assertEqual(
+            [DeployStatus.SKIPPED, DeployStatus.DEPLOYED],
+            [result.status for result in results],
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    @patch("grafana_api.folder.AsyncFolder.get_folder_uid_by_dashboard_path")
+    def test_create_or_update_dashboard(
+        self, folder_uid_by_dashboard_path_mock, call_the_api_mock
+    ):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: AsyncDashboard = AsyncDashboard(grafana_api_model=model)
+
+        folder_uid_by_dashboard_path_mock.return_value = "test-uid"
+        call_the_api_mock.return_value = dict({"status": "success"})
+
+        self.assertEqual(
+            None,
+            asyncio.run(
+                dashboard.create_or_update_dashboard(
+                    dashboard_path="test",
+                    dashboard_json=dict({"test": "test"}),
+                    message="test",
+                )
+            ),
+        )
+        self.assertEqual(
+            "test-uid", call_the_api_mock.call_args[0][2]["folderUid"]
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_dashboard_by_uid(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: AsyncDashboard = AsyncDashboard(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"dashboard": "test"})
+
+        self.assertEqual(
+            dict({"dashboard": "test"}),
+            asyncio.run(dashboard.get_dashboard_by_uid("test")),
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_dashboard_by_uid_concurrently(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: AsyncDashboard = AsyncDashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            dict({"dashboard": "test1"}),
+            dict({"dashboard": "test2"}),
+        ]
+
+        async def _get_dashboards():
+            return await asyncio.gather(
+                dashboard.get_dashboard_by_uid("test1"),
+                dashboard.get_dashboard_by_uid("test2"),
+            )
+
+        self.assertEqual(
+            [dict({"dashboard": "test1"}), dict({"dashboard": "test2"})],
+            asyncio.run(_get_dashboards()),
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_dashboard_by_uid_error_response(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: AsyncDashboard = AsyncDashboard(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict()
+
+        with self.assertRaises(Exception):
+            asyncio.run(dashboard.get_dashboard_by_uid("test"))
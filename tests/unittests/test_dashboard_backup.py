@@ -0,0 +1,412 @@
+import os
+import json
+import tarfile
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from grafana_api.model import APIModel, ExportFormat, FolderIndex, DeployStatus
+from grafana_api.dashboard import Dashboard
+from grafana_api.dashboard_backup import DashboardBackup
+
+
+class DashboardBackupTestCase(TestCase):
+    def setUp(self):
+        self.model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        self.dashboard_backup: DashboardBackup = DashboardBackup(
+            grafana_api_model=self.model
+        )
+
+        self.folder_index: FolderIndex = FolderIndex()
+        self.folder_index.update(
+            [{"id": 0, "uid": "", "title": "General"}],
+            dict(
+                {
+                    "Root": {"id": 1, "uid": "root", "title": "Root"},
+                    "Root/Child": {"id": 2, "uid": "child", "title": "Child"},
+                }
+            ),
+            60,
+        )
+
+        self.dashboards: dict = dict(
+            {
+                "test-1": {
+                    "dashboard": {"uid": "test-1", "title": "Test 1"},
+                    "meta": {"folderUid": "child"},
+                },
+                "test-2": {
+                    "dashboard": {"uid": "test-2", "title": "Test 2"},
+                    "meta": {"folderUid": ""},
+                },
+                "test-3": {
+                    "dashboard": {"uid": "test-3", "title": "Test 3"},
+                    "meta": {"folderUid": "root"},
+                },
+            }
+        )
+
+    def call_the_api(self, api_call: str) -> any:
+        if api_call.startswith("/api/search"):
+            parameters: dict = dict(
+                parameter.split("=") for parameter in api_call.split("?")[1].split("&")
+            )
+            limit, page = int(parameters.get("limit")), int(parameters.get("page"))
+            return [
+                {"uid": uid}
+                for uid in list(self.dashboards.keys())[(page - 1) * limit : page * limit]
+            ]
+        return self.dashboards.get(api_call.split("/")[-1])
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_export_dashboards_directory(self, folder_index_mock, call_the_api_mock):
+        folder_index_mock.return_value = self.folder_index
+        call_the_api_mock.side_effect = self.call_the_api
+
+        with tempfile.TemporaryDirectory() as target_path:
+            self.assertEqual(
+                3,
+                self.dashboard_backup.export_dashboards(
+                    target_path, results_per_page=2
+                ),
+            )
+
+            with open(os.path.join(target_path, "Root", "Child", "test-1.json")) as file:
+                self.assertEqual(self.dashboards.get("test-1"), json.load(file))
+            self.assertTrue(
+                os.path.isfile(os.path.join(target_path, "General", "test-2.json"))
+            )
+            self.assertTrue(
+                os.path.isfile(os.path.join(target_path, "Root", "test-3.json"))
+            )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_export_dashboards_jsonl(self, folder_index_mock, call_the_api_mock):
+        folder_index_mock.return_value = self.folder_index
+        call_the_api_mock.side_effect = self.call_the_api
+
+        with tempfile.TemporaryDirectory() as target_directory:
+            target_path: str = os.path.join(target_directory, "dashboards.jsonl")
+
+            self.assertEqual(
+                3,
+                self.dashboard_backup.export_dashboards(
+                    target_path, ExportFormat.JSONL, results_per_page=2
+                ),
+            )
+
+            with open(target_path) as file:
+                self.assertEqual(
+                    ["test-1", "test-2", "test-3"],
+                    [json.loads(line)["dashboard"]["uid"] for line in file],
+                )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_export_dashboards_tar(self, folder_index_mock, call_the_api_mock):
+        folder_index_mock.return_value = self.folder_index
+        call_the_api_mock.side_effect = self.call_the_api
+
+        with tempfile.TemporaryDirectory() as target_directory:
+            target_path: str = os.path.join(target_directory, "dashboards.tar.gz")
+
+            self.assertEqual(
+                3,
+                self.dashboard_backup.export_dashboards(
+                    target_path, ExportFormat.TAR, results_per_page=2
+                ),
+            )
+
+            with tarfile.open(target_path) as archive:
+                self.assertEqual(
+                    [
+                        "Root/Child/test-1.json",
+                        "General/test-2.json",
+                        "Root/test-3.json",
+                    ],
+                    archive.getnames(),
+                )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_export_dashboards_full_last_page(
+        self, folder_index_mock, call_the_api_mock
+    ):
+        folder_index_mock.return_value = self.folder_index
+        call_the_api_mock.side_effect = self.call_the_api
+
+        with tempfile.TemporaryDirectory() as target_directory:
+            self.assertEqual(
+                3,
+                self.dashboard_backup.export_dashboards(
+                    os.path.join(target_directory, "dashboards.jsonl"),
+                    ExportFormat.JSONL,
+                    results_per_page=1,
+                ),
+            )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_export_dashboards_error_response(
+        self, folder_index_mock, call_the_api_mock
+    ):
+        folder_index_mock.return_value = self.folder_index
+        call_the_api_mock.side_effect = [[{"uid": "test-1"}], dict()]
+
+        with tempfile.TemporaryDirectory() as target_directory:
+            with self.assertRaises(Exception):
+                self.dashboard_backup.export_dashboards(
+                    os.path.join(target_directory, "dashboards.jsonl"),
+                    ExportFormat.JSONL,
+                )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_export_dashboards_search_error(
+        self, folder_index_mock, call_the_api_mock
+    ):
+        folder_index_mock.return_value = self.folder_index
+        call_the_api_mock.side_effect = [[{"uid": "test-1"}], Exception]
+
+        with tempfile.TemporaryDirectory() as target_directory:
+            with self.assertRaises(Exception):
+                self.dashboard_backup.export_dashboards(
+                    os.path.join(target_directory, "dashboards.jsonl"),
+                    ExportFormat.JSONL,
+                    results_per_page=1,
+                )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_export_dashboards_search_error_response(
+        self, folder_index_mock, call_the_api_mock
+    ):
+        folder_index_mock.return_value = self.folder_index
+        call_the_api_mock.return_value = dict({"message": "error"})
+
+        with tempfile.TemporaryDirectory() as target_directory:
+            with self.assertRaises(Exception):
+                self.dashboard_backup.export_dashboards(
+                    os.path.join(target_directory, "dashboards.jsonl"),
+                    ExportFormat.JSONL,
+                )
+
+    def test_export_dashboards_no_target_path(self):
+        with self.assertRaises(ValueError):
+            self.dashboard_backup.export_dashboards("")
+
+    def test_sanitize_the_path_segment(self):
+        self.assertEqual("a_b", DashboardBackup._sanitize_the_path_segment("a/b"))
+        self.assertEqual("_", DashboardBackup._sanitize_the_path_segment(".."))
+
+    def write_the_export(self, target_path: str):
+        for uid, folder_path in (("test-1", "Root/Child"), ("test-2", "General")):
+            os.makedirs(os.path.join(target_path, *folder_path.split("/")), exist_ok=True)
+            with open(
+                os.path.join(target_path, *folder_path.split("/"), f"{uid}.json"), "w"
+            ) as file:
+                json.dump(self.dashboards.get(uid), file)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_import_dashboards(self, folder_index_mock, call_the_api_mock):
+        folder_index_mock.return_value = self.folder_index
+        deployed_dashboards: dict = dict(
+            {
+                "/api/dashboards/uid/test-1": dict(
+                    {
+                        "dashboard": {"id": 1, "uid": "test-1", "title": "Test 1"},
+                        "meta": {"folderUid": "child", "version": 3},
+                    }
+                ),
+                "/api/dashboards/uid/test-2": dict({"message": "Dashboard not found"}),
+            }
+        )
+
+        def call_the_api(api_call, method=None, json_complete=None):
+            if api_call == "/api/dashboards/db":
+                return dict({"status": "success", "uid": "test-2", "version": 1})
+            return deployed_dashboards.get(api_call)
+
+        call_the_api_mock.side_effect = call_the_api
+
+        with tempfile.TemporaryDirectory() as target_path:
+            self.write_the_export(os.path.join(target_path, "export"))
+            manifest_path: str = os.path.join(target_path, "manifest.json")
+
+            results = self.dashboard_backup.import_dashboards(
+                os.path.join(target_path, "export"), manifest_path=manifest_path
+            )
+
+            self.assertEqual(
+                [DeployStatus.SKIPPED, DeployStatus.DEPLOYED],
+                [result.status for result in sorted(results, key=lambda result: result.dashboard_uid)],
+            )
+            self.assertEqual(
+                {"dashboard": {"uid": "test-2", "title": "Test 2"}, "message": "Imported dashboard", "overwrite": True, "folderUid": ""},
+                call_the_api_mock.call_args[0][2],
+            )
+
+            with open(manifest_path) as file:
+                manifest: dict = json.load(file)
+            self.assertEqual(3, manifest.get("test-1").get("version"))
+            self.assertEqual(1, manifest.get("test-2").get("version"))
+
+            call_the_api_mock.reset_mock()
+            results = self.dashboard_backup.import_dashboards(
+                os.path.join(target_path, "export"), manifest_path=manifest_path
+            )
+
+            self.assertEqual(
+                [DeployStatus.SKIPPED, DeployStatus.SKIPPED],
+                [result.status for result in results],
+            )
+            call_the_api_mock.assert_not_called()
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_import_dashboards_verify_versions(
+        self, folder_index_mock, call_the_api_mock
+    ):
+        folder_index_mock.return_value = self.folder_index
+
+        def call_the_api(api_call, method=None, json_complete=None):
+            if api_call == "/api/dashboards/db":
+                return dict({"status": "success", "uid": "test-1", "version": 5})
+            return dict(
+                {
+                    "dashboard": {"uid": "test-1", "title": "Changed"},
+                    "meta": {"folderUid": "child", "version": 4},
+                }
+            )
+
+        call_the_api_mock.side_effect = call_the_api
+
+        with tempfile.TemporaryDirectory() as target_path:
+            with open(os.path.join(target_path, "dashboards.jsonl"), "w") as file:
+                file.write(json.dumps(self.dashboards.get("test-1")) + "\n")
+
+            manifest_path: str = os.path.join(target_path, "manifest.json")
+            with open(manifest_path, "w") as file:
+                json.dump(
+                    {
+                        "test-1": {
+                            "hash": Dashboard.calculate_dashboard_hash(
+                                self.dashboards.get("test-1").get("dashboard")
+                            ),
+                            "version": 3,
+                        }
+                    },
+                    file,
+                )
+
+            results = self.dashboard_backup.import_dashboards(
+                os.path.join(target_path, "dashboards.jsonl"),
+                ExportFormat.JSONL,
+                manifest_path=manifest_path,
+                verify_versions=True,
+            )
+
+            self.assertEqual(DeployStatus.DEPLOYED, results[0].status)
+            self.assertEqual("Root/Child", results[0].dashboard_path)
+
+            with open(manifest_path) as file:
+                self.assertEqual(5, json.load(file).get("test-1").get("version"))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_import_dashboards_tar(self, folder_index_mock, call_the_api_mock):
+        folder_index_mock.return_value = self.folder_index
+        call_the_api_mock.side_effect = self.call_the_api
+
+        with tempfile.TemporaryDirectory() as target_path:
+            archive_path: str = os.path.join(target_path, "dashboards.tar")
+            self.dashboard_backup.export_dashboards(archive_path, ExportFormat.TAR)
+
+            results = self.dashboard_backup.import_dashboards(
+                archive_path, ExportFormat.TAR
+            )
+
+            self.assertEqual(
+                [DeployStatus.SKIPPED, DeployStatus.SKIPPED, DeployStatus.SKIPPED],
+                [result.status for result in results],
+            )
+            self.assertEqual(
+                ["Root/Child", "General", "Root"],
+                [result.dashboard_path for result in results],
+            )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_import_dashboards_missing_folders(
+        self, folder_index_mock, call_the_api_mock
+    ):
+        created_folder_index: FolderIndex = FolderIndex()
+        created_folder_index.update(
+            [{"id": 0, "uid": "", "title": "General"}],
+            dict(
+                {
+                    "Root": {"id": 1, "uid": "root", "title": "Root"},
+                    "Root/Child": {"id": 2, "uid": "child", "title": "Child"},
+                    "Root/New": {"id": 3, "uid": "new", "title": "New"},
+                    "Root/New/Nested": {"id": 4, "uid": "nested", "title": "Nested"},
+                }
+            ),
+            60,
+        )
+        folder_index_mock.side_effect = [self.folder_index, created_folder_index]
+
+        def call_the_api(api_call, method=None, json_complete=None):
+            if api_call == "/api/folders":
+                uid: str = json_complete.get("title").lower()
+                return dict({"id": 3, "uid": uid, "title": json_complete.get("title")})
+            elif api_call == "/api/dashboards/db":
+                return dict({"status": "success", "uid": "test-4", "version": 1})
+            return dict({"message": "Dashboard not found"})
+
+        call_the_api_mock.side_effect = call_the_api
+
+        with tempfile.TemporaryDirectory() as target_path:
+            self.write_the_export(target_path)
+            os.makedirs(os.path.join(target_path, "Root", "New", "Nested"))
+            with open(
+                os.path.join(target_path, "Root", "New", "Nested", "test-4.json"), "w"
+            ) as file:
+                json.dump(
+                    {
+                        "dashboard": {"uid": "test-4", "title": "Test 4"},
+                        "meta": {"folderUid": "nested"},
+                    },
+                    file,
+                )
+
+            results = self.dashboard_backup.import_dashboards(target_path)
+
+            self.assertEqual(
+                [DeployStatus.DEPLOYED] * 3, [result.status for result in results]
+            )
+            self.assertEqual(
+                [
+                    dict({"title": "New", "parentUid": "root"}),
+                    dict({"title": "Nested", "parentUid": "new"}),
+                ],
+                [
+                    call.args[2]
+                    for call in call_the_api_mock.call_args_list
+                    if call.args[0] == "/api/folders"
+                ],
+            )
+
+    def test_import_dashboards_no_source_path(self):
+        with self.assertRaises(ValueError):
+            self.dashboard_backup.import_dashboards("")
+
+    def test_get_the_dashboard(self):
+        self.assertEqual(
+            ("Root/Child", {"uid": "test", "title": "test"}),
+            DashboardBackup._get_the_dashboard(
+                {"id": 1, "uid": "test", "title": "test"}, "Root/Child", dict()
+            ),
+        )
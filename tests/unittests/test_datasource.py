@@ -1,3 +1,7 @@
+import array
+import asyncio
+import datetime
+import tempfile
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -6,9 +10,14 @@ from grafana_api.model import (
     DatasourceQuery,
     DatasourceCache,
     DatasourcePermission,
+    DataFrameDecoder,
+    BatchResult,
+    DatasourceQueryRequest,
+    QueryResultCache,
 )
 from grafana_api.datasource import (
     Datasource,
+    AsyncDatasource,
     DatasourcePermissions,
     DatasourceLegacyPermissions,
     DatasourceQueryResourceCaching,
@@ -107,6 +116,40 @@ class DatasourceTestCase(TestCase):
 
         self.assertEqual({"id": 1}, datasource.get_datasource_by_name("test"))
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_datasource_by_name_registered(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            list([{"id": 1, "uid": "test", "name": "test", "type": "prometheus"}]),
+            dict({"id": 1, "uid": "test", "name": "test", "jsonData": {}}),
+        ]
+
+        self.assertEqual(1, datasource.get_datasource_id_by_name("test"))
+        self.assertEqual(
+            {"id": 1, "uid": "test", "name": "test", "jsonData": {}},
+            datasource.get_datasource_by_name("test"),
+        )
+        self.assertEqual(1, datasource.get_datasource_id_by_name("test"))
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_datasource_id_by_name_registry_disabled(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), datasource_registry_ttl=0
+        )
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"id": 1})
+
+        self.assertEqual(1, datasource.get_datasource_id_by_name("test"))
+        self.assertEqual(1, datasource.get_datasource_id_by_name("test"))
+        self.assertEqual(2, call_the_api_mock.call_count)
+        self.assertEqual(
+            "/api/datasources/id/test", call_the_api_mock.call_args.args[0]
+        )
+
     def test_get_datasource_by_name_no_name(self):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         datasource: Datasource = Datasource(grafana_api_model=model)
@@ -129,7 +172,7 @@ class DatasourceTestCase(TestCase):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         datasource: Datasource = Datasource(grafana_api_model=model)
 
-        call_the_api_mock.return_value = dict({"id": 1})
+        call_the_api_mock.side_effect = [list(), dict({"id": 1})]
 
         self.assertEqual(1, datasource.get_datasource_id_by_name("test"))
 
@@ -145,11 +188,120 @@ class DatasourceTestCase(TestCase):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         datasource: Datasource = Datasource(grafana_api_model=model)
 
-        call_the_api_mock.return_value = dict()
+        call_the_api_mock.side_effect = [list(), dict()]
 
         with self.assertRaises(Exception):
             datasource.get_datasource_id_by_name("test")
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_datasource_registry(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list(
+            [{"id": 1, "uid": "test", "name": "test", "type": "prometheus"}]
+        )
+
+        datasource_registry = datasource.get_datasource_registry()
+
+        self.assertEqual(1, datasource_registry.by_name.get("test").get("id"))
+        self.assertIs(datasource_registry, datasource.get_datasource_registry())
+        self.assertEqual(1, call_the_api_mock.call_count)
+
+        datasource.get_datasource_registry(refresh=True)
+
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_datasource_registry_no_datasources(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list()
+
+        self.assertEqual([], datasource.get_datasource_registry().datasources)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_datasource_registry_no_ttl(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), datasource_registry_ttl=0
+        )
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list()
+
+        datasource.get_datasource_registry()
+        datasource.get_datasource_registry()
+
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_datasource_registry_error(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"message": "error"})
+
+        with self.assertRaises(Exception):
+            datasource.get_datasource_registry()
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_datasource_registry_in_place_updates(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list(
+            [{"id": 1, "uid": "test", "name": "test", "type": "prometheus"}]
+        )
+        datasource_registry = datasource.get_datasource_registry()
+
+        call_the_api_mock.return_value = dict(
+            {
+                "message": "Datasource added",
+                "datasource": {"id": 2, "uid": "new", "name": "new", "type": "loki"},
+            }
+        )
+        datasource.create_datasource(dict({"name": "new"}))
+
+        call_the_api_mock.return_value = dict(
+            {
+                "message": "Datasource updated",
+                "datasource": {
+                    "id": 1,
+                    "uid": "test",
+                    "name": "renamed",
+                    "type": "prometheus",
+                },
+            }
+        )
+        datasource.update_datasource(dict({"name": "renamed"}), datasource_uid="test")
+
+        self.assertEqual(2, datasource_registry.by_uid.get("new").get("id"))
+        self.assertEqual(1, datasource_registry.by_name.get("renamed").get("id"))
+        self.assertIsNone(datasource_registry.by_name.get("test"))
+
+        call_the_api_mock.return_value = dict({"message": "Data source deleted"})
+        datasource.delete_datasource_by_id(1)
+        datasource.delete_datasource_by_name("new")
+
+        self.assertEqual([], datasource_registry.datasources)
+        self.assertTrue(datasource_registry.is_valid())
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_datasource_registry_invalidated_without_datasource(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list()
+        datasource_registry = datasource.get_datasource_registry()
+
+        call_the_api_mock.return_value = dict({"message": "Datasource added"})
+        datasource.create_datasource(dict({"name": "new"}))
+
+        self.assertFalse(datasource_registry.is_valid())
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_create_datasource(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -350,7 +502,9 @@ class DatasourceTestCase(TestCase):
 
         call_the_api_mock.return_value = dict({"results": dict({"test": "test"})})
 
-        datasource_query: DatasourceQuery = DatasourceQuery("test", datasource_id=1)
+        datasource_query: DatasourceQuery = DatasourceQuery(
+            "test", datasource_id=1, datasource_uid="test"
+        )
         datasource_queries: list = list()
         datasource_queries.append(datasource_query)
 
@@ -358,6 +512,12 @@ class DatasourceTestCase(TestCase):
             dict({"test": "test"}),
             datasource.query_datasource_by_id("1234", "1234", datasource_queries),
         )
+        self.assertEqual(
+            1, call_the_api_mock.call_args.args[2].get("queries")[0].get("datasourceId")
+        )
+        self.assertIsNone(
+            call_the_api_mock.call_args.args[2].get("queries")[0].get("datasource")
+        )
 
     def test_query_datasource_by_id_no_time(self):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -394,6 +554,116 @@ class DatasourceTestCase(TestCase):
         with self.assertRaises(Exception):
             datasource.query_datasource_by_id("1234", "1234", datasource_queries)
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasource_by_id_payload(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": dict({"test": "test"})})
+
+        datasource.query_datasource_by_id(
+            "now-1h", "now", [DatasourceQuery("SELECT 1", datasource_id=1)]
+        )
+
+        self.assertEqual(
+            dict(
+                {
+                    "from": "now-1h",
+                    "to": "now",
+                    "queries": [
+                        {
+                            "refId": "A",
+                            "intervalMs": 1000,
+                            "maxDataPoints": 100,
+                            "datasourceId": 1,
+                            "rawSql": "SELECT 1",
+                            "format": "time_series",
+                        }
+                    ],
+                }
+            ),
+            call_the_api_mock.call_args.args[2],
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasource_by_uid_payload(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": dict({"test": "test"})})
+
+        datasource.query_datasource_by_uid(
+            "1000", "2000", [DatasourceQuery("SELECT 1", datasource_uid="test")]
+        )
+
+        self.assertEqual("/api/ds/query", call_the_api_mock.call_args.args[0])
+        self.assertEqual("1000", call_the_api_mock.call_args.args[2].get("from"))
+        self.assertEqual("2000", call_the_api_mock.call_args.args[2].get("to"))
+        self.assertEqual(
+            dict({"uid": "test"}),
+            call_the_api_mock.call_args.args[2].get("queries")[0].get("datasource"),
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasources(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict(
+            {"results": dict({"A": {"frames": []}, "B": {"frames": []}})}
+        )
+
+        datasource_query_request: DatasourceQueryRequest = (
+            DatasourceQueryRequest("now-6h", "now")
+            .add_query("prometheus", {"expr": "up"}, datasource_type="prometheus")
+            .add_query("loki", {"expr": '{job="test"}', "queryType": "range"})
+        )
+
+        self.assertEqual(
+            dict({"A": {"frames": []}, "B": {"frames": []}}),
+            datasource.query_datasources(datasource_query_request),
+        )
+        self.assertEqual(1, call_the_api_mock.call_count)
+        self.assertEqual(
+            [
+                {
+                    "refId": "A",
+                    "intervalMs": 1000,
+                    "maxDataPoints": 100,
+                    "datasource": {"uid": "prometheus", "type": "prometheus"},
+                    "expr": "up",
+                },
+                {
+                    "refId": "B",
+                    "intervalMs": 1000,
+                    "maxDataPoints": 100,
+                    "datasource": {"uid": "loki"},
+                    "expr": '{job="test"}',
+                    "queryType": "range",
+                },
+            ],
+            call_the_api_mock.call_args.args[2].get("queries"),
+        )
+
+    def test_query_datasources_no_queries(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        with self.assertRaises(ValueError):
+            datasource.query_datasources(DatasourceQueryRequest())
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasources_no_query_result(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": dict()})
+
+        with self.assertRaises(Exception):
+            datasource.query_datasources(
+                DatasourceQueryRequest().add_query("test", {"expr": "up"})
+            )
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_query_datasource_by_uid(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -410,6 +680,432 @@ class DatasourceTestCase(TestCase):
             datasource.query_datasource_by_uid("1234", "1234", datasource_queries),
         )
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasource_by_uid_data_frame_decoder(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict(
+            {
+                "results": {
+                    "A": {
+                        "frames": [
+                            {
+                                "schema": {
+                                    "refId": "A",
+                                    "fields": [{"name": "Value", "type": "number"}],
+                                },
+                                "data": {"values": [[1, 2]]},
+                            }
+                        ]
+                    }
+                }
+            }
+        )
+
+        results: dict = datasource.query_datasource_by_uid(
+            "1234",
+            "1234",
+            [DatasourceQuery("test", datasource_uid="test")],
+            DataFrameDecoder(),
+        )
+
+        self.assertEqual(
+            array.array("d", [1, 2]), results.get("A")[0].get_the_field("Value").values
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasource_by_uid_in_chunks(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        def _query(api_call: str, method, payload: dict) -> dict:
+            start: int = int(payload.get("from"))
+            return dict(
+                {
+                    "results": {
+                        "A": {
+                            "status": 200,
+                            "frames": [
+                                {
+                                    "schema": {
+                                        "fields": [
+                                            {"name": "Time", "type": "time"},
+                                            {"name": "Value", "type": "number"},
+                                        ]
+                                    },
+                                    "data": {
+                                        "values": [[start], [None]],
+                                        "entities": [None, {"NaN": [0]}],
+                                    },
+                                }
+                            ],
+                        }
+                    }
+                }
+            )
+
+        call_the_api_mock.side_effect = _query
+
+        results: dict = datasource.query_datasource_by_uid_in_chunks(
+            1500,
+            "4500",
+            [DatasourceQuery("test", datasource_uid="test", interval_ms=10, max_data_points=100)],
+            chunk_size_ms=1000,
+            max_workers=2,
+        )
+
+        self.assertEqual(
+            [("1500", "1999"), ("2000", "2999"), ("3000", "3999"), ("4000", "4500")],
+            [
+                (call.args[2].get("from"), call.args[2].get("to"))
+                for call in sorted(
+                    call_the_api_mock.call_args_list,
+                    key=lambda call: int(call.args[2].get("from")),
+                )
+            ],
+        )
+        self.assertEqual(
+            dict({"uid": "test"}),
+            call_the_api_mock.call_args.args[2].get("queries")[0].get("datasource"),
+        )
+        self.assertEqual(1, len(results.get("A").get("frames")))
+        self.assertEqual(
+            [[1500, 2000, 3000, 4000], [None, None, None, None]],
+            results.get("A").get("frames")[0].get("data").get("values"),
+        )
+        self.assertEqual(
+            [None, {"NaN": [0, 1, 2, 3]}],
+            results.get("A").get("frames")[0].get("data").get("entities"),
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasource_by_uid_in_chunks_data_frame_decoder(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": {"A": {"frames": []}}})
+
+        self.assertEqual(
+            dict({"A": []}),
+            datasource.query_datasource_by_uid_in_chunks(
+                "0",
+                "10",
+                [DatasourceQuery("test", datasource_uid="test")],
+                chunk_size_ms=5,
+                data_frame_decoder=DataFrameDecoder(),
+            ),
+        )
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasource_by_uid_in_chunks_query_result_cache(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(
+            host=MagicMock(),
+            token=MagicMock(),
+            query_result_cache=QueryResultCache(settle_time_ms=0),
+        )
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        def _query(api_call: str, method, payload: dict) -> dict:
+            return dict(
+                {
+                    "results": {
+                        "A": {
+                            "frames": [
+                                {
+                                    "schema": {"fields": [{"name": "Time", "type": "time"}]},
+                                    "data": {"values": [[int(payload.get("from"))]]},
+                                }
+                            ]
+                        }
+                    }
+                }
+            )
+
+        call_the_api_mock.side_effect = _query
+
+        results: dict = datasource.query_datasource_by_uid_in_chunks(
+            "0", "10", [DatasourceQuery("test", datasource_uid="test")], chunk_size_ms=5
+        )
+        cached_results: dict = datasource.query_datasource_by_uid_in_chunks(
+            "0", "10", [DatasourceQuery("test", datasource_uid="test")], chunk_size_ms=5
+        )
+
+        self.assertEqual(2, call_the_api_mock.call_count)
+        self.assertEqual(results, cached_results)
+        self.assertEqual(
+            [[0, 5]], cached_results.get("A").get("frames")[0].get("data").get("values")
+        )
+
+        extended_results: dict = datasource.query_datasource_by_uid_in_chunks(
+            "0", "15", [DatasourceQuery("test", datasource_uid="test")], chunk_size_ms=5
+        )
+
+        self.assertEqual(4, call_the_api_mock.call_count)
+        self.assertEqual(
+            [("5", "9"), ("10", "15")],
+            [
+                (call.args[2].get("from"), call.args[2].get("to"))
+                for call in call_the_api_mock.call_args_list[2:]
+            ],
+        )
+        self.assertEqual(
+            [[0, 5, 10]],
+            extended_results.get("A").get("frames")[0].get("data").get("values"),
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasources_query_result_cache_not_settled(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(
+            host=MagicMock(),
+            token=MagicMock(),
+            query_result_cache=QueryResultCache(),
+        )
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": {"A": {"frames": []}}})
+
+        for _ in range(2):
+            datasource.query_datasources(
+                DatasourceQueryRequest("now-10m", "now").add_query(
+                    "test", {"expr": "up"}
+                )
+            )
+
+        self.assertEqual(2, call_the_api_mock.call_count)
+        self.assertEqual(0, len(model.query_result_cache.entries))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasource_by_uid_in_chunks_query_result_cache_error(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(
+            host=MagicMock(),
+            token=MagicMock(),
+            query_result_cache=QueryResultCache(settle_time_ms=0),
+        )
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict(
+            {"results": {"A": {"error": "test", "frames": []}}}
+        )
+
+        for _ in range(2):
+            datasource.query_datasource_by_uid_in_chunks(
+                "0", "10", [DatasourceQuery("test", datasource_uid="test")], chunk_size_ms=5
+            )
+
+        self.assertEqual(4, call_the_api_mock.call_count)
+        self.assertEqual(0, len(model.query_result_cache.entries))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasources_query_result_cache(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(),
+            token=MagicMock(),
+            query_result_cache=QueryResultCache(settle_time_ms=0),
+        )
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": dict({"A": {"frames": []}})})
+
+        for time, to in (("1005", "2995"), ("1009", "2999")):
+            self.assertEqual(
+                dict({"A": {"frames": []}}),
+                datasource.query_datasources(
+                    DatasourceQueryRequest(time, to).add_query(
+                        "test", {"expr": "up"}, interval_ms=10
+                    )
+                ),
+            )
+
+        self.assertEqual(1, call_the_api_mock.call_count)
+        self.assertEqual(
+            ("1005", "2995"),
+            (
+                call_the_api_mock.call_args.args[2].get("from"),
+                call_the_api_mock.call_args.args[2].get("to"),
+            ),
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasources_query_result_cache_not_supported_time(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(
+            host=MagicMock(),
+            token=MagicMock(),
+            query_result_cache=QueryResultCache(settle_time_ms=0),
+        )
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": dict({"A": {"frames": []}})})
+
+        for _ in range(2):
+            datasource.query_datasources(
+                DatasourceQueryRequest("now-1h/h", "now/d").add_query(
+                    "test", {"expr": "up"}
+                )
+            )
+
+        self.assertEqual(2, call_the_api_mock.call_count)
+        self.assertEqual(
+            ("now-1h/h", "now/d"),
+            (
+                call_the_api_mock.call_args.args[2].get("from"),
+                call_the_api_mock.call_args.args[2].get("to"),
+            ),
+        )
+        self.assertEqual(0, len(model.query_result_cache.entries))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_query_datasource_by_uid_in_chunks_error(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict()
+
+        with self.assertRaises(Exception):
+            datasource.query_datasource_by_uid_in_chunks(
+                0, 10, [DatasourceQuery("test", datasource_uid="test")]
+            )
+
+    def test_create_the_chunk_requests_default_chunk_size(self):
+        self.assertEqual(
+            365,
+            len(
+                Datasource._create_the_chunk_requests(
+                    0,
+                    365 * 86400000 - 1,
+                    [DatasourceQuery("test", datasource_uid="test")],
+                )
+            ),
+        )
+        self.assertEqual(
+            2,
+            len(
+                Datasource._create_the_chunk_requests(
+                    0,
+                    4 * 86400000,
+                    [
+                        DatasourceQuery(
+                            "test",
+                            datasource_uid="test",
+                            interval_ms=3600000,
+                            max_data_points=72,
+                        )
+                    ],
+                )
+            ),
+        )
+
+    def test_create_the_chunk_requests_max_chunks(self):
+        self.assertEqual(
+            3,
+            len(
+                Datasource._create_the_chunk_requests(
+                    0,
+                    29,
+                    [DatasourceQuery("test", datasource_uid="test")],
+                    chunk_size_ms=10,
+                    max_chunks=3,
+                )
+            ),
+        )
+
+        with self.assertRaises(ValueError):
+            Datasource._create_the_chunk_requests(
+                0,
+                31,
+                [DatasourceQuery("test", datasource_uid="test")],
+                chunk_size_ms=10,
+                max_chunks=3,
+            )
+
+    def test_query_datasource_by_uid_in_chunks_no_valid_time_range(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+
+        with self.assertRaises(ValueError):
+            datasource.query_datasource_by_uid_in_chunks(
+                "now", "now-1h", [DatasourceQuery("test", datasource_uid="test")]
+            )
+
+        with self.assertRaises(ValueError):
+            datasource.query_datasource_by_uid_in_chunks(
+                "yesterday", "now", [DatasourceQuery("test", datasource_uid="test")]
+            )
+
+        with self.assertRaises(ValueError):
+            datasource.query_datasource_by_uid_in_chunks(0, 10, [])
+
+    def test_get_the_epoch_milliseconds(self):
+        now: datetime.datetime = datetime.datetime(
+            2024, 3, 31, 12, tzinfo=datetime.timezone.utc
+        )
+
+        self.assertEqual(
+            int(now.timestamp() * 1000), Datasource._get_the_epoch_milliseconds("now", now)
+        )
+        self.assertEqual(
+            int(now.timestamp() * 1000) - 3600000,
+            Datasource._get_the_epoch_milliseconds("now-1h", now),
+        )
+        self.assertEqual(
+            int(datetime.datetime(2024, 2, 29, 12, tzinfo=datetime.timezone.utc).timestamp() * 1000),
+            Datasource._get_the_epoch_milliseconds("now-1M", now),
+        )
+        self.assertEqual(
+            int(datetime.datetime(2023, 3, 31, 12, tzinfo=datetime.timezone.utc).timestamp() * 1000),
+            Datasource._get_the_epoch_milliseconds("now-1y", now),
+        )
+        self.assertEqual(
+            int(now.timestamp() * 1000), Datasource._get_the_epoch_milliseconds(now, now)
+        )
+        self.assertEqual(1000, Datasource._get_the_epoch_milliseconds("1000", now))
+        self.assertIsNone(Datasource._get_the_epoch_milliseconds("now/d", now))
+
+    def test_stitch_the_chunk_results_nanos(self):
+        def _create_the_result(values: list, nanos: list) -> BatchResult:
+            return BatchResult(
+                None,
+                dict(
+                    {
+                        "results": {
+                            "A": {
+                                "frames": [
+                                    {
+                                        "schema": {"fields": [{"name": "Time", "type": "time"}]},
+                                        "data": {"values": [values], "nanos": nanos},
+                                    }
+                                ]
+                            }
+                        }
+                    }
+                ),
+            )
+
+        results: dict = Datasource._stitch_the_chunk_results(
+            [
+                _create_the_result([1], None),
+                _create_the_result([2], [[5]]),
+                _create_the_result([], None),
+                _create_the_result([3], None),
+            ]
+        )
+
+        self.assertEqual(
+            dict({"values": [[1, 2, 3]], "nanos": [[0, 5, 0]]}),
+            results.get("A").get("frames")[0].get("data"),
+        )
+
     def test_query_datasource_by_uid_no_time(self):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         datasource: Datasource = Datasource(grafana_api_model=model)
@@ -1236,3 +1932,198 @@ class DatasourceLabelBasedAccessControlTestCase(TestCase):
 
         with self.assertRaises(Exception):
             datasource.update_lbac_rules_for_datasource("test")
+
+
+class AsyncDatasourceTestCase(TestCase):
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_datasource_registry(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list(
+            [{"id": 1, "uid": "test", "name": "test", "type": "prometheus"}]
+        )
+
+        datasource_registry = asyncio.run(datasource.get_datasource_registry())
+        asyncio.run(datasource.get_datasource_registry())
+
+        self.assertEqual(1, datasource_registry.by_uid.get("test").get("id"))
+        self.assertEqual(1, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_datasource_registry_in_place_updates(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list(
+            [{"id": 1, "uid": "test", "name": "test", "type": "prometheus"}]
+        )
+        datasource_registry = asyncio.run(datasource.get_datasource_registry())
+
+        call_the_api_mock.return_value = dict(
+            {
+                "message": "Datasource added",
+                "datasource": {"id": 2, "uid": "new", "name": "new", "type": "loki"},
+            }
+        )
+        asyncio.run(datasource.create_datasource(dict({"name": "new"})))
+
+        call_the_api_mock.return_value = dict({"message": "Data source deleted"})
+        asyncio.run(datasource.delete_datasource_by_uid("test"))
+
+        self.assertEqual(["new"], list(datasource_registry.by_name))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_datasource_id_by_name_registered(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list(
+            [{"id": 1, "uid": "test", "name": "test", "type": "prometheus"}]
+        )
+
+        self.assertEqual(
+            1, asyncio.run(datasource.get_datasource_id_by_name("test"))
+        )
+        self.assertEqual(
+            1, asyncio.run(datasource.get_datasource_id_by_name("test"))
+        )
+        self.assertEqual(1, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_all_datasources(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list([{"id": 1}])
+
+        self.assertEqual([{"id": 1}], asyncio.run(datasource.get_all_datasources()))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_all_datasources_no_datasources(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list()
+
+        with self.assertRaises(Exception):
+            asyncio.run(datasource.get_all_datasources())
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_datasource_by_uid(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"id": 1})
+
+        self.assertEqual(
+            dict({"id": 1}), asyncio.run(datasource.get_datasource_by_uid("test"))
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_query_datasource_by_uid_in_chunks(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        async def _query(api_call: str, method, payload: dict) -> dict:
+            return dict(
+                {
+                    "results": {
+                        "A": {
+                            "frames": [
+                                {
+                                    "schema": {"fields": [{"name": "Time", "type": "time"}]},
+                                    "data": {"values": [[int(payload.get("from"))]]},
+                                }
+                            ]
+                        }
+                    }
+                }
+            )
+
+        call_the_api_mock.side_effect = _query
+
+        results: dict = asyncio.run(
+            datasource.query_datasource_by_uid_in_chunks(
+                0, 29, [DatasourceQuery("test", datasource_uid="test")], chunk_size_ms=10
+            )
+        )
+
+        self.assertEqual(
+            [[0, 10, 20]], results.get("A").get("frames")[0].get("data").get("values")
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_query_datasources(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": dict({"A": {"frames": []}})})
+
+        self.assertEqual(
+            dict({"A": {"frames": []}}),
+            asyncio.run(
+                datasource.query_datasources(
+                    DatasourceQueryRequest().add_query("test", {"expr": "up"})
+                )
+            ),
+        )
+        self.assertEqual("now-1h", call_the_api_mock.call_args.args[2].get("from"))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_query_datasource_by_uid_in_chunks_query_result_cache(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(
+            host=MagicMock(),
+            token=MagicMock(),
+            query_result_cache=QueryResultCache(settle_time_ms=0),
+        )
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"results": {"A": {"frames": []}}})
+
+        for _ in range(2):
+            self.assertEqual(
+                dict({"A": {"status": None, "frames": []}}),
+                asyncio.run(
+                    datasource.query_datasource_by_uid_in_chunks(
+                        "0",
+                        "10",
+                        [DatasourceQuery("test", datasource_uid="test")],
+                        chunk_size_ms=5,
+                    )
+                ),
+            )
+
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.datasource.asyncio.to_thread", wraps=asyncio.to_thread)
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_query_datasources_persisted_query_result_cache(
+        self, call_the_api_mock, to_thread_mock
+    ):
+        call_the_api_mock.return_value = dict({"results": {"A": {"frames": []}}})
+
+        with tempfile.TemporaryDirectory() as path:
+            model: APIModel = APIModel(
+                host=MagicMock(),
+                token=MagicMock(),
+                query_result_cache=QueryResultCache(path=path, settle_time_ms=0),
+            )
+            datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+
+            for _ in range(2):
+                self.assertEqual(
+                    dict({"A": {"frames": []}}),
+                    asyncio.run(
+                        datasource.query_datasources(
+                            DatasourceQueryRequest(
+                                "0", "10", [DatasourceQuery("test", datasource_uid="test")]
+                            )
+                        )
+                    ),
+                )
+
+        self.assertEqual(1, call_the_api_mock.call_count)
+        self.assertEqual(3, to_thread_mock.call_count)
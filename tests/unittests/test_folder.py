@@ -1,10 +1,11 @@
+import asyncio
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 import httpx
 
 from grafana_api.model import APIModel
-from grafana_api.folder import Folder
+from grafana_api.folder import Folder, AsyncFolder
 
 
 class FolderTestCase(TestCase):
@@ -352,12 +353,15 @@ class FolderTestCase(TestCase):
         with self.assertRaises(Exception):
             folder.update_folder_permissions("test", dict({"test": "test"}))
 
-    @patch("grafana_api.folder.Folder.get_all_folder_ids_uids_and_names")
-    def test_get_folder_id_by_dashboard_path(self, all_folder_ids_uids_and_names_mock):
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_id_by_dashboard_path(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
 
-        all_folder_ids_uids_and_names_mock.return_value = [{"id": 12, "uid": "test-uid", "title": "test"}]
+        call_the_api_mock.side_effect = [
+            [{"id": 12, "uid": "test-uid", "title": "test"}],
+            [],
+        ]
         self.assertEqual(
             12, folder.get_folder_id_by_dashboard_path(dashboard_path="test")
         )
@@ -377,14 +381,17 @@ class FolderTestCase(TestCase):
         with self.assertRaises(ValueError):
             folder.get_folder_id_by_dashboard_path(dashboard_path="")
 
-    @patch("grafana_api.folder.Folder.get_all_folder_ids_uids_and_names")
+    @patch("grafana_api.api.Api.call_the_api")
     def test_get_folder_id_by_dashboard_path_no_title_match(
-        self, all_folder_ids_uids_and_names_mock
+        self, call_the_api_mock
     ):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
 
-        all_folder_ids_uids_and_names_mock.return_value = [{"title": None, "id": "xty13y", "uid": "test-uid"}]
+        call_the_api_mock.side_effect = [
+            [{"title": None, "id": "xty13y", "uid": "test-uid"}],
+            [],
+        ]
         with self.assertRaises(Exception):
             folder.get_folder_id_by_dashboard_path(dashboard_path="test")
 
@@ -455,24 +462,28 @@ class FolderTestCase(TestCase):
         with self.assertRaises(Exception):
             folder.get_all_folder_ids_uids_and_names()
 
-    @patch("grafana_api.folder.Folder.get_all_folder_ids_uids_and_names")
-    def test_get_folder_uid_by_dashboard_path(self, all_folder_ids_uids_and_names_mock):
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_uid_by_dashboard_path(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
 
-        all_folder_ids_uids_and_names_mock.return_value = [
-            {"id": 12, "uid": "test-uid", "title": "test"}
+        call_the_api_mock.side_effect = [
+            [
+                {"id": 12, "uid": "test-uid", "title": "test"}
+            ],
+            [],
         ]
 
         self.assertEqual("test-uid", folder.get_folder_uid_by_dashboard_path("test"))
 
-    @patch("grafana_api.folder.Folder.get_all_folder_ids_uids_and_names")
-    def test_get_folder_uid_by_dashboard_path_general_path(self, all_folder_ids_uids_and_names_mock):
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_uid_by_dashboard_path_general_path(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
 
-        all_folder_ids_uids_and_names_mock.return_value = [
-            {"title": "General", "id": 0, "uid": ""}
+        call_the_api_mock.side_effect = [
+            [{"id": 12, "uid": "test-uid", "title": "test"}],
+            [],
         ]
 
         self.assertEqual("", folder.get_folder_uid_by_dashboard_path("General"))
@@ -484,20 +495,132 @@ class FolderTestCase(TestCase):
         with self.assertRaises(ValueError):
             folder.get_folder_uid_by_dashboard_path("")
 
-    @patch("grafana_api.folder.Folder.get_all_folder_ids_uids_and_names")
+    @patch("grafana_api.api.Api.call_the_api")
     def test_get_folder_uid_by_dashboard_path_no_title_match(
-        self, all_folder_ids_uids_and_names_mock
+        self, call_the_api_mock
     ):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
 
-        all_folder_ids_uids_and_names_mock.return_value = [
-            {"title": "different", "id": 12, "uid": "test-uid"}
+        call_the_api_mock.side_effect = [
+            [
+                {"title": "different", "id": 12, "uid": "test-uid"}
+            ],
+            [],
         ]
 
         with self.assertRaises(Exception):
             folder.get_folder_uid_by_dashboard_path("test")
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_uid_by_dashboard_path_nested_folder_path(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            [{"id": 1, "uid": "root", "title": "Root"}],
+            [{"id": 2, "uid": "child", "title": "Child"}],
+            [],
+        ]
+
+        self.assertEqual(
+            "child", folder.get_folder_uid_by_dashboard_path("Root/Child")
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_uid_by_dashboard_path_folder_index_reused(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+
+        call_the_api_mock.side_effect = [
+            [{"id": 12, "uid": "test-uid", "title": "test"}],
+            [],
+        ]
+
+        self.assertEqual(
+            "test-uid", Folder(model).get_folder_uid_by_dashboard_path("test")
+        )
+        self.assertEqual(12, Folder(model).get_folder_id_by_dashboard_path("test"))
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_uid_by_dashboard_path_folder_index_invalidated(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            [{"id": 12, "uid": "test-uid", "title": "test"}],
+            [],
+            dict({"id": 13, "uid": "test-uid-2", "title": "test2"}),
+            [
+                {"id": 12, "uid": "test-uid", "title": "test"},
+                {"id": 13, "uid": "test-uid-2", "title": "test2"},
+            ],
+            [],
+            [],
+        ]
+
+        self.assertEqual("test-uid", folder.get_folder_uid_by_dashboard_path("test"))
+        folder.create_folder("test2")
+        self.assertEqual(
+            "test-uid-2", folder.get_folder_uid_by_dashboard_path("test2")
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_index_invalidated_during_rebuild(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        def _get_top_level_folders(api_call: str) -> list:
+            model.folder_index.invalidate()
+            return [{"id": 12, "uid": "test-uid", "title": "test"}]
+
+        call_the_api_mock.side_effect = lambda api_call: (
+            _get_top_level_folders(api_call) if "folderIds=0" in api_call else []
+        )
+
+        folder_index = folder.get_folder_index()
+
+        self.assertEqual("test-uid", folder_index.get_folder("test").get("uid"))
+        self.assertFalse(folder_index.is_valid())
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_uid_by_dashboard_path_folder_index_disabled(
+        self, call_the_api_mock
+    ):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), folder_index_ttl=0
+        )
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            [{"id": 12, "uid": "test-uid", "title": "test"}],
+            [],
+            [{"id": 12, "uid": "test-uid", "title": "test"}],
+            [],
+        ]
+
+        folder.get_folder_uid_by_dashboard_path("test")
+        folder.get_folder_uid_by_dashboard_path("test")
+
+        self.assertEqual(4, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_delete_folder_folder_index_invalidated(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+        model.folder_index.update([], dict(), 60)
+
+        call_the_api_mock.return_value = dict({"message": "Folder deleted"})
+        folder.delete_folder("test")
+
+        self.assertFalse(model.folder_index.is_valid())
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_folders_with_nested_folders(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -583,21 +706,23 @@ class FolderTestCase(TestCase):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
 
-        call_the_api_mock.side_effect = [
-            [
-                {"id": 2, "uid": "child-1", "title": "Child 1"},
-                {"id": 3, "uid": "child-2", "title": "Child 2"},
-            ],
-            [{"id": 4, "uid": "grandchild-1", "title": "Grandchild 1"}],
-            [],
-            [
-                {"id": 5, "uid": "grandchild-2", "title": "Grandchild 2"},
-                {"id": 6, "uid": "grandchild-3", "title": "Grandchild 3"},
-            ],
-            [],
-            [],
-        ]
-        result = folder._get_nested_folders("parent-uid")
+        nested_folders: dict = dict(
+            {
+                "parent-uid": [
+                    {"id": 2, "uid": "child-1", "title": "Child 1"},
+                    {"id": 3, "uid": "child-2", "title": "Child 2"},
+                ],
+                "child-1": [{"id": 4, "uid": "grandchild-1", "title": "Grandchild 1"}],
+                "child-2": [
+                    {"id": 5, "uid": "grandchild-2", "title": "Grandchild 2"},
+                    {"id": 6, "uid": "grandchild-3", "title": "Grandchild 3"},
+                ],
+            }
+        )
+        call_the_api_mock.side_effect = lambda api_call: nested_folders.get(
+            api_call.split("parentUid=")[1], []
+        )
+        result = folder._get_nested_folders("parent-uid", max_workers=2)
         self.assertEqual(
             [
                 {"id": 2, "uid": "child-1", "title": "Child 1"},
@@ -609,6 +734,63 @@ class FolderTestCase(TestCase):
             result,
         )
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_nested_folders_cycle(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        nested_folders: dict = dict(
+            {
+                "a": [{"id": 2, "uid": "b", "title": "B"}],
+                "b": [{"id": 1, "uid": "a", "title": "A"}],
+            }
+        )
+        call_the_api_mock.side_effect = lambda api_call: nested_folders.get(
+            api_call.split("parentUid=")[1], []
+        )
+
+        self.assertEqual(
+            [{"id": 2, "uid": "b", "title": "B"}], folder._get_nested_folders("a")
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_tree_cycle(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        nested_folders: dict = dict(
+            {
+                "a": [{"id": 2, "uid": "b", "title": "B"}],
+                "b": [{"id": 1, "uid": "a", "title": "A"}],
+            }
+        )
+        call_the_api_mock.side_effect = lambda api_call: (
+            [{"id": 1, "uid": "a", "title": "A"}]
+            if "folderIds=0" in api_call
+            else nested_folders.get(api_call.split("parentUid=")[1], [])
+        )
+
+        self.assertEqual(
+            [
+                {
+                    "id": 1,
+                    "uid": "a",
+                    "title": "A",
+                    "parentUid": None,
+                    "children": [
+                        {
+                            "id": 2,
+                            "uid": "b",
+                            "title": "B",
+                            "parentUid": "a",
+                            "children": [],
+                        }
+                    ],
+                }
+            ],
+            folder.get_folder_tree(),
+        )
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_folders_nested_folders_enabled(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -628,3 +810,200 @@ class FolderTestCase(TestCase):
             ],
             result,
         )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folders_nested_folders_breadth_first(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            [{"id": 1, "uid": "root", "title": "Root"}],
+            [
+                {"id": 2, "uid": "child-1", "title": "Child 1"},
+                {"id": 3, "uid": "child-2", "title": "Child 2"},
+            ],
+            [],
+            [],
+        ]
+        folder.get_folders(nested_folders=True, max_workers=1)
+
+        self.assertEqual(
+            [
+                "/api/folders?parentUid=root",
+                "/api/folders?parentUid=child-1",
+                "/api/folders?parentUid=child-2",
+            ],
+            [call.args[0] for call in call_the_api_mock.call_args_list[1:]],
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folders_nested_folders_error_response(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            [{"id": 1, "uid": "root", "title": "Root"}],
+            Exception("Test"),
+        ]
+
+        with self.assertRaises(Exception):
+            folder.get_folders(nested_folders=True)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_tree(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        nested_folders: dict = dict(
+            {
+                "root": [{"id": 2, "uid": "child", "title": "Child"}],
+                "child": [{"id": 3, "uid": "grandchild", "title": "Grandchild"}],
+            }
+        )
+        call_the_api_mock.side_effect = lambda api_call: (
+            [{"id": 1, "uid": "root", "title": "Root"}]
+            if "folderIds=0" in api_call
+            else nested_folders.get(api_call.split("parentUid=")[1], [])
+        )
+
+        self.assertEqual(
+            [
+                {
+                    "id": 1,
+                    "uid": "root",
+                    "title": "Root",
+                    "parentUid": None,
+                    "children": [
+                        {
+                            "id": 2,
+                            "uid": "child",
+                            "title": "Child",
+                            "parentUid": "root",
+                            "children": [
+                                {
+                                    "id": 3,
+                                    "uid": "grandchild",
+                                    "title": "Grandchild",
+                                    "parentUid": "child",
+                                    "children": [],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+            folder.get_folder_tree(),
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_tree_error_response(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list()
+
+        with self.assertRaises(Exception):
+            folder.get_folder_tree()
+
+
+class AsyncFolderTestCase(TestCase):
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_folders_nested_folders(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            list([{"id": 12, "uid": "test-uid", "title": "test"}]),
+            list([{"id": 13, "uid": "test-uid-2", "title": "test2"}]),
+            list(),
+        ]
+
+        self.assertEqual(
+            list(
+                [
+                    {"id": 0, "uid": "", "title": "General"},
+                    {"id": 12, "uid": "test-uid", "title": "test"},
+                    {"id": 13, "uid": "test-uid-2", "title": "test2"},
+                ]
+            ),
+            asyncio.run(folder.get_folders(nested_folders=True)),
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_folder_tree(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            list([{"id": 12, "uid": "test-uid", "title": "test"}]),
+            list([{"id": 13, "uid": "test-uid-2", "title": "test2"}]),
+            list(),
+        ]
+
+        self.assertEqual(
+            list(
+                [
+                    {
+                        "id": 12,
+                        "uid": "test-uid",
+                        "title": "test",
+                        "parentUid": None,
+                        "children": [
+                            {
+                                "id": 13,
+                                "uid": "test-uid-2",
+                                "title": "test2",
+                                "parentUid": "test-uid",
+                                "children": [],
+                            }
+                        ],
+                    }
+                ]
+            ),
+            asyncio.run(folder.get_folder_tree()),
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_folder_by_uid(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"title": None, "id": 12})
+
+        self.assertEqual(
+            dict({"title": None, "id": 12}),
+            asyncio.run(folder.get_folder_by_uid("xty13y")),
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_folder_by_uid_error_response(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict()
+
+        with self.assertRaises(Exception):
+            asyncio.run(folder.get_folder_by_uid("xty13y"))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_folder_uid_by_dashboard_path(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            list([{"id": 12, "uid": "test-uid", "title": "test"}]),
+            list(),
+        ]
+
+        self.assertEqual(
+            "test-uid", asyncio.run(folder.get_folder_uid_by_dashboard_path("test"))
+        )
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_delete_folder(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"message": "Folder deleted"})
+
+        self.assertEqual(None, asyncio.run(folder.delete_folder("test")))
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+import grafana_api
+
+
+class GrafanaAPITestCase(TestCase):
+    def test_getattr(self):
+        from grafana_api.dashboard import Dashboard
+        from grafana_api.model import APIModel
+
+        self.assertIs(Dashboard, grafana_api.Dashboard)
+        self.assertIs(APIModel, grafana_api.APIModel)
+
+    def test_getattr_submodule(self):
+        from grafana_api import legacy_alerting
+
+        self.assertIs(legacy_alerting, grafana_api.legacy_alerting)
+        self.assertIsNot(legacy_alerting.Alerting, grafana_api.Alerting)
+
+    def test_getattr_no_valid_attribute(self):
+        with self.assertRaises(AttributeError):
+            grafana_api.test
+
+    def test_dir(self):
+        self.assertIn("Folder", dir(grafana_api))
+        self.assertIn("model", dir(grafana_api))
+
+    def test_all(self):
+        for name in grafana_api.__all__:
+            self.assertIsNotNone(getattr(grafana_api, name))
+
+    def test_lazy_import(self):
+        result: subprocess.CompletedProcess = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, grafana_api; "
+                "print(any(module.startswith(('grafana_api.', 'httpx')) for module in sys.modules))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual("False", result.stdout.strip())
@@ -42,6 +42,21 @@ class LibraryTestCase(TestCase):
         with self.assertRaises(Exception):
             library.get_all_library_elements()
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_library_elements(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        library: Library = Library(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            dict({"result": {"totalCount": 2, "elements": [{"uid": "test1"}]}}),
+            dict({"result": {"totalCount": 2, "elements": [{"uid": "test2"}]}}),
+        ]
+
+        self.assertEqual(
+            [{"uid": "test1"}, {"uid": "test2"}],
+            list(library.iter_library_elements(results_per_page=1)),
+        )
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_library_element_by_uid(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
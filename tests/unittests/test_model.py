@@ -1,11 +1,40 @@
-from unittest import TestCase
+import array
+import asyncio
+import importlib.util
+import math
+import os
+import ssl
+import tempfile
+import time
+from unittest import TestCase, skipIf
+from unittest.mock import MagicMock, patch
+
+import httpx
 
 from grafana_api.model import (
     APIModel,
     RequestsMethods,
     APIEndpoints,
     DatasourceQuery,
+    DatasourceQueryRequest,
     DatasourcePermission,
+    JSONCodec,
+    FolderIndex,
+    DatasourceRegistry,
+    ResponseCache,
+    QueryResultCache,
+    RetryPolicy,
+    TokenBucket,
+    RateLimiter,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    CircuitState,
+    RequestEvent,
+    MetricsCollector,
+    DataFrame,
+    DataFrameBackend,
+    DataFrameDecoder,
+    DataFrameField,
 )
 
 
@@ -38,6 +67,351 @@ class APIModelTestCase(TestCase):
         self.assertEqual("test", model.username)
         self.assertEqual("test", model.password)
 
+    def test_api_model_close(self):
+        model = APIModel(host="test", token="test")
+        http_client = MagicMock()
+        model.http_client = http_client
+
+        model.close()
+
+        http_client.close.assert_called_once()
+        self.assertIsNone(model.http_client)
+
+    def test_api_model_context_manager(self):
+        http_client = MagicMock()
+
+        with APIModel(host="test", token="test") as model:
+            model.http_client = http_client
+
+        http_client.close.assert_called_once()
+        self.assertIsNone(model.http_client)
+
+    def test_get_the_ssl_context(self):
+        model: APIModel = APIModel(host="test", token="test")
+
+        self.assertIsNone(model.ssl_context)
+        self.assertIsInstance(model.get_the_ssl_context(), ssl.SSLContext)
+        self.assertIs(
+            model.get_the_ssl_context(),
+            APIModel(host="test", token="test").get_the_ssl_context(),
+        )
+
+    def test_get_the_ssl_context_custom_ssl_context(self):
+        ssl_context: ssl.SSLContext = ssl.create_default_context()
+
+        self.assertIs(
+            ssl_context,
+            APIModel(
+                host="test", token="test", ssl_context=ssl_context
+            ).get_the_ssl_context(),
+        )
+
+    def test_get_the_max_concurrency(self):
+        self.assertEqual(
+            4, APIModel(host="test", token="test", num_pools=4).get_the_max_concurrency()
+        )
+        self.assertEqual(
+            20,
+            APIModel(
+                host="test",
+                token="test",
+                http2_support=True,
+                http2_max_connections=2,
+                http2_max_concurrent_streams=10,
+            ).get_the_max_concurrency(),
+        )
+
+
+class JSONCodecTestCase(TestCase):
+    def test_json_codec_init(self):
+        json_codec: JSONCodec = JSONCodec()
+
+        self.assertEqual(b'{"test":1}', json_codec.dumps({"test": 1}).replace(b" ", b""))
+        self.assertEqual({"test": 1}, json_codec.loads(b'{"test": 1}'))
+        self.assertEqual({"test": 1}, json_codec.loads('{"test": 1}'))
+
+    @patch("grafana_api.model.orjson", None)
+    def test_json_codec_init_standard_library(self):
+        json_codec: JSONCodec = JSONCodec()
+
+        self.assertEqual(b'{"1": 2}', json_codec.dumps({1: 2}))
+        self.assertEqual({"test": 1}, json_codec.loads(b'{"test": 1}'))
+
+    def test_json_codec_init_custom_functions(self):
+        json_codec: JSONCodec = JSONCodec(dumps=str, loads=str)
+
+        self.assertEqual("1", json_codec.dumps(1))
+        self.assertEqual("1", json_codec.loads(1))
+
+    def test_api_model_json_codec(self):
+        model = APIModel(host="test", token="test")
+
+        self.assertIsInstance(model.json_codec, JSONCodec)
+
+
+class FolderIndexTestCase(TestCase):
+    def test_update(self):
+        folder_index: FolderIndex = FolderIndex()
+        folder: dict = dict({"id": 12, "uid": "test-uid", "title": "test"})
+
+        self.assertFalse(folder_index.is_valid())
+
+        folder_index.update([folder], dict({"Root/test": folder}), 60)
+
+        self.assertTrue(folder_index.is_valid())
+        self.assertEqual(folder, folder_index.by_uid.get("test-uid"))
+        self.assertEqual(folder, folder_index.get_folder("test"))
+        self.assertEqual(folder, folder_index.get_folder("Root/test"))
+        self.assertIsNone(folder_index.get_folder("Root"))
+
+    def test_update_no_ttl(self):
+        folder_index: FolderIndex = FolderIndex()
+
+        folder_index.update([], dict(), 0)
+
+        self.assertFalse(folder_index.is_valid())
+
+    def test_invalidate(self):
+        folder_index: FolderIndex = FolderIndex()
+        folder_index.update([], dict(), 60)
+
+        folder_index.invalidate()
+
+        self.assertFalse(folder_index.is_valid())
+
+    def test_update_invalidated_generation(self):
+        folder_index: FolderIndex = FolderIndex()
+        generation: int = folder_index.generation
+
+        folder_index.invalidate()
+        folder_index.update([], dict(), 60, generation)
+
+        self.assertFalse(folder_index.is_valid())
+
+        folder_index.update([], dict(), 60, folder_index.generation)
+
+        self.assertTrue(folder_index.is_valid())
+
+
+class DatasourceRegistryTestCase(TestCase):
+    def test_update(self):
+        datasource_registry: DatasourceRegistry = DatasourceRegistry()
+        datasource: dict = dict(
+            {"id": 1, "uid": "test-uid", "name": "test", "type": "prometheus"}
+        )
+
+        self.assertFalse(datasource_registry.is_valid())
+
+        datasource_registry.update([datasource], 60)
+
+        self.assertTrue(datasource_registry.is_valid())
+        self.assertEqual(datasource, datasource_registry.by_name.get("test"))
+        self.assertEqual(datasource, datasource_registry.by_uid.get("test-uid"))
+        self.assertEqual(datasource, datasource_registry.by_id.get(1))
+        self.assertEqual(
+            [datasource], datasource_registry.get_datasources_by_type("prometheus")
+        )
+        self.assertEqual([datasource], datasource_registry.datasources)
+
+    def test_update_no_ttl(self):
+        datasource_registry: DatasourceRegistry = DatasourceRegistry()
+
+        datasource_registry.update([], 0)
+
+        self.assertFalse(datasource_registry.is_valid())
+
+    def test_put_replaces_the_datasource(self):
+        datasource_registry: DatasourceRegistry = DatasourceRegistry()
+        datasource_registry.update(
+            [dict({"id": 1, "uid": "test-uid", "name": "test", "type": "loki"})], 60
+        )
+        datasource: dict = dict(
+            {"id": 1, "uid": "test-uid", "name": "renamed", "type": "prometheus"}
+        )
+
+        datasource_registry.put(datasource)
+
+        self.assertIsNone(datasource_registry.by_name.get("test"))
+        self.assertEqual(datasource, datasource_registry.by_name.get("renamed"))
+        self.assertEqual([], datasource_registry.get_datasources_by_type("loki"))
+        self.assertEqual(
+            [datasource], datasource_registry.get_datasources_by_type("prometheus")
+        )
+
+    def test_remove(self):
+        datasource_registry: DatasourceRegistry = DatasourceRegistry()
+        datasource: dict = dict(
+            {"id": 1, "uid": "test-uid", "name": "test", "type": "prometheus"}
+        )
+        datasource_registry.update([datasource], 60)
+
+        datasource_registry.remove(datasource)
+        datasource_registry.remove(None)
+
+        self.assertEqual(dict(), datasource_registry.by_name)
+        self.assertEqual(dict(), datasource_registry.by_uid)
+        self.assertEqual(dict(), datasource_registry.by_id)
+        self.assertEqual(dict(), datasource_registry.by_type)
+
+    def test_invalidate(self):
+        datasource_registry: DatasourceRegistry = DatasourceRegistry()
+        datasource_registry.update([], 60)
+
+        datasource_registry.invalidate()
+
+        self.assertFalse(datasource_registry.is_valid())
+
+
+class DataFrameDecoderTestCase(TestCase):
+    frame: dict = dict(
+        {
+            "schema": {
+                "name": "test",
+                "refId": "A",
+                "meta": {"executedQueryString": "test"},
+                "fields": [
+                    {
+                        "name": "Time",
+                        "type": "time",
+                        "typeInfo": {"frame": "time.Time"},
+                    },
+                    {
+                        "name": "Value",
+                        "type": "number",
+                        "typeInfo": {"frame": "float64", "nullable": True},
+                        "labels": {"instance": "test"},
+                    },
+                    {"name": "Count", "type": "number", "typeInfo": {"frame": "int64"}},
+                    {"name": "Name", "type": "string"},
+                    {"name": "Up", "type": "boolean"},
+                ],
+            },
+            "data": {
+                "values": [
+                    [1000, 2000, 3000, 4000],
+                    [1.5, None, None, None],
+                    [1, 2, 3, 4],
+                    ["a", "b", None, "d"],
+                    [True, False, True, True],
+                ],
+                "entities": [None, {"NaN": [1], "Inf": [2]}, None, None, None],
+                "nanos": [[0, 1, 0, 0], None, None, None, None],
+            },
+        }
+    )
+
+    def test_decode_the_frame(self):
+        data_frame: DataFrame = DataFrameDecoder().decode_the_frame(self.frame)
+
+        self.assertEqual("test", data_frame.name)
+        self.assertEqual("A", data_frame.ref_id)
+        self.assertEqual(dict({"executedQueryString": "test"}), data_frame.meta)
+        self.assertEqual(4, len(data_frame))
+        self.assertEqual(
+            array.array("q", [1000000000, 2000000001, 3000000000, 4000000000]),
+            data_frame.get_the_field("Time").values,
+        )
+        self.assertEqual(array.array("q", [1, 2, 3, 4]), data_frame.get_the_field("Count").values)
+        self.assertEqual(["a", "b", None, "d"], data_frame.get_the_field("Name").values)
+        self.assertEqual(
+            [True, False, True, True], data_frame.get_the_field("Up").values
+        )
+        self.assertIs(True, data_frame.get_the_field("Up").values[0])
+        self.assertIsNone(data_frame.get_the_field("test"))
+
+        value: DataFrameField = data_frame.get_the_field("Value")
+
+        self.assertEqual("d", value.values.typecode)
+        self.assertEqual(1.5, value.values[0])
+        self.assertTrue(math.isnan(value.values[1]))
+        self.assertEqual(float("inf"), value.values[2])
+        self.assertTrue(math.isnan(value.values[3]))
+        self.assertEqual(dict({"instance": "test"}), value.labels)
+
+    def test_decode_the_frame_nullable_integers_and_times(self):
+        data_frame: DataFrame = DataFrameDecoder().decode_the_frame(
+            dict(
+                {
+                    "schema": {
+                        "fields": [
+                            {"name": "Time", "type": "time"},
+                            {"name": "Count", "type": "number", "typeInfo": {"frame": "int64"}},
+                        ]
+                    },
+                    "data": {"values": [[1, None], [1, None]]},
+                }
+            )
+        )
+
+        self.assertEqual([1000000, None], data_frame.fields[0].values)
+        self.assertEqual("d", data_frame.fields[1].values.typecode)
+        self.assertTrue(math.isnan(data_frame.fields[1].values[1]))
+
+    def test_decode_the_frame_without_data(self):
+        data_frame: DataFrame = DataFrameDecoder().decode_the_frame(
+            dict({"schema": {"fields": [{"name": "Value", "type": "number"}]}})
+        )
+
+        self.assertEqual(0, len(data_frame))
+        self.assertEqual(0, len(DataFrame()))
+
+    def test_decode_the_results(self):
+        results: dict = DataFrameDecoder().decode_the_results(
+            dict({"A": {"frames": [self.frame]}, "B": {"status": 200}})
+        )
+
+        self.assertEqual(["A", "B"], list(results))
+        self.assertEqual("test", results.get("A")[0].name)
+        self.assertEqual([], results.get("B"))
+
+    def test_decode_the_results_error(self):
+        with self.assertRaises(ValueError):
+            DataFrameDecoder().decode_the_results(
+                dict({"A": {"error": "test", "status": 400}})
+            )
+
+    @skipIf(importlib.util.find_spec("numpy") is None, "numpy is not installed")
+    def test_decode_the_frame_numpy(self):
+        data_frame: DataFrame = DataFrameDecoder(
+            DataFrameBackend.NUMPY
+        ).decode_the_frame(self.frame)
+
+        self.assertEqual("datetime64[ns]", str(data_frame.fields[0].values.dtype))
+        self.assertEqual("float64", str(data_frame.fields[1].values.dtype))
+        self.assertEqual(float("inf"), data_frame.fields[1].values[2])
+        self.assertEqual("int64", str(data_frame.fields[2].values.dtype))
+        self.assertEqual("object", str(data_frame.fields[3].values.dtype))
+        self.assertEqual("bool", str(data_frame.fields[4].values.dtype))
+
+    @skipIf(importlib.util.find_spec("numpy") is None, "numpy is not installed")
+    def test_decode_the_frame_numpy_int8(self):
+        data_frame: DataFrame = DataFrameDecoder(
+            DataFrameBackend.NUMPY
+        ).decode_the_frame(
+            dict(
+                {
+                    "schema": {
+                        "fields": [
+                            {"name": "Count", "type": "number", "typeInfo": {"frame": "int8"}}
+                        ]
+                    },
+                    "data": {"values": [[-1, 2]]},
+                }
+            )
+        )
+
+        self.assertEqual("int8", str(data_frame.fields[0].values.dtype))
+        self.assertEqual([-1, 2], data_frame.fields[0].values.tolist())
+
+    @skipIf(importlib.util.find_spec("pandas") is None, "pandas is not installed")
+    def test_to_pandas(self):
+        data_frame = DataFrameDecoder().decode_the_frame(self.frame).to_pandas()
+
+        self.assertEqual(["Time", "Value", "Count", "Name", "Up"], list(data_frame.columns))
+        self.assertEqual("float64", str(data_frame["Value"].dtype))
+        self.assertEqual("bool", str(data_frame["Up"].dtype))
+        self.assertEqual(2000000001, data_frame["Time"][1].value)
+
 
 class DatasourceQueryTestCase(TestCase):
     def test_datasource_query_init(self):
@@ -50,8 +424,559 @@ class DatasourceQueryTestCase(TestCase):
         self.assertEqual(100, datasource_query.max_data_points)
         self.assertEqual("time_series", datasource_query.output_format)
 
+    def test_to_json(self):
+        self.assertEqual(
+            dict(
+                {
+                    "refId": "B",
+                    "intervalMs": 60000,
+                    "maxDataPoints": 1000,
+                    "datasource": {"uid": "test", "type": "influxdb"},
+                    "query": "from(bucket: \"test\")",
+                }
+            ),
+            DatasourceQuery(
+                "",
+                datasource_uid="test",
+                ref_id="B",
+                interval_ms=60000,
+                max_data_points=1000,
+                datasource_type="influxdb",
+                model=dict({"query": 'from(bucket: "test")'}),
+            ).to_json(),
+        )
+
+    def test_to_json_no_datasource(self):
+        with self.assertRaises(ValueError):
+            DatasourceQuery("SELECT 1").to_json()
+
+    def test_to_json_legacy(self):
+        self.assertEqual(
+            dict(
+                {
+                    "refId": "A",
+                    "intervalMs": 1000,
+                    "maxDataPoints": 100,
+                    "datasourceId": 1,
+                    "rawSql": "SELECT 1",
+                    "format": "time_series",
+                }
+            ),
+            DatasourceQuery(
+                "SELECT 1", datasource_id=1, datasource_uid="test"
+            ).to_json(legacy=True),
+        )
+
+        with self.assertRaises(ValueError):
+            DatasourceQuery("SELECT 1", datasource_uid="test").to_json(legacy=True)
+
+
+class DatasourceQueryRequestTestCase(TestCase):
+    def test_add_query(self):
+        datasource_query_request: DatasourceQueryRequest = DatasourceQueryRequest()
+        datasource_query_request.queries.append(
+            DatasourceQuery("SELECT 1", datasource_uid="test")
+        )
+
+        for _ in range(26):
+            datasource_query_request.add_query("test", dict({"expr": "up"}))
+
+        self.assertEqual(
+            ["A", "B", "Z", "Q1"],
+            [
+                datasource_query_request.queries[index].ref_id
+                for index in (0, 1, 25, 26)
+            ],
+        )
+
+    def test_to_json(self):
+        self.assertEqual(
+            dict(
+                {
+                    "from": "1000",
+                    "to": "2000",
+                    "queries": [
+                        {
+                            "refId": "test",
+                            "intervalMs": 1000,
+                            "maxDataPoints": 100,
+                            "datasource": {"uid": "test"},
+                            "expr": "up",
+                        }
+                    ],
+                }
+            ),
+            DatasourceQueryRequest(1000, 2000)
+            .add_query("test", dict({"expr": "up"}), ref_id="test")
+            .to_json(),
+        )
+
 
 class DatasourcePermissionTestCase(TestCase):
     def test_datasource_permission_init_value_error(self):
         with self.assertRaises(ValueError):
             DatasourcePermission("")
+
+
+class ResponseCacheTestCase(TestCase):
+    def test_create_the_key(self):
+        self.assertEqual(
+            ResponseCache.create_the_key(
+                "/test", dict({"Authorization": "test", "Accept": "application/json"})
+            ),
+            ResponseCache.create_the_key(
+                "/test", dict({"accept": "application/json", "Authorization": "test"})
+            ),
+        )
+        self.assertNotEqual(
+            ResponseCache.create_the_key(
+                "/test", dict({"Authorization": "test", "Accept": "application/json"})
+            ),
+            ResponseCache.create_the_key(
+                "/test", dict({"Authorization": "test", "Accept": "text/csv"})
+            ),
+        )
+
+    def test_put_lru_eviction(self):
+        response_cache: ResponseCache = ResponseCache(max_entries=2)
+
+        response_cache.put(("1",), httpx.Response(200))
+        response_cache.put(("2",), httpx.Response(200))
+        response_cache.get(("1",))
+        response_cache.put(("3",), httpx.Response(200))
+
+        self.assertEqual([("1",), ("3",)], list(response_cache.entries.keys()))
+
+    def test_get_expired_without_validator(self):
+        response_cache: ResponseCache = ResponseCache(ttl=0)
+
+        response_cache.put(("1",), httpx.Response(200))
+
+        self.assertIsNone(response_cache.get(("1",)))
+        self.assertEqual(0, len(response_cache.entries))
+
+    def test_get_expired_with_validator(self):
+        response_cache: ResponseCache = ResponseCache(ttl=0)
+
+        response_cache.put(
+            ("1",), httpx.Response(200, headers={"ETag": '"1"', "Last-Modified": "test"})
+        )
+
+        self.assertEqual(
+            {"If-None-Match": '"1"', "If-Modified-Since": "test"},
+            response_cache.get(("1",)).get_the_conditional_headers(),
+        )
+
+    def test_clear(self):
+        response_cache: ResponseCache = ResponseCache()
+
+        response_cache.put(("1",), httpx.Response(200))
+        response_cache.clear()
+
+        self.assertIsNone(response_cache.get(("1",)))
+
+
+class QueryResultCacheTestCase(TestCase):
+    def test_create_the_key(self):
+        self.assertEqual(
+            QueryResultCache.create_the_key(
+                dict({"from": "0", "to": "1", "queries": [{"a": 1, "b": 2}]})
+            ),
+            QueryResultCache.create_the_key(
+                dict({"queries": [{"b": 2, "a": 1}], "to": "1", "from": "0"})
+            ),
+        )
+        self.assertNotEqual(
+            QueryResultCache.create_the_key(dict({"from": "0", "to": "1"})),
+            QueryResultCache.create_the_key(dict({"from": "0", "to": "2"})),
+        )
+
+    def test_is_settled(self):
+        query_result_cache: QueryResultCache = QueryResultCache(settle_time_ms=60000)
+        now: int = int(time.time() * 1000)
+
+        self.assertTrue(query_result_cache.is_settled(now - 120000))
+        self.assertFalse(query_result_cache.is_settled(now))
+
+    def test_put(self):
+        query_result_cache: QueryResultCache = QueryResultCache(max_entries=2)
+
+        query_result_cache.put("a", b"a")
+        query_result_cache.put("b", b"b")
+        self.assertEqual(b"a", query_result_cache.get("a"))
+        query_result_cache.put("c", b"c")
+
+        self.assertIsNone(query_result_cache.get("b"))
+        self.assertEqual(b"a", query_result_cache.get("a"))
+        self.assertEqual(b"c", query_result_cache.get("c"))
+
+        query_result_cache.clear()
+
+        self.assertIsNone(query_result_cache.get("a"))
+
+    def test_put_path(self):
+        with tempfile.TemporaryDirectory() as path:
+            query_result_cache: QueryResultCache = QueryResultCache(
+                max_entries=2, path=os.path.join(path, "cache")
+            )
+            query_result_cache.put("a", b"a")
+            query_result_cache.put("b", b"b")
+
+            self.assertIsNone(query_result_cache.entries.get("a"))
+            self.assertEqual(
+                ["a.json", "b.json"], sorted(os.listdir(os.path.join(path, "cache")))
+            )
+
+            persisted_query_result_cache: QueryResultCache = QueryResultCache(
+                max_entries=2, path=os.path.join(path, "cache")
+            )
+
+            self.assertEqual(b"b", persisted_query_result_cache.get("b"))
+
+            persisted_query_result_cache.put("c", b"c")
+            persisted_query_result_cache.put("d", b"d")
+
+            self.assertEqual(
+                ["c.json", "d.json"], sorted(os.listdir(os.path.join(path, "cache")))
+            )
+
+            os.remove(os.path.join(path, "cache", "c.json"))
+
+            self.assertIsNone(persisted_query_result_cache.get("c"))
+
+            persisted_query_result_cache.clear()
+
+            self.assertEqual([], os.listdir(os.path.join(path, "cache")))
+
+
+class RetryPolicyTestCase(TestCase):
+    def test_is_retryable(self):
+        retry_policy: RetryPolicy = RetryPolicy()
+
+        self.assertTrue(retry_policy.is_retryable("GET", 503))
+        self.assertTrue(retry_policy.is_retryable("POST", 429))
+        self.assertFalse(retry_policy.is_retryable("POST", 503))
+        self.assertFalse(retry_policy.is_retryable("GET", 500))
+        self.assertTrue(retry_policy.is_retryable("GET", error=httpx.ReadTimeout("Test")))
+        self.assertFalse(retry_policy.is_retryable("POST", error=httpx.ReadTimeout("Test")))
+        self.assertFalse(retry_policy.is_retryable("GET", error=ValueError("Test")))
+
+    def test_get_the_backoff(self):
+        retry_policy: RetryPolicy = RetryPolicy(
+            backoff_factor=1, max_backoff=5, jitter=False
+        )
+
+        self.assertEqual(
+            [1, 2, 4, 5], [retry_policy.get_the_backoff(attempt) for attempt in range(4)]
+        )
+
+    def test_get_the_backoff_jitter(self):
+        retry_policy: RetryPolicy = RetryPolicy(backoff_factor=1)
+
+        self.assertTrue(0 <= retry_policy.get_the_backoff(2) <= 4)
+
+    def test_get_the_backoff_retry_after(self):
+        retry_policy: RetryPolicy = RetryPolicy(max_retry_after=10)
+
+        self.assertEqual(
+            3.0,
+            retry_policy.get_the_backoff(
+                0, httpx.Response(429, headers={"Retry-After": "3"})
+            ),
+        )
+        self.assertEqual(
+            10,
+            retry_policy.get_the_backoff(
+                0, httpx.Response(429, headers={"Retry-After": "60"})
+            ),
+        )
+        self.assertEqual(
+            0.0,
+            retry_policy.get_the_backoff(
+                0,
+                httpx.Response(
+                    503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+                ),
+            ),
+        )
+
+    def test_get_the_backoff_invalid_retry_after(self):
+        retry_policy: RetryPolicy = RetryPolicy(backoff_factor=1, jitter=False)
+
+        self.assertEqual(
+            1,
+            retry_policy.get_the_backoff(
+                0, httpx.Response(503, headers={"Retry-After": "invalid"})
+            ),
+        )
+
+
+class TokenBucketTestCase(TestCase):
+    def test_reserve(self):
+        token_bucket: TokenBucket = TokenBucket(requests_per_second=1, burst=2)
+
+        self.assertEqual(0.0, token_bucket.reserve())
+        self.assertEqual(0.0, token_bucket.reserve())
+        self.assertAlmostEqual(1.0, token_bucket.reserve(), places=2)
+        self.assertAlmostEqual(2.0, token_bucket.reserve(), places=2)
+
+    def test_reserve_refill(self):
+        token_bucket: TokenBucket = TokenBucket(requests_per_second=10)
+
+        token_bucket.reserve()
+        token_bucket.updated_at -= 0.1
+
+        self.assertEqual(0.0, token_bucket.reserve())
+
+    def test_invalid_requests_per_second(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(requests_per_second=0)
+
+
+class RateLimiterTestCase(TestCase):
+    def test_reserve(self):
+        rate_limiter: RateLimiter = RateLimiter(requests_per_second=100, burst=10)
+
+        self.assertEqual(
+            [0.0] * 10,
+            [rate_limiter.reserve("https://test.com/api/search") for _ in range(10)],
+        )
+        self.assertGreater(rate_limiter.reserve("https://test.com/api/search"), 0)
+
+    def test_reserve_endpoint_limits(self):
+        rate_limiter: RateLimiter = RateLimiter(
+            requests_per_second=100,
+            burst=10,
+            endpoint_limits={APIEndpoints.SEARCH: (1, 1), "/api/search/sorting": (100, 5)},
+        )
+
+        self.assertEqual(0.0, rate_limiter.reserve("https://test.com/api/search?query=test"))
+        self.assertGreater(rate_limiter.reserve("https://test.com/api/search"), 0)
+        self.assertEqual(0.0, rate_limiter.reserve("https://test.com/api/search/sorting"))
+        self.assertEqual(0.0, rate_limiter.reserve("https://test.com/api/searches"))
+
+    @patch("time.sleep")
+    def test_acquire(self, sleep_mock):
+        rate_limiter: RateLimiter = RateLimiter(requests_per_second=1)
+
+        rate_limiter.acquire("/api/search")
+        rate_limiter.acquire("/api/search")
+
+        sleep_mock.assert_called_once()
+
+    @patch("asyncio.sleep")
+    def test_acquire_async(self, sleep_mock):
+        rate_limiter: RateLimiter = RateLimiter(requests_per_second=1)
+
+        async def acquire():
+            await rate_limiter.acquire_async("/api/search")
+            await rate_limiter.acquire_async("/api/search")
+
+        asyncio.run(acquire())
+
+        sleep_mock.assert_called_once()
+
+
+class CircuitBreakerTestCase(TestCase):
+    def test_record_failure(self):
+        circuit_breaker: CircuitBreaker = CircuitBreaker(failure_threshold=2)
+
+        circuit_breaker.record_failure()
+        self.assertEqual(CircuitState.CLOSED, circuit_breaker.get_the_state())
+
+        circuit_breaker.record_failure()
+        self.assertEqual(CircuitState.OPEN, circuit_breaker.get_the_state())
+
+        with self.assertRaises(CircuitBreakerOpenError):
+            circuit_breaker.before_request()
+        self.assertEqual(1, circuit_breaker.get_the_statistics()["rejected_requests"])
+
+    def test_record_success(self):
+        circuit_breaker: CircuitBreaker = CircuitBreaker(failure_threshold=2)
+
+        circuit_breaker.record_failure()
+        circuit_breaker.record_success()
+        circuit_breaker.record_failure()
+
+        self.assertEqual(CircuitState.CLOSED, circuit_breaker.get_the_state())
+
+    def test_record_response(self):
+        circuit_breaker: CircuitBreaker = CircuitBreaker(failure_threshold=1)
+
+        circuit_breaker.record_response(404)
+        self.assertEqual(CircuitState.CLOSED, circuit_breaker.get_the_state())
+
+        circuit_breaker.record_response(503)
+        self.assertEqual(CircuitState.OPEN, circuit_breaker.get_the_state())
+
+    def test_half_open(self):
+        circuit_breaker: CircuitBreaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0
+        )
+
+        circuit_breaker.record_failure()
+        self.assertEqual(CircuitState.HALF_OPEN, circuit_breaker.get_the_state())
+
+        circuit_breaker.before_request()
+        with self.assertRaises(CircuitBreakerOpenError):
+            circuit_breaker.before_request()
+
+        circuit_breaker.record_success()
+        self.assertEqual(CircuitState.CLOSED, circuit_breaker.get_the_state())
+
+    def test_half_open_failed_probe(self):
+        circuit_breaker: CircuitBreaker = CircuitBreaker(
+            failure_threshold=5, recovery_timeout=60
+        )
+        circuit_breaker.state = CircuitState.HALF_OPEN
+
+        circuit_breaker.before_request()
+        circuit_breaker.record_failure()
+
+        self.assertEqual(CircuitState.OPEN, circuit_breaker.get_the_state())
+        self.assertEqual("open", circuit_breaker.get_the_statistics()["state"])
+        self.assertIsNotNone(
+            circuit_breaker.get_the_statistics()["open_since_seconds"]
+        )
+
+
+class MetricsCollectorTestCase(TestCase):
+    def test_get_the_endpoint(self):
+        metrics_collector: MetricsCollector = MetricsCollector()
+
+        self.assertEqual(
+            "/api/dashboards/uid/{param}",
+            metrics_collector.get_the_endpoint(
+                "https://test.com/api/dashboards/uid/test?test=1"
+            ),
+        )
+        self.assertEqual(
+            "/api/teams/{id}/members",
+            metrics_collector.get_the_endpoint("https://test.com/api/teams/12/members"),
+        )
+        self.assertEqual(
+            "/api/v1/provisioning/alert-rules/{param}",
+            metrics_collector.get_the_endpoint(
+                "https://test.com/api/v1/provisioning/alert-rules/a1b2"
+            ),
+        )
+        self.assertEqual(
+            "/api/folders",
+            metrics_collector.get_the_endpoint("https://test.com/api/folders"),
+        )
+
+    def test_get_the_endpoint_endpoint_resolver(self):
+        metrics_collector: MetricsCollector = MetricsCollector(
+            endpoint_resolver=lambda api_url: "test"
+        )
+
+        self.assertEqual(
+            "test", metrics_collector.get_the_endpoint("https://test.com/api/folders")
+        )
+
+    def test_get_the_metrics(self):
+        metrics_collector: MetricsCollector = MetricsCollector(buckets=(1.0, 0.1))
+
+        metrics_collector.after_response(
+            RequestEvent(
+                "GET",
+                "https://test.com/api/folders/1",
+                status_code=200,
+                response_bytes=10,
+                duration=0.05,
+            ),
+            MagicMock(),
+        )
+        metrics_collector.after_response(
+            RequestEvent(
+                "GET",
+                "https://test.com/api/folders/2",
+                attempt=1,
+                status_code=503,
+                response_bytes=5,
+                duration=0.5,
+            ),
+            MagicMock(),
+        )
+        metrics_collector.on_error(
+            RequestEvent(
+                "PUT",
+                "https://test.com/api/folders/1",
+                request_bytes=7,
+                duration=2.0,
+                error=Exception("Test"),
+            ),
+            Exception("Test"),
+        )
+
+        metrics: dict = metrics_collector.get_the_metrics()
+
+        self.assertEqual(
+            dict(
+                {
+                    "method": "GET",
+                    "endpoint": "/api/folders/{id}",
+                    "requests": 2,
+                    "errors": 0,
+                    "retries": 1,
+                    "request_bytes": 0,
+                    "response_bytes": 15,
+                    "status_codes": {200: 1, 503: 1},
+                    "latency": {
+                        "count": 2,
+                        "sum": 0.55,
+                        "buckets": {0.1: 1, 1.0: 2, "+Inf": 2},
+                    },
+                }
+            ),
+            metrics["GET /api/folders/{id}"],
+        )
+        self.assertEqual(1, metrics["PUT /api/folders/{id}"]["errors"])
+        self.assertEqual(7, metrics["PUT /api/folders/{id}"]["request_bytes"])
+        self.assertEqual(
+            {0.1: 0, 1.0: 0, "+Inf": 1},
+            metrics["PUT /api/folders/{id}"]["latency"]["buckets"],
+        )
+
+    def test_get_the_prometheus_metrics(self):
+        metrics_collector: MetricsCollector = MetricsCollector(
+            buckets=(0.1,), endpoint_resolver=lambda api_url: 'test"'
+        )
+        metrics_collector.after_response(
+            RequestEvent(
+                "GET", "https://test.com", status_code=200, duration=0.05
+            ),
+            MagicMock(),
+        )
+
+        prometheus_metrics: str = metrics_collector.get_the_prometheus_metrics()
+
+        self.assertIn(
+            "# TYPE grafana_api_request_duration_seconds histogram", prometheus_metrics
+        )
+        self.assertIn(
+            'grafana_api_request_duration_seconds_bucket{method="GET",endpoint="test\\"",le="0.1"} 1',
+            prometheus_metrics,
+        )
+        self.assertIn(
+            'grafana_api_request_duration_seconds_count{method="GET",endpoint="test\\""} 1',
+            prometheus_metrics,
+        )
+        self.assertIn(
+            'grafana_api_responses_total{method="GET",endpoint="test\\"",status_code="200"} 1',
+            prometheus_metrics,
+        )
+        self.assertIn(
+            'grafana_api_request_retries_total{method="GET",endpoint="test\\""} 0',
+            prometheus_metrics,
+        )
+
+    def test_reset(self):
+        metrics_collector: MetricsCollector = MetricsCollector()
+        metrics_collector.on_error(
+            RequestEvent("GET", "https://test.com", duration=0.1), Exception("Test")
+        )
+
+        metrics_collector.reset()
+
+        self.assertEqual(dict(), metrics_collector.get_the_metrics())
@@ -1,10 +1,11 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+import pytest
 from pytest_httpx import HTTPXMock
 from httpx import ConnectError
 
-from grafana_api.model import APIModel
+from grafana_api.model import APIModel, RetryPolicy
 from grafana_api.other_http import OtherHTTP
 
 
@@ -159,3 +160,35 @@ def test_get_plugin_metrics_http2_support(httpx_mock: HTTPXMock):
     other_http: OtherHTTP = OtherHTTP(grafana_api_model=model)
 
     assert other_http.get_plugin_metrics("test") == "test"
+
+
+def test_iter_metrics(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text="test 1\ntest 2\n")
+    model: APIModel = APIModel(host="https://test.com", token="test")
+    other_http: OtherHTTP = OtherHTTP(grafana_api_model=model)
+
+    assert list(other_http.iter_metrics("test", "test")) == ["test 1", "test 2"]
+    assert httpx_mock.get_request().headers["Authorization"].startswith("Basic")
+
+
+def test_iter_metrics_error(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=401, text="Unauthorized")
+    model: APIModel = APIModel(host="https://test.com", token="test")
+    other_http: OtherHTTP = OtherHTTP(grafana_api_model=model)
+
+    with pytest.raises(Exception):
+        list(other_http.iter_metrics())
+
+
+def test_iter_metrics_retry_policy(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(text="test 1\n")
+    model: APIModel = APIModel(
+        host="https://test.com",
+        token="test",
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+    other_http: OtherHTTP = OtherHTTP(grafana_api_model=model)
+
+    assert list(other_http.iter_metrics()) == ["test 1"]
+    assert len(httpx_mock.get_requests()) == 2
@@ -76,6 +76,25 @@ class QueryHistoryTestCase(TestCase):
         with self.assertRaises(Exception):
             query_history.search_query_history(["test"], "test")
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_query_history(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        query_history: QueryHistory = QueryHistory(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            dict({"result": {"totalCount": 2, "queryHistory": [{"uid": "test1"}]}}),
+            dict({"result": {"totalCount": 2, "queryHistory": [{"uid": "test2"}]}}),
+        ]
+
+        self.assertEqual(
+            [{"uid": "test1"}, {"uid": "test2"}],
+            list(
+                query_history.iter_query_history(
+                    ["test"], "test", results_per_page=1, prefetch=True
+                )
+            ),
+        )
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_delete_query_history(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -1,8 +1,9 @@
+import asyncio
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from grafana_api.model import APIModel
-from grafana_api.search import Search
+from grafana_api.search import Search, AsyncSearch
 
 
 class SearchTestCase(TestCase):
@@ -34,3 +35,68 @@ class SearchTestCase(TestCase):
 
         with self.assertRaises(Exception):
             search.search(search_query=MagicMock())
+
+    @patch("grafana_api.api.Api.iterate_the_json_items")
+    def test_iter_search(self, iterate_the_json_items_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: Search = Search(grafana_api_model=model)
+
+        iterate_the_json_items_mock.return_value = iter([{"uid": "test"}])
+
+        self.assertEqual([{"uid": "test"}], list(search.iter_search("query=test")))
+        iterate_the_json_items_mock.assert_called_once_with(
+            "/api/search?query=test"
+        )
+
+    def test_iter_search_no_search_query(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: Search = Search(grafana_api_model=model)
+
+        with self.assertRaises(ValueError):
+            list(search.iter_search(""))
+
+
+class AsyncSearchTestCase(TestCase):
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_search(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: AsyncSearch = AsyncSearch(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list(["test"])
+
+        self.assertEqual(["test"], asyncio.run(search.search(search_query="Test")))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_search_invalid_empty_list(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: AsyncSearch = AsyncSearch(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list()
+
+        with self.assertRaises(Exception):
+            asyncio.run(search.search(search_query="test"))
+
+    @patch("grafana_api.api.AsyncApi.iterate_the_json_items")
+    def test_iter_search(self, iterate_the_json_items_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: AsyncSearch = AsyncSearch(grafana_api_model=model)
+
+        async def _iterate_the_json_items(api_call: str):
+            yield {"uid": "test"}
+
+        iterate_the_json_items_mock.side_effect = _iterate_the_json_items
+
+        async def _collect_the_results():
+            return [result async for result in search.iter_search("query=test")]
+
+        self.assertEqual([{"uid": "test"}], asyncio.run(_collect_the_results()))
+
+    def test_iter_search_no_search_query(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: AsyncSearch = AsyncSearch(grafana_api_model=model)
+
+        async def _collect_the_results():
+            return [result async for result in search.iter_search("")]
+
+        with self.assertRaises(ValueError):
+            asyncio.run(_collect_the_results())
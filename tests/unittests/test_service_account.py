@@ -59,6 +59,18 @@ class ServiceAccountTestCase(TestCase):
         with self.assertRaises(Exception):
             self.service_account.create_service_account("test", "test")
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_service_accounts(self, call_the_api_mock):
+        call_the_api_mock.side_effect = [
+            dict({"totalCount": 2, "serviceAccounts": [{"id": 1}]}),
+            dict({"totalCount": 2, "serviceAccounts": [{"id": 2}]}),
+        ]
+
+        self.assertEqual(
+            [{"id": 1}, {"id": 2}],
+            list(self.service_account.iter_service_accounts(results_per_page=1)),
+        )
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_service_account_by_id(self, call_the_api_mock):
         call_the_api_mock.return_value = dict({"id": 2})
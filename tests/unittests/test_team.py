@@ -1,8 +1,9 @@
+import asyncio
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from grafana_api.model import APIModel, TeamObject
-from grafana_api.team import Team
+from grafana_api.team import Team, AsyncTeam
 
 
 class TeamTestCase(TestCase):
@@ -43,6 +44,24 @@ class TeamTestCase(TestCase):
         with self.assertRaises(Exception):
             team.search_team()
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_teams(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        team: Team = Team(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            dict({"totalCount": 3, "teams": [{"id": 1}, {"id": 2}]}),
+            dict({"totalCount": 3, "teams": [{"id": 3}]}),
+        ]
+
+        self.assertEqual(
+            [{"id": 1}, {"id": 2}, {"id": 3}],
+            list(team.iter_teams(results_per_page=2, prefetch=True)),
+        )
+        self.assertEqual(2, call_the_api_mock.call_count)
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_team_by_id(self, call_the_api_mock):
         model: APIModel = APIModel(
@@ -519,3 +538,45 @@ class TeamTestCase(TestCase):
         call_the_api_mock.return_value = dict({"status": 500})
 
         self.assertEqual(None, team.remove_external_group(1, "test"))
+
+
+class AsyncTeamTestCase(TestCase):
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_team_by_id(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        team: AsyncTeam = AsyncTeam(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"id": 1})
+
+        self.assertEqual(dict({"id": 1}), asyncio.run(team.get_team_by_id(1)))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_team_by_id_no_team(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        team: AsyncTeam = AsyncTeam(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict()
+
+        with self.assertRaises(Exception):
+            asyncio.run(team.get_team_by_id(1))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_iter_teams(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        team: AsyncTeam = AsyncTeam(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            dict({"totalCount": 3, "teams": [{"id": 1}, {"id": 2}]}),
+            dict({"totalCount": 3, "teams": [{"id": 3}]}),
+        ]
+
+        async def _get_teams():
+            return [t async for t in team.iter_teams(results_per_page=2, prefetch=True)]
+
+        self.assertEqual([{"id": 1}, {"id": 2}, {"id": 3}], asyncio.run(_get_teams()))
@@ -1,8 +1,9 @@
+import asyncio
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from grafana_api.model import APIModel, UserObject
-from grafana_api.user import User, CurrentUser
+from grafana_api.user import User, CurrentUser, AsyncUser, AsyncCurrentUser
 
 
 class UserTestCase(TestCase):
@@ -94,6 +95,38 @@ class UserTestCase(TestCase):
         with self.assertRaises(Exception):
             user.search_users_with_paging()
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_users(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        user: User = User(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            dict({"totalCount": 4, "users": [{"id": 1}, {"id": 2}]}),
+            dict({"totalCount": 4, "users": [{"id": 3}, {"id": 4}]}),
+        ]
+
+        self.assertEqual(
+            [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}],
+            list(user.iter_users(results_per_page=2)),
+        )
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_users_lazy(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        user: User = User(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict(
+            {"totalCount": 100, "users": [{"id": 1}, {"id": 2}]}
+        )
+
+        self.assertEqual({"id": 1}, next(user.iter_users(results_per_page=2)))
+        self.assertEqual(1, call_the_api_mock.call_count)
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_user_by_id(self, call_the_api_mock):
         model: APIModel = APIModel(
@@ -576,3 +609,56 @@ class CurrentUserTestCase(TestCase):
 
         with self.assertRaises(Exception):
             current_user.revoke_auth_token(1)
+
+
+class AsyncUserTestCase(TestCase):
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_user_by_id(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        user: AsyncUser = AsyncUser(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"id": 1})
+
+        self.assertEqual(dict({"id": 1}), asyncio.run(user.get_user_by_id(1)))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_user_by_id_no_user(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        user: AsyncUser = AsyncUser(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict()
+
+        with self.assertRaises(Exception):
+            asyncio.run(user.get_user_by_id(1))
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_iter_users(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), username=MagicMock(), password=MagicMock()
+        )
+        user: AsyncUser = AsyncUser(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            dict({"totalCount": 3, "users": [{"id": 1}, {"id": 2}]}),
+            dict({"totalCount": 3, "users": [{"id": 3}]}),
+        ]
+
+        async def _get_users():
+            return [u async for u in user.iter_users(results_per_page=2)]
+
+        self.assertEqual([{"id": 1}, {"id": 2}, {"id": 3}], asyncio.run(_get_users()))
+
+
+class AsyncCurrentUserTestCase(TestCase):
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_get_user(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        current_user: AsyncCurrentUser = AsyncCurrentUser(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"id": 1})
+
+        self.assertEqual(dict({"id": 1}), asyncio.run(current_user.get_user()))